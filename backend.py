@@ -1,7 +1,6 @@
 from __future__ import annotations
 import asyncio
 import getpass
-import json
 import logging
 import pwd
 import traceback
@@ -45,8 +44,9 @@ class CryoBoostBackend:
 
     def registry_for(self, project_path: Path) -> TiltSeriesRegistry:
         """TiltSeriesRegistry for a project. Lazily loaded from sidecar JSON
-        at `{project_path}/registry/`. Empty for legacy projects without a
-        registry on disk — populate via project_service on import/load."""
+        at `{project_path}/registry/`: index.json up front, each TS sidecar
+        on first access. Empty for legacy projects without a registry on
+        disk — populate via project_service on import/load."""
         return get_registry_for(project_path)
 
     async def start_pipeline(
@@ -92,7 +92,7 @@ class CryoBoostBackend:
         # Save state so the driver can read it
         job_model.execution_status = JobStatus.RUNNING
         state.mark_dirty()
-        await self.state_service.save_project(project_path=project_path, force=True)
+        await self.state_service.save_project(project_path=project_path, force=True, durable=True)
 
         # Build driver command
         python_exe = self.server_dir / "venv" / "bin" / "python3"
@@ -199,111 +199,105 @@ class CryoBoostBackend:
             return []
 
         try:
-            for item in path.iterdir():
-                if not item.is_dir():
-                    continue
-                params_file = item / "project_params.json"
-                if not params_file.exists():
-                    if not item.name.startswith("."):
-                        logger.info("Skipped '%s' - missing project_params.json", item.name)
-                    continue
-                try:
-                    stats = params_file.stat()
-                    mod_time = datetime.fromtimestamp(stats.st_mtime)
-
-                    created_at = None
-                    created_ts = None
-                    creator = None
-                    pipeline_active = False
-                    total_jobs_planned = 0
-                    ts_count = 0
-                    mnemonic = ""
-                    source_directory = ""
-                    try:
-                        with open(params_file) as f:
-                            data = json.load(f)
-                        raw_created = data.get("created_at")
-                        if raw_created:
-                            created_at = str(raw_created)[:16]
-                            try:
-                                created_ts = datetime.fromisoformat(str(raw_created)).timestamp()
-                            except Exception:
-                                created_ts = None
-                        creator = data.get("created_by")
-                        pipeline_active = bool(data.get("pipeline_active", False))
-                        jobs_dict = data.get("jobs") or {}
-                        total_jobs_planned = len(jobs_dict)
-                        ts_count = (
-                            data.get("import_selected_tilt_series")
-                            or data.get("import_total_tilt_series")
-                            or 0
-                        )
-                        mnemonic = data.get("mnemonic") or ""
-                        # Where the raw data came from. Prefer the resolved
-                        # frames dir; fall back to the movies glob's parent.
-                        source_directory = data.get("import_source_directory") or ""
-                        if not source_directory:
-                            mg = data.get("movies_glob") or ""
-                            if mg:
-                                source_directory = str(Path(mg).parent) if "*" in mg else mg
-                    except Exception:
-                        pass
-
-                    # Legacy projects (no `mnemonic` persisted) get a
-                    # deterministic fallback so the UI always has something
-                    # to show. Seed is the resolved project dir — stable
-                    # across reloads, independent of project_name renames.
-                    if not mnemonic:
-                        try:
-                            from services.project_nickname import nickname_for
+            from services.project_catalog import scan_project_catalog
 
-                            mnemonic = nickname_for(str(item.resolve()))
-                        except Exception:
-                            mnemonic = ""
-
-                    if creator is None:
-                        try:
-                            creator = pwd.getpwuid(stats.st_uid).pw_name
-                        except Exception:
-                            creator = None
+            catalog = scan_project_catalog(path)
+        except Exception as e:
+            logger.error("Error scanning projects: %s", e)
+            return []
 
-                    if created_ts is None:
-                        # Stable fallback: directory ctime (creation on most filesystems).
+        for entry in catalog:
+            item = entry.project_dir
+            try:
+                mod_time = datetime.fromtimestamp(entry.params_mtime)
+
+                created_at = None
+                created_ts = None
+                creator = None
+                pipeline_active = False
+                total_jobs_planned = 0
+                ts_count = 0
+                mnemonic = ""
+                source_directory = ""
+                jobs_dict: Dict[str, Any] = {}
+                data = entry.summary
+                if data is not None:
+                    raw_created = data.get("created_at")
+                    if raw_created:
+                        created_at = str(raw_created)[:16]
                         try:
-                            created_ts = item.stat().st_ctime
+                            created_ts = datetime.fromisoformat(str(raw_created)).timestamp()
                         except Exception:
-                            created_ts = stats.st_mtime
-
-                    derived = self._derive_live_status(item, jobs_dict)
-                    derived["pipeline_active_flag"] = pipeline_active
-
-                    last_activity_ts = max(stats.st_mtime, derived.get("last_activity_ts", 0.0))
-
-                    projects.append(
-                        {
-                            "name": item.name,
-                            "path": str(item),
-                            "mnemonic": mnemonic,
-                            "modified": mod_time.strftime("%Y-%m-%d %H:%M"),
-                            "modified_timestamp": stats.st_mtime,
-                            "created_at": created_at,
-                            "created_timestamp": created_ts,
-                            "creator": creator,
-                            "pipeline_active": pipeline_active,
-                            "total_jobs_planned": total_jobs_planned,
-                            "ts_count": ts_count,
-                            "source_directory": source_directory,
-                            "last_activity_ts": last_activity_ts,
-                            "last_activity": datetime.fromtimestamp(last_activity_ts).strftime("%Y-%m-%d %H:%M"),
-                            **derived,
-                        }
+                            created_ts = None
+                    creator = data.get("created_by")
+                    pipeline_active = bool(data.get("pipeline_active", False))
+                    jobs_dict = data.get("jobs") or {}
+                    total_jobs_planned = len(jobs_dict)
+                    ts_count = (
+                        data.get("import_selected_tilt_series")
+                        or data.get("import_total_tilt_series")
+                        or 0
                     )
-                except Exception as e:
-                    logger.info("Error reading %s: %s", item.name, e)
+                    mnemonic = data.get("mnemonic") or ""
+                    # Where the raw data came from. Prefer the resolved
+                    # frames dir; fall back to the movies glob's parent.
+                    source_directory = data.get("import_source_directory") or ""
+                    if not source_directory:
+                        mg = data.get("movies_glob") or ""
+                        if mg:
+                            source_directory = str(Path(mg).parent) if "*" in mg else mg
+
+                # Legacy projects (no `mnemonic` persisted) get a
+                # deterministic fallback so the UI always has something
+                # to show. Seed is the resolved project dir — stable
+                # across reloads, independent of project_name renames.
+                if not mnemonic:
+                    try:
+                        from services.project_nickname import nickname_for
 
-        except Exception as e:
-            logger.error("Error scanning projects: %s", e)
-            return []
+                        mnemonic = nickname_for(str(item.resolve()))
+                    except Exception:
+                        mnemonic = ""
+
+                if creator is None:
+                    try:
+                        creator = pwd.getpwuid(entry.params_uid).pw_name
+                    except Exception:
+                        creator = None
+
+                if created_ts is None:
+                    # Stable fallback: directory ctime (creation on most filesystems).
+                    try:
+                        created_ts = item.stat().st_ctime
+                    except Exception:
+                        created_ts = entry.params_mtime
+
+                derived = self._derive_live_status(item, jobs_dict)
+                derived["pipeline_active_flag"] = pipeline_active
+
+                last_activity_ts = max(entry.params_mtime, derived.get("last_activity_ts", 0.0))
+
+                projects.append(
+                    {
+                        "name": item.name,
+                        "path": str(item),
+                        "mnemonic": mnemonic,
+                        "modified": mod_time.strftime("%Y-%m-%d %H:%M"),
+                        "modified_timestamp": entry.params_mtime,
+                        "created_at": created_at,
+                        "created_timestamp": created_ts,
+                        "creator": creator,
+                        "pipeline_active": pipeline_active,
+                        "total_jobs_planned": total_jobs_planned,
+                        "ts_count": ts_count,
+                        "source_directory": source_directory,
+                        "last_activity_ts": last_activity_ts,
+                        "last_activity": datetime.fromtimestamp(last_activity_ts).strftime("%Y-%m-%d %H:%M"),
+                        **derived,
+                    }
+                )
+            except Exception as e:
+                logger.info("Error reading %s: %s", item.name, e)
 
         # Stable order: oldest-first by created_at (or ctime fallback). Newly
         # created projects always go to the end -- positions never shuffle on
@@ -456,13 +456,47 @@ def submit_array_sbatch(script_path: Path, cwd: Path) -> str:
     return out.split()[-1]
 
 
-def wait_for_array_completion(array_job_id: str, poll_secs: int = 30) -> None:
+# While .task_status/ still shows unsettled items, squeue is only consulted
+# every Nth poll as a backstop for tasks that die without writing a marker
+# (OOM kill, node failure). Keeps per-supervisor slurmctld RPCs low.
+SQUEUE_BACKSTOP_EVERY = 10
+
+
+def _all_items_settled(job_dir: Path) -> bool:
+    """True once every manifest item has a .ok/.fail/.skip marker."""
+    try:
+        items = read_manifest(job_dir).get("items") or []
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    status_dir = job_dir / STATUS_DIR_NAME
+    try:
+        settled = {
+            name.rsplit(".", 1)[0]
+            for name in os.listdir(status_dir)
+            if not name.startswith(".") and name.endswith((".ok", ".fail", ".skip"))
+        }
+    except FileNotFoundError:
+        return False
+    return set(items) <= settled
+
+
+def wait_for_array_completion(array_job_id: str, poll_secs: int = 30, job_dir: Optional[Path] = None) -> None:
     """
     Poll squeue until no array tasks remain.  squeue exits non-zero (or returns
     empty) once the array is no longer in the queue.
+
+    With job_dir, progress is tracked from .task_status/ (one directory
+    listing per poll) and squeue only runs once every item has settled, or
+    every SQUEUE_BACKSTOP_EVERY polls to catch tasks that died silently.
     """
     print(f"[ARRAY] Polling squeue for array job {array_job_id}...", flush=True)
+    polls = 0
     while True:
+        if job_dir is not None and polls % SQUEUE_BACKSTOP_EVERY != 0 and not _all_items_settled(job_dir):
+            polls += 1
+            time.sleep(poll_secs)
+            continue
+        polls += 1
         proc = subprocess.run(["squeue", "-j", str(array_job_id), "--noheader", "-h"], capture_output=True, text=True)
         if proc.returncode != 0 or not proc.stdout.strip():
             print(f"[ARRAY] Array job {array_job_id} no longer in queue", flush=True)
@@ -267,7 +267,7 @@ def run_supervisor_mode():
 
         if array_job_id is not None:
             install_cancel_handler(array_job_id, job_dir)
-            wait_for_array_completion(array_job_id, poll_secs=15)
+            wait_for_array_completion(array_job_id, poll_secs=15, job_dir=job_dir)
         else:
             print("[SUPERVISOR] No array submitted (all tomograms previously succeeded)", flush=True)
 
@@ -343,6 +343,7 @@ def run_supervisor_mode():
                 project_state=state,
                 instance_id=instance_id,
                 job_model=params,
+                use_processes=True,
             )
             print(
                 "[SUPERVISOR] Previews: "
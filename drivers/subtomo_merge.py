@@ -22,6 +22,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import starfile
 
@@ -201,10 +202,34 @@ def write_optimisation_set(path: Path, *, particles_star: Path, tomograms_star:
     path.write_text(txt)
 
 
-def _format_star_value(x: Any) -> str:
-    if pd.isna(x):
-        return ""
-    return str(x)
+# Rows formatted and written per chunk; bounds the transient string arrays
+# when merging millions of particles.
+STAR_WRITE_CHUNK_ROWS = 100_000
+
+
+def _format_star_column(values: np.ndarray) -> List[str]:
+    """Format one STAR column: `str()` of every value, "" for NaN.
+
+    `values` is one column of `DataFrame.to_numpy()`, i.e. already cast to
+    the frame's common dtype, which is what the old per-row `iterrows()`
+    writer formatted (an int column next to float columns comes out as
+    "1.0"). NumPy's str cast uses the same shortest-repr formatting as
+    `str(np.float64)`, so the output is byte-identical.
+    """
+    out = values.astype(str).tolist()
+    missing = pd.isna(values)
+    if missing.any():
+        for i in np.flatnonzero(missing):
+            out[i] = ""
+    return out
+
+
+def _write_star_rows(f, df: pd.DataFrame, sep: str) -> None:
+    """Write the data rows of a loop block, `sep`-joined, in chunks."""
+    for start in range(0, len(df), STAR_WRITE_CHUNK_ROWS):
+        values = df.iloc[start : start + STAR_WRITE_CHUNK_ROWS].to_numpy()
+        columns = [_format_star_column(values[:, j]) for j in range(values.shape[1])]
+        f.write("".join(sep.join(row) + "\n" for row in zip(*columns)))
 
 
 def _write_loop_block(f, block_name: str, df: pd.DataFrame) -> None:
@@ -213,9 +238,7 @@ def _write_loop_block(f, block_name: str, df: pd.DataFrame) -> None:
     f.write("loop_\n")
     for i, col in enumerate(df.columns, 1):
         f.write(f"_{col} #{i}\n")
-    for _, row in df.iterrows():
-        vals = [_format_star_value(row[c]) for c in df.columns]
-        f.write(" ".join(vals) + "\n")
+    _write_star_rows(f, df, " ")
     f.write("\n")
 
 
@@ -252,9 +275,7 @@ def _write_tomograms_star(out_path: Path, df: pd.DataFrame) -> None:
         f.write("loop_\n")
         for i, col in enumerate(df.columns, 1):
             f.write(f"_{col} #{i}\n")
-        for _, row in df.iterrows():
-            vals = [_format_star_value(row[c]) for c in df.columns]
-            f.write("\t".join(vals) + "\n")
+        _write_star_rows(f, df, "\t")
         f.write("\n")
 
 
@@ -256,7 +256,7 @@ def run_supervisor_mode():
 
         if array_job_id is not None:
             install_cancel_handler(array_job_id, job_dir)
-            wait_for_array_completion(array_job_id, poll_secs=30)
+            wait_for_array_completion(array_job_id, poll_secs=30, job_dir=job_dir)
         else:
             print("[SUPERVISOR] No array submitted (all tasks previously succeeded)", flush=True)
 
@@ -13,6 +13,8 @@ from fastapi.staticfiles import StaticFiles
 from nicegui import ui
 
 from backend import CryoBoostBackend
+from services.array_progress import get_array_progress_tracker
+from services.visualization.journey_table import get_journey_service
 import logging
 
 import sys
@@ -108,17 +110,22 @@ def setup_app():
     create_ui_router(backend)
 
     # Single server-side pipeline observer: runs sync_all_jobs centrally
-    # on a 3-s tick for every project with pipeline_active=True, and on
+    # on a per-project 3-15 s tick for every project with pipeline_active=True, and on
     # startup scans the configured project base for projects that were
     # mid-pipeline when uvicorn last died — re-deploys their remaining
     # jobs from a fresh scheme. See docs/architecture.md.
     @app.on_event("startup")
     async def _start_pipeline_monitor():
+        # Task-status events keep the shared array-progress tracker and the
+        # dashboards' journey tables fresh.
+        backend.pipeline_monitor.add_marker_listener(get_array_progress_tracker().on_marker)
+        backend.pipeline_monitor.add_marker_listener(get_journey_service().on_marker)
         await backend.pipeline_monitor.start()
 
     @app.on_event("shutdown")
     async def _stop_pipeline_monitor():
         await backend.pipeline_monitor.stop()
+        await backend.state_service.flush_all()
 
     storage_secret = os.environ.get("CRBOOST_STORAGE_SECRET", "crboost-change-me")
     # Default reconnect_timeout is 3s, which sets ping_interval=4s / ping_timeout=2s
@@ -8,13 +8,14 @@ candidates the merge panel can offer the user as one-click sources.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional
 
+from services.configs.starfile_service import StarfileService
 from services.models_base import JobType
+from services.project_catalog import scan_project_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,7 @@ class SubtomoCandidate:
     species_id: Optional[str] = None
     species_color: Optional[str] = None
     mnemonic: str = ""
-    has_filter: bool = False  # True if a curated particles_filtered.star exists
+    has_filter: bool = False  # True if the job has a curation (see picks_filter)
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -45,7 +46,7 @@ class TomoCuration:
 
     ts_name: str
     total: int  # picks in the original particles.star for this tomo
-    kept: Optional[int]  # picks in particles_filtered.star; None = no curation (all kept)
+    kept: Optional[int]  # picks kept by the curation; None = no curation (all kept)
     reviewed: bool  # user explicitly reviewed this TS in the curator
 
 
@@ -55,33 +56,18 @@ def _count_tomograms(job_dir: Path) -> Optional[int]:
     if not tomos.exists():
         return None
     try:
-        # starfile is already a hard dep of subtomo_merge; safe to import here.
-        import starfile
-
-        d = starfile.read(tomos, always_dict=True)
-        for v in d.values():
-            try:
-                cols = list(v.columns)
-            except AttributeError:
-                continue
-            if "rlnTomoName" in cols:
-                return int(len(v))
+        df = StarfileService().read_block(tomos, columns=["rlnTomoName"])
+        if df is not None:
+            return int(len(df))
     except Exception as e:
         logger.debug("tomogram count failed for %s: %s", tomos, e)
     return None
 
 
-def _scan_project(proj_dir: Path, seen_optsets: set) -> List[SubtomoCandidate]:
-    params_file = proj_dir / "project_params.json"
-    if not params_file.exists():
-        return []
-
-    try:
-        with open(params_file) as f:
-            data = json.load(f)
-    except Exception as e:
-        logger.debug("skip %s: cannot parse project_params.json: %s", proj_dir, e)
-        return []
+def _scan_project(proj_dir: Path, data: dict, seen_optsets: set) -> List[SubtomoCandidate]:
+    """Candidates of one project, from its catalog summary (see
+    services.project_catalog) rather than the full project_params.json."""
+    from services.visualization.picks_filter import has_filtered_set
 
     project_name = data.get("project_name") or proj_dir.name
     mnemonic = data.get("mnemonic") or ""
@@ -145,7 +131,7 @@ def _scan_project(proj_dir: Path, seen_optsets: set) -> List[SubtomoCandidate]:
                 species_id=species_id,
                 species_color=species_color,
                 mnemonic=mnemonic,
-                has_filter=(job_dir / "particles_filtered.star").exists(),
+                has_filter=has_filtered_set(job_dir),
             )
         )
     return out
@@ -168,12 +154,17 @@ def discover_subtomo_optimisation_sets(base_paths: Iterable[str]) -> List[Subtom
         if not base.is_dir():
             continue
         try:
-            proj_dirs = [p for p in base.iterdir() if p.is_dir() and not p.name.startswith(".")]
+            catalog = scan_project_catalog(base)
         except Exception as e:
             logger.debug("cannot list %s: %s", base, e)
             continue
-        for proj_dir in proj_dirs:
-            candidates.extend(_scan_project(proj_dir, seen))
+        for entry in catalog:
+            if entry.project_dir.name.startswith("."):
+                continue
+            if entry.summary is None:
+                logger.debug("skip %s: cannot parse project_params.json", entry.project_dir)
+                continue
+            candidates.extend(_scan_project(entry.project_dir, entry.summary, seen))
 
     candidates.sort(key=lambda c: (c.project_name.lower(), c.instance_id))
     return candidates
@@ -184,20 +175,13 @@ def _counts_by_tomo(star_path: Path) -> dict:
     if not star_path.exists():
         return {}
     try:
-        import starfile
-
-        d = starfile.read(star_path, always_dict=True)
+        df = StarfileService().read_block(star_path, columns=["rlnTomoName"])
     except Exception as e:
         logger.debug("count-by-tomo failed for %s: %s", star_path, e)
         return {}
-    for v in d.values():
-        try:
-            cols = list(v.columns)
-        except AttributeError:
-            continue
-        if "rlnTomoName" in cols:
-            return {str(k): int(n) for k, n in v["rlnTomoName"].astype(str).value_counts().items()}
-    return {}
+    if df is None:
+        return {}
+    return {str(k): int(n) for k, n in df["rlnTomoName"].astype(str).value_counts().items()}
 
 
 def load_tomo_curation(job_dir: str) -> List[TomoCuration]:
@@ -207,32 +191,25 @@ def load_tomo_curation(job_dir: str) -> List[TomoCuration]:
     cross-project scan — reading every particles.star up front would not scale.
     Tomogram universe comes from tomograms.star so tomos with zero kept picks
     still appear; totals from the original particles.star, kept from the
-    curated `particles_filtered.star` (None when no curation exists)."""
+    curation journal, where uncurated tomos keep all their picks (None when
+    no curation exists)."""
     from services.visualization.picks_filter import read_reviewed_counts
 
     jd = Path(job_dir)
     totals = _counts_by_tomo(jd / "particles.star")
 
-    filtered_path = jd / "particles_filtered.star"
-    has_filter = filtered_path.exists()
-    kept_counts = _counts_by_tomo(filtered_path) if has_filter else {}
-    reviewed = set(read_reviewed_counts(jd).keys())
+    kept_counts = read_reviewed_counts(jd)
+    has_filter = bool(kept_counts)
+    reviewed = set(kept_counts)
 
     # Universe of tomo names: prefer tomograms.star, fall back to particles.
     tomo_names: List[str] = []
     tomos_star = jd / "tomograms.star"
     if tomos_star.exists():
         try:
-            import starfile
-
-            d = starfile.read(tomos_star, always_dict=True)
-            for v in d.values():
-                try:
-                    if "rlnTomoName" in list(v.columns):
-                        tomo_names = [str(x) for x in v["rlnTomoName"].tolist()]
-                        break
-                except AttributeError:
-                    continue
+            df = StarfileService().read_block(tomos_star, columns=["rlnTomoName"])
+            if df is not None:
+                tomo_names = [str(x) for x in df["rlnTomoName"].tolist()]
         except Exception as e:
             logger.debug("tomo list read failed for %s: %s", tomos_star, e)
     if not tomo_names:
@@ -244,7 +221,7 @@ def load_tomo_curation(job_dir: str) -> List[TomoCuration]:
             TomoCuration(
                 ts_name=tn,
                 total=int(totals.get(tn, 0)),
-                kept=(int(kept_counts.get(tn, 0)) if has_filter else None),
+                kept=(int(kept_counts.get(tn, totals.get(tn, 0))) if has_filter else None),
                 reviewed=tn in reviewed,
             )
         )
@@ -0,0 +1,274 @@
+"""
+Shared progress of SLURM array jobs, read from the supervisor's task tracker.
+
+An array job's supervisor writes, per job directory:
+
+    {job_dir}/.task_manifest.json        # {"items": [...]}
+    {job_dir}/.task_status/{item}.ok|fail|skip
+    {job_dir}/task_{idx}.out             # SLURM started task idx
+
+The pipeline roster, the per-job task tracker tab and the Journey dashboard
+of every open browser tab all want the same (done, failed, total) counts and
+per-item statuses, and used to list `.task_status/` themselves on every tick.
+`ArrayProgressTracker` keeps one entry per job directory: a refresh costs
+three `stat` calls, and a directory is only re-listed when its mtime moved
+(or was too recent to trust, see `_racy`).
+Entries are rechecked at most once per ARRAY_PROGRESS_RECHECK_SEC whatever
+the number of readers; marker events forwarded by the pipeline monitor make
+the next read recheck immediately and wake `wait_for_change` callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from services.scheduling_and_orchestration.marker_watcher import RACY_MTIME_WINDOW_SEC
+
+logger = logging.getLogger(__name__)
+
+TASK_MANIFEST = ".task_manifest.json"
+TASK_STATUS_DIR = ".task_status"
+
+ARRAY_PROGRESS_RECHECK_SEC = 2.0
+
+
+@dataclass(frozen=True)
+class ArrayProgress:
+    """One version of an array job's progress. `statuses` maps every manifest
+    item to ok / fail / skip / running / pending, as `scan_statuses` does."""
+
+    version: int
+    items: Tuple[str, ...]
+    statuses: Dict[str, str]
+    done: int
+    failed: int
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def counts(self) -> Tuple[int, int, int]:
+        """(n_done, n_failed, n_total); done includes failed."""
+        return self.done, self.failed, self.total
+
+
+def _sig(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _racy(sig: Optional[Tuple[int, int]], read_at: float) -> bool:
+    """True if a directory listed at `read_at` (wall clock) had an mtime too
+    close to it to trust: on coarse-mtime filesystems (Lustre: 1 s) a marker
+    created in the same tick leaves (mtime, size) unchanged. Such listings
+    are redone until they are older than RACY_MTIME_WINDOW_SEC, as
+    pipeline_runner does for the pipeline star and MarkerWatcher for
+    polled .task_status/ dirs."""
+    return sig is not None and read_at - sig[0] / 1e9 <= RACY_MTIME_WINDOW_SEC
+
+
+class _Entry:
+    def __init__(self, job_dir: Path):
+        self.job_dir = job_dir
+        self.lock = threading.Lock()
+        self.checked_at = float("-inf")
+        self.stale = True
+        self.manifest_sig: Optional[Tuple[int, int]] = None
+        self.items: Tuple[str, ...] = ()
+        self.status_sig: Optional[Tuple[int, int]] = None
+        self.status_read_at = 0.0
+        self.markers: Dict[str, FrozenSet[str]] = {}
+        self.job_sig: Optional[Tuple[int, int]] = None
+        self.job_read_at = 0.0
+        self.started: FrozenSet[int] = frozenset()
+        self.progress: Optional[ArrayProgress] = None
+        self.version = 0
+        self.waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+
+class ArrayProgressTracker:
+    """Process-wide cache of array-job progress keyed by job directory."""
+
+    def __init__(self):
+        self._entries: Dict[Path, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, job_dir: Path) -> _Entry:
+        job_dir = Path(job_dir)
+        entry = self._entries.get(job_dir)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.setdefault(job_dir, _Entry(job_dir))
+        return entry
+
+    def get(self, job_dir: Path) -> Optional[ArrayProgress]:
+        """Current progress of the array job in `job_dir`; None while it has
+        no (non-empty, readable) task manifest."""
+        entry = self._entry(job_dir)
+        if entry.stale or time.monotonic() - entry.checked_at >= ARRAY_PROGRESS_RECHECK_SEC:
+            with entry.lock:
+                if entry.stale or time.monotonic() - entry.checked_at >= ARRAY_PROGRESS_RECHECK_SEC:
+                    self._refresh(entry)
+        return entry.progress
+
+    def invalidate(self, job_dir: Path) -> None:
+        """Recheck `job_dir` on its next read and wake its waiters."""
+        entry = self._entries.get(Path(job_dir))
+        if entry is not None:
+            entry.stale = True
+            self._wake(entry)
+
+    def on_marker(self, project_path: Path, directory: Path, name: str) -> None:
+        """PipelineMonitor marker listener."""
+        directory = Path(directory)
+        self.invalidate(directory.parent if directory.name == TASK_STATUS_DIR else directory)
+
+    async def wait_for_change(self, job_dir: Path, version: int, timeout: float) -> Optional[ArrayProgress]:
+        """Wait until `job_dir`'s progress is no longer at `version` (0 for
+        "no progress yet"), or `timeout` seconds pass; return the progress
+        current at that point. Reads run off the event loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._entry(job_dir)
+        deadline = loop.time() + timeout
+        while True:
+            progress = await asyncio.to_thread(self.get, entry.job_dir)
+            remaining = deadline - loop.time()
+            if (progress.version if progress else 0) != version or remaining <= 0:
+                return progress
+            fut = loop.create_future()
+            waiter = (loop, fut)
+            entry.waiters.append(waiter)
+            try:
+                # Capped so directories nobody raises events for are still
+                # rechecked at the shared cadence.
+                await asyncio.wait_for(fut, min(remaining, ARRAY_PROGRESS_RECHECK_SEC))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                try:
+                    entry.waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _wake(entry: _Entry) -> None:
+        for loop, fut in list(entry.waiters):
+            loop.call_soon_threadsafe(lambda f=fut: f.done() or f.set_result(None))
+
+    def _refresh(self, entry: _Entry) -> None:
+        entry.stale = False
+        entry.checked_at = time.monotonic()
+        job_dir = entry.job_dir
+        changed = False
+
+        manifest_sig = _sig(job_dir / TASK_MANIFEST)
+        if manifest_sig != entry.manifest_sig:
+            entry.manifest_sig = manifest_sig
+            items: Tuple[str, ...] = ()
+            if manifest_sig is not None:
+                try:
+                    items = tuple((json.loads((job_dir / TASK_MANIFEST).read_text()) or {}).get("items") or ())
+                except Exception as e:
+                    logger.debug("Unreadable task manifest in %s: %s", job_dir, e)
+            entry.items = items
+            changed = True
+
+        now = time.time()
+        status_sig = _sig(job_dir / TASK_STATUS_DIR)
+        if status_sig != entry.status_sig or _racy(status_sig, entry.status_read_at):
+            entry.status_sig = status_sig
+            entry.status_read_at = now
+            markers: Dict[str, set] = {".ok": set(), ".fail": set(), ".skip": set()}
+            if status_sig is not None:
+                try:
+                    for name in os.listdir(job_dir / TASK_STATUS_DIR):
+                        stem, suffix = os.path.splitext(name)
+                        if suffix in markers:
+                            markers[suffix].add(stem)
+                except OSError as e:
+                    logger.debug("Cannot list %s/%s: %s", job_dir, TASK_STATUS_DIR, e)
+            entry.markers = {k: frozenset(v) for k, v in markers.items()}
+            changed = True
+
+        # task_{idx}.out appearing (SLURM started the task) moves the job
+        # dir's mtime; one listing replaces a stat per pending item.
+        job_sig = _sig(job_dir)
+        if job_sig != entry.job_sig or _racy(job_sig, entry.job_read_at):
+            entry.job_sig = job_sig
+            entry.job_read_at = now
+            started = set()
+            if job_sig is not None:
+                try:
+                    for name in os.listdir(job_dir):
+                        if name.startswith("task_") and name.endswith(".out") and name[5:-4].isdigit():
+                            started.add(int(name[5:-4]))
+                except OSError as e:
+                    logger.debug("Cannot list %s: %s", job_dir, e)
+            entry.started = frozenset(started)
+            changed = True
+
+        if not changed and entry.progress is not None:
+            return
+        progress = self._build(entry)
+        old = entry.progress
+        if progress is None:
+            if old is not None:
+                entry.progress = None
+                self._wake(entry)
+            return
+        if old is not None and (old.items, old.statuses, old.done, old.failed) == (
+            progress.items,
+            progress.statuses,
+            progress.done,
+            progress.failed,
+        ):
+            return
+        entry.version += 1
+        entry.progress = ArrayProgress(entry.version, progress.items, progress.statuses, progress.done, progress.failed)
+        self._wake(entry)
+
+    @staticmethod
+    def _build(entry: _Entry) -> Optional[ArrayProgress]:
+        if not entry.items:
+            return None
+        ok = entry.markers.get(".ok", frozenset())
+        fail = entry.markers.get(".fail", frozenset())
+        skip = entry.markers.get(".skip", frozenset())
+        statuses: Dict[str, str] = {}
+        for idx, name in enumerate(entry.items):
+            if name in ok:
+                statuses[name] = "ok"
+            elif name in fail:
+                statuses[name] = "fail"
+            elif name in skip:
+                statuses[name] = "skip"
+            elif idx in entry.started:
+                statuses[name] = "running"
+            else:
+                statuses[name] = "pending"
+        # Counted over the marker files, like the roster always has.
+        return ArrayProgress(0, entry.items, statuses, len(ok) + len(fail), len(fail))
+
+
+_tracker: Optional[ArrayProgressTracker] = None
+
+
+def get_array_progress_tracker() -> ArrayProgressTracker:
+    global _tracker
+    if _tracker is None:
+        _tracker = ArrayProgressTracker()
+    return _tracker
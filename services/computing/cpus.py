@@ -0,0 +1,11 @@
+# services/computing/cpus.py
+import os
+
+
+def usable_cpus() -> int:
+    """CPUs this process may run on: the affinity mask (the SLURM cpuset
+    when running inside a supervisor), falling back to os.cpu_count()."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
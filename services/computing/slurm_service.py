@@ -1,11 +1,12 @@
 # services/slurm_service.py
 import asyncio
 import logging
+import time
 from enum import Enum
 from pathlib import Path
 import re
 from typing import ClassVar, Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -121,6 +122,72 @@ class UserJob:
     stdout_path: str = ""  # %o -- path to stdout file, contains job dir
 
 
+# A snapshot younger than this is handed out even to force_refresh callers.
+# Sits just under PipelineMonitor's 3 s tick so every project reconciled in
+# one tick shares a single squeue call, while the next tick always sees a
+# fresh one.
+SNAPSHOT_MIN_INTERVAL_SEC = 2.5
+
+
+@dataclass
+class SqueueSnapshot:
+    """One `squeue -u <user>` result plus lookup indices built once per call.
+
+    by_stdout_dir is keyed on the *resolved* parent of each job's stdout
+    file (RELION puts run.out / task_N.out inside the job dir), by_work_dir
+    on the resolved submit directory as a fallback.
+    """
+
+    jobs: List[UserJob]
+    taken_at: float = 0.0  # time.monotonic()
+    by_job_id: Dict[str, UserJob] = field(default_factory=dict)
+    by_stdout_dir: Dict[str, List[UserJob]] = field(default_factory=dict)
+    by_work_dir: Dict[str, List[UserJob]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, jobs: List[UserJob]) -> "SqueueSnapshot":
+        snap = cls(jobs=jobs, taken_at=time.monotonic())
+        resolved_cache: Dict[str, str] = {}
+
+        def _resolve(p: str) -> Optional[str]:
+            if p not in resolved_cache:
+                try:
+                    resolved_cache[p] = str(Path(p).resolve())
+                except Exception as e:
+                    logger.info("Could not resolve %s: %s", p, e)
+                    resolved_cache[p] = ""
+            return resolved_cache[p] or None
+
+        for job in jobs:
+            snap.by_job_id[job.job_id] = job
+            if job.stdout_path:
+                # Resolve the directory rather than the file: every task of an
+                # array shares it, so one realpath covers the whole array.
+                stdout_dir = _resolve(str(Path(job.stdout_path).parent))
+                if stdout_dir:
+                    snap.by_stdout_dir.setdefault(stdout_dir, []).append(job)
+            if job.work_dir:
+                work_dir = _resolve(job.work_dir)
+                if work_dir:
+                    snap.by_work_dir.setdefault(work_dir, []).append(job)
+        return snap
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.taken_at
+
+    def jobs_for_directory(self, job_dir: Path) -> List[UserJob]:
+        """Jobs whose stdout lives in `job_dir`, falling back to a work_dir
+        match for jobs that cd'd into it. Order follows squeue output."""
+        target = str(job_dir.resolve())
+        matches = list(self.by_stdout_dir.get(target, []))
+        seen = {j.job_id for j in matches}
+        for job in self.by_work_dir.get(target, []):
+            if job.job_id not in seen:
+                matches.append(job)
+        return matches
+
+
 def normalize_slurm_ids(job_ids: List[str]) -> List[str]:
     """
     Deduplicate SLURM job IDs by normalizing array task IDs to their parent.
@@ -148,6 +215,11 @@ class SlurmService:
         self._cache = {}
         self._cache_timestamp = {}
         self._cache_ttl = 60
+        self._snapshot: Optional[SqueueSnapshot] = None
+        self._snapshot_inflight: Optional[asyncio.Future] = None
+        # Bumped whenever the snapshot is invalidated (scancel, clear_cache);
+        # a refresh started under an older generation is not cached.
+        self._snapshot_gen = 0
 
     async def _run_command(self, cmd: List[str]) -> tuple[bool, str, str]:
         try:
@@ -281,11 +353,51 @@ class SlurmService:
         self._cache_timestamp[cache_key] = datetime.now()
         return nodes
 
-    async def get_user_jobs(self, force_refresh: bool = False) -> List[UserJob]:
-        cache_key = "user_jobs"
-        if not force_refresh and self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
+    async def get_squeue_snapshot(self, max_age: Optional[float] = None) -> SqueueSnapshot:
+        """Return a squeue snapshot no older than `max_age` seconds.
 
+        Single-flight: if a refresh is already running, callers await that
+        one instead of spawning their own squeue, so N projects reconciled
+        concurrently still cost one slurmctld RPC. A failed squeue yields an
+        empty snapshot that is not cached.
+        """
+        if max_age is None:
+            max_age = SNAPSHOT_MIN_INTERVAL_SEC
+        snap = self._snapshot
+        if snap is not None and snap.age < max_age:
+            return snap
+
+        inflight = self._snapshot_inflight
+        if inflight is None or inflight.done():
+            inflight = asyncio.ensure_future(self._refresh_snapshot())
+            self._snapshot_inflight = inflight
+        # shield: one cancelled waiter must not kill the refresh for the rest
+        return await asyncio.shield(inflight)
+
+    async def _refresh_snapshot(self) -> SqueueSnapshot:
+        gen = self._snapshot_gen
+        try:
+            jobs = await self._query_user_jobs()
+        finally:
+            if gen == self._snapshot_gen:
+                self._snapshot_inflight = None
+        if jobs is None:
+            return SqueueSnapshot.build([])
+        snap = SqueueSnapshot.build(jobs)
+        if gen == self._snapshot_gen:
+            # Taken before an invalidation otherwise: its waiters get it, but
+            # it must not be served to anyone asking afterwards.
+            self._snapshot = snap
+        return snap
+
+    def _invalidate_snapshot(self) -> None:
+        """Drop the cached snapshot and detach any refresh in flight, so the
+        next caller runs a fresh squeue."""
+        self._snapshot_gen += 1
+        self._snapshot = None
+        self._snapshot_inflight = None
+
+    async def _query_user_jobs(self) -> Optional[List[UserJob]]:
         logger.debug("Fetching jobs for user: %s", self.username)
 
         # %o = stdout file path -- parent dir is the job directory (e.g. External/job002)
@@ -298,7 +410,7 @@ class SlurmService:
 
         if not success:
             logger.error("Failed to get user jobs: %s", stderr)
-            return []
+            return None
 
         jobs = []
         for line in stdout.strip().split("\n"):
@@ -329,39 +441,27 @@ class SlurmService:
             jobs.append(job)
 
         logger.debug("Total jobs found: %d", len(jobs))
-        self._cache[cache_key] = jobs
-        self._cache_timestamp[cache_key] = datetime.now()
         return jobs
 
+    async def get_user_jobs(self, force_refresh: bool = False) -> List[UserJob]:
+        """force_refresh=True still reuses a snapshot taken within the last
+        SNAPSHOT_MIN_INTERVAL_SEC; otherwise anything within the cache TTL."""
+        max_age = SNAPSHOT_MIN_INTERVAL_SEC if force_refresh else self._cache_ttl
+        snap = await self.get_squeue_snapshot(max_age=max_age)
+        return snap.jobs
+
     async def find_slurm_job_for_directory(self, job_dir: Path) -> Optional[UserJob]:
         """
         Find the SLURM job whose stdout file lives inside the given job directory.
         RELION sets --output=<job_dir>/run.out, so parent of stdout_path == job_dir.
         Falls back to work_dir match for safety.
         """
-        jobs = await self.get_user_jobs(force_refresh=True)
-        target = job_dir.resolve()
-
-        for job in jobs:
-            # Primary: match via stdout file parent directory
-            if job.stdout_path:
-                try:
-                    if Path(job.stdout_path).resolve().parent == target:
-                        logger.info("Matched job %s via stdout path: %s", job.job_id, job.stdout_path)
-                        return job
-                except Exception as e:
-                    logger.info("Error resolving stdout path for job %s: %s", job.job_id, e)
-
-            # Fallback: work_dir match (only works if the job cd'd to job_dir)
-            if job.work_dir:
-                try:
-                    if Path(job.work_dir).resolve() == target:
-                        logger.info("Matched job %s via work_dir: %s", job.job_id, job.work_dir)
-                        return job
-                except Exception as e:
-                    logger.info("Error resolving work_dir for job %s: %s", job.job_id, e)
-
-        logger.info("No SLURM job found for %s", target)
+        snap = await self.get_squeue_snapshot()
+        matches = snap.jobs_for_directory(job_dir)
+        if matches:
+            logger.info("Matched job %s for %s", matches[0].job_id, job_dir)
+            return matches[0]
+        logger.info("No SLURM job found for %s", job_dir)
         return None
 
     async def find_all_slurm_jobs_for_directory(self, job_dir: Path) -> List[UserJob]:
@@ -373,34 +473,17 @@ class SlurmService:
         inside the same directory.  Returns every match so the caller can collect
         all related IDs for a comprehensive scancel.
         """
-        jobs = await self.get_user_jobs(force_refresh=True)
-        target = job_dir.resolve()
-        matches: List[UserJob] = []
-
-        for job in jobs:
-            matched = False
-            if job.stdout_path:
-                try:
-                    if Path(job.stdout_path).resolve().parent == target:
-                        matched = True
-                except Exception:
-                    pass
-            if not matched and job.work_dir:
-                try:
-                    if Path(job.work_dir).resolve() == target:
-                        matched = True
-                except Exception:
-                    pass
-            if matched:
-                matches.append(job)
-
-        logger.info("Found %d SLURM job(s) for %s: %s", len(matches), target, [j.job_id for j in matches])
+        snap = await self.get_squeue_snapshot()
+        matches = snap.jobs_for_directory(job_dir)
+        logger.info("Found %d SLURM job(s) for %s: %s", len(matches), job_dir, [j.job_id for j in matches])
         return matches
 
     async def scancel_jobs(self, job_ids: List[str]) -> Dict[str, Any]:
         if not job_ids:
             return {"success": True, "cancelled": []}
         success, stdout, stderr = await self._run_command(["scancel"] + job_ids)
+        # Whatever we just cancelled is still in the snapshot; drop it.
+        self._invalidate_snapshot()
         if success:
             logger.info("Cancelled jobs: %s", job_ids)
             return {"success": True, "cancelled": job_ids}
@@ -472,6 +555,7 @@ class SlurmService:
     def clear_cache(self):
         self._cache.clear()
         self._cache_timestamp.clear()
+        self._invalidate_snapshot()
 
     async def get_user_slurm_jobs(self, force_refresh: bool = False) -> Dict[str, Any]:
         try:
@@ -11,9 +11,11 @@ import logging
 import os
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+from services.configs.mdoc_index import MDOC_PARSE_MAX_WORKERS
 from services.configs.mdoc_service import get_mdoc_service
 from services.dataset_models import AcquisitionSummary, DatasetOverview, StagePositionInfo, TiltInfo, TiltSeriesInfo
 
@@ -21,6 +23,40 @@ logger = logging.getLogger(__name__)
 
 MDOC_FILENAME_RE = re.compile(r"^Position_(\d+)(?:_(\d+))?\.mdoc$")
 
+FRAME_EXTENSIONS = (".eer", ".tiff", ".tif", ".mrc")
+
+
+class _FramesListing:
+    """One `os.scandir` of the frames directory, answering the per-tilt
+    existence checks and the extension sniff without further round trips."""
+
+    def __init__(self, frames_dir: Optional[Path]):
+        self.frames_dir = frames_dir
+        self.resolved_dir: Optional[Path] = None
+        self.names: Set[str] = set()
+        self.symlinks: Set[str] = set()
+        if not frames_dir:
+            return
+        try:
+            with os.scandir(frames_dir) as it:
+                for entry in it:
+                    self.names.add(entry.name)
+                    if entry.is_symlink():
+                        self.symlinks.add(entry.name)
+        except OSError:
+            return
+        self.resolved_dir = frames_dir.resolve()
+
+    def frame_path(self, name: str) -> Optional[Path]:
+        """Resolved path of `name` in the frames dir, or None if absent."""
+        if name not in self.names or self.resolved_dir is None:
+            return None
+        if name in self.symlinks:
+            # Dangling links didn't count as existing before either.
+            candidate = self.resolved_dir / name
+            return candidate.resolve() if candidate.exists() else None
+        return self.resolved_dir / name
+
 
 class DatasetParsingService:
     """Parses cryo-ET dataset directories into structured position/tilt-series hierarchy."""
@@ -53,56 +89,33 @@ class DatasetParsingService:
             )
 
         resolved_frames_dir = self._resolve_frames_directory(mdoc_paths, frames_dir)
-        frame_ext = self._detect_frame_extension(resolved_frames_dir)
-
-        warnings: List[str] = []
-        tilt_series_list: List[TiltSeriesInfo] = []
+        listing = _FramesListing(resolved_frames_dir)
+        frame_ext = self._detect_frame_extension(listing)
 
         total_mdocs = len(mdoc_paths)
         if progress_cb:
             progress_cb(0, total_mdocs)
 
-        for mdoc_idx, mdoc_path in enumerate(mdoc_paths):
-            parsed = self._parse_mdoc_filename(mdoc_path.name)
-            if parsed is None:
-                warnings.append(f"Skipped mdoc with unrecognized name: {mdoc_path.name}")
-                continue
-
-            stage_pos, beam_pos = parsed
-
-            try:
-                mdoc_data = self.mdoc_service.parse_mdoc_file(mdoc_path)
-            except Exception as e:
-                warnings.append(f"Failed to parse {mdoc_path.name}: {e}")
-                continue
-
-            tilts: List[TiltInfo] = []
-            for section in mdoc_data["data"]:
-                tilt = self._build_tilt_info(section, resolved_frames_dir)
-                if tilt is not None:
-                    tilts.append(tilt)
-
-            acq = self._extract_acquisition_params(mdoc_data)
-
-            ts = TiltSeriesInfo(
-                stage_position=stage_pos,
-                beam_position=beam_pos,
-                mdoc_filename=mdoc_path.name,
-                mdoc_path=mdoc_path,
-                tilts=tilts,
-                pixel_size=acq.get("pixel_size"),
-                voltage=acq.get("voltage"),
-                dose_per_tilt=acq.get("dose_per_tilt"),
-                tilt_axis=acq.get("tilt_axis"),
-            )
-            tilt_series_list.append(ts)
-
-            missing = ts.missing_frames
-            if missing > 0:
-                warnings.append(f"{ts.ts_label}: {missing}/{ts.tilt_count} frames not found")
+        # Fan the mdocs out over threads; progress is reported here on the
+        # calling thread as each one finishes, results are kept in mdoc order.
+        results: List[Tuple[Optional[TiltSeriesInfo], List[str]]] = [(None, [])] * total_mdocs
+        workers = max(1, min(MDOC_PARSE_MAX_WORKERS, total_mdocs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._parse_one_mdoc, mdoc_path, listing): idx
+                for idx, mdoc_path in enumerate(mdoc_paths)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress_cb:
+                    progress_cb(done, total_mdocs)
 
-            if progress_cb:
-                progress_cb(mdoc_idx + 1, total_mdocs)
+        warnings: List[str] = []
+        tilt_series_list: List[TiltSeriesInfo] = []
+        for ts, ts_warnings in results:
+            warnings.extend(ts_warnings)
+            if ts is not None:
+                tilt_series_list.append(ts)
 
         positions = self._aggregate_to_positions(tilt_series_list)
         acq_summary = self._build_acquisition_summary(tilt_series_list)
@@ -115,6 +128,47 @@ class DatasetParsingService:
             acquisition_summary=acq_summary,
         )
 
+    def _parse_one_mdoc(
+        self, mdoc_path: Path, listing: _FramesListing
+    ) -> Tuple[Optional[TiltSeriesInfo], List[str]]:
+        """Parse one mdoc into a TiltSeriesInfo plus its warnings."""
+        parsed = self._parse_mdoc_filename(mdoc_path.name)
+        if parsed is None:
+            return None, [f"Skipped mdoc with unrecognized name: {mdoc_path.name}"]
+
+        stage_pos, beam_pos = parsed
+
+        try:
+            mdoc_data = self.mdoc_service.parse_mdoc_file_cached(mdoc_path)
+        except Exception as e:
+            return None, [f"Failed to parse {mdoc_path.name}: {e}"]
+
+        tilts: List[TiltInfo] = []
+        for section in mdoc_data["data"]:
+            tilt = self._build_tilt_info(section, listing)
+            if tilt is not None:
+                tilts.append(tilt)
+
+        acq = self._extract_acquisition_params(mdoc_data)
+
+        ts = TiltSeriesInfo(
+            stage_position=stage_pos,
+            beam_position=beam_pos,
+            mdoc_filename=mdoc_path.name,
+            mdoc_path=mdoc_path,
+            tilts=tilts,
+            pixel_size=acq.get("pixel_size"),
+            voltage=acq.get("voltage"),
+            dose_per_tilt=acq.get("dose_per_tilt"),
+            tilt_axis=acq.get("tilt_axis"),
+        )
+
+        warnings: List[str] = []
+        missing = ts.missing_frames
+        if missing > 0:
+            warnings.append(f"{ts.ts_label}: {missing}/{ts.tilt_count} frames not found")
+        return ts, warnings
+
     def _parse_mdoc_filename(self, mdoc_name: str) -> Optional[Tuple[int, int]]:
         """
         Extract (stage_position, beam_position) from mdoc filename.
@@ -153,7 +207,7 @@ class DatasetParsingService:
         # Try to infer from first mdoc's SubFramePath
         if mdoc_files:
             try:
-                mdoc_data = self.mdoc_service.parse_mdoc_file(mdoc_files[0])
+                mdoc_data = self.mdoc_service.parse_mdoc_file_cached(mdoc_files[0])
                 for section in mdoc_data["data"]:
                     sub = section.get("SubFramePath", "")
                     if not sub:
@@ -173,15 +227,14 @@ class DatasetParsingService:
 
         return None
 
-    def _detect_frame_extension(self, frames_dir: Optional[Path]) -> str:
-        if not frames_dir or not frames_dir.exists():
-            return ""
-        for ext in [".eer", ".tiff", ".tif", ".mrc"]:
-            if any(frames_dir.glob(f"*{ext}")):
+    def _detect_frame_extension(self, listing: _FramesListing) -> str:
+        for ext in FRAME_EXTENSIONS:
+            # Hidden files excluded, as `Path.glob("*ext")` did.
+            if any(name.endswith(ext) and not name.startswith(".") for name in listing.names):
                 return ext
         return ""
 
-    def _build_tilt_info(self, section: Dict, frames_dir: Optional[Path]) -> Optional[TiltInfo]:
+    def _build_tilt_info(self, section: Dict, listing: _FramesListing) -> Optional[TiltInfo]:
         """Build a TiltInfo from a parsed mdoc ZValue section."""
         z_value_str = section.get("ZValue")
         if z_value_str is None:
@@ -207,11 +260,7 @@ class DatasetParsingService:
         frame_filename = Path(sub_frame_path.replace("\\", "/")).name
 
         # Resolve the actual file path
-        frame_path = None
-        if frames_dir:
-            candidate = frames_dir / frame_filename
-            if candidate.exists():
-                frame_path = candidate.resolve()
+        frame_path = listing.frame_path(frame_filename)
 
         # Extract numeric MDOC stats for per-tilt metadata registry
         mdoc_stats: Dict[str, float] = {}
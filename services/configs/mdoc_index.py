@@ -0,0 +1,165 @@
+# services/configs/mdoc_index.py
+"""
+Shared index of parsed mdoc files.
+
+Parameter autodetection, the import panel's dataset overview, the project
+data import and the tilt-series registry build all read the same mdocs.
+They go through this index, so each file is parsed once per (mtime, size)
+for the lifetime of the server process instead of once per consumer.
+
+Per file the tilts are stored column-wise (one list per mdoc key, aligned
+with the ZValue sections) rather than as a dict per section; section dicts
+are rebuilt on demand and are private to the caller.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# mdoc reads are I/O-bound (network storage), so this is deliberately above
+# the CPU count.
+MDOC_PARSE_MAX_WORKERS = 16
+
+
+class MdocEntry:
+    """One parsed mdoc: header lines plus a columnar per-tilt table."""
+
+    def __init__(
+        self,
+        path: Path,
+        header_lines: List[str],
+        columns: Dict[str, List[Optional[str]]],
+        layouts: List[Tuple[str, ...]],
+    ):
+        self.path = path
+        self.header_lines = header_lines
+        # key -> value per tilt (None where that section lacks the key)
+        self.columns = columns
+        # Per-section key order, so rebuilt sections (and mdocs written back
+        # from them) keep the original line order. Sections normally share
+        # one layout tuple.
+        self.layouts = layouts
+        self._header_kv: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_parsed(cls, path: Path, parsed: Dict) -> "MdocEntry":
+        """Build from `MdocService.parse_mdoc_file` output."""
+        sections = parsed.get("data", [])
+        columns: Dict[str, List[Optional[str]]] = {}
+        layouts: List[Tuple[str, ...]] = []
+        seen_layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        for i, section in enumerate(sections):
+            layout = tuple(section)
+            layouts.append(seen_layouts.setdefault(layout, layout))
+            for key, value in section.items():
+                col = columns.get(key)
+                if col is None:
+                    col = columns[key] = [None] * len(sections)
+                col[i] = value
+        header = parsed.get("header", "")
+        return cls(Path(path), header.split("\n") if header else [], columns, layouts)
+
+    @property
+    def n_tilts(self) -> int:
+        return len(self.layouts)
+
+    @property
+    def header_text(self) -> str:
+        return "\n".join(self.header_lines)
+
+    def header_kv(self) -> Dict[str, str]:
+        """`key = value` lines of the header (before the first ZValue)."""
+        if self._header_kv is None:
+            kv: Dict[str, str] = {}
+            for line in self.header_lines:
+                if "=" in line:
+                    k, v = line.split("=", 1)
+                    kv[k.strip()] = v.strip()
+            self._header_kv = kv
+        return self._header_kv
+
+    def section(self, i: int) -> Dict[str, str]:
+        """ZValue section `i` as a fresh dict (safe to mutate)."""
+        return {key: self.columns[key][i] for key in self.layouts[i]}
+
+    def sections(self) -> List[Dict[str, str]]:
+        return [self.section(i) for i in range(self.n_tilts)]
+
+    def as_parsed(self) -> Dict:
+        """Fresh `parse_mdoc_file`-shaped dict: {"header": str, "data": [section, ...]}."""
+        return {"header": self.header_text, "data": self.sections()}
+
+    def column(self, key: str) -> List[Optional[str]]:
+        return self.columns.get(key) or [None] * self.n_tilts
+
+    def floats(self, key: str) -> np.ndarray:
+        """Column `key` as float64; NaN where missing or not a number."""
+        out = np.full(self.n_tilts, np.nan)
+        for i, v in enumerate(self.column(key)):
+            if v is None:
+                continue
+            try:
+                out[i] = float(v)
+            except ValueError:
+                pass
+        return out
+
+
+class MdocIndex:
+    """Process-wide cache of `MdocEntry` keyed by absolute path and
+    validated against the file's (mtime, size) on every lookup."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], MdocEntry]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, mdoc_path: Union[str, Path]) -> MdocEntry:
+        """Parsed entry for `mdoc_path`; raises OSError if it can't be read."""
+        from services.configs.mdoc_service import get_mdoc_service
+
+        st = os.stat(mdoc_path)
+        key = os.path.abspath(mdoc_path)
+        sig = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            hit = self._entries.get(key)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        entry = MdocEntry.from_parsed(Path(mdoc_path), get_mdoc_service().parse_mdoc_file(Path(mdoc_path)))
+        with self._lock:
+            self._entries[key] = (sig, entry)
+        return entry
+
+    def get_many(
+        self, mdoc_paths: Iterable[Union[str, Path]], max_workers: int = MDOC_PARSE_MAX_WORKERS
+    ) -> List[Tuple[Optional[MdocEntry], Optional[Exception]]]:
+        """`get` over many files on a thread pool; one (entry, error) pair
+        per path, in input order."""
+        paths = list(mdoc_paths)
+
+        def _one(p):
+            try:
+                return self.get(p), None
+            except Exception as e:
+                return None, e
+
+        if len(paths) <= 1:
+            return [_one(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+            return list(executor.map(_one, paths))
+
+
+_mdoc_index: Optional[MdocIndex] = None
+
+
+def get_mdoc_index() -> MdocIndex:
+    global _mdoc_index
+    if _mdoc_index is None:
+        _mdoc_index = MdocIndex()
+    return _mdoc_index
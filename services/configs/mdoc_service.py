@@ -6,6 +6,8 @@ import os
 from typing import Dict, Any, Optional
 from functools import lru_cache
 
+from services.configs.mdoc_index import get_mdoc_index
+
 logger = logging.getLogger(__name__)
 
 class MdocService:
@@ -29,27 +31,11 @@ class MdocService:
             return {}
 
         result = {}
-        header_data = {}
-        first_section = {}
-        in_zvalue_section = False
 
         try:
-            with open(mdoc_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    if line.startswith("[ZValue"):
-                        if in_zvalue_section:
-                            break  # First ZValue section is complete, stop here
-                        in_zvalue_section = True
-                    elif in_zvalue_section and "=" in line:
-                        key, value = [x.strip() for x in line.split("=", 1)]
-                        first_section[key] = value
-                    elif not in_zvalue_section and "=" in line:
-                        key, value = [x.strip() for x in line.split("=", 1)]
-                        header_data[key] = value
+            entry = get_mdoc_index().get(mdoc_path)
+            header_data = entry.header_kv()
+            first_section = entry.section(0) if entry.n_tilts else {}
 
             if "SerialEM" in header_data.get("", ""):
                 result["acquisition_software"] = "SerialEM"
@@ -140,35 +126,31 @@ class MdocService:
         dose_rates = set()
         tilt_angles = []
 
-        for mdoc_file in mdoc_files:
-            if not os.path.isfile(mdoc_file): continue
-            
-            mdoc_path = Path(mdoc_file)
+        mdoc_paths = [Path(p) for p in mdoc_files if os.path.isfile(p)]
+        for mdoc_path, (entry, error) in zip(mdoc_paths, get_mdoc_index().get_many(mdoc_paths)):
+            if error is not None:
+                logger.warning("Failed to parse %s: %s", mdoc_path, error)
+                continue
             try:
-                parsed = self.parse_mdoc_file(mdoc_path)
-                data_sections = parsed["data"]
-                
-                if data_sections:
+                if entry.n_tilts:
                     # Extract parameters from first section of each file
-                    first_section = data_sections[0]
-                    
+                    first_section = entry.section(0)
+
                     if "PixelSpacing" in first_section:
                         pixel_sizes.add(float(first_section["PixelSpacing"]))
                     if "Voltage" in first_section:
                         voltages.add(float(first_section["Voltage"]))
                     if "ExposureDose" in first_section:
                         dose_rates.add(float(first_section["ExposureDose"]))
-                    
+
                     # Collect all tilt angles
-                    for section in data_sections:
-                        if "TiltAngle" in section:
-                            tilt_angles.append(float(section["TiltAngle"]))
-                    
-                    result["total_tilts"] += len(data_sections)
+                    tilt_angles.extend(float(v) for v in entry.column("TiltAngle") if v is not None)
+
+                    result["total_tilts"] += entry.n_tilts
                     result["mdoc_files"].append(mdoc_path.name)
-                    
+
             except Exception as e:
-                logger.warning("Failed to parse %s: %s", mdoc_file, e)
+                logger.warning("Failed to parse %s: %s", mdoc_path, e)
                 continue
 
         result["tilt_series_count"] = len(result["mdoc_files"])
@@ -223,6 +205,14 @@ class MdocService:
 
         return {"header": "\n".join(header_lines), "data": data_sections}
 
+    def parse_mdoc_file_cached(self, mdoc_path: Path) -> Dict[str, Any]:
+        """
+        `parse_mdoc_file` served from the shared mdoc index: the file is only
+        re-read when its (mtime, size) changes. The returned dict is a fresh
+        copy, so callers may mutate it (e.g. before `write_mdoc_file`).
+        """
+        return get_mdoc_index().get(mdoc_path).as_parsed()
+
     def write_mdoc_file(self, mdoc_data: Dict[str, Any], output_path: Path):
         """
         Writes a parsed mdoc data structure back to a file.
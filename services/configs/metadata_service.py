@@ -5,149 +5,267 @@ Bridges the gap between fsMotionAndCtf output and downstream jobs.
 """
 
 import glob
+import json
 import logging
 import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import xml.etree.ElementTree as ET
 import numpy as np
 import pandas as pd
+from services.computing.cpus import usable_cpus
 from services.configs.starfile_service import StarfileService
 from services.project_state import AlignmentMethod
+from services.tilt_series.tilt_table import write_tilt_table
 
 logger = logging.getLogger(__name__)
 
 
-class WarpXmlParser:
-    """Parses WarpTools XML files to extract CTF and processing metadata"""
+# Below this many uncached XMLs a process pool costs more than it saves.
+PARALLEL_PARSE_MIN_FILES = 64
+XML_PARSE_CACHE_VERSION = 1
+XML_PARSE_CACHE_FILENAME = ".xml_parse_cache.json"
 
-    def __init__(self, xml_pattern: str):
-        """
-        Args:
-            xml_pattern: Glob pattern for XML files (e.g., "warp_frameseries/*.xml")
-        """
-        self.data_df = pd.DataFrame()
-        self._parse_xml_files(xml_pattern)
+# In-process LRU memo: absolute xml path -> ((mtime_ns, size), rows). Survives
+# across WarpXmlParser instances, e.g. the per-TS loop in the tsCtf adapter.
+# Bounded so a long-lived server touching many projects does not keep every
+# XML it ever parsed; a miss just falls back to the on-disk parse cache.
+_XML_ROWS_MEMO_MAX = 4096
+_xml_rows_memo: "OrderedDict[str, Tuple[Tuple[int, int], List[dict]]]" = OrderedDict()
+_xml_rows_memo_lock = threading.Lock()
 
-    def _parse_xml_files(self, pattern: str):
-        """Parse all XML files matching the pattern"""
-        xml_files = glob.glob(pattern)
-        if not xml_files:
-            raise FileNotFoundError(f"No XML files found matching: {pattern}")
 
-        for xml_path in xml_files:
-            file_type = self._check_xml_type(xml_path)
-            if file_type == "fs":  # Frame series
-                df = self._parse_frame_series_xml(xml_path)
-            else:  # Tilt series
-                df = self._parse_tilt_series_xml(xml_path)
+def _parse_warp_xml(xml_path: str) -> List[dict]:
+    """Parse one WarpTools XML into plain row dicts.
 
-            self.data_df = pd.concat([self.data_df, df], ignore_index=True)
+    Module-level (not a method) so it pickles into ProcessPoolExecutor
+    workers. One ET.parse per file: the root tells us whether it is a
+    frame-series or a tilt-series XML.
+    """
+    root = ET.parse(xml_path).getroot()
+    if root.find("MoviePath") is None:
+        return _frame_series_rows(root, xml_path)
+    return _tilt_series_rows(root, xml_path)
 
-    @staticmethod
-    def _check_xml_type(xml_path: str) -> str:
-        """Check if XML is frame series or tilt series"""
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        return "fs" if root.find("MoviePath") is None else "ts"
-
-    def _parse_frame_series_xml(self, xml_path: str) -> pd.DataFrame:
-        """Parse frame series XML to extract CTF parameters"""
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        ctf  = root.find(".//CTF")
-
-        if ctf is None:
-            raise ValueError(f"No CTF data found in {xml_path}")
-
-        data = {
+
+def _frame_series_rows(root: ET.Element, xml_path: str) -> List[dict]:
+    """Frame series XML: one row of CTF parameters."""
+    ctf = root.find(".//CTF")
+
+    if ctf is None:
+        raise ValueError(f"No CTF data found in {xml_path}")
+
+    return [
+        {
             "cryoBoostKey": Path(xml_path).stem,  # Filename without .xml
             "folder": str(Path(xml_path).parent),
             "defocus_value": float(ctf.find(".//Param[@Name='Defocus']").get("Value")),
             "defocus_angle": float(ctf.find(".//Param[@Name='DefocusAngle']").get("Value")),
             "defocus_delta": float(ctf.find(".//Param[@Name='DefocusDelta']").get("Value")),
         }
+    ]
+
+
+def _tilt_series_rows(root: ET.Element, xml_path: str) -> List[dict]:
+    """Tilt series XML: one row of CTF parameters per fitted tilt.
+
+    <MoviePath> is the authoritative ordered list of tilts in the TS.
+    Each <GridCTF>/<GridCTFDefocusDelta>/<GridCTFDefocusAngle> <Node Z="k">
+    addresses into MoviePath by Z. Never slice [:num_entries] — when WarpTools
+    writes fewer grid nodes than MoviePath entries (CTF fit skipped/failed on
+    some tilts), that slice silently drops the tail of MoviePath and routes
+    results to the wrong tilts.
+    """
+    # Read handedness flag from root element.
+    # ts_defocus_hand --set_flip writes AreAnglesInverted="True" here.
+    # This maps to rlnTomoHand = -1 in the output STAR.
+    are_angles_inverted = root.get("AreAnglesInverted", "False").strip() == "True"
+
+    # MoviePath is authoritative for tilt ordering and identity.
+    movie_paths_all = []
+    for path in root.find("MoviePath").text.split("\n"):
+        if path.strip():
+            movie_name = os.path.basename(path).replace("_EER.eer", "")
+            movie_name = movie_name.replace(".tif", "")
+            movie_name = movie_name.replace(".eer", "")
+            movie_paths_all.append(movie_name)
+
+    def _read_grid(grid_name: str) -> dict:
+        grid = root.find(grid_name)
+        if grid is None:
+            raise ValueError(f"No <{grid_name}> element in {xml_path}")
+        return {int(n.get("Z")): float(n.get("Value")) for n in grid.findall("Node")}
+
+    ctf_by_z = _read_grid("GridCTF")
+    delta_by_z = _read_grid("GridCTFDefocusDelta")
+    angle_by_z = _read_grid("GridCTFDefocusAngle")
+
+    # The three grids MUST share an identical Z-set: they are parallel arrays
+    # keyed by Z. Divergence means per-tilt values would get joined across
+    # different tilts — the exact silent-corruption failure we forbid.
+    ctf_z = set(ctf_by_z)
+    if ctf_z != set(delta_by_z) or ctf_z != set(angle_by_z):
+        raise ValueError(
+            f"Grid Z-sets diverge in {xml_path}: "
+            f"GridCTF={sorted(ctf_z)}, Delta={sorted(delta_by_z)}, Angle={sorted(angle_by_z)}"
+        )
+
+    # Every Z must be a valid index into MoviePath. If WarpTools skipped CTF
+    # fitting on some tilts, those Z values are simply absent from the grids;
+    # the tilts_df merge will then report them as unresolved — that's correct,
+    # a missing CTF IS a problem and must be visible, not silently dropped.
+    out_of_range = sorted(z for z in ctf_z if z < 0 or z >= len(movie_paths_all))
+    if out_of_range:
+        raise ValueError(
+            f"GridCTF Z indices {out_of_range} out of range for "
+            f"{len(movie_paths_all)} MoviePath entries in {xml_path}"
+        )
+
+    missing = sorted(set(range(len(movie_paths_all))) - ctf_z)
+    if missing:
+        logger.warning(
+            "%s: %d of %d tilts have no CTF fit (Z=%s); those tilts will be reported "
+            "as unresolved at merge time.",
+            xml_path, len(missing), len(movie_paths_all), missing,
+        )
+
+    return [
+        {
+            "Z": z,
+            "defocus_value": ctf_by_z[z],
+            "defocus_delta": delta_by_z[z],
+            "defocus_angle": angle_by_z[z],
+            "cryoBoostKey": movie_paths_all[z],
+            "are_angles_inverted": are_angles_inverted,
+        }
+        for z in sorted(ctf_z)
+    ]
 
-        return pd.DataFrame([data])
 
-    def _parse_tilt_series_xml(self, xml_path: str) -> pd.DataFrame:
-        """Parse tilt series XML to extract per-tilt CTF parameters.
+class WarpXmlParser:
+    """Parses WarpTools XML files to extract CTF and processing metadata"""
 
-        <MoviePath> is the authoritative ordered list of tilts in the TS.
-        Each <GridCTF>/<GridCTFDefocusDelta>/<GridCTFDefocusAngle> <Node Z="k">
-        addresses into MoviePath by Z. Never slice [:num_entries] — when WarpTools
-        writes fewer grid nodes than MoviePath entries (CTF fit skipped/failed on
-        some tilts), that slice silently drops the tail of MoviePath and routes
-        results to the wrong tilts.
+    def __init__(self, xml_pattern: str, *, max_workers: Optional[int] = None, cache_path: Optional[Path] = None):
         """
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        # Read handedness flag from root element.
-        # ts_defocus_hand --set_flip writes AreAnglesInverted="True" here.
-        # This maps to rlnTomoHand = -1 in the output STAR.
-        are_angles_inverted = root.get("AreAnglesInverted", "False").strip() == "True"
-
-        # MoviePath is authoritative for tilt ordering and identity.
-        movie_paths_all = []
-        for path in root.find("MoviePath").text.split("\n"):
-            if path.strip():
-                movie_name = os.path.basename(path).replace("_EER.eer", "")
-                movie_name = movie_name.replace(".tif", "")
-                movie_name = movie_name.replace(".eer", "")
-                movie_paths_all.append(movie_name)
-
-        def _read_grid(grid_name: str) -> dict:
-            grid = root.find(grid_name)
-            if grid is None:
-                raise ValueError(f"No <{grid_name}> element in {xml_path}")
-            return {int(n.get("Z")): float(n.get("Value")) for n in grid.findall("Node")}
-
-        ctf_by_z = _read_grid("GridCTF")
-        delta_by_z = _read_grid("GridCTFDefocusDelta")
-        angle_by_z = _read_grid("GridCTFDefocusAngle")
-
-        # The three grids MUST share an identical Z-set: they are parallel arrays
-        # keyed by Z. Divergence means per-tilt values would get joined across
-        # different tilts — the exact silent-corruption failure we forbid.
-        ctf_z = set(ctf_by_z)
-        if ctf_z != set(delta_by_z) or ctf_z != set(angle_by_z):
-            raise ValueError(
-                f"Grid Z-sets diverge in {xml_path}: "
-                f"GridCTF={sorted(ctf_z)}, Delta={sorted(delta_by_z)}, Angle={sorted(angle_by_z)}"
-            )
+        Args:
+            xml_pattern: Glob pattern for XML files (e.g., "warp_frameseries/*.xml")
+            max_workers: Process-pool size for uncached files (default: usable CPUs)
+            cache_path: Optional JSON file persisting parsed rows across runs,
+                keyed by (path, mtime, size)
+        """
+        self.data_df = pd.DataFrame()
+        self._parse_xml_files(xml_pattern, max_workers=max_workers, cache_path=cache_path)
 
-        # Every Z must be a valid index into MoviePath. If WarpTools skipped CTF
-        # fitting on some tilts, those Z values are simply absent from the grids;
-        # the tilts_df merge will then report them as unresolved — that's correct,
-        # a missing CTF IS a problem and must be visible, not silently dropped.
-        out_of_range = sorted(z for z in ctf_z if z < 0 or z >= len(movie_paths_all))
-        if out_of_range:
-            raise ValueError(
-                f"GridCTF Z indices {out_of_range} out of range for "
-                f"{len(movie_paths_all)} MoviePath entries in {xml_path}"
-            )
+    def _parse_xml_files(self, pattern: str, max_workers: Optional[int] = None, cache_path: Optional[Path] = None):
+        """Parse all XML files matching the pattern"""
+        xml_files = glob.glob(pattern)
+        if not xml_files:
+            raise FileNotFoundError(f"No XML files found matching: {pattern}")
 
-        missing = sorted(set(range(len(movie_paths_all))) - ctf_z)
-        if missing:
-            logger.warning(
-                "%s: %d of %d tilts have no CTF fit (Z=%s); those tilts will be reported "
-                "as unresolved at merge time.",
-                xml_path, len(missing), len(movie_paths_all), missing,
-            )
+        rows_by_file = self.parse_files(xml_files, max_workers=max_workers, cache_path=cache_path)
+        rows = [row for xml_path in xml_files for row in rows_by_file[xml_path]]
+        self.data_df = pd.DataFrame(rows)
 
-        rows = [
-            {
-                "Z": z,
-                "defocus_value": ctf_by_z[z],
-                "defocus_delta": delta_by_z[z],
-                "defocus_angle": angle_by_z[z],
-                "cryoBoostKey": movie_paths_all[z],
-                "are_angles_inverted": are_angles_inverted,
-            }
-            for z in sorted(ctf_z)
-        ]
-        return pd.DataFrame(rows)
+    @staticmethod
+    def parse_files(
+        xml_files: Sequence[str], *, max_workers: Optional[int] = None, cache_path: Optional[Path] = None
+    ) -> Dict[str, List[dict]]:
+        """Parse each XML once and return its rows, keyed by the given path.
+
+        Unchanged files (same mtime + size) come from the in-process memo or
+        `cache_path`; the rest fan out over a process pool when there are
+        enough of them. Parse errors propagate, as with the serial parser.
+        """
+        persisted = _load_xml_cache(cache_path) if cache_path else {}
+        results: Dict[str, List[dict]] = {}
+        to_parse: List[str] = []
+        keys: Dict[str, Tuple[int, int]] = {}
+
+        for xml_path in xml_files:
+            st = os.stat(xml_path)
+            key = (st.st_mtime_ns, st.st_size)
+            keys[xml_path] = key
+            abs_path = os.path.abspath(xml_path)
+            with _xml_rows_memo_lock:
+                memo_hit = _xml_rows_memo.get(abs_path)
+                if memo_hit is not None:
+                    _xml_rows_memo.move_to_end(abs_path)
+            for hit in (memo_hit, persisted.get(abs_path)):
+                if hit is not None and tuple(hit[0]) == key:
+                    results[xml_path] = hit[1]
+                    break
+            else:
+                to_parse.append(xml_path)
+
+        if to_parse:
+            workers = min(max_workers or usable_cpus(), len(to_parse))
+            if workers > 1 and len(to_parse) >= PARALLEL_PARSE_MIN_FILES:
+                chunksize = max(1, len(to_parse) // (workers * 8))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parsed = list(executor.map(_parse_warp_xml, to_parse, chunksize=chunksize))
+            else:
+                parsed = [_parse_warp_xml(xml_path) for xml_path in to_parse]
+            for xml_path, rows in zip(to_parse, parsed):
+                results[xml_path] = rows
+
+        with _xml_rows_memo_lock:
+            for xml_path, rows in results.items():
+                abs_path = os.path.abspath(xml_path)
+                _xml_rows_memo[abs_path] = (keys[xml_path], rows)
+                _xml_rows_memo.move_to_end(abs_path)
+            while len(_xml_rows_memo) > _XML_ROWS_MEMO_MAX:
+                _xml_rows_memo.popitem(last=False)
+
+        logger.info(
+            "WarpXmlParser: %d XML(s), %d parsed, %d from cache", len(xml_files), len(to_parse),
+            len(xml_files) - len(to_parse),
+        )
+        if cache_path and to_parse:
+            persisted.update({os.path.abspath(p): (keys[p], results[p]) for p in xml_files})
+            _save_xml_cache(cache_path, persisted)
+        return results
+
+
+def _load_xml_cache(cache_path: Path) -> Dict[str, Tuple[Tuple[int, int], List[dict]]]:
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning("Ignoring unreadable XML parse cache %s: %s", cache_path, e)
+        return {}
+    if data.get("version") != XML_PARSE_CACHE_VERSION:
+        return {}
+    return {path: (tuple(key), rows) for path, (key, rows) in data.get("entries", {}).items()}
+
+
+def _save_xml_cache(cache_path: Path, entries: Dict[str, Tuple[Tuple[int, int], List[dict]]]) -> None:
+    cache_path = Path(cache_path)
+    payload = {
+        "version": XML_PARSE_CACHE_VERSION,
+        "entries": {path: [list(key), rows] for path, (key, rows) in entries.items()},
+    }
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(cache_path.parent), prefix=".tmp_", suffix=".json")
+    except OSError as e:
+        # The cache is an optimisation; a read-only job dir must not fail the step.
+        logger.warning("Could not write XML parse cache %s: %s", cache_path, e)
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, str(cache_path))
+    except OSError as e:
+        logger.warning("Could not write XML parse cache %s: %s", cache_path, e)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
 
 
 class MetadataTranslator:
@@ -220,7 +338,7 @@ class MetadataTranslator:
     ) -> Dict:
         try:
             xml_pattern = str(job_dir / warp_folder / "*.xml")
-            warp_data = WarpXmlParser(xml_pattern)
+            warp_data = WarpXmlParser(xml_pattern, cache_path=job_dir / warp_folder / XML_PARSE_CACHE_FILENAME)
             logger.info("Parsed %d XML files", len(warp_data.data_df))
 
             star_data = self.starfile_service.read(input_star_path)
@@ -543,97 +661,25 @@ class MetadataTranslator:
             tiltstack_root = job_dir / "warp_tiltseries" / "tiltstack"
             tomostar_dir = job_dir / "tomostar"
 
-            for _, ts_row in in_ts_df.iterrows():
-                ts_star_file_rel = ts_row["rlnTomoTiltSeriesStarFile"]
-                ts_id = Path(ts_star_file_rel).stem
-                # Strict identity: the rlnTomoName MUST equal the tilt_series_star filename stem.
-                # Per-TS STARs are created one-to-one, indexed by name. Divergence would mean
-                # upstream data has already been corrupted.
-                if str(ts_row["rlnTomoName"]) != ts_id:
-                    ts_failures[ts_id] = (
-                        f"rlnTomoName={ts_row['rlnTomoName']!r} does not equal "
-                        f"tilt_series filename stem={ts_id!r}"
+            # Each TS is independent (own STARs, own aln files), so the merge
+            # fans out over threads; results are collected in input order so
+            # the outputs are identical to a serial run.
+            ts_rows = [row for _, row in in_ts_df.iterrows()]
+            workers = min(usable_cpus(), max(1, len(ts_rows)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                merged = list(
+                    executor.map(
+                        lambda row: self._merge_ts_alignment(
+                            row, input_star_dir, tiltstack_root, tomostar_dir, alignment_method_enum, shift_angpix
+                        ),
+                        ts_rows,
                     )
-                    continue
-
-                ts_star_path_abs = (input_star_dir / ts_star_file_rel).resolve()
-                if not ts_star_path_abs.exists():
-                    ts_failures[ts_id] = f"input tilt_series STAR not found: {ts_star_path_abs}"
-                    continue
-
-                ts_data_in = self.starfile_service.read(ts_star_path_abs)
-                ts_tilts_df = next(iter(ts_data_in.values())).copy()
-
-                # Strict exact-name match. No glob, no prefix — tiltstack dir MUST exist with
-                # exactly this name or aggregation fails loud.
-                ts_tiltstack_dir = tiltstack_root / ts_id
-                if not ts_tiltstack_dir.is_dir():
-                    ts_failures[ts_id] = f"no tiltstack dir at {ts_tiltstack_dir}"
-                    continue
-
-                aln_data = None
-                if alignment_method_enum == AlignmentMethod.ARETOMO:
-                    aln_files = sorted(ts_tiltstack_dir.glob("*.st.aln"))
-                    if len(aln_files) > 1:
-                        ts_failures[ts_id] = f"expected 1 .st.aln file, found {len(aln_files)}: {aln_files}"
-                        continue
-                    if aln_files:
-                        aln_data = self._read_aretomo_aln_file(aln_files[0])
-                elif alignment_method_enum == AlignmentMethod.IMOD:
-                    xf_files = sorted(ts_tiltstack_dir.glob("*.xf"))
-                    tlt_files = sorted(ts_tiltstack_dir.glob("*.tlt"))
-                    if len(xf_files) > 1 or len(tlt_files) > 1:
-                        ts_failures[ts_id] = (
-                            f"expected 1 .xf and 1 .tlt, found {len(xf_files)} .xf / {len(tlt_files)} .tlt"
-                        )
-                        continue
-                    if xf_files and tlt_files:
-                        aln_data = self._read_imod_xf_tlt_files(xf_files[0], tlt_files[0])
-
-                if aln_data is None:
-                    ts_failures[ts_id] = f"alignment output files missing in {ts_tiltstack_dir}"
-                    continue
-
-                # Sort by tilt index
-                aln_data = aln_data[aln_data[:, 0].argsort()]
-                keys_rel = [Path(p).name for p in ts_tilts_df["rlnMicrographMovieName"]]
-
-                # Strict exact-name tomostar lookup — no id_base fallback.
-                tomostar_path = tomostar_dir / f"{ts_id}.tomostar"
-                if not tomostar_path.exists():
-                    ts_failures[ts_id] = f"tomostar not found at {tomostar_path}"
-                    continue
-
-                tomostar_data = self.starfile_service.read(tomostar_path)
-                tomostar_df = next(iter(tomostar_data.values()))
-
-                # Apply alignment
-                applied_count = 0
-                for index, tomo_row in tomostar_df.iterrows():
-                    if "wrpMovieName" not in tomo_row:
-                        continue
-
-                    movie_path = tomo_row["wrpMovieName"]
-                    key_base = Path(movie_path).stem
-
-                    matching_positions = [i for i, k in enumerate(keys_rel) if Path(k).stem == key_base]
-
-                    if matching_positions:
-                        pos = matching_positions[0]
-                        ts_tilts_df.at[pos, "rlnTomoXTilt"] = 0
-                        ts_tilts_df.at[pos, "rlnTomoYTilt"] = -1.0 * aln_data[index, 9]
-                        ts_tilts_df.at[pos, "rlnTomoZRot"] = aln_data[index, 1]
-                        ts_tilts_df.at[pos, "rlnTomoXShiftAngst"] = aln_data[index, 3] * shift_angpix
-                        ts_tilts_df.at[pos, "rlnTomoYShiftAngst"] = aln_data[index, 4] * shift_angpix
-                        applied_count += 1
+                )
 
-                if applied_count == 0:
-                    ts_failures[ts_id] = (
-                        "no movie names in the tomostar matched the per-TS input STAR — "
-                        "likely a cross-TS contamination of the staging dir"
-                    )
+            for ts_row, (ts_id, failure, ts_tilts_df) in zip(ts_rows, merged):
+                if failure is not None:
+                    ts_failures[ts_id] = failure
                     continue
-
                 updated_tilt_dfs[ts_id] = ts_tilts_df
                 ts_row_df = pd.concat([pd.DataFrame(ts_row).T] * len(ts_tilts_df), ignore_index=True)
                 ts_row_df.index = ts_tilts_df.index
@@ -651,6 +697,7 @@ class MetadataTranslator:
             # Write outputs
             for tid, tdf in updated_tilt_dfs.items():
                 self.starfile_service.write({tid: tdf}, output_tilts_dir / f"{tid}.star")
+            write_tilt_table(output_tilts_dir, updated_tilt_dfs)
 
             # No more name_mapping: rlnTomoName already equals the canonical TS id (asserted above).
             out_ts_df = in_ts_df.copy()
@@ -679,6 +726,110 @@ class MetadataTranslator:
             traceback.print_exc()
             return {"success": False, "error": str(e)}
 
+    def _merge_ts_alignment(
+        self,
+        ts_row: pd.Series,
+        input_star_dir: Path,
+        tiltstack_root: Path,
+        tomostar_dir: Path,
+        alignment_method: AlignmentMethod,
+        shift_angpix: float,
+    ) -> Tuple[str, Optional[str], Optional[pd.DataFrame]]:
+        """Overlay alignment results onto one TS's tilt STAR.
+
+        Returns (ts_id, failure_reason, updated_tilts_df); exactly one of the
+        last two is None. Runs in a worker thread, so it only reads shared state.
+        """
+        ts_star_file_rel = ts_row["rlnTomoTiltSeriesStarFile"]
+        ts_id = Path(ts_star_file_rel).stem
+        # Strict identity: the rlnTomoName MUST equal the tilt_series_star filename stem.
+        # Per-TS STARs are created one-to-one, indexed by name. Divergence would mean
+        # upstream data has already been corrupted.
+        if str(ts_row["rlnTomoName"]) != ts_id:
+            return (
+                ts_id,
+                f"rlnTomoName={ts_row['rlnTomoName']!r} does not equal tilt_series filename stem={ts_id!r}",
+                None,
+            )
+
+        ts_star_path_abs = (input_star_dir / ts_star_file_rel).resolve()
+        if not ts_star_path_abs.exists():
+            return ts_id, f"input tilt_series STAR not found: {ts_star_path_abs}", None
+
+        ts_data_in = self.starfile_service.read(ts_star_path_abs)
+        ts_tilts_df = next(iter(ts_data_in.values())).copy()
+
+        # Strict exact-name match. No glob, no prefix — tiltstack dir MUST exist with
+        # exactly this name or aggregation fails loud.
+        ts_tiltstack_dir = tiltstack_root / ts_id
+        if not ts_tiltstack_dir.is_dir():
+            return ts_id, f"no tiltstack dir at {ts_tiltstack_dir}", None
+
+        aln_data = None
+        if alignment_method == AlignmentMethod.ARETOMO:
+            aln_files = sorted(ts_tiltstack_dir.glob("*.st.aln"))
+            if len(aln_files) > 1:
+                return ts_id, f"expected 1 .st.aln file, found {len(aln_files)}: {aln_files}", None
+            if aln_files:
+                aln_data = self._read_aretomo_aln_file(aln_files[0])
+        elif alignment_method == AlignmentMethod.IMOD:
+            xf_files = sorted(ts_tiltstack_dir.glob("*.xf"))
+            tlt_files = sorted(ts_tiltstack_dir.glob("*.tlt"))
+            if len(xf_files) > 1 or len(tlt_files) > 1:
+                return (
+                    ts_id,
+                    f"expected 1 .xf and 1 .tlt, found {len(xf_files)} .xf / {len(tlt_files)} .tlt",
+                    None,
+                )
+            if xf_files and tlt_files:
+                aln_data = self._read_imod_xf_tlt_files(xf_files[0], tlt_files[0])
+
+        if aln_data is None:
+            return ts_id, f"alignment output files missing in {ts_tiltstack_dir}", None
+
+        # Sort by tilt index
+        aln_data = aln_data[aln_data[:, 0].argsort()]
+
+        # Strict exact-name tomostar lookup — no id_base fallback.
+        tomostar_path = tomostar_dir / f"{ts_id}.tomostar"
+        if not tomostar_path.exists():
+            return ts_id, f"tomostar not found at {tomostar_path}", None
+
+        tomostar_data = self.starfile_service.read(tomostar_path)
+        tomostar_df = next(iter(tomostar_data.values()))
+
+        # Keyed join on movie stem: tomostar row i (== aln_data row i) -> the
+        # first tilt row with the same stem. Replaces a per-row scan of every
+        # tilt, which made each TS quadratic in its tilt count.
+        if "wrpMovieName" not in tomostar_df.columns:
+            tilt_pos = pd.Series(dtype=float)
+        else:
+            tilt_stems = pd.Index([Path(p).stem for p in ts_tilts_df["rlnMicrographMovieName"]])
+            first_pos = pd.Series(np.arange(len(tilt_stems)), index=tilt_stems)
+            first_pos = first_pos[~first_pos.index.duplicated(keep="first")]
+            tomo_stems = tomostar_df["wrpMovieName"].map(lambda p: Path(p).stem)
+            tilt_pos = tomo_stems.map(first_pos).dropna().astype(int)
+
+        if tilt_pos.empty:
+            return (
+                ts_id,
+                "no movie names in the tomostar matched the per-TS input STAR — "
+                "likely a cross-TS contamination of the staging dir",
+                None,
+            )
+
+        # If two tomostar rows hit the same tilt, the later one wins, as it
+        # did with row-by-row assignment.
+        tilt_pos = tilt_pos[~tilt_pos.duplicated(keep="last")]
+        aln_rows = aln_data[tilt_pos.index.to_numpy()]
+        targets = tilt_pos.to_numpy()
+        ts_tilts_df.loc[targets, "rlnTomoXTilt"] = 0
+        ts_tilts_df.loc[targets, "rlnTomoYTilt"] = -1.0 * aln_rows[:, 9]
+        ts_tilts_df.loc[targets, "rlnTomoZRot"] = aln_rows[:, 1]
+        ts_tilts_df.loc[targets, "rlnTomoXShiftAngst"] = aln_rows[:, 3] * shift_angpix
+        ts_tilts_df.loc[targets, "rlnTomoYShiftAngst"] = aln_rows[:, 4] * shift_angpix
+        return ts_id, None, ts_tilts_df
+
     def _merge_ctf_metadata(self, tilts_df: pd.DataFrame, warp_df: pd.DataFrame) -> pd.DataFrame:
         """Merge CTF parameters from WarpTools into tilt series DataFrame.
 
@@ -809,7 +960,7 @@ class MetadataTranslator:
 
             # Parse WarpTools XML files from job directory
             xml_pattern = str(job_dir / warp_folder / "*.xml")
-            warp_data = WarpXmlParser(xml_pattern)
+            warp_data = WarpXmlParser(xml_pattern, cache_path=job_dir / warp_folder / XML_PARSE_CACHE_FILENAME)
             logger.info("Parsed %d XML files", len(warp_data.data_df))
 
             # Read input tilt series data
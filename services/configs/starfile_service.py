@@ -1,19 +1,249 @@
 # services/starfile_service.py
 
 import logging
+import os
+import shlex
+import threading
 import starfile
 import pandas as pd
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Union, Any
+from typing import Dict, Union, Any, List, Mapping, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Projected block reads keyed by (path, mtime_ns, size, block, columns, where).
+# Dashboards re-read the same particles/tomograms STARs on every refresh;
+# entries for a file are superseded as soon as it is rewritten. Bounded by
+# entry count and by the blocks' in-memory size; a single block bigger than
+# _BLOCK_CACHE_MAX_ENTRY_BYTES (a full particles table, say) is not cached.
+_BLOCK_CACHE_MAX = 64
+_BLOCK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_BLOCK_CACHE_MAX_ENTRY_BYTES = _BLOCK_CACHE_MAX_BYTES // 4
+# key -> (block or None, its memory_usage in bytes)
+_block_cache: "OrderedDict[tuple, Tuple[Optional[pd.DataFrame], int]]" = OrderedDict()
+_block_cache_bytes = 0
+# read_block runs from worker threads; the scan itself happens unlocked.
+_block_cache_lock = threading.Lock()
+
+
+def _split_star_line(line: str, maxsplit: int = -1) -> List[str]:
+    if "'" in line or '"' in line:
+        return shlex.split(line)
+    return line.split(None, maxsplit)
+
+
+class _StarLines:
+    """Line iterator over an open STAR file with one-line pushback, so a
+    block parser can stop on the next `data_` line without losing it."""
+
+    def __init__(self, f):
+        self._it = iter(f)
+        self._pushed: List[str] = []
+
+    def __iter__(self) -> "_StarLines":
+        return self
+
+    def __next__(self) -> str:
+        if self._pushed:
+            return self._pushed.pop()
+        return next(self._it)
+
+    def push(self, line: str) -> None:
+        self._pushed.append(line)
+
+
+def _read_loop_lines(lines: _StarLines) -> List[str]:
+    """Non-empty, non-comment data lines of the current loop, up to the
+    next `data_` (where starfile ends a loop too)."""
+    out: List[str] = []
+    while lines._pushed:
+        raw = lines._pushed.pop()
+        if raw.startswith("data_"):
+            lines.push(raw)
+            return out
+        out.append(raw)
+    # Tight loop straight over the file; this is the hot path.
+    for raw in lines._it:
+        if raw.startswith("data_"):
+            lines.push(raw)
+            break
+        out.append(raw)
+    stripped = [raw.strip() for raw in out]
+    return [line for line in stripped if line and line[0] != "#"]
+
+
+def _read_loop_header(lines: _StarLines) -> List[str]:
+    header: List[str] = []
+    for raw in lines:
+        line = raw.strip()
+        if line.startswith("_"):
+            header.append(line.split()[0][1:])
+        elif line and not line.startswith("#"):
+            lines.push(raw)
+            break
+    return header
+
+
+def _read_simple_block(lines: _StarLines) -> Dict[str, str]:
+    block: Dict[str, str] = {}
+    for raw in lines:
+        line = raw.strip()
+        if line.startswith(("data_", "loop_")):
+            lines.push(raw)
+            break
+        if line.startswith("_"):
+            k, v = _split_star_line(line)[:2]
+            block[k[1:]] = v
+    return block
+
+
+# Tokens starfile reads as missing.
+_STAR_NA_TOKENS = frozenset(("nan", "NaN", "<NA>"))
+
+
+def _numericise_column(values: List[str]) -> pd.Series:
+    """Same rule as starfile: numeric if every value parses, else strings."""
+    values = [None if v in _STAR_NA_TOKENS else v for v in values]
+    probe = next((v for v in values if v is not None), None)
+    try:
+        if probe is not None:
+            float(probe)
+    except ValueError:
+        return pd.Series(values)
+    try:
+        return pd.to_numeric(pd.Series(values, dtype=object))
+    except (ValueError, TypeError):
+        return pd.Series(values)
+
+
+def _scan_star_block(
+    path: Path,
+    block: Optional[str],
+    columns: Optional[Sequence[str]],
+    where: Mapping[str, str],
+) -> Optional[pd.DataFrame]:
+    """One pass over `path`, stopping after the selected block."""
+    required = set(columns or ()) | set(where)
+
+    with open(path) as f:
+        lines = _StarLines(f)
+        current_block: Optional[str] = None
+        for raw in lines:
+            line = raw.strip()
+            if line.startswith("data_"):
+                current_block = line[5:]
+                continue
+            if current_block is None or (block is not None and current_block != block):
+                continue
+
+            if line.startswith("loop_"):
+                header = _read_loop_header(lines)
+                rows = _read_loop_lines(lines)
+            elif line.startswith("_"):
+                lines.push(raw)
+                simple = _read_simple_block(lines)
+                header = list(simple)
+                rows = [" ".join(shlex.quote(v) for v in simple.values())]
+            else:
+                continue
+
+            if not required.issubset(header):
+                if block is not None:
+                    return None
+                # No block name given: keep looking for one with these columns.
+                current_block = None
+                continue
+
+            out_cols = list(columns) if columns is not None else header
+            out_idx = [header.index(c) for c in out_cols]
+            filters = [(header.index(c), v) for c, v in where.items()]
+            # Only split as far as the last column we look at.
+            maxsplit = max(out_idx + [i for i, _ in filters], default=-1) + 1
+            for _, v in filters:
+                # Cheap substring reject before tokenising.
+                rows = [line for line in rows if v in line]
+            if any("'" in line or '"' in line for line in rows):
+                split = [_split_star_line(line) for line in rows]
+            else:
+                split = [line.split(None, maxsplit) for line in rows]
+            for i, v in filters:
+                split = [row for row in split if row[i] == v]
+            kept = [[row[i] for row in split] for i in out_idx]
+            return pd.DataFrame(
+                {c: _numericise_column(v) for c, v in zip(out_cols, kept)}, columns=out_cols
+            )
+    return None
+
+
+def _remember_block(key: tuple, df: Optional[pd.DataFrame], nbytes: int) -> None:
+    global _block_cache_bytes
+    with _block_cache_lock:
+        old = _block_cache.pop(key, None)
+        if old is not None:
+            _block_cache_bytes -= old[1]
+        _block_cache[key] = (df, nbytes)
+        _block_cache_bytes += nbytes
+        while len(_block_cache) > _BLOCK_CACHE_MAX or _block_cache_bytes > _BLOCK_CACHE_MAX_BYTES:
+            _block_cache_bytes -= _block_cache.popitem(last=False)[1][1]
+
+
 class StarfileService:
     def read(self, path: Union[str, Path]) -> Dict[str, Any]:
         if not Path(path).exists():
             raise FileNotFoundError(f"STAR file not found: {path}")
         return starfile.read(path, always_dict=True)
 
+    def read_block(
+        self,
+        path: Union[str, Path],
+        block: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Stream one block of a STAR file, keeping only what the caller needs.
+
+        `block` is the data block name without `data_` (e.g. "particles");
+        None picks the first block that has every column in `columns` and
+        `where`. `columns` projects the result (None keeps all). `where`
+        keeps rows whose raw STAR token equals `str(value)` for every
+        `{column: value}` pair, e.g. `{"rlnTomoName": ts_name}`.
+
+        Only the selected block is tokenised and only kept cells are
+        numericised (same int/float/str rule as `starfile.read`). Results
+        are cached on the file's (mtime, size), within the cache's size
+        bound; callers get a copy.
+
+        Returns None when no matching block exists.
+        """
+        path = Path(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"STAR file not found: {path}")
+        where = {k: str(v) for k, v in (where or {}).items()}
+        key = (
+            str(path.resolve()),
+            st.st_mtime_ns,
+            st.st_size,
+            block,
+            tuple(columns) if columns is not None else None,
+            tuple(sorted(where.items())),
+        )
+        with _block_cache_lock:
+            found = key in _block_cache
+            if found:
+                _block_cache.move_to_end(key)
+                hit = _block_cache[key][0]
+        if found:
+            return hit.copy() if hit is not None else None
+
+        df = _scan_star_block(path, block, columns, where)
+        nbytes = int(df.memory_usage(deep=True).sum()) if df is not None else 0
+        if nbytes <= _BLOCK_CACHE_MAX_ENTRY_BYTES:
+            _remember_block(key, df, nbytes)
+        return df.copy() if df is not None else None
+
     def write(self, data: Union[Dict[str, Any], pd.DataFrame], path: Union[str, Path]):
         try:
             if isinstance(data, dict):
@@ -382,6 +382,8 @@ class PathResolutionService:
         if self._output_index is not None:
             return self._output_index
 
+        from services.visualization.picks_filter import curated_output_pending
+
         project_root = self._project_root()
         index: Dict[JobFileType, List[OutputCandidate]] = {t: [] for t in JobFileType}
 
@@ -424,8 +426,10 @@ class PathResolutionService:
                 # prefer_if_exists slots are opt-in: don't pollute the candidate
                 # pool with a phantom path the resolver might otherwise pick up.
                 # The file is only created post-hoc by the UI (curated filters)
-                # so its existence is the entire signal.
-                if slot.prefer_if_exists and not Path(path).exists():
+                # so its existence is the entire signal -- or, for a curated
+                # particles_filtered.star, its journal (it is materialized at
+                # deploy, see picks_filter.ensure_filtered_materialized).
+                if slot.prefer_if_exists and not Path(path).exists() and not curated_output_pending(Path(path)):
                     continue
 
                 index[slot.produces].append(
@@ -0,0 +1,175 @@
+"""
+Persistent catalog of the projects under a project base path.
+
+The landing page roster, aggregation discovery and the pipeline monitor's
+startup recovery all walk `{base}/*/project_params.json`. Those files embed
+per-tilt metadata and run to several MB each, so a cold walk over a few
+hundred projects spends almost all its time in `json.load`. The catalog
+keeps the handful of summary fields those callers read, keyed by project
+directory and stamped with the params file's (mtime_ns, size); a scan only
+re-parses the entries whose params file changed since the last one.
+
+One catalog per base path lives in ~/.crboost/project_catalogs/, next to the
+other per-user caches: project bases are often shared and not writable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+_CATALOG_DIR = Path.home() / ".crboost" / "project_catalogs"
+
+# Loaded catalogs keyed by resolved base path; refreshed in place.
+_catalogs: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+@dataclass
+class CatalogEntry:
+    """One project under a base path. `summary` is None when the params
+    file could not be parsed (it is retried once the file changes)."""
+
+    project_dir: Path
+    params_mtime: float
+    params_uid: int
+    summary: Optional[Dict[str, Any]]
+
+
+def _summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of project_params.json the scanners read."""
+    jobs = {}
+    for iid, job in (data.get("jobs") or {}).items():
+        if not isinstance(job, dict):
+            continue
+        jobs[iid] = {
+            "job_type": job.get("job_type"),
+            "relion_job_name": job.get("relion_job_name"),
+            "execution_status": job.get("execution_status"),
+            "species_id": job.get("species_id"),
+        }
+    species = [
+        {"id": s.get("id"), "name": s.get("name"), "color": s.get("color")}
+        for s in (data.get("species_registry") or [])
+        if isinstance(s, dict)
+    ]
+    return {
+        "project_name": data.get("project_name"),
+        "created_at": data.get("created_at"),
+        "created_by": data.get("created_by"),
+        "pipeline_active": bool(data.get("pipeline_active", False)),
+        "mnemonic": data.get("mnemonic") or "",
+        "is_aggregation": bool(data.get("is_aggregation", False)),
+        "import_selected_tilt_series": data.get("import_selected_tilt_series"),
+        "import_total_tilt_series": data.get("import_total_tilt_series"),
+        "import_source_directory": data.get("import_source_directory") or "",
+        "movies_glob": data.get("movies_glob") or "",
+        "jobs": jobs,
+        "species_registry": species,
+    }
+
+
+def _catalog_path(base_key: str) -> Path:
+    digest = hashlib.sha1(base_key.encode()).hexdigest()[:16]
+    return _CATALOG_DIR / f"{digest}.json"
+
+
+def _load_catalog(base_key: str) -> Dict[str, Any]:
+    path = _catalog_path(base_key)
+    try:
+        with open(path) as f:
+            catalog = json.load(f)
+        if catalog.get("version") == CATALOG_VERSION and catalog.get("base") == base_key:
+            return catalog
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Ignoring unreadable project catalog %s: %s", path, e)
+    return {"version": CATALOG_VERSION, "base": base_key, "projects": {}}
+
+
+def _save_catalog(base_key: str, catalog: Dict[str, Any]) -> None:
+    path = _catalog_path(base_key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(catalog, f)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except Exception as e:
+        logger.warning("Could not save project catalog %s: %s", path, e)
+
+
+def scan_project_catalog(base_path: str | Path) -> List[CatalogEntry]:
+    """Every `{base_path}/*/project_params.json` project, summarized.
+
+    Costs one `stat` per project directory; only new or changed params
+    files are read. Entries come back in directory-listing order.
+    """
+    base = Path(base_path).expanduser()
+    base_key = str(base.resolve())
+
+    items: List[tuple] = []
+    for item in base.iterdir():
+        if not item.is_dir():
+            continue
+        try:
+            st = os.stat(item / "project_params.json")
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.debug("Cannot stat params in %s: %s", item, e)
+            continue
+        items.append((item, st))
+
+    with _lock:
+        catalog = _catalogs.get(base_key)
+        if catalog is None:
+            catalog = _catalogs[base_key] = _load_catalog(base_key)
+        projects: Dict[str, Any] = catalog["projects"]
+
+        changed = False
+        entries: List[CatalogEntry] = []
+        live = set()
+        for item, st in items:
+            live.add(item.name)
+            rec = projects.get(item.name)
+            if rec is None or rec.get("mtime_ns") != st.st_mtime_ns or rec.get("size") != st.st_size:
+                try:
+                    with open(item / "project_params.json") as f:
+                        summary = _summarize(json.load(f))
+                except Exception as e:
+                    logger.debug("Cannot parse %s/project_params.json: %s", item, e)
+                    summary = None
+                rec = projects[item.name] = {
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "summary": summary,
+                }
+                changed = True
+            entries.append(CatalogEntry(item, st.st_mtime, st.st_uid, rec["summary"]))
+
+        for name in [n for n in projects if n not in live]:
+            del projects[name]
+            changed = True
+
+        if changed:
+            _save_catalog(base_key, catalog)
+    return entries
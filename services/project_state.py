@@ -1,13 +1,16 @@
 # services/project_state.py
 from __future__ import annotations
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
 import shutil
 import tempfile
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Literal, Optional, Tuple, Type, List
@@ -53,7 +56,47 @@ logger = logging.getLogger(__name__)
 # load.  A major mismatch emits a loud warning; a missing version (pre-versioning
 # files) is treated as (0, 0).
 
-SCHEMA_VERSION: Tuple[int, int] = (3, 0)
+SCHEMA_VERSION: Tuple[int, int] = (3, 1)
+
+
+# ─── Cold sections ──────────────────────────────────────────────────────
+# project_params.json is rewritten on every job status change, and the
+# roster / discovery scanners parse it. Fields that are large and written
+# once at project creation live in per-section sidecar files instead:
+#
+#     {project}/project_params.json                      # header
+#     {project}/project_params.sections/<field>.json     # one per section
+#
+# The header's "sections" manifest records each sidecar's version and
+# content digest. A sidecar is rewritten only when its serialized content
+# no longer matches that digest, and `ProjectState.load` defers reading it
+# until the field is first accessed. Files from before 3.1 carry these
+# fields inline; they are moved out on the next save.
+
+COLD_SECTIONS: Tuple[str, ...] = ("tilt_metadata", "import_position_details", "import_tilt_series_details")
+SECTION_VERSION = 1
+
+
+def _sections_dir_for(params_path: Path) -> Path:
+    return params_path.with_name(params_path.stem + ".sections")
+
+
+def _section_digest(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _atomic_write_text(path: Path, text: str, prefix: str) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp", prefix=prefix)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.rename(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 # ─── Sidecar helpers ────────────────────────────────────────────────────
@@ -536,6 +579,84 @@ class ProjectState(BaseModel):
     tilt_filter_png_dir: Optional[str] = None
 
     _dirty: bool = PrivateAttr(default=False)
+    # Cold sections not yet read from disk: field name -> sidecar path.
+    # While pending, the field is absent from __dict__ and __getattr__
+    # loads it on first access.
+    _pending_sections: Dict[str, Path] = PrivateAttr(default_factory=dict)
+    # Digest of each section as last written to / read from its sidecar.
+    _section_digests: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _sections_dir: Optional[Path] = PrivateAttr(default=None)
+
+    def __getattr__(self, item: str) -> Any:
+        if item in COLD_SECTIONS:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and item in private["_pending_sections"]:
+                self._load_section(item)
+                return self.__dict__[item]
+        return super().__getattr__(item)
+
+    def __copy__(self):
+        # The private dicts would otherwise be shared: a cold section loaded
+        # through the copy would vanish from the original's pending set.
+        clone = super().__copy__()
+        clone._pending_sections = dict(self._pending_sections)
+        clone._section_digests = dict(self._section_digests)
+        return clone
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None):
+        clone = super().__deepcopy__(memo)
+        clone._pending_sections = dict(self._pending_sections)
+        clone._section_digests = dict(self._section_digests)
+        return clone
+
+    def _load_section(self, name: str) -> None:
+        sidecar = self._pending_sections.pop(name)
+        if name in self.__dict__:
+            # Assigned before it was ever read; the assignment wins.
+            return
+        raw = None
+        try:
+            with open(sidecar, "r") as f:
+                doc = json.load(f)
+            if doc.get("version") != SECTION_VERSION:
+                logger.warning(
+                    "Section %s has version %s, code expects %s", sidecar.name, doc.get("version"), SECTION_VERSION
+                )
+            raw = doc.get("data")
+        except Exception as e:
+            logger.warning("Could not load project section %s: %s", sidecar, e)
+        self.__dict__[name] = self._section_from_raw(name, raw)
+        if raw is None:
+            # Don't replace an unreadable sidecar with an empty one unless
+            # the field is actually changed.
+            self._section_digests[name] = _section_digest(self._section_text(name))
+
+    @staticmethod
+    def _section_from_raw(name: str, raw: Any) -> Any:
+        if name == "tilt_metadata":
+            return raw or {}
+        model = ImportPositionSummary if name == "import_position_details" else ImportTiltSeriesSummary
+        try:
+            return [model(**d) for d in raw or []]
+        except Exception as e:
+            logger.warning("Could not load %s: %s", name, e)
+            return []
+
+    def _section_text(self, name: str) -> str:
+        data = BaseModel.model_dump(self, include={name})[name]
+        return json.dumps(data, default=str, separators=(",", ":"))
+
+    def _load_all_sections(self) -> None:
+        for name in list(self._pending_sections):
+            self._load_section(name)
+
+    def model_dump(self, *args, **kwargs) -> Dict[str, Any]:
+        self._load_all_sections()
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs) -> str:
+        self._load_all_sections()
+        return super().model_dump_json(*args, **kwargs)
 
     @field_validator("aggregation_sources", mode="before")
     @classmethod
@@ -622,28 +743,47 @@ class ProjectState(BaseModel):
         self.modified_at = datetime.now()
 
     def save(self, path: Optional[Path] = None):
-        """Atomic file write via tempfile + rename."""
+        """Atomic write of the header plus any cold section whose content
+        changed since it was last written or read."""
         save_path = path or (
             self.project_path / "project_params.json" if self.project_path else Path("project_params.json")
         )
         save_path.parent.mkdir(parents=True, exist_ok=True)
+        sections_dir = _sections_dir_for(save_path)
+
+        if self._sections_dir != sections_dir:
+            # New location: nothing there is known to be current.
+            self._load_all_sections()
+            self._section_digests.clear()
 
         # Always stamp the current code's schema version on save
         self.schema_version = SCHEMA_VERSION
 
-        data = self.model_dump(exclude={"project_path"})
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for name in COLD_SECTIONS:
+            sidecar = sections_dir / f"{name}.json"
+            if name in self._pending_sections and name not in self.__dict__:
+                # Never read or assigned, so unchanged.
+                digest = self._section_digests[name]
+            else:
+                self._pending_sections.pop(name, None)
+                text = self._section_text(name)
+                digest = _section_digest(text)
+                if digest != self._section_digests.get(name) or not sidecar.exists():
+                    sections_dir.mkdir(exist_ok=True)
+                    _atomic_write_text(
+                        sidecar,
+                        f'{{"section":"{name}","version":{SECTION_VERSION},"data":{text}}}',
+                        prefix=f".{name}_",
+                    )
+                    self._section_digests[name] = digest
+            manifest[name] = {"file": sidecar.name, "version": SECTION_VERSION, "sha1": digest}
+        self._sections_dir = sections_dir
+
+        data = BaseModel.model_dump(self, exclude={"project_path", *COLD_SECTIONS})
         data["project_path"] = str(self.project_path) if self.project_path else None
-        fd, tmp_path = tempfile.mkstemp(dir=str(save_path.parent), suffix=".tmp", prefix=".project_params_")
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-            os.rename(tmp_path, str(save_path))
-        except BaseException:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        data["sections"] = manifest
+        _atomic_write_text(save_path, json.dumps(data, indent=2, default=str), prefix=".project_params_")
 
         self._dirty = False
 
@@ -738,20 +878,19 @@ class ProjectState(BaseModel):
         project_state.import_selected_tilt_series = data.get("import_selected_tilt_series", 0)
         project_state.import_source_directory = data.get("import_source_directory", "")
         project_state.import_frame_extension = data.get("import_frame_extension", "")
-        try:
-            project_state.import_position_details = [
-                ImportPositionSummary(**pd) for pd in data.get("import_position_details", [])
-            ]
-            project_state.import_tilt_series_details = [
-                ImportTiltSeriesSummary(**td) for td in data.get("import_tilt_series_details", [])
-            ]
-        except Exception as e:
-            logger.warning("Could not load import details: %s", e)
-            project_state.import_position_details = []
-            project_state.import_tilt_series_details = []
-
-        # Restore per-tilt MDOC metadata
-        project_state.tilt_metadata = data.get("tilt_metadata", {})
+        # Cold sections: inline in pre-3.1 files, otherwise deferred to
+        # their sidecars until first access.
+        sections_dir = _sections_dir_for(path)
+        manifest = data.get("sections") or {}
+        for name in COLD_SECTIONS:
+            entry = manifest.get(name)
+            if name in data or not isinstance(entry, dict):
+                project_state.__dict__[name] = cls._section_from_raw(name, data.get(name))
+            else:
+                del project_state.__dict__[name]
+                project_state._pending_sections[name] = sections_dir / entry.get("file", f"{name}.json")
+                project_state._section_digests[name] = entry.get("sha1", "")
+        project_state._sections_dir = sections_dir
 
         # Restore tilt filter state
         project_state.tilt_filter_labels = data.get("tilt_filter_labels", {})
@@ -852,16 +991,44 @@ def set_project_state(new_state: ProjectState):
         pass
 
 
+# ─── Save coalescing ────────────────────────────────────────────────────
+# Status sync, thumbnails, recovery and the UI all call save_project, often
+# several times a second for one project while a pipeline is busy. A save
+# request only marks the state dirty and arms a per-file timer; one write
+# covers every request that arrives within the window. Anything another
+# process reads from disk (drivers, the schemer) must go through
+# `flush_project` / `save_project(durable=True)` first.
+
+SAVE_COALESCE_SEC = 0.5
+
+
+@dataclass
+class SaveMetrics:
+    """Per-params-file save counters."""
+
+    requests: int = 0
+    writes: int = 0
+    # Wall time of the most recent / slowest write itself.
+    last_write_sec: float = 0.0
+    max_write_sec: float = 0.0
+    # First coalesced request -> data on disk, for the most recent write.
+    last_flush_latency_sec: float = 0.0
+
+
 class StateService:
     """Manages persistence of ProjectState to disk.
 
     - UI code accesses .state (resolves via tab context)
     - Backend code with an explicit path uses .state_for(path)
-    - save_project is serialized with an asyncio.Lock
+    - save_project coalesces writes per params file; writes are serialized
+      with an asyncio.Lock
     """
 
     def __init__(self):
         self._save_lock = asyncio.Lock()
+        # Armed flush timers: target path -> (state, task, first request time)
+        self._pending_saves: Dict[Path, Tuple[ProjectState, asyncio.Task, float]] = {}
+        self._save_metrics: Dict[Path, SaveMetrics] = {}
 
     def state_for(self, project_path: Path) -> ProjectState:
         """Explicit accessor for backend/service code that has a path."""
@@ -920,30 +1087,102 @@ class StateService:
         except Exception:
             return False
 
-    # in StateService.save_project(), replace the final save call:
-
     async def save_project(
-        self, save_path: Optional[Path] = None, project_path: Optional[Path] = None, force: bool = False
+        self,
+        save_path: Optional[Path] = None,
+        project_path: Optional[Path] = None,
+        force: bool = False,
+        durable: bool = False,
     ):
-        async with self._save_lock:
-            if project_path:
-                state = get_project_state_for(project_path)
-            else:
-                state = get_project_state()
+        """Persist the project state.
 
-            if save_path:
-                target_path = save_path
-            elif state.project_path:
-                target_path = state.project_path / "project_params.json"
-            else:
-                return
+        `force` saves even if nothing marked the state dirty (job metadata
+        such as execution_status doesn't). The write itself is deferred by up
+        to SAVE_COALESCE_SEC and shared with other requests in that window,
+        unless `durable` is set, in which case this returns once it is on disk.
+        """
+        if project_path:
+            state = get_project_state_for(project_path)
+        else:
+            state = get_project_state()
 
-            loop = asyncio.get_event_loop()
-            if force:
-                await loop.run_in_executor(None, state.save, target_path)
-            else:
-                if state.is_dirty:
-                    await loop.run_in_executor(None, state.save, target_path)
+        if save_path:
+            target_path = save_path
+        elif state.project_path:
+            target_path = state.project_path / "project_params.json"
+        else:
+            return
+
+        self._metrics_for(target_path).requests += 1
+        if force:
+            state.mark_dirty()
+        if not state.is_dirty and target_path not in self._pending_saves:
+            return
+
+        if durable:
+            await self._flush(target_path, state)
+        elif target_path not in self._pending_saves:
+            task = asyncio.get_running_loop().create_task(self._flush_later(target_path))
+            self._pending_saves[target_path] = (state, task, time.perf_counter())
+
+    async def flush_project(self, project_path: Path):
+        """Durability barrier: write any pending save for `project_path` now."""
+        state = get_project_state_for(project_path)
+        target_path = (state.project_path or project_path.resolve()) / "project_params.json"
+        if target_path in self._pending_saves or state.is_dirty:
+            await self._flush(target_path, state)
+
+    async def flush_all(self):
+        """Write every pending save (server shutdown)."""
+        for target_path, (state, _, _) in list(self._pending_saves.items()):
+            try:
+                await self._flush(target_path, state)
+            except Exception as e:
+                logger.error("Failed to flush %s: %s", target_path, e)
+
+    def get_save_metrics(self) -> Dict[Path, SaveMetrics]:
+        """Save counters per params file."""
+        return dict(self._save_metrics)
+
+    def _metrics_for(self, target_path: Path) -> SaveMetrics:
+        metrics = self._save_metrics.get(target_path)
+        if metrics is None:
+            metrics = self._save_metrics[target_path] = SaveMetrics()
+        return metrics
+
+    async def _flush_later(self, target_path: Path):
+        await asyncio.sleep(SAVE_COALESCE_SEC)
+        pending = self._pending_saves.get(target_path)
+        if pending is None:
+            return
+        try:
+            await self._flush(target_path, pending[0])
+        except Exception as e:
+            logger.error("Deferred save of %s failed: %s", target_path, e)
+
+    async def _flush(self, target_path: Path, state: ProjectState):
+        async with self._save_lock:
+            pending = self._pending_saves.pop(target_path, None)
+            if pending is not None and pending[1] is not asyncio.current_task():
+                pending[1].cancel()
+            requested_at = pending[2] if pending else time.perf_counter()
+
+            # Requests arriving during the write re-mark the state and arm a
+            # new timer, so clear the flag before writing rather than after.
+            state._dirty = False
+            started = time.perf_counter()
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, state.save, target_path)
+            except BaseException:
+                state.mark_dirty()
+                raise
+            finished = time.perf_counter()
+
+            metrics = self._metrics_for(target_path)
+            metrics.writes += 1
+            metrics.last_write_sec = finished - started
+            metrics.max_write_sec = max(metrics.max_write_sec, metrics.last_write_sec)
+            metrics.last_flush_latency_sec = finished - requested_at
 
 
 _state_service_instance: Optional[StateService] = None
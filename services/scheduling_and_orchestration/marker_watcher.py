@@ -0,0 +1,400 @@
+"""
+Filesystem-event source for pipeline status markers.
+
+The monitor used to notice a finished job only on its next poll of
+`RELION_JOB_EXIT_{SUCCESS,FAILURE}`. MarkerWatcher subscribes to the
+directories where those markers appear and tells its listeners as soon as
+one is created, so the monitor can reconcile that project immediately:
+
+    {project}/default_pipeline.star           # schemer advanced a job
+    {project}/{job}/RELION_JOB_EXIT_*          # job finished
+    {project}/{job}/.task_status/*.ok|fail|skip  # array task finished
+
+Two backends, chosen per project:
+
+  - inotify (Linux, via ctypes — no extra dependency), read on the event
+    loop through `add_reader`. Only used on local filesystems.
+
+  - A batched-stat poller for filesystems whose clients don't see events
+    raised by other hosts (NFS, Lustre, GPFS, ...). Every POLL_INTERVAL_SEC
+    one executor call stats the markers of every polled directory; a
+    `.task_status/` dir is only listed when its mtime moved, or when its
+    last listing was too close to that mtime to trust (see
+    RACY_MTIME_WINDOW_SEC).
+
+Set CRBOOST_FS_EVENTS=poll to force the poller everywhere, or =off to
+disable the watcher (the monitor's own polling still runs).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXIT_MARKERS = ("RELION_JOB_EXIT_SUCCESS", "RELION_JOB_EXIT_FAILURE")
+PIPELINE_STAR = "default_pipeline.star"
+TASK_STATUS_DIR = ".task_status"
+TASK_STATUS_SUFFIXES = (".ok", ".fail", ".skip")
+
+POLL_INTERVAL_SEC = 1.0
+# A directory listed (or file read) within this many seconds of its mtime is
+# "racily clean" (git's index uses the same trick): on coarse-mtime
+# filesystems (Lustre: 1 s) a change in the same tick leaves the mtime as it
+# was, so such reads are redone until they age past the window.
+RACY_MTIME_WINDOW_SEC = 2.0
+
+# Filesystems where inotify only reports changes made by this host.
+EVENT_UNRELIABLE_FS = {
+    "nfs",
+    "nfs4",
+    "lustre",
+    "gpfs",
+    "beegfs",
+    "ceph",
+    "cifs",
+    "smb3",
+    "smbfs",
+    "panfs",
+    "wekafs",
+    "9p",
+    "fuse.sshfs",
+}
+
+# inotify(7)
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_CLOSE_WRITE = 0x00000008
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = _IN_CREATE | _IN_MOVED_TO | _IN_CLOSE_WRITE | _IN_ONLYDIR
+_EVENT_HEADER = struct.Struct("iIII")
+
+# listener(project_path, directory, file name)
+MarkerListener = Callable[[Path, Path, str], None]
+
+# What a subscribed directory can contain.
+_PROJECT, _JOB, _TASKS = "project", "job", "tasks"
+
+
+def _mount_fs_types() -> List[Tuple[str, str]]:
+    """(mount point, fs type) from /proc/mounts, longest mount point first."""
+    mounts: List[Tuple[str, str]] = []
+    try:
+        with open("/proc/mounts") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 3:
+                    mounts.append((parts[1].replace("\\040", " "), parts[2]))
+    except OSError:
+        pass
+    mounts.sort(key=lambda m: len(m[0]), reverse=True)
+    return mounts
+
+
+def fs_type_of(path: Path, mounts: Optional[List[Tuple[str, str]]] = None) -> str:
+    """Filesystem type `path` lives on; "" if unknown."""
+    p = str(path)
+    for mount_point, fs_type in mounts if mounts is not None else _mount_fs_types():
+        if p == mount_point or p.startswith(mount_point.rstrip("/") + "/"):
+            return fs_type
+    return ""
+
+
+def is_marker_name(name: str) -> bool:
+    return name in EXIT_MARKERS or name == PIPELINE_STAR or name.endswith(TASK_STATUS_SUFFIXES)
+
+
+class _Inotify:
+    """Minimal non-blocking inotify handle."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: Path) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Pending (wd, mask, name) events; empty when there are none."""
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset : offset + length].split(b"\0", 1)[0].decode(errors="replace")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class MarkerWatcher:
+    """Watches the pipeline-star directory and running job dirs of each
+    active project and forwards marker events to listeners.
+
+    Owned by PipelineMonitor, which updates the watched set after every
+    reconcile via `watch_project`. All methods run on the event loop.
+    """
+
+    def __init__(self, run_io: Callable[..., Awaitable], mode: Optional[str] = None):
+        self._run_io = run_io
+        self._mode = (mode or os.environ.get("CRBOOST_FS_EVENTS", "auto")).lower()
+        self._listeners: List[MarkerListener] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._mounts: Optional[List[Tuple[str, str]]] = None
+
+        # project -> {directory: kind} currently subscribed for it
+        self._dirs: Dict[Path, Dict[Path, str]] = {}
+        # project -> whether it is polled rather than watched
+        self._polled: Dict[Path, bool] = {}
+
+        self._inotify: Optional[_Inotify] = None
+        self._wd_by_dir: Dict[Path, int] = {}
+        self._dir_by_wd: Dict[int, Tuple[Path, Path]] = {}
+
+        self._poll_task: Optional[asyncio.Task] = None
+        # polled dir -> last signature (see _stat_dirs)
+        self._poll_sigs: Dict[Path, tuple] = {}
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._mode == "off":
+            logger.info("MarkerWatcher disabled (CRBOOST_FS_EVENTS=off)")
+            return
+        self._loop = asyncio.get_running_loop()
+        self._mounts = _mount_fs_types()
+        if self._mode != "poll":
+            try:
+                self._inotify = _Inotify()
+                self._loop.add_reader(self._inotify.fd, self._on_inotify_readable)
+            except (OSError, AttributeError) as e:
+                logger.info("inotify unavailable (%s); marker watcher will poll", e)
+                self._inotify = None
+        self._poll_task = asyncio.create_task(self._poll_loop(), name="marker-watcher-poll")
+
+    async def close(self) -> None:
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+        if self._inotify is not None:
+            if self._loop is not None:
+                self._loop.remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+        self._wd_by_dir.clear()
+        self._dir_by_wd.clear()
+        self._dirs.clear()
+        self._poll_sigs.clear()
+
+    def add_listener(self, listener: MarkerListener) -> None:
+        self._listeners.append(listener)
+
+    # ── Subscriptions ────────────────────────────────────────────────────
+
+    def watch_project(self, project_path: Path, job_dirs: Iterable[Path]) -> None:
+        """Subscribe to `project_path` itself plus `job_dirs` (and their
+        .task_status/ subdirs), replacing the project's previous set."""
+        if self._loop is None:
+            return
+        wanted: Dict[Path, str] = {project_path: _PROJECT}
+        for job_dir in job_dirs:
+            wanted[job_dir] = _JOB
+            wanted[job_dir / TASK_STATUS_DIR] = _TASKS
+
+        polled = self._polled.get(project_path)
+        if polled is None:
+            fs_type = fs_type_of(project_path, self._mounts)
+            polled = self._inotify is None or self._mode == "poll" or fs_type in EVENT_UNRELIABLE_FS
+            self._polled[project_path] = polled
+            logger.info(
+                "MarkerWatcher[%s]: %s (fs=%s)", project_path.name, "polling" if polled else "inotify", fs_type or "?"
+            )
+
+        current = self._dirs.get(project_path, {})
+        for d in current.keys() - wanted.keys():
+            self._unwatch_dir(d)
+        self._dirs[project_path] = wanted
+        if not polled:
+            for d in wanted.keys() - current.keys():
+                if self._watch_dir(project_path, d) and wanted[d] == _JOB:
+                    # A marker written between the last reconcile and now
+                    # raised no event we could see.
+                    for name in EXIT_MARKERS:
+                        if (d / name).exists():
+                            self._loop.call_soon(self._emit, project_path, d, name)
+
+    def forget_project(self, project_path: Path) -> None:
+        for d in self._dirs.pop(project_path, {}):
+            self._unwatch_dir(d)
+        self._polled.pop(project_path, None)
+
+    def _watch_dir(self, project_path: Path, directory: Path) -> bool:
+        if self._inotify is None or directory in self._wd_by_dir:
+            return False
+        try:
+            wd = self._inotify.add_watch(directory)
+        except FileNotFoundError:
+            # .task_status/ usually doesn't exist yet; its creation inside
+            # the (watched) job dir adds the watch.
+            return False
+        except OSError as e:
+            logger.debug("inotify_add_watch %s failed: %s", directory, e)
+            return False
+        self._wd_by_dir[directory] = wd
+        self._dir_by_wd[wd] = (project_path, directory)
+        return True
+
+    def _unwatch_dir(self, directory: Path) -> None:
+        self._poll_sigs.pop(directory, None)
+        wd = self._wd_by_dir.pop(directory, None)
+        if wd is not None:
+            self._dir_by_wd.pop(wd, None)
+            if self._inotify is not None:
+                self._inotify.rm_watch(wd)
+
+    # ── Event delivery ───────────────────────────────────────────────────
+
+    def _emit(self, project_path: Path, directory: Path, name: str) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(project_path, directory, name)
+            except Exception:
+                logger.exception("MarkerWatcher listener failed")
+
+    def _on_inotify_readable(self) -> None:
+        if self._inotify is None:
+            return
+        for wd, mask, name in self._inotify.read_events():
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped; have every project re-checked.
+                logger.info("MarkerWatcher: inotify queue overflow")
+                for project_path in self._dirs:
+                    self._emit(project_path, project_path, PIPELINE_STAR)
+                continue
+            hit = self._dir_by_wd.get(wd)
+            if hit is None:
+                continue
+            project_path, directory = hit
+            if mask & _IN_IGNORED:
+                # Directory removed or unmounted.
+                self._wd_by_dir.pop(directory, None)
+                self._dir_by_wd.pop(wd, None)
+                continue
+            if mask & _IN_ISDIR:
+                if name == TASK_STATUS_DIR and directory / name in self._dirs.get(project_path, {}):
+                    self._watch_dir(project_path, directory / name)
+                continue
+            # Files: act once their content is complete (a marker raises
+            # IN_CREATE and then IN_CLOSE_WRITE).
+            if mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO) and is_marker_name(name):
+                self._emit(project_path, directory, name)
+
+    # ── Polling fallback ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _stat_dirs(dirs: List[Tuple[Path, str]], previous: Dict[Path, tuple]) -> Dict[Path, tuple]:
+        """One batched pass over `dirs`. Signature per dir: for a project or
+        job dir, (name, mtime_ns, size) of each marker it can hold; for a
+        .task_status/ dir, (mtime_ns, names, listed_at) where names is only
+        re-listed when the dir mtime moved or the previous listing was racy."""
+        sigs: Dict[Path, tuple] = {}
+        for d, kind in dirs:
+            if kind == _TASKS:
+                try:
+                    mtime = os.stat(d).st_mtime_ns
+                except OSError:
+                    sigs[d] = (None, frozenset(), 0.0)
+                    continue
+                prev = previous.get(d)
+                if prev is not None and prev[0] == mtime and prev[2] - mtime / 1e9 > RACY_MTIME_WINDOW_SEC:
+                    sigs[d] = prev
+                    continue
+                listed_at = time.time()
+                try:
+                    names = frozenset(n for n in os.listdir(d) if n.endswith(TASK_STATUS_SUFFIXES))
+                except OSError:
+                    names = frozenset()
+                sigs[d] = (mtime, names, listed_at)
+                continue
+            sig = []
+            for name in (PIPELINE_STAR,) if kind == _PROJECT else EXIT_MARKERS:
+                try:
+                    st = os.stat(d / name)
+                    sig.append((name, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    sig.append((name, None, None))
+            sigs[d] = tuple(sig)
+        return sigs
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(POLL_INTERVAL_SEC)
+            owners = {d: (p, kind) for p, ds in self._dirs.items() if self._polled.get(p) for d, kind in ds.items()}
+            if not owners:
+                continue
+            previous = dict(self._poll_sigs)
+            try:
+                sigs = await self._run_io(self._stat_dirs, [(d, kind) for d, (_, kind) in owners.items()], previous)
+            except Exception:
+                logger.exception("MarkerWatcher poll failed")
+                continue
+            for d, sig in sigs.items():
+                project_path, kind = owners[d]
+                if d not in self._dirs.get(project_path, {}):
+                    continue  # unsubscribed while the stat pass ran
+                old = previous.get(d)
+                self._poll_sigs[d] = sig
+                if old == sig:
+                    continue
+                if kind == _TASKS:
+                    # The first listing is only a baseline.
+                    if old is not None:
+                        for name in sorted(sig[1] - old[1]):
+                            self._emit(project_path, d, name)
+                    continue
+                for i, (name, mtime, size) in enumerate(sig):
+                    if mtime is None:
+                        continue
+                    if old is None:
+                        # First look at a job dir: a marker already there may
+                        # postdate the last reconcile. Project dirs: baseline.
+                        if kind == _JOB:
+                            self._emit(project_path, d, name)
+                    elif old[i][1:] != (mtime, size):
+                        self._emit(project_path, d, name)
@@ -19,8 +19,8 @@ Responsibilities:
      External/jobNNN dirs are reused, so .task_status/*.ok markers from
      the prior run let per-TS retries skip already-succeeded tasks.
 
-  3. Run a single async tick (3 s) over every project in the registry
-     with `pipeline_active=True`, calling
+  3. Reconcile every project in the registry with `pipeline_active=True`
+     on its own schedule, calling
      `PipelineRunnerService.sync_all_jobs`. That call is the canonical
      reconciler: it patches `default_pipeline.star` Running→Succeeded/Failed
      from `RELION_JOB_EXIT_*` markers, writes the changes to in-memory
@@ -28,6 +28,16 @@ Responsibilities:
      any per-job failure invokes `stop_and_cleanup` (which clears
      `state.pipeline_active`).
 
+     Projects are reconciled concurrently (at most
+     MAX_CONCURRENT_RECONCILES at once; their filesystem work runs on the
+     runner's I/O pool, off the event loop). Each project polls every
+     TICK_INTERVAL_SEC while its jobs are changing state or waiting in the
+     SLURM queue, and backs off towards MAX_TICK_INTERVAL_SEC while
+     everything is simply running. A MarkerWatcher (inotify, or batched
+     stat polling on NFS/Lustre) subscribed to the running job dirs cuts
+     that wait short: an exit marker or a default_pipeline.star rewrite
+     makes the project due at once.
+
 All UI surfaces (landing page, workspace pipeline indicator, project hub
 dialog) now read from `state.pipeline_active` and `job_model.execution_status`
 in memory; they no longer reconcile themselves. The per-tab status
@@ -39,17 +49,26 @@ and run-slot rebuild themselves when state changes — but it does NOT call
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+from services.scheduling_and_orchestration.marker_watcher import EXIT_MARKERS, PIPELINE_STAR, MarkerWatcher
 
 if TYPE_CHECKING:
     from backend import CryoBoostBackend
 
 logger = logging.getLogger(__name__)
 
+# Per-project poll interval while jobs are transitioning, and the ceiling it
+# backs off to (by TICK_BACKOFF per quiet reconcile) while nothing changes.
 TICK_INTERVAL_SEC = 3.0
+MAX_TICK_INTERVAL_SEC = 15.0
+TICK_BACKOFF = 1.5
+# How often the scheduler looks for newly active projects.
+SCHEDULER_WAKE_SEC = 1.0
+MAX_CONCURRENT_RECONCILES = 4
 
 
 class PipelineMonitor:
@@ -58,14 +77,38 @@ class PipelineMonitor:
         self._task: asyncio.Task | None = None
         self._stopping = asyncio.Event()
         self._recovered_paths: set[Path] = set()
+        self._reconcile_slots = asyncio.Semaphore(MAX_CONCURRENT_RECONCILES)
+        # Per-project schedule, keyed by the registry's (resolved) path.
+        self._intervals: Dict[Path, float] = {}
+        self._next_due: Dict[Path, float] = {}
+        self._inflight: Dict[Path, asyncio.Task] = {}
+        # Projects with a marker event since their current reconcile began.
+        self._kicked: set[Path] = set()
+        self._wakeup = asyncio.Event()
+        self._watcher: MarkerWatcher | None = None
+        self._marker_listeners: List[Callable[[Path, Path, str], None]] = []
 
     async def start(self) -> None:
+        self._watcher = MarkerWatcher(self._backend.pipeline_runner.run_io)
+        self._watcher.add_listener(self._on_marker)
+        self._watcher.start()
         await self._discover_and_recover()
         self._task = asyncio.create_task(self._loop(), name="pipeline-monitor")
-        logger.info("PipelineMonitor started (tick=%.1fs)", TICK_INTERVAL_SEC)
+        logger.info(
+            "PipelineMonitor started (tick=%.1f-%.1fs, %d concurrent)",
+            TICK_INTERVAL_SEC,
+            MAX_TICK_INTERVAL_SEC,
+            MAX_CONCURRENT_RECONCILES,
+        )
 
     async def stop(self) -> None:
         self._stopping.set()
+        self._wakeup.set()
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._watcher is not None:
+            await self._watcher.close()
+            self._watcher = None
         if self._task is None:
             return
         self._task.cancel()
@@ -96,19 +139,12 @@ class PipelineMonitor:
 
         candidates: list[Path] = []
         try:
-            for item in base_path.iterdir():
-                if not item.is_dir():
-                    continue
-                params_file = item / "project_params.json"
-                if not params_file.exists():
-                    continue
-                try:
-                    with open(params_file) as f:
-                        data = json.load(f)
-                except Exception:
-                    continue
-                if bool(data.get("pipeline_active")):
-                    candidates.append(item)
+            from services.project_catalog import scan_project_catalog
+
+            catalog = await asyncio.to_thread(scan_project_catalog, base_path)
+            for entry in catalog:
+                if entry.summary is not None and entry.summary["pipeline_active"]:
+                    candidates.append(entry.project_dir)
         except Exception:
             logger.exception("Recovery: failed to walk %s", base_path)
             return
@@ -200,52 +236,168 @@ class PipelineMonitor:
             except Exception:
                 logger.exception("PipelineMonitor tick failed")
             try:
-                await asyncio.wait_for(self._stopping.wait(), timeout=TICK_INTERVAL_SEC)
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._wake_timeout())
             except asyncio.TimeoutError:
-                continue
+                pass
+            self._wakeup.clear()
+
+    def _wake_timeout(self) -> float:
+        """Seconds until the next project that can start a reconcile is due.
+        Projects with a reconcile in flight are left out: their deadline is
+        set when it finishes (a kick meanwhile only flags a follow-up)."""
+        wake = SCHEDULER_WAKE_SEC
+        due = [t for p, t in self._next_due.items() if p not in self._inflight]
+        if due:
+            wake = min(wake, max(0.0, min(due) - time.monotonic()))
+        return wake
 
     async def _tick_once(self) -> None:
+        """Start a reconcile for every active project that is due and not
+        already being reconciled."""
         from services.project_state import _project_states
 
         # Snapshot to avoid mutation-during-iteration when a new project
         # opens or closes mid-tick.
-        targets = [path for path, state in list(_project_states.items()) if state.pipeline_active]
-        if not targets:
-            return
-
+        targets = {path for path, state in list(_project_states.items()) if state.pipeline_active}
+        for project_path in [p for p in self._next_due if p not in targets and p not in self._inflight]:
+            self._next_due.pop(project_path, None)
+            self._intervals.pop(project_path, None)
+            self._kicked.discard(project_path)
+            if self._watcher is not None:
+                self._watcher.forget_project(project_path)
+            self._backend.pipeline_runner.forget_project(project_path)
+
+        now = time.monotonic()
         for project_path in targets:
-            # sbatch errors land on the schemer's stderr while the row in
-            # default_pipeline.star still reads "Running" — sync_all_jobs
-            # alone can't detect this because no exit marker is written
-            # for a job that never sbatched cleanly. Used to live in the
-            # per-tab status_poller; moved here so it fires even when no
-            # workspace tab is open.
+            if project_path in self._inflight:
+                continue
+            # Newly active projects are due immediately.
+            if self._next_due.setdefault(project_path, now) > now:
+                continue
+            self._next_due[project_path] = float("inf")
+            self._inflight[project_path] = asyncio.create_task(
+                self._reconcile(project_path), name=f"pipeline-monitor:{project_path.name}"
+            )
+
+    def kick(self, project_path: Path) -> None:
+        """Reconcile `project_path` as soon as possible (now, or right after
+        a reconcile already in flight)."""
+        self._kicked.add(project_path)
+        if project_path not in self._inflight:
+            self._next_due[project_path] = 0.0
+        self._intervals[project_path] = TICK_INTERVAL_SEC
+        self._wakeup.set()
+
+    def add_marker_listener(self, listener: Callable[[Path, Path, str], None]) -> None:
+        """Forward every marker event (exit markers, task-status files, the
+        pipeline star) to `listener(project_path, directory, name)` too.
+        Called on the event loop; must not block."""
+        self._marker_listeners.append(listener)
+
+    def _on_marker(self, project_path: Path, directory: Path, name: str) -> None:
+        if name in EXIT_MARKERS or name == PIPELINE_STAR:
+            logger.debug("Monitor[%s]: %s in %s", project_path.name, name, directory)
+            self.kick(project_path)
+        for listener in self._marker_listeners:
             try:
-                sbatch_errors = self._backend.pipeline_runner.get_sbatch_errors(project_path)
+                listener(project_path, directory, name)
             except Exception:
-                sbatch_errors = []
-            if sbatch_errors:
-                logger.warning(
-                    "Monitor[%s]: sbatch error detected, tearing down: %s", project_path.name, sbatch_errors[0]
-                )
-                try:
-                    await self._backend.pipeline_runner.stop_pipeline(project_path)
-                    await self._backend.pipeline_runner.reset_submission_failure(project_path)
-                except Exception:
-                    logger.exception("Monitor[%s]: sbatch-error cleanup failed", project_path.name)
+                logger.exception("Marker listener failed")
 
+    def _watch_running_jobs(self, project_path: Path) -> None:
+        from services.models_base import JobStatus
+        from services.project_state import _project_states
+
+        if self._watcher is None:
+            return
+        state = _project_states.get(project_path)
+        if state is None or not state.pipeline_active:
+            self._watcher.forget_project(project_path)
+            return
+        job_dirs = [
+            project_path / model.relion_job_name.rstrip("/")
+            for model in state.jobs.values()
+            if model.relion_job_name and model.execution_status in (JobStatus.RUNNING, JobStatus.QUEUED)
+        ]
+        self._watcher.watch_project(project_path, job_dirs)
+
+    def get_tick_intervals(self) -> Dict[Path, float]:
+        """Current poll interval (seconds) per active project."""
+        return dict(self._intervals)
+
+    async def _reconcile(self, project_path: Path) -> None:
+        changes: Dict[str, bool] = {}
+        try:
+            async with self._reconcile_slots:
+                self._kicked.discard(project_path)
+                changes = await self._reconcile_one(project_path)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Monitor[%s]: reconcile failed", project_path.name)
+        finally:
+            self._inflight.pop(project_path, None)
+            interval = self._next_interval(project_path, changes)
+            self._intervals[project_path] = interval
+            if project_path in self._kicked:
+                self._next_due[project_path] = 0.0
+                self._wakeup.set()
+            else:
+                self._next_due[project_path] = time.monotonic() + interval
             try:
-                await self._backend.pipeline_runner.sync_all_jobs(str(project_path))
+                self._watch_running_jobs(project_path)
             except Exception:
-                logger.exception("Monitor: sync_all_jobs failed for %s", project_path)
-
-            # Second-chance recovery: if a project we deferred earlier
-            # (jobs were RUNNING) has now caught up — no more RUNNING,
-            # SCHEDULED remain, no active schemer — re-deploy the
-            # remainder. Idempotent: subsequent ticks will see pipeline
-            # active = True (deploy sets it) and skip this branch.
-            if project_path.resolve() in self._recovered_paths:
-                await self._maybe_resume_deferred(project_path)
+                logger.exception("Monitor[%s]: updating marker watches failed", project_path.name)
+
+    def _next_interval(self, project_path: Path, changes: Dict[str, bool]) -> float:
+        from services.models_base import JobStatus
+        from services.project_state import _project_states
+
+        state = _project_states.get(project_path)
+        waiting = state is not None and any(
+            model.execution_status == JobStatus.QUEUED for model in state.jobs.values()
+        )
+        if changes or waiting:
+            return TICK_INTERVAL_SEC
+        previous = self._intervals.get(project_path, TICK_INTERVAL_SEC)
+        return min(previous * TICK_BACKOFF, MAX_TICK_INTERVAL_SEC)
+
+    async def _reconcile_one(self, project_path: Path) -> Dict[str, bool]:
+        runner = self._backend.pipeline_runner
+        # sbatch errors land on the schemer's stderr while the row in
+        # default_pipeline.star still reads "Running" — sync_all_jobs
+        # alone can't detect this because no exit marker is written
+        # for a job that never sbatched cleanly. Used to live in the
+        # per-tab status_poller; moved here so it fires even when no
+        # workspace tab is open.
+        try:
+            sbatch_errors = await runner.run_io(runner.get_sbatch_errors, project_path)
+        except Exception:
+            sbatch_errors = []
+        if sbatch_errors:
+            logger.warning(
+                "Monitor[%s]: sbatch error detected, tearing down: %s", project_path.name, sbatch_errors[0]
+            )
+            try:
+                await runner.stop_pipeline(project_path)
+                await runner.reset_submission_failure(project_path)
+            except Exception:
+                logger.exception("Monitor[%s]: sbatch-error cleanup failed", project_path.name)
+
+        changes: Dict[str, bool] = {}
+        try:
+            changes = await runner.sync_all_jobs(str(project_path))
+        except Exception:
+            logger.exception("Monitor: sync_all_jobs failed for %s", project_path)
+
+        # Second-chance recovery: if a project we deferred earlier
+        # (jobs were RUNNING) has now caught up — no more RUNNING,
+        # SCHEDULED remain, no active schemer — re-deploy the
+        # remainder. Idempotent: subsequent ticks will see pipeline
+        # active = True (deploy sets it) and skip this branch.
+        if project_path.resolve() in self._recovered_paths:
+            await self._maybe_resume_deferred(project_path)
+        return changes
 
     async def _maybe_resume_deferred(self, project_path: Path) -> None:
         from services.models_base import JobStatus, JobType
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import pandas as pd
@@ -187,6 +188,19 @@ class PipelineOrchestratorService:
                 job_model.relion_job_name = None
                 job_model.relion_job_number = None
 
+        # Curated subtomo sets are journals until something consumes them;
+        # write their filtered STARs before any job of this run can read them.
+        from services.visualization.picks_filter import materialize_project_curations
+
+        try:
+            await asyncio.to_thread(materialize_project_curations, state, project_dir)
+        except Exception as e:
+            logger.exception("Could not materialize curated particle sets in %s", project_dir)
+            return {"success": False, "message": f"Could not write curated particle sets: {e}"}
+
+        # The drivers the schemer launches read job params from disk.
+        await self.backend.state_service.flush_project(project_dir)
+
         return await self.backend.pipeline_runner.run_generated_scheme(
             project_dir=project_dir, scheme_name=scheme_name, bind_paths=list(set(bind_paths))
         )
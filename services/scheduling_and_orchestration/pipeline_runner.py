@@ -1,13 +1,17 @@
 import asyncio
 import logging
 import os
+import time
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from typing import TYPE_CHECKING
 
 from services.models_base import JobType
 from services.project_state import JobStatus
+from services.scheduling_and_orchestration.marker_watcher import RACY_MTIME_WINDOW_SEC
 from services.scheduling_and_orchestration.pipeline_orchestrator_service import JobTypeResolver
 
 if TYPE_CHECKING:
@@ -16,6 +20,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Ticks slower than this get logged at INFO so a slow filesystem shows up
+# in the server log without turning on debug output.
+SLOW_SYNC_WARN_SEC = 1.0
+# Threads for the monitor's blocking filesystem work (STAR reads, marker
+# stats, log scans), kept apart from the default executor so a stalled
+# Lustre mount can't starve to_thread users elsewhere in the server.
+MONITOR_IO_WORKERS = 8
+
+
+@dataclass
+class _PipelineTableCache:
+    """Parsed default_pipeline.star, keyed on (mtime_ns, size, inode).
+
+    Entries whose mtime falls within RACY_MTIME_WINDOW_SEC of when they
+    were read are never trusted (same trick as git's "racily clean" index):
+    on filesystems with coarse mtime a same-size rewrite in that window
+    would otherwise go unnoticed.
+    """
+
+    key: Tuple[int, int, int]
+    data: Dict[str, Any]
+    read_at: float = 0.0
+
+    def is_fresh(self, key: Tuple[int, int, int]) -> bool:
+        return self.key == key and (self.read_at - key[0] / 1e9) > RACY_MTIME_WINDOW_SEC
+
+
+@dataclass
+class _PathIndexCache:
+    """path_to_instance + per-type instance counts for one ProjectState.
+
+    Rebuilt only when `signature` (the job fields the index depends on)
+    changes, i.e. once per state mutation rather than once per tick.
+    `resolved_job_dirs` memoizes job_path -> resolved absolute job dir and
+    is dropped with the index, so it never outgrows the project's jobs.
+    """
+
+    signature: tuple
+    path_to_instance: Dict[str, str] = field(default_factory=dict)
+    type_instance_count: Dict[str, int] = field(default_factory=dict)
+    resolved_job_dirs: Dict[str, str] = field(default_factory=dict)
+
 
 class PipelineRunnerService:
     """
@@ -35,6 +81,16 @@ class PipelineRunnerService:
         # pipeline_active out from under a running retry.
         self._retry_monitors: Dict[Path, asyncio.Task] = {}
         self.job_resolver = JobTypeResolver(backend_instance.pipeline_orchestrator.star_handler)
+        # Incremental-reconcile caches, keyed by resolved project path.
+        self._pipeline_tables: Dict[Path, _PipelineTableCache] = {}
+        self._path_indices: Dict[Path, _PathIndexCache] = {}
+        self._sync_durations: Dict[Path, float] = {}
+        self._sync_locks: Dict[Path, asyncio.Lock] = {}
+        self._io_executor = ThreadPoolExecutor(max_workers=MONITOR_IO_WORKERS, thread_name_prefix="pipeline-io")
+
+    async def run_io(self, fn, *args):
+        """Run blocking filesystem work `fn(*args)` on the monitor's I/O pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, fn, *args)
 
     def is_active(self, project_path: Path) -> bool:
         resolved = project_path.resolve()
@@ -44,46 +100,214 @@ class PipelineRunnerService:
     # Status sync
     # -------------------------------------------------------------------------
 
+    def _read_pipeline_table(self, pipeline_star: Path) -> Optional[Dict[str, Any]]:
+        """Return default_pipeline.star parsed, re-reading only when the file
+        changed since the last call. One stat per tick on a cache hit.
+
+        The returned dict holds a copy of `pipeline_processes`, so callers may
+        patch it in place before handing it to _write_pipeline_table."""
+        try:
+            st = os.stat(pipeline_star)
+        except FileNotFoundError:
+            self._pipeline_tables.pop(pipeline_star, None)
+            return None
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        cached = self._pipeline_tables.get(pipeline_star)
+        if cached is None or not cached.is_fresh(key):
+            read_at = time.time()
+            data = self.backend.pipeline_orchestrator.star_handler.read(pipeline_star)
+            cached = _PipelineTableCache(key=key, data=data, read_at=read_at)
+            self._pipeline_tables[pipeline_star] = cached
+
+        data = dict(cached.data)
+        processes = data.get("pipeline_processes")
+        if isinstance(processes, pd.DataFrame):
+            data["pipeline_processes"] = processes.copy()
+        return data
+
+    def _write_pipeline_table(self, data: Dict[str, Any], pipeline_star: Path) -> None:
+        # A fresh write is always inside the racy window, so there is nothing
+        # to gain from seeding the cache here; the next tick re-reads once.
+        self._pipeline_tables.pop(pipeline_star, None)
+        self.backend.pipeline_orchestrator.star_handler.write(data, pipeline_star)
+
+    def _path_index_for(self, state: "ProjectState", project_root: Path) -> _PathIndexCache:
+        """path_to_instance / type_instance_count for `state`, rebuilt only
+        when a field it's derived from has changed since the last tick."""
+        mapping = state.job_path_mapping or {}
+        signature = tuple(
+            (iid, getattr(model, "relion_job_name", None), mapping.get(iid), (model.paths or {}).get("job_dir"))
+            for iid, model in state.jobs.items()
+        )
+        resolved = project_root.resolve()
+        cached = self._path_indices.get(resolved)
+        if cached is not None and cached.signature == signature:
+            return cached
+
+        path_to_instance: Dict[str, str] = {}
+        for iid, rjn, _, _ in signature:
+            if rjn:
+                path_to_instance[rjn.rstrip("/")] = iid
+
+        for iid, _, mapped, _ in signature:
+            if mapped:
+                key = mapped.rstrip("/")
+                if key not in path_to_instance:
+                    path_to_instance[key] = iid
+
+        for iid, rjn, _, job_dir_abs in signature:
+            if rjn or not job_dir_abs:
+                continue
+            try:
+                rel = str(Path(job_dir_abs).relative_to(project_root))
+                if rel not in path_to_instance:
+                    path_to_instance[rel] = iid
+            except ValueError:
+                pass
+
+        type_instance_count: Dict[str, int] = {}
+        for iid in state.jobs:
+            base = iid.split("__")[0]
+            type_instance_count[base] = type_instance_count.get(base, 0) + 1
+
+        cached = _PathIndexCache(
+            signature=signature, path_to_instance=path_to_instance, type_instance_count=type_instance_count
+        )
+        self._path_indices[resolved] = cached
+        return cached
+
+    @staticmethod
+    def _resolved_job_dir(path_index: _PathIndexCache, project_root: Path, job_path_clean: str) -> str:
+        resolved = path_index.resolved_job_dirs.get(job_path_clean)
+        if resolved is None:
+            resolved = str((project_root / job_path_clean).resolve())
+            path_index.resolved_job_dirs[job_path_clean] = resolved
+        return resolved
+
+    def forget_project(self, project_path: Path) -> None:
+        """Drop the incremental-reconcile caches of a project that is no
+        longer monitored."""
+        resolved = Path(project_path).resolve()
+        self._path_indices.pop(resolved, None)
+        self._pipeline_tables.pop(Path(project_path) / "default_pipeline.star", None)
+
+    def get_sync_durations(self) -> Dict[Path, float]:
+        """Wall time (seconds) of the most recent sync_all_jobs per project."""
+        return dict(self._sync_durations)
+
     async def sync_all_jobs(self, project_path: str) -> Dict[str, bool]:
+        resolved = Path(project_path).resolve()
+        lock = self._sync_locks.setdefault(resolved, asyncio.Lock())
+        async with lock:
+            started = time.perf_counter()
+            try:
+                return await self._sync_all_jobs(project_path)
+            finally:
+                elapsed = time.perf_counter() - started
+                self._sync_durations[resolved] = elapsed
+                if elapsed >= SLOW_SYNC_WARN_SEC:
+                    logger.info("sync_all_jobs[%s] took %.2fs", resolved.name, elapsed)
+                else:
+                    logger.debug("sync_all_jobs[%s] took %.3fs", resolved.name, elapsed)
+
+    def _reconcile_exit_markers(self, project_path: str) -> Optional[Tuple[Dict[str, Any], List[str], bool]]:
+        """Blocking half of the marker pass: read default_pipeline.star,
+        flip Running rows whose RELION_JOB_EXIT_* marker exists, write the
+        table back if anything changed. Returns (data, failed_job_paths,
+        already_failed_in_star), or None if there is no pipeline table."""
         pipeline_star = Path(project_path) / "default_pipeline.star"
-        if not pipeline_star.exists():
-            return {}
+        data = self._read_pipeline_table(pipeline_star)
+        if data is None:
+            return None
 
-        star_handler = self.backend.pipeline_orchestrator.star_handler
-        data = star_handler.read(pipeline_star)
         processes = data.get("pipeline_processes", pd.DataFrame())
 
         star_patched = False
         failed_job_paths: List[str] = []
         already_failed_in_star = False
         if not processes.empty and "rlnPipeLineProcessStatusLabel" in processes.columns:
-            for idx, row in processes.iterrows():
-                label = row["rlnPipeLineProcessStatusLabel"]
-                if label == "Failed":
-                    # The relion schemer recorded this failure itself before
-                    # halting the scheme — there's no Running->Failed transition
-                    # left for the branch below to catch.
-                    already_failed_in_star = True
-                elif label == "Running":
-                    job_dir = Path(project_path) / row["rlnPipeLineProcessName"].rstrip("/")
-                    if (job_dir / "RELION_JOB_EXIT_SUCCESS").exists():
-                        processes.at[idx, "rlnPipeLineProcessStatusLabel"] = "Succeeded"
-                        star_patched = True
-                        logger.info(
-                            "Reconciled %s: Running -> Succeeded (RELION_JOB_EXIT_SUCCESS found on disk)",
-                            row["rlnPipeLineProcessName"],
-                        )
-                    elif (job_dir / "RELION_JOB_EXIT_FAILURE").exists():
-                        processes.at[idx, "rlnPipeLineProcessStatusLabel"] = "Failed"
-                        star_patched = True
-                        failed_job_paths.append(row["rlnPipeLineProcessName"])
-                        logger.info(
-                            "Reconciled %s: Running -> Failed (RELION_JOB_EXIT_FAILURE found on disk)",
-                            row["rlnPipeLineProcessName"],
-                        )
+            labels = processes["rlnPipeLineProcessStatusLabel"]
+            # The relion schemer recorded this failure itself before halting
+            # the scheme — there's no Running->Failed transition left for the
+            # marker check below to catch.
+            already_failed_in_star = bool((labels == "Failed").any())
+            # Only Running rows can still be reconciled from exit markers;
+            # terminal and Pending rows are never stat'ed.
+            for idx in processes.index[labels == "Running"]:
+                job_name = processes.at[idx, "rlnPipeLineProcessName"]
+                job_dir = Path(project_path) / job_name.rstrip("/")
+                if (job_dir / "RELION_JOB_EXIT_SUCCESS").exists():
+                    processes.at[idx, "rlnPipeLineProcessStatusLabel"] = "Succeeded"
+                    star_patched = True
+                    logger.info(
+                        "Reconciled %s: Running -> Succeeded (RELION_JOB_EXIT_SUCCESS found on disk)", job_name
+                    )
+                elif (job_dir / "RELION_JOB_EXIT_FAILURE").exists():
+                    processes.at[idx, "rlnPipeLineProcessStatusLabel"] = "Failed"
+                    star_patched = True
+                    failed_job_paths.append(job_name)
+                    logger.info(
+                        "Reconciled %s: Running -> Failed (RELION_JOB_EXIT_FAILURE found on disk)", job_name
+                    )
             if star_patched:
                 data["pipeline_processes"] = processes
-                star_handler.write(data, pipeline_star)
+                self._write_pipeline_table(data, pipeline_star)
+        return data, failed_job_paths, already_failed_in_star
+
+    def _probe_process_rows(
+        self,
+        project_path: str,
+        processes: pd.DataFrame,
+        path_index: _PathIndexCache,
+        slurm_jobs_by_dir: Dict[str, Any],
+    ) -> List[Tuple[str, str, str, Optional[str], bool]]:
+        """Blocking half of the status pass: everything per pipeline row
+        that needs the filesystem. One (job_path, status_label, instance_id,
+        job_dir_abs, has_task_manifest) tuple per row that maps to a job
+        instance; job_dir_abs / has_task_manifest only for Running rows."""
+        project_root = Path(project_path)
+        rows: List[Tuple[str, str, str, Optional[str], bool]] = []
+        if processes.empty:
+            return rows
+        for job_path, status_str in zip(
+            processes["rlnPipeLineProcessName"], processes["rlnPipeLineProcessStatusLabel"]
+        ):
+            job_path_clean = job_path.rstrip("/")
+
+            instance_id = path_index.path_to_instance.get(job_path_clean)
+
+            if instance_id is None:
+                job_type_str = self.job_resolver.get_job_type_from_path(project_root, job_path)
+                if not job_type_str:
+                    continue
+                if path_index.type_instance_count.get(job_type_str, 0) == 1:
+                    instance_id = job_type_str
+                else:
+                    continue
+
+            job_dir_abs = None
+            has_manifest = False
+            if status_str == "Running":
+                job_dir_abs = self._resolved_job_dir(path_index, project_root, job_path_clean)
+                sj = slurm_jobs_by_dir.get(job_dir_abs)
+                # For array-dispatching jobs: if the supervisor wrote a task
+                # manifest, the job is actively running even if the
+                # supervisor's own SLURM state is still PENDING (children may
+                # already be running).
+                if sj is not None and sj.state == "PENDING":
+                    has_manifest = (project_root / job_path_clean / ".task_manifest.json").exists()
+            rows.append((job_path, status_str, instance_id, job_dir_abs, has_manifest))
+        return rows
+
+    async def _sync_all_jobs(self, project_path: str) -> Dict[str, bool]:
+        # Filesystem work runs on the I/O pool; only in-memory state is
+        # touched on the event loop.
+        reconciled = await self.run_io(self._reconcile_exit_markers, project_path)
+        if reconciled is None:
+            return {}
+        data, failed_job_paths, already_failed_in_star = reconciled
+        processes = data.get("pipeline_processes", pd.DataFrame())
 
         changes: Dict[str, bool] = {}
         state = self.backend.state_service.state_for(Path(project_path))
@@ -135,31 +359,23 @@ class PipelineRunnerService:
             except Exception as e:
                 logger.warning("STOP-ON-FAIL: stop_and_cleanup raised: %s", e)
 
-        # build squeue lookup once if any Running rows exist
+        # squeue lookup, only if any Running rows exist. The snapshot is shared
+        # across every project reconciled in this tick (single-flight in
+        # SlurmService), so this is at most one squeue per monitor interval.
         slurm_jobs_by_dir: dict = {}
         if not processes.empty and "rlnPipeLineProcessStatusLabel" in processes.columns:
             has_running = (processes["rlnPipeLineProcessStatusLabel"] == "Running").any()
             if has_running:
                 try:
-                    slurm_jobs = await self.backend.slurm_service.get_user_jobs(force_refresh=True)
-                    for sj in slurm_jobs:
-                        if sj.stdout_path:
-                            try:
-                                resolved_dir = str(Path(sj.stdout_path).resolve().parent)
-                                existing = slurm_jobs_by_dir.get(resolved_dir)
-                                if existing is None:
-                                    slurm_jobs_by_dir[resolved_dir] = sj
-                                else:
-                                    # For array jobs, the supervisor (run.out) and child tasks
-                                    # (task_0.out, task_1.out, ...) all resolve to the same dir.
-                                    # Prefer the supervisor so the model's slurm_job_id is the
-                                    # supervisor ID, which is what cancel_job needs to scancel.
-                                    existing_is_task = Path(existing.stdout_path).name.startswith("task_")
-                                    new_is_task = Path(sj.stdout_path).name.startswith("task_")
-                                    if existing_is_task and not new_is_task:
-                                        slurm_jobs_by_dir[resolved_dir] = sj
-                            except Exception as e:
-                                logger.info("Could not resolve stdout path for SLURM job %s: %s", sj.job_id, e)
+                    snapshot = await self.backend.slurm_service.get_squeue_snapshot()
+                    for resolved_dir, dir_jobs in snapshot.by_stdout_dir.items():
+                        # For array jobs, the supervisor (run.out) and child tasks
+                        # (task_0.out, task_1.out, ...) all resolve to the same dir.
+                        # Prefer the supervisor so the model's slurm_job_id is the
+                        # supervisor ID, which is what cancel_job needs to scancel.
+                        slurm_jobs_by_dir[resolved_dir] = next(
+                            (sj for sj in dir_jobs if not Path(sj.stdout_path).name.startswith("task_")), dir_jobs[0]
+                        )
                 except Exception as e:
                     logger.info("Could not fetch squeue for QUEUED cross-reference: %s", e)
 
@@ -171,79 +387,34 @@ class PipelineRunnerService:
             except Exception as e:
                 logger.info("Could not persist pipeline_active reset: %s", e)
 
-        path_to_instance: Dict[str, str] = {}
-
-        for iid, model in state.jobs.items():
-            rjn = getattr(model, "relion_job_name", None)
-            if rjn:
-                path_to_instance[rjn.rstrip("/")] = iid
-
-        for iid in state.jobs:
-            mapped = (state.job_path_mapping or {}).get(iid)
-            if mapped:
-                key = mapped.rstrip("/")
-                if key not in path_to_instance:
-                    path_to_instance[key] = iid
-
-        for iid, model in state.jobs.items():
-            if getattr(model, "relion_job_name", None):
-                continue
-            job_dir_abs = (model.paths or {}).get("job_dir")
-            if job_dir_abs:
-                try:
-                    rel = str(Path(job_dir_abs).relative_to(project_root))
-                    if rel not in path_to_instance:
-                        path_to_instance[rel] = iid
-                except ValueError:
-                    pass
-
-        type_instance_count: Dict[str, int] = {}
-        for iid in state.jobs:
-            base = iid.split("__")[0]
-            type_instance_count[base] = type_instance_count.get(base, 0) + 1
+        path_index = self._path_index_for(state, project_root)
 
         found_instances: set = set()
 
-        for _, row in processes.iterrows():
-            job_path = row["rlnPipeLineProcessName"]
-            job_path_clean = job_path.rstrip("/")
-
-            instance_id = path_to_instance.get(job_path_clean)
-
-            if instance_id is None:
-                job_type_str = self.job_resolver.get_job_type_from_path(Path(project_path), job_path)
-                if not job_type_str:
-                    continue
-                if type_instance_count.get(job_type_str, 0) == 1:
-                    instance_id = job_type_str
-                else:
-                    continue
+        if not processes.empty and "rlnPipeLineProcessStatusLabel" not in processes.columns:
+            processes = pd.DataFrame()
+        rows = await self.run_io(
+            self._probe_process_rows, project_path, processes, path_index, slurm_jobs_by_dir
+        )
 
+        for job_path, status_str, instance_id, job_dir_abs, has_manifest in rows:
             if instance_id not in state.jobs:
                 continue
 
             job_model = state.jobs[instance_id]
             old_status = job_model.execution_status
 
-            status_str = row["rlnPipeLineProcessStatusLabel"]
             if status_str == "Pending":
                 new_status = JobStatus.SCHEDULED
             elif status_str == "Running":
-                job_dir_abs = str((Path(project_path) / job_path_clean).resolve())
                 sj = slurm_jobs_by_dir.get(job_dir_abs)
                 if sj:
                     job_model.slurm_job_id = sj.job_id
                     new_status = JobStatus.QUEUED if sj.state == "PENDING" else JobStatus.RUNNING
                 else:
                     new_status = JobStatus.RUNNING
-
-                # For array-dispatching jobs: if the supervisor wrote a task
-                # manifest, the job is actively running even if the supervisor's
-                # own SLURM state is still PENDING (children may already be running).
-                if new_status == JobStatus.QUEUED:
-                    manifest_path = Path(project_path) / job_path_clean / ".task_manifest.json"
-                    if manifest_path.exists():
-                        new_status = JobStatus.RUNNING
+                if new_status == JobStatus.QUEUED and has_manifest:
+                    new_status = JobStatus.RUNNING
             else:
                 try:
                     new_status = JobStatus(status_str)
@@ -663,6 +834,18 @@ class PipelineRunnerService:
                 return {"success": False, "message": f"Cannot retry {iid}: {script} missing"}
             prepared.append((iid, job_dir, script))
 
+        # Retried consumers read curated sets saved since their first run.
+        from services.visualization.picks_filter import materialize_project_curations
+
+        try:
+            await asyncio.to_thread(materialize_project_curations, state, project_dir)
+        except Exception as e:
+            logger.exception("Could not materialize curated particle sets in %s", project_dir)
+            return {"success": False, "message": f"Could not write curated particle sets: {e}"}
+
+        # The re-sbatched drivers read job params from disk.
+        await self.backend.state_service.flush_project(project_dir)
+
         # Clean stale markers, flip pipeline.star to Running, sbatch each supervisor.
         for iid, job_dir, script in prepared:
             for marker in ("RELION_JOB_EXIT_SUCCESS", "RELION_JOB_EXIT_FAILURE"):
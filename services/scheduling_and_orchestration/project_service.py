@@ -62,7 +62,8 @@ class DataImportService:
             for mdoc_path_str in mdoc_files:
                 mdoc_path = Path(mdoc_path_str)
 
-                parsed_mdoc = self.mdoc_service.parse_mdoc_file(mdoc_path)
+                # Fresh copy from the shared index (the overview parsed it already).
+                parsed_mdoc = self.mdoc_service.parse_mdoc_file_cached(mdoc_path)
 
                 for section in parsed_mdoc["data"]:
                     if "SubFramePath" not in section:
@@ -476,7 +477,7 @@ class ProjectService:
             # 4. Save Project State (project_params.json) — includes import summary
             params_json_path = project_dir / "project_params.json"
             await self.backend.state_service.save_project(
-                save_path=params_json_path, project_path=project_dir, force=True
+                save_path=params_json_path, project_path=project_dir, force=True, durable=True
             )
 
             # 5. Initialize Relion (Create default_pipeline.star)
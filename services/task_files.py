@@ -0,0 +1,75 @@
+# services/task_files.py
+"""
+Readers for the files an array job's supervisor leaves in its job directory
+(.task_manifest.json, .task_status/, task_{idx}.out), plus job-dir
+resolution. Shared by the per-job task tracker, the Journey table and the
+Tomogram Dashboard.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def read_manifest(job_dir: Path) -> Optional[dict]:
+    """Read .task_manifest.json from a job directory."""
+    manifest_path = job_dir / ".task_manifest.json"
+    if not manifest_path.exists():
+        return None
+    try:
+        return json.loads(manifest_path.read_text())
+    except Exception:
+        return None
+
+
+def scan_statuses(job_dir: Path, items: List[str]) -> Dict[str, str]:
+    """Scan .task_status/ dir and return {item_name: status_string}.
+
+    Uses task_{idx}.out existence to distinguish running vs pending:
+      - .task_status/{name}.ok   → "ok"
+      - .task_status/{name}.fail → "fail"
+      - .task_status/{name}.skip → "skip" (supervisor pre-marked; never dispatched)
+      - task_{idx}.out exists (no status file) → "running" (SLURM started it)
+      - task_{idx}.out missing (no status file) → "pending" (still queued)
+    """
+    status_dir = job_dir / ".task_status"
+    ok_set: set = set()
+    fail_set: set = set()
+    skip_set: set = set()
+    if status_dir.is_dir():
+        for p in status_dir.iterdir():
+            if p.suffix == ".ok":
+                ok_set.add(p.stem)
+            elif p.suffix == ".fail":
+                fail_set.add(p.stem)
+            elif p.suffix == ".skip":
+                skip_set.add(p.stem)
+
+    statuses: Dict[str, str] = {}
+    for idx, name in enumerate(items):
+        if name in ok_set:
+            statuses[name] = "ok"
+        elif name in fail_set:
+            statuses[name] = "fail"
+        elif name in skip_set:
+            statuses[name] = "skip"
+        elif (job_dir / f"task_{idx}.out").exists():
+            statuses[name] = "running"
+        else:
+            statuses[name] = "pending"
+    return statuses
+
+
+def resolve_job_dir(job_model, project_path: Optional[Path] = None) -> Optional[Path]:
+    """Resolve the on-disk job directory from a job model."""
+    stored = (job_model.paths or {}).get("job_dir")
+    if stored:
+        p = Path(stored)
+        if p.is_dir():
+            return p
+    rjn = getattr(job_model, "relion_job_name", None)
+    if rjn and project_path:
+        p = project_path / rjn.rstrip("/")
+        if p.is_dir():
+            return p
+    return None
@@ -35,12 +35,25 @@ search would be wrong — but that's the user's mistake, not ours.
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Orientations canonicalized per batch in `_reduce_to_asymmetric_unit`.
+REDUCE_CHUNK = 16384
+# Quaternion components are compared rounded to 1e-6.
+_QUAT_KEY_SCALE = 1e6
+
+# Bump when the grid or the reduction changes, so stale cached lists are
+# not served.
+ANGLE_CACHE_VERSION = 1
+_CACHE_DIR = Path.home() / ".crboost" / "angle_lists"
+
 # Order of each point group — used to estimate output count and as the
 # expected reduction factor relative to full SO(3) sampling.
 POINT_GROUP_ORDER = {
@@ -96,36 +109,120 @@ def _uniform_so3_grid(angle_increment_deg: float) -> np.ndarray:
     return np.stack([A.ravel(), B.ravel(), G.ravel()], axis=1)
 
 
+def _quat_compose(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Hamilton products p_j ⊗ q_i for every pair, scipy [x, y, z, w] order:
+    (len(q), len(p), 4), matching `Rotation(p) * Rotation(q)` (q applied first)."""
+    px, py, pz, pw = (p[None, :, k] for k in range(4))
+    qx, qy, qz, qw = (q[:, None, k] for k in range(4))
+    return np.stack(
+        [
+            pw * qx + px * qw + py * qz - pz * qy,
+            pw * qy - px * qz + py * qw + pz * qx,
+            pw * qz + px * qy - py * qx + pz * qw,
+            pw * qw - px * qx - py * qy - pz * qz,
+        ],
+        axis=-1,
+    )
+
+
+def _canonical_keys(rot_quats: np.ndarray, group_quats: np.ndarray) -> np.ndarray:
+    """(N, 4) int64 coset fingerprint per rotation: the lex-smallest of its
+    |G| equivalents S·R as a w≥0 quaternion rounded to 1e-6."""
+    quats = _quat_compose(group_quats, rot_quats)  # (N, |G|, 4)
+    # Enforce w >= 0 so the two equivalent quaternions (q, -q) for one
+    # rotation collapse to a single canonical form. Without this we'd
+    # double-count via sign.
+    quats *= np.where(quats[..., 3:4] < 0, -1.0, 1.0)
+    # Same classes as np.round(q, 6), but exact to compare and hash.
+    keys = np.rint(quats * _QUAT_KEY_SCALE).astype(np.int64)
+    # Lex-smallest per row: narrow the candidates one component at a time.
+    cand = np.ones(keys.shape[:2], dtype=bool)
+    big = np.iinfo(np.int64).max
+    for k in range(4):
+        vals = np.where(cand, keys[..., k], big)
+        cand &= vals == vals.min(axis=1, keepdims=True)
+    return keys[np.arange(len(keys)), cand.argmax(axis=1)]
+
+
 def _reduce_to_asymmetric_unit(angles_rad: np.ndarray, point_group: str) -> np.ndarray:
     """For each input orientation R, compute all |G| equivalents (S·R for S in
     group), canonicalize to the lex-smallest quaternion (with w≥0 sign-flip
-    so q and -q collapse), and keep one input per canonical key. Output
-    contains the original ZXZ angles of the surviving reps."""
+    so q and -q collapse), and keep the first input per canonical key.
+    Output contains the original ZXZ angles of the surviving reps, in input
+    order.
+
+    Batched over REDUCE_CHUNK orientations at a time, which bounds the
+    (chunk, |G|, 4) equivalents array (~30 MB for I at the default)."""
     from scipy.spatial.transform import Rotation as R
 
-    sym_group = R.create_group(_scipy_group_name(point_group))
-    rots = R.from_euler("ZXZ", angles_rad)
-
-    canonical_keys: set[tuple] = set()
-    keep_indices: list[int] = []
-    for i in range(len(rots)):
-        rot = rots[i]
-        equivs = sym_group * rot  # shape (|G|,)
-        quats = equivs.as_quat()  # (|G|, 4), scipy order [x, y, z, w]
-        # Enforce w >= 0 so the two equivalent quaternions (q, -q) for one
-        # rotation collapse to a single canonical form. Without this we'd
-        # double-count via sign.
-        signs = np.where(quats[:, 3:4] < 0, -1.0, 1.0)
-        quats = quats * signs
-        # Pick lex-smallest as the canonical fingerprint — stable across runs.
-        rep_key = min(tuple(np.round(q, 6)) for q in quats)
-        if rep_key not in canonical_keys:
-            canonical_keys.add(rep_key)
-            keep_indices.append(i)
-
-    if not keep_indices:
+    if not len(angles_rad):
         return np.zeros((0, 3))
-    return angles_rad[keep_indices]
+    group_quats = R.create_group(_scipy_group_name(point_group)).as_quat()
+    rot_quats = R.from_euler("ZXZ", angles_rad).as_quat()
+
+    keys = np.concatenate(
+        [
+            _canonical_keys(rot_quats[start : start + REDUCE_CHUNK], group_quats)
+            for start in range(0, len(rot_quats), REDUCE_CHUNK)
+        ]
+    )
+    # return_index gives each key's first occurrence, so the kept reps are
+    # the ones the sequential scan would have kept.
+    _, first = np.unique(keys, axis=0, return_index=True)
+    return angles_rad[np.sort(first)]
+
+
+def _cache_dir() -> Path:
+    override = os.environ.get("CRBOOST_ANGLE_LIST_CACHE")
+    return Path(override).expanduser() if override else _CACHE_DIR
+
+
+def _cache_path(point_group: str, angle_increment_deg: float) -> Path:
+    group = _scipy_group_name(point_group)
+    return _cache_dir() / f"{group}_{angle_increment_deg:g}deg.v{ANGLE_CACHE_VERSION}.npy"
+
+
+def _load_cached(path: Path) -> Optional[np.ndarray]:
+    try:
+        angles = np.load(path, allow_pickle=False)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable angle list cache %s: %s", path, e)
+        return None
+    if angles.ndim != 2 or angles.shape[1] != 3:
+        logger.warning("Ignoring malformed angle list cache %s", path)
+        return None
+    return angles
+
+
+def _default_file_mode() -> int:
+    """0o666 minus the process umask: what open() would have created."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return 0o666 & ~mask
+
+
+def _save_cached(path: Path, angles: np.ndarray) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp_", suffix=".npy")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, angles, allow_pickle=False)
+            # mkstemp creates 0600; a site-shared cache must be readable by
+            # the other users, or each of them recomputes and then fails to
+            # replace the file in a sticky directory.
+            os.chmod(tmp, _default_file_mode())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        logger.warning("Could not cache angle list %s: %s", path, e)
 
 
 def generate_asymmetric_unit_angles(point_group: str, angle_increment_deg: float = 12.0) -> np.ndarray:
@@ -134,13 +231,22 @@ def generate_asymmetric_unit_angles(point_group: str, angle_increment_deg: float
     For C1 returns full SO(3) sampling — caller would normally use the float
     --angular-search increment instead of writing a file, but this is the
     sensible fallback if a downstream caller wants a file unconditionally.
+
+    Reductions are cached per (group, increment) under ~/.crboost/angle_lists/
+    (or $CRBOOST_ANGLE_LIST_CACHE, e.g. a directory shared by a whole site),
+    so repeated template-match runs don't redo them.
     """
     if point_group not in POINT_GROUP_ORDER:
         raise ValueError(f"Unknown point group: {point_group}")
-    grid = _uniform_so3_grid(angle_increment_deg)
     if point_group == "C1":
-        return grid
-    return _reduce_to_asymmetric_unit(grid, point_group)
+        return _uniform_so3_grid(angle_increment_deg)
+    path = _cache_path(point_group, angle_increment_deg)
+    angles = _load_cached(path)
+    if angles is not None:
+        return angles
+    angles = _reduce_to_asymmetric_unit(_uniform_so3_grid(angle_increment_deg), point_group)
+    _save_cached(path, angles)
+    return angles
 
 
 def write_angle_list_file(angles_rad: np.ndarray, out_path: Path) -> Path:
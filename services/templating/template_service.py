@@ -3,10 +3,10 @@ import asyncio
 import gzip
 import logging
 import shutil
+import threading
 import requests
 import numpy as np
 import mrcfile
-from scipy import fftpack
 from skimage import filters
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -57,6 +57,68 @@ def normalize_white_and_negate_to_black(path_white: str, path_black: str) -> Opt
         return str(e)
 
 
+# Threshold results of recent (path, mtime_ns, size, lowpass) requests.
+THRESHOLD_CACHE_SIZE = 32
+_threshold_cache: Dict[tuple, Dict[str, float]] = {}
+# Filled from to_thread workers; the volume read itself happens unlocked.
+_threshold_cache_lock = threading.Lock()
+
+# Bins otsu / isodata / yen see: skimage's default, so they match what they
+# return when given the volume itself. Li is iterative on intensity means and
+# gets the finer histogram they are summed from.
+THRESHOLD_NBINS = 256
+THRESHOLD_FINE_BINS = THRESHOLD_NBINS * 16
+
+
+def _threshold_li_hist(counts: np.ndarray, centers: np.ndarray) -> float:
+    """Li's iterative minimum cross-entropy threshold (as skimage's
+    `threshold_li`) over a histogram; converges to within half a bin."""
+    offset = float(centers[0])
+    x = centers - offset  # Li needs non-negative intensities
+    total = counts.sum()
+    t_next = float((counts * x).sum() / total)
+    tolerance = (float(x[1]) if len(x) > 1 else 0.0) / 2
+    t_curr = -2 * tolerance
+    for _ in range(1000):
+        if abs(t_next - t_curr) <= tolerance:
+            break
+        t_curr = t_next
+        fore = x > t_curr
+        n_fore = counts[fore].sum()
+        n_back = total - n_fore
+        if n_fore == 0 or n_back == 0:
+            break
+        mean_fore = (counts[fore] * x[fore]).sum() / n_fore
+        mean_back = (counts[~fore] * x[~fore]).sum() / n_back
+        if mean_back <= 0:
+            break
+        t_next = float((mean_back - mean_fore) / (np.log(mean_back) - np.log(mean_fore)))
+    return t_next + offset
+
+
+def _histogram_thresholds(vol: np.ndarray) -> Dict[str, float]:
+    """All workbench threshold presets from one pass over `vol` plus one
+    shared histogram."""
+    vmin, vmax = float(vol.min()), float(vol.max())
+    mean = float(vol.mean(dtype=np.float64))
+    std = float(vol.std(dtype=np.float64))
+    flexible = mean + 1.85 * std
+    if vmin == vmax:
+        return {"otsu": vmin, "isodata": vmin, "li": vmin, "yen": vmin, "flexible_bounds": flexible}
+
+    fine, fine_edges = np.histogram(vol, bins=THRESHOLD_FINE_BINS, range=(vmin, vmax))
+    counts = fine.reshape(THRESHOLD_NBINS, -1).sum(axis=1)
+    edges = fine_edges[:: THRESHOLD_FINE_BINS // THRESHOLD_NBINS]
+    hist = (counts, (edges[:-1] + edges[1:]) / 2)
+    return {
+        "otsu": float(filters.threshold_otsu(hist=hist)),
+        "isodata": float(filters.threshold_isodata(hist=hist)),
+        "li": _threshold_li_hist(fine.astype(np.float64), (fine_edges[:-1] + fine_edges[1:]) / 2),
+        "yen": float(filters.threshold_yen(hist=hist)),
+        "flexible_bounds": flexible,
+    }
+
+
 class TemplateService:
     def __init__(self, backend):
         self.backend = backend
@@ -318,43 +380,54 @@ class TemplateService:
     # =========================================================
 
     def _calculate_thresholds_sync(self, input_path: str, lowpass: float = None) -> Dict[str, float]:
-        """Calculate multiple threshold methods using skimage filters."""
+        """Calculate multiple threshold methods from one shared histogram.
+
+        Cached per (path, mtime, size, lowpass): the workbench asks again on
+        every threshold-method change, and only the lowpass changes the answer."""
         try:
+            st = os.stat(input_path)
+            key = (os.path.abspath(input_path), st.st_mtime_ns, st.st_size, float(lowpass or 0))
+            with _threshold_cache_lock:
+                hit = _threshold_cache.get(key)
+            if hit is not None:
+                return dict(hit)
+
             with mrcfile.open(input_path) as mrc:
-                vol = mrc.data.copy()
+                vol = np.asarray(mrc.data, dtype=np.float32)
                 voxel_size = float(mrc.voxel_size.x)
 
             if lowpass is not None and lowpass > 0:
                 # Use internal numpy lowpass for threshold estimation
                 vol = self._gaussian_lowpass(vol, lowpass, voxel_size)
 
-            return {
-                "otsu": float(filters.threshold_otsu(vol)),
-                "isodata": float(filters.threshold_isodata(vol)),
-                "li": float(filters.threshold_li(vol)),
-                "yen": float(filters.threshold_yen(vol)),
-                "flexible_bounds": float(np.mean(vol) + 1.85 * np.std(vol)),
-            }
+            thresholds = _histogram_thresholds(vol)
+            with _threshold_cache_lock:
+                _threshold_cache[key] = thresholds
+                while len(_threshold_cache) > THRESHOLD_CACHE_SIZE:
+                    _threshold_cache.pop(next(iter(_threshold_cache)))
+            return dict(thresholds)
         except Exception as e:
             logger.info("Threshold calculation error: %s", e)
             return {"flexible_bounds": 0.001}
 
     def _gaussian_lowpass(self, volume: np.ndarray, cutoff_angstrom: float, voxel_size: float) -> np.ndarray:
-        """Apply Gaussian low-pass filter in Fourier space (numpy version)."""
-        nx, ny, nz = volume.shape
-        kx = fftpack.fftfreq(nx, d=voxel_size)
-        ky = fftpack.fftfreq(ny, d=voxel_size)
-        kz = fftpack.fftfreq(nz, d=voxel_size)
-
-        kx_grid, ky_grid, kz_grid = np.meshgrid(kx, ky, kz, indexing="ij")
-        k_squared = kx_grid**2 + ky_grid**2 + kz_grid**2
+        """Apply Gaussian low-pass filter in Fourier space (numpy version).
 
+        The Gaussian is separable, so it is applied as three broadcast 1-D
+        factors on the half-spectrum of a real FFT, in place; nothing
+        volume-sized is allocated besides the spectrum itself."""
+        volume = np.asarray(volume, dtype=np.float32)
         sigma = cutoff_angstrom / (2 * np.pi)
-        gaussian_filter = np.exp(-k_squared * (2 * np.pi**2) * sigma**2)
-
-        vol_fft = fftpack.fftn(volume)
-        filtered_vol = np.real(fftpack.ifftn(vol_fft * gaussian_filter))
-        return filtered_vol.astype(np.float32)
+        scale = -(2 * np.pi**2) * sigma**2
+
+        vol_fft = np.fft.rfftn(volume)
+        n_axes = volume.ndim
+        for axis, n in enumerate(volume.shape):
+            k = np.fft.rfftfreq(n, d=voxel_size) if axis == n_axes - 1 else np.fft.fftfreq(n, d=voxel_size)
+            shape = [1] * n_axes
+            shape[axis] = len(k)
+            vol_fft *= np.exp(scale * k**2).astype(np.float32).reshape(shape)
+        return np.fft.irfftn(vol_fft, s=volume.shape, axes=range(n_axes)).astype(np.float32, copy=False)
 
     def _list_files_sync(self, folder: str) -> List[str]:
         path = Path(folder)
@@ -25,6 +25,7 @@ from services.tilt_series.registry import (
     get_registry_for,
     set_registry_for,
 )
+from services.tilt_series.tilt_table import TiltTable, open_tilt_table, read_ts_tilts, write_tilt_table
 
 __all__ = [
     "Frame",
@@ -42,4 +43,8 @@ __all__ = [
     "clear_registry",
     "get_registry_for",
     "set_registry_for",
+    "TiltTable",
+    "open_tilt_table",
+    "read_ts_tilts",
+    "write_tilt_table",
 ]
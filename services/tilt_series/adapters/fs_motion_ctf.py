@@ -25,15 +25,17 @@ is exactly `Frame.id`. So the lookup is a direct `job_dir/warp_frameseries/
 from __future__ import annotations
 
 import logging
-import xml.etree.ElementTree as ET
+import os
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
 import pandas as pd
 
+from services.configs.metadata_service import XML_PARSE_CACHE_FILENAME, WarpXmlParser
 from services.configs.starfile_service import StarfileService
 from services.tilt_series.models import FsMotionCtfFrameOutput, TiltSeries
 from services.tilt_series.registry import TiltSeriesRegistry
+from services.tilt_series.tilt_table import read_ts_tilts, write_tilt_table
 
 logger = logging.getLogger(__name__)
 
@@ -78,17 +80,37 @@ class FsMotionCtfIngestAdapter:
                 f"Reload the project to backfill the registry from mdocs."
             )
 
-        unresolved: List[str] = []
+        # One directory listing instead of a stat per frame, then a single
+        # cached / parallel parse over every XML in scope.
+        try:
+            present = set(os.listdir(self.warp_dir))
+        except FileNotFoundError:
+            present = set()
+
+        # Both passes walk every frame of every TS: keep them resident.
+        with self.registry.pinned():
+            unresolved: List[str] = []
+            wanted: List[tuple] = []  # (ts_id, frame_id, xml_path)
+            for ts_id in expected:
+                ts = self.registry.get_tilt_series(ts_id)
+                for frame in ts.frames:
+                    xml_path = self.warp_dir / f"{frame.id}.xml"
+                    if xml_path.name not in present:
+                        unresolved.append(f"{ts_id}/{frame.id}: {xml_path}")
+                        continue
+                    wanted.append((ts_id, frame.id, xml_path))
+
+            rows_by_file = WarpXmlParser.parse_files(
+                [str(p) for _, _, p in wanted], cache_path=self.warp_dir / XML_PARSE_CACHE_FILENAME
+            )
+
+            per_ts_count: Dict[str, int] = {}
+            for ts_id, frame_id, xml_path in wanted:
+                output = self._build_frame_output(frame_id, xml_path, rows_by_file[str(xml_path)])
+                self.registry.attach_frame_output(frame_id, output)
+                per_ts_count[ts_id] = per_ts_count.get(ts_id, 0) + 1
         for ts_id in expected:
-            ts = self.registry.get_tilt_series(ts_id)
-            for frame in ts.frames:
-                xml_path = self.warp_dir / f"{frame.id}.xml"
-                if not xml_path.exists():
-                    unresolved.append(f"{ts_id}/{frame.id}: {xml_path}")
-                    continue
-                output = self._build_frame_output(frame.id, xml_path)
-                self.registry.attach_frame_output(frame.id, output)
-            logger.info("fs_motion_and_ctf: ingested %d frames for TS %s", ts.frame_count, ts_id)
+            logger.info("fs_motion_and_ctf: ingested %d frames for TS %s", per_ts_count.get(ts_id, 0), ts_id)
 
         if unresolved:
             sample = unresolved[:5]
@@ -119,6 +141,7 @@ class FsMotionCtfIngestAdapter:
         out_ts_df = in_ts_df.copy()
 
         unresolved: List[str] = []
+        written: Dict[str, pd.DataFrame] = {}
         for _, ts_row in in_ts_df.iterrows():
             ts_id = str(ts_row["rlnTomoName"])
             per_ts_rel = ts_row["rlnTomoTiltSeriesStarFile"]
@@ -140,12 +163,14 @@ class FsMotionCtfIngestAdapter:
                 continue
 
             self.starfile_service.write({ts_id: updated_df}, tilt_dir / f"{ts_id}.star")
+            written[ts_id] = updated_df
 
         if unresolved:
             raise RuntimeError(
                 "fs_motion_and_ctf emit_star: " + str(len(unresolved)) + " per-TS problem(s):\n  - "
                 + "\n  - ".join(unresolved)
             )
+        write_tilt_table(tilt_dir, written)
 
         # Rewrite per-TS paths in the global block to point to the new tilt_dir.
         out_ts_df["rlnTomoTiltSeriesStarFile"] = out_ts_df["rlnTomoName"].apply(
@@ -157,18 +182,16 @@ class FsMotionCtfIngestAdapter:
 
     # ── Internals ──────────────────────────────────────────────────────────
 
-    def _build_frame_output(self, frame_id: str, xml_path: Path) -> FsMotionCtfFrameOutput:
-        """Parse one per-movie WarpTools XML. The paths to the averaged / even /
+    def _build_frame_output(self, frame_id: str, xml_path: Path, rows: List[dict]) -> FsMotionCtfFrameOutput:
+        """Build the output for one per-movie WarpTools XML from its parsed
+        <CTF> row (see WarpXmlParser). The paths to the averaged / even /
         odd / powerspectrum MRCs follow WarpTools's fixed output layout."""
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        ctf = root.find(".//CTF")
-        if ctf is None:
-            raise ValueError(f"No CTF data in {xml_path}")
-
-        defocus_value = float(ctf.find(".//Param[@Name='Defocus']").get("Value"))
-        defocus_angle = float(ctf.find(".//Param[@Name='DefocusAngle']").get("Value"))
-        defocus_delta = float(ctf.find(".//Param[@Name='DefocusDelta']").get("Value"))
+        if len(rows) != 1 or "folder" not in rows[0]:
+            raise ValueError(f"{xml_path} is not a per-movie frame-series XML")
+        row = rows[0]
+        defocus_value = row["defocus_value"]
+        defocus_angle = row["defocus_angle"]
+        defocus_delta = row["defocus_delta"]
 
         # Legacy quirk: fs_motion writes U == V and stuffs delta into astigmatism.
         # Replicated exactly to preserve on-disk STAR layout (byte-for-byte
@@ -205,6 +228,10 @@ class FsMotionCtfIngestAdapter:
         return None
 
     def _read_only_block(self, path: Path) -> pd.DataFrame:
+        # The upstream job's tilt table, when current, saves a STAR parse per TS.
+        cached = read_ts_tilts(path)
+        if cached is not None:
+            return cached
         data = self.starfile_service.read(path)
         return next(iter(data.values())).copy()
 
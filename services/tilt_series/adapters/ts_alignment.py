@@ -24,12 +24,14 @@ adapter now.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from services.computing.cpus import usable_cpus
 from services.configs.starfile_service import StarfileService
 from services.models_base import AlignmentMethod
 from services.tilt_series.models import (
@@ -38,6 +40,7 @@ from services.tilt_series.models import (
     TsAlignmentTiltSeriesOutput,
 )
 from services.tilt_series.registry import TiltSeriesRegistry
+from services.tilt_series.tilt_table import read_ts_tilts, write_tilt_table
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,14 @@ _ALN_COL_XSHIFT = 3
 _ALN_COL_YSHIFT = 4
 _ALN_COL_TILT = 9
 
+_ALIGNMENT_COLUMNS = ("rlnTomoXTilt", "rlnTomoYTilt", "rlnTomoZRot", "rlnTomoXShiftAngst", "rlnTomoYShiftAngst")
+
+
+def _merge_workers(n_items: int) -> int:
+    """Thread count for the per-TS fan-out: bounded by the CPUs we may use
+    (the SLURM cpuset when running in a supervisor) and by the work."""
+    return max(1, min(usable_cpus(), n_items))
+
 
 class TsAlignmentIngestAdapter:
     def __init__(
@@ -111,21 +122,29 @@ class TsAlignmentIngestAdapter:
                 f"Reload the project to backfill the registry from mdocs."
             )
 
-        problems: Dict[str, str] = {}
-        ingested: List[str] = []
-        for ts_id in expected:
-            ts = self.registry.get_tilt_series(ts_id)
-            try:
-                output = self._build_ts_output(ts, alignment_method, shift_angpix)
-            except RuntimeError as e:
-                problems[ts_id] = str(e)
-                continue
-            self.registry.attach_ts_output(ts_id, output)
-            ingested.append(ts_id)
-            logger.info(
-                "tsAlignment: ingested %s (%d/%d frames aligned)",
-                ts_id, len(output.per_frame), ts.frame_count,
-            )
+        # Parsing is per-TS and independent, so it fans out over threads.
+        # Registry reads and writes stay on this thread; workers only see
+        # the TiltSeries objects handed to them.
+        with self.registry.pinned():
+            series = [self.registry.get_tilt_series(ts_id) for ts_id in expected]
+            with ThreadPoolExecutor(max_workers=_merge_workers(len(series))) as executor:
+                built = list(
+                    executor.map(lambda ts: self._try_build_ts_output(ts, alignment_method, shift_angpix), series)
+                )
+
+            problems: Dict[str, str] = {}
+            ingested: List[str] = []
+            for ts, (output, problem) in zip(series, built):
+                ts_id = ts.id
+                if problem is not None:
+                    problems[ts_id] = problem
+                    continue
+                self.registry.attach_ts_output(ts_id, output)
+                ingested.append(ts_id)
+                logger.info(
+                    "tsAlignment: ingested %s (%d/%d frames aligned)",
+                    ts_id, len(output.per_frame), ts.frame_count,
+                )
 
         # Per-TS failure is tolerated (drop + warn); only a total wipeout is fatal.
         if problems:
@@ -179,6 +198,8 @@ class TsAlignmentIngestAdapter:
         all_tilts_list: List[pd.DataFrame] = []
         problems: Dict[str, str] = {}
         emitted: List[str] = []
+        written: Dict[str, pd.DataFrame] = {}
+        pending: List[Tuple[pd.Series, TiltSeries, TsAlignmentTiltSeriesOutput, Path]] = []
         for _, ts_row in in_ts_df.iterrows():
             ts_id = str(ts_row["rlnTomoName"])
             # Strict identity: rlnTomoName MUST equal the tilt_series STAR stem
@@ -203,15 +224,25 @@ class TsAlignmentIngestAdapter:
             if aln_output is None or aln_output.output_type != "ts_alignment":
                 problems[ts_id] = "no ingested tsAlignment output in registry"
                 continue
+            pending.append((ts_row, ts, aln_output, per_ts_in))
 
+        def _emit_one(item):
+            _, ts, aln_output, per_ts_in = item
             tilt_df = self._read_only_block(per_ts_in)
             updated, errors = self._apply_alignment_to_tilt_df(ts, aln_output, tilt_df)
+            if not errors:
+                self.starfile_service.write({ts.id: updated}, tilt_dir / f"{ts.id}.star")
+            return updated, errors
+
+        with ThreadPoolExecutor(max_workers=_merge_workers(len(pending))) as executor:
+            results = list(executor.map(_emit_one, pending))
+
+        for (ts_row, ts, _, _), (updated, errors) in zip(pending, results):
             if errors:
-                problems[ts_id] = "; ".join(errors)
+                problems[ts.id] = "; ".join(errors)
                 continue
-
-            self.starfile_service.write({ts_id: updated}, tilt_dir / f"{ts_id}.star")
-            emitted.append(ts_id)
+            emitted.append(ts.id)
+            written[ts.id] = updated
 
             # Build the {ts-row-expanded + per-tilt} wide DataFrame that the
             # legacy writer dumped into all_tilts.star for downstream jobs.
@@ -219,6 +250,8 @@ class TsAlignmentIngestAdapter:
             ts_row_df.index = updated.index
             all_tilts_list.append(pd.concat([ts_row_df, updated], axis=1))
 
+        write_tilt_table(tilt_dir, written)
+
         # Tolerate per-TS failure: drop the unusable tilt-series (typically the
         # ones ingest already excluded) and emit a STAR with the rest. Only a
         # total wipeout is fatal — see the matching policy in ingest().
@@ -266,6 +299,16 @@ class TsAlignmentIngestAdapter:
 
     # ── Internals ──────────────────────────────────────────────────────────
 
+    def _try_build_ts_output(
+        self, ts: TiltSeries, alignment_method: AlignmentMethod, shift_angpix: float
+    ) -> Tuple[Optional[TsAlignmentTiltSeriesOutput], Optional[str]]:
+        """Worker entry point: (output, None) or (None, reason) for a
+        per-TS problem that ingest tolerates."""
+        try:
+            return self._build_ts_output(ts, alignment_method, shift_angpix), None
+        except RuntimeError as e:
+            return None, str(e)
+
     def _build_ts_output(
         self, ts: TiltSeries, alignment_method: AlignmentMethod, shift_angpix: float
     ) -> TsAlignmentTiltSeriesOutput:
@@ -300,11 +343,10 @@ class TsAlignmentIngestAdapter:
 
         per_frame: List[TsAlignmentPerFrame] = []
         unresolved: List[str] = []
-        for i, tomo_row in tomostar_df.iterrows():
-            movie_name = str(tomo_row["wrpMovieName"])
-            try:
-                frame = ts.frame_by_filename(movie_name)
-            except KeyError:
+        movie_names = [str(m) for m in tomostar_df["wrpMovieName"]]
+        frames = ts.frames_by_filenames(movie_names)
+        for i, (movie_name, frame) in enumerate(zip(movie_names, frames)):
+            if frame is None:
                 unresolved.append(f"row {i}: {movie_name}")
                 continue
 
@@ -491,6 +533,10 @@ class TsAlignmentIngestAdapter:
         return None
 
     def _read_only_block(self, path: Path) -> pd.DataFrame:
+        # The upstream job's tilt table, when current, saves a STAR parse per TS.
+        cached = read_ts_tilts(path)
+        if cached is not None:
+            return cached
         data = self.starfile_service.read(path)
         return next(iter(data.values())).copy()
 
@@ -520,16 +566,19 @@ class TsAlignmentIngestAdapter:
             errors.append("per-TS STAR has no rlnMicrographMovieName column")
             return tilt_df, errors
 
-        for col in ("rlnTomoXTilt", "rlnTomoYTilt", "rlnTomoZRot", "rlnTomoXShiftAngst", "rlnTomoYShiftAngst"):
+        for col in _ALIGNMENT_COLUMNS:
             if col not in tilt_df.columns:
                 tilt_df[col] = float("nan")
 
+        # Resolve every row in one pass, then write the five columns as one
+        # block instead of five .at writes per row.
+        movie_names = tilt_df["rlnMicrographMovieName"].tolist()
+        frames = ts.frames_by_filenames(movie_names)
+        target_rows: List = []
+        values: List[Tuple[float, float, float, float, float]] = []
         skipped = 0
-        for idx, row in tilt_df.iterrows():
-            movie_name = row["rlnMicrographMovieName"]
-            try:
-                frame = ts.frame_by_filename(movie_name)
-            except KeyError:
+        for idx, movie_name, frame in zip(tilt_df.index, movie_names, frames):
+            if frame is None:
                 errors.append(f"row {idx}: movie {movie_name!r} not in registry TS {ts.id}")
                 continue
 
@@ -538,11 +587,13 @@ class TsAlignmentIngestAdapter:
                 skipped += 1
                 continue
 
-            tilt_df.at[idx, "rlnTomoXTilt"] = aln.tilt_x_deg
-            tilt_df.at[idx, "rlnTomoYTilt"] = aln.tilt_y_deg
-            tilt_df.at[idx, "rlnTomoZRot"] = aln.z_rot_deg
-            tilt_df.at[idx, "rlnTomoXShiftAngst"] = aln.x_shift_angstrom
-            tilt_df.at[idx, "rlnTomoYShiftAngst"] = aln.y_shift_angstrom
+            target_rows.append(idx)
+            values.append(
+                (aln.tilt_x_deg, aln.tilt_y_deg, aln.z_rot_deg, aln.x_shift_angstrom, aln.y_shift_angstrom)
+            )
+
+        if target_rows:
+            tilt_df.loc[target_rows, list(_ALIGNMENT_COLUMNS)] = np.array(values, dtype=float)
 
         if skipped > 0:
             logger.info(
@@ -34,6 +34,7 @@ from services.tilt_series.models import (
     TsCtfTiltSeriesOutput,
 )
 from services.tilt_series.registry import TiltSeriesRegistry
+from services.tilt_series.tilt_table import read_ts_tilts, write_tilt_table
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +131,7 @@ class TsCtfIngestAdapter:
         )
 
         unresolved: List[str] = []
+        written: Dict[str, pd.DataFrame] = {}
         for _, ts_row in in_ts_df.iterrows():
             ts_id = str(ts_row["rlnTomoName"])
             per_ts_rel = ts_row["rlnTomoTiltSeriesStarFile"]
@@ -159,12 +161,14 @@ class TsCtfIngestAdapter:
             # Write the per-TS STAR alongside the main STAR. The key name in
             # the STAR block matches RELION convention: the TS id.
             self.starfile_service.write({ts_id: updated_df}, tilt_dir / f"{ts_id}.star")
+            written[ts_id] = updated_df
 
         if unresolved:
             raise RuntimeError(
                 "tsCtf emit_star: " + str(len(unresolved)) + " per-TS problem(s):\n  - "
                 + "\n  - ".join(unresolved)
             )
+        write_tilt_table(tilt_dir, written)
 
         # Set rlnTomoHand on the global block from each TS's ingested output.
         # Different TS can have different handedness if ts_defocus_hand decided
@@ -265,6 +269,10 @@ class TsCtfIngestAdapter:
         return None
 
     def _read_only_block(self, path: Path) -> pd.DataFrame:
+        # The upstream job's tilt table, when current, saves a STAR parse per TS.
+        cached = read_ts_tilts(path)
+        if cached is not None:
+            return cached
         data = self.starfile_service.read(path)
         return next(iter(data.values())).copy()
 
@@ -7,7 +7,7 @@ Two entry points:
   TiltSeries/Frame entities. No file reads.
 
 - `build_from_mdocs(mdocs_glob, frames_dir)` — fallback for legacy projects
-  that predate the registry. Re-parses mdocs via `MdocService`.
+  that predate the registry. Reads mdocs via the shared mdoc index.
 
 Both return a list of `TiltSeries`; callers are responsible for attaching
 them to a `TiltSeriesRegistry`.
@@ -120,23 +120,22 @@ def build_from_mdocs(
     to an absolute path within it. Otherwise `raw_path` is left as the bare
     filename from the mdoc's `SubFramePath`.
     """
-    from services.configs.mdoc_service import get_mdoc_service
+    from services.configs.mdoc_index import get_mdoc_index
 
-    svc = get_mdoc_service()
     mdoc_paths = sorted(Path(p) for p in glob.glob(mdocs_glob))
     if not mdoc_paths:
         logger.warning("build_from_mdocs: no mdocs matched %s", mdocs_glob)
         return []
 
     out: List[TiltSeries] = []
-    for mdoc_path in mdoc_paths:
-        try:
-            parsed = svc.parse_mdoc_file(mdoc_path)
-        except Exception as e:
-            logger.warning("Failed to parse mdoc %s: %s", mdoc_path, e)
+    # Served from the shared mdoc index: usually already parsed by the
+    # import panel / data import moments earlier.
+    for mdoc_path, (entry, error) in zip(mdoc_paths, get_mdoc_index().get_many(mdoc_paths)):
+        if error is not None:
+            logger.warning("Failed to parse mdoc %s: %s", mdoc_path, error)
             continue
 
-        sections = parsed.get("data", [])
+        sections = entry.sections()
         if not sections:
             logger.warning("Empty mdoc (no ZValue sections): %s", mdoc_path)
             continue
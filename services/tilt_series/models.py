@@ -26,7 +26,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Dict, List, Literal, Optional, Union
+from typing import Annotated, Dict, Iterable, List, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -240,3 +240,19 @@ class TiltSeries(BaseModel):
             if f.raw_filename == target or f.id == target_stem:
                 return f
         raise KeyError(f"Frame {name!r} not found in TS {self.id}")
+
+    def frames_by_filenames(self, names: Iterable[str]) -> List[Optional[Frame]]:
+        """Batch form of `frame_by_filename`: one pass to index the frames,
+        then a dict lookup per name. Same first-match semantics; None where a
+        name does not resolve instead of KeyError."""
+        by_name: Dict[str, int] = {}
+        by_id: Dict[str, int] = {}
+        for i, f in enumerate(self.frames):
+            by_name.setdefault(f.raw_filename, i)
+            by_id.setdefault(f.id, i)
+        out: List[Optional[Frame]] = []
+        for name in names:
+            target = Path(name).name
+            hits = [i for i in (by_name.get(target), by_id.get(Path(target).stem)) if i is not None]
+            out.append(self.frames[min(hits)] if hits else None)
+        return out
@@ -3,12 +3,17 @@
 Persistence layout (per project):
 
     {project_root}/registry/
-        index.json                         # cheap listing: ts_id → frame_count
+        index.json                         # ts listing + compact frame/filename index
         tilt_series/{ts_id}.json           # full TiltSeries serialized
 
-Per-TS sidecars anticipate Stage 6 (lazy load for 100s of TS projects). For now
-the registry is loaded eagerly — all TS are read into memory at project load —
-but the on-disk shape already supports partial loads and per-TS atomic writes.
+Loading is lazy by default (`get_registry_for`): only index.json is read, and
+each TS sidecar is hydrated + validated on first access. At most
+`max_resident` clean TiltSeries stay in memory (LRU); dirty ones are pinned
+until the next save, and `pinned()` holds everything hydrated inside a block
+(ingests that walk every TS twice). `lazy=False` keeps the old
+read-everything behaviour.
+Index files written before the compact frame index existed are loaded
+eagerly once and upgraded on the next save.
 
 Concurrency: a single asyncio.Lock per registry serializes saves. Mutations
 are in-memory and lock-free; `save()` flushes dirty TS to disk in one pass.
@@ -21,8 +26,10 @@ import json
 import logging
 import os
 import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterable, List, Set
+from typing import Dict, Iterator, List, Set, Tuple
 
 from services.tilt_series.models import (
     Frame,
@@ -38,7 +45,11 @@ logger = logging.getLogger(__name__)
 
 # Schema version for the on-disk registry files. Bump MINOR for additive
 # changes, MAJOR for incompatible ones.
-REGISTRY_SCHEMA_VERSION = (1, 0)
+REGISTRY_SCHEMA_VERSION = (1, 1)
+
+# Upper bound on clean, fully validated TiltSeries kept resident by a lazy
+# registry. Dirty TS are never evicted, so this can be exceeded mid-ingest.
+DEFAULT_MAX_RESIDENT = 64
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -52,15 +63,23 @@ class TiltSeriesRegistry:
     One registry per project directory. Obtained via `get_registry_for(path)`.
     """
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, *, lazy: bool = False, max_resident: int = DEFAULT_MAX_RESIDENT):
         self.project_path = project_path.resolve()
-        self._tilt_series: Dict[str, TiltSeries] = {}
+        self._lazy = lazy
+        self._max_resident = max_resident
+        # Resident (hydrated) TS in LRU order. In eager mode this is every TS.
+        self._tilt_series: "OrderedDict[str, TiltSeries]" = OrderedDict()
+        # Every known TS → its (frame_id, raw_filename) pairs in tilt order,
+        # whether or not the TS is resident. Persisted as the compact index.
+        self._ts_frames: Dict[str, List[Tuple[str, str]]] = {}
         # Fast reverse indexes rebuilt on mutation/load. Kept in sync with
-        # _tilt_series; never set directly from outside.
-        self._frame_index: Dict[str, TiltSeries] = {}       # frame_id → TS
-        self._filename_index: Dict[str, Frame] = {}         # raw_filename → Frame
+        # _ts_frames; never set directly from outside.
+        self._frame_index: Dict[str, str] = {}               # frame_id → ts_id
+        self._filename_index: Dict[str, Tuple[str, str]] = {}  # raw_filename → (ts_id, frame_id)
         self._dirty_ts: Set[str] = set()
         self._dirty_index: bool = False
+        # >0 while inside pinned(): nothing is evicted until the outermost exit.
+        self._pin_depth = 0
         self._save_lock = asyncio.Lock()
 
     # ── Paths ──────────────────────────────────────────────────────────────
@@ -84,61 +103,89 @@ class TiltSeriesRegistry:
 
     def get_tilt_series(self, ts_id: str) -> TiltSeries:
         ts = self._tilt_series.get(ts_id)
-        if ts is None:
+        if ts is not None:
+            self._tilt_series.move_to_end(ts_id)
+            return ts
+        if ts_id not in self._ts_frames:
             raise KeyError(f"No tilt-series with id {ts_id!r} in registry")
-        return ts
+        return self._hydrate(ts_id)
 
     def has_tilt_series(self, ts_id: str) -> bool:
-        return ts_id in self._tilt_series
+        return ts_id in self._ts_frames
 
-    def all_tilt_series(self) -> Iterable[TiltSeries]:
-        return self._tilt_series.values()
+    def all_tilt_series(self) -> Iterator[TiltSeries]:
+        """Yield every TS, hydrating lazily. In lazy mode earlier items may be
+        evicted while iterating, so don't rely on identity across the loop."""
+        for ts_id in list(self._ts_frames):
+            yield self.get_tilt_series(ts_id)
 
     def tilt_series_ids(self) -> List[str]:
-        return sorted(self._tilt_series)
+        return sorted(self._ts_frames)
 
     def get_frame(self, frame_id: str) -> Frame:
-        ts = self._frame_index.get(frame_id)
-        if ts is None:
+        ts_id = self._frame_index.get(frame_id)
+        if ts_id is None:
             raise KeyError(f"No frame with id {frame_id!r} in registry")
-        return ts.frame_by_id(frame_id)
+        return self.get_tilt_series(ts_id).frame_by_id(frame_id)
 
     def frame_by_filename(self, name: str) -> Frame:
         """Resolve a frame by raw filename (basename). Matches filename or stem."""
         target = Path(name).name
         hit = self._filename_index.get(target)
         if hit is not None:
-            return hit
-        # fall back to stem-keyed lookup
+            ts_id, frame_id = hit
+            return self.get_tilt_series(ts_id).frame_by_id(frame_id)
+        # Fall back to stem-keyed lookup. Frame ids are the raw filename stem,
+        # so a different extension (e.g. .eer → .mrc) still resolves. The
+        # other two keys keep what TiltSeries.frame_by_filename(stem) matched.
         stem = Path(target).stem
-        for ts in self._tilt_series.values():
-            try:
-                return ts.frame_by_filename(stem)
-            except KeyError:
-                continue
+        hit = self._filename_index.get(stem)
+        if hit is not None:
+            ts_id, frame_id = hit
+            return self.get_tilt_series(ts_id).frame_by_id(frame_id)
+        for key in (stem, Path(stem).stem):
+            ts_id = self._frame_index.get(key)
+            if ts_id is not None:
+                return self.get_tilt_series(ts_id).frame_by_id(key)
         raise KeyError(f"No frame matching filename {name!r}")
 
     def frame_count(self) -> int:
-        return sum(ts.frame_count for ts in self._tilt_series.values())
+        return sum(len(frames) for frames in self._ts_frames.values())
+
+    def resident_count(self) -> int:
+        return len(self._tilt_series)
+
+    @contextmanager
+    def pinned(self) -> Iterator["TiltSeriesRegistry"]:
+        """Keep every TS hydrated inside the block resident until it exits,
+        so a batch that touches all TS more than once parses each sidecar
+        once. Nests; eviction resumes on the outermost exit."""
+        self._pin_depth += 1
+        try:
+            yield self
+        finally:
+            self._pin_depth -= 1
+            self._evict()
 
     # ── Mutations ──────────────────────────────────────────────────────────
 
     def add_tilt_series(self, ts: TiltSeries, *, overwrite: bool = False) -> None:
         """Register a new tilt-series. Refuses to overwrite unless explicit."""
-        if ts.id in self._tilt_series and not overwrite:
+        if ts.id in self._ts_frames and not overwrite:
             raise ValueError(f"Tilt-series {ts.id!r} already registered; pass overwrite=True to replace")
         self._tilt_series[ts.id] = ts
+        self._tilt_series.move_to_end(ts.id)
         self._reindex_ts(ts)
         self._dirty_ts.add(ts.id)
         self._dirty_index = True
 
     def remove_tilt_series(self, ts_id: str) -> None:
-        ts = self._tilt_series.pop(ts_id, None)
-        if ts is None:
+        if ts_id not in self._ts_frames:
             return
-        for f in ts.frames:
-            self._frame_index.pop(f.id, None)
-            self._filename_index.pop(f.raw_filename, None)
+        self._tilt_series.pop(ts_id, None)
+        self._drop_index_entries(ts_id)
+        self._ts_frames.pop(ts_id, None)
+        self._dirty_ts.discard(ts_id)
         self._dirty_index = True
         path = self._ts_path(ts_id)
         if path.exists():
@@ -147,8 +194,7 @@ class TiltSeriesRegistry:
     def attach_frame_output(self, frame_id: str, output: FrameOutput) -> None:
         frame = self.get_frame(frame_id)
         frame.outputs[output.job_instance_id] = output
-        ts = self._frame_index[frame_id]
-        self._dirty_ts.add(ts.id)
+        self._dirty_ts.add(self._frame_index[frame_id])
 
     def attach_ts_output(self, ts_id: str, output: TiltSeriesOutput) -> None:
         ts = self.get_tilt_series(ts_id)
@@ -171,10 +217,10 @@ class TiltSeriesRegistry:
         missing_frames: List[str] = []
 
         for ts_id in sorted(expected_ts_ids):
-            if ts_id not in self._tilt_series:
+            if ts_id not in self._ts_frames:
                 missing_ts.append(f"{ts_id} (not registered)")
                 continue
-            ts = self._tilt_series[ts_id]
+            ts = self.get_tilt_series(ts_id)
             has_ts_output = job_instance_id in ts.outputs
             has_tomo_output = (
                 ts.tomogram is not None and job_instance_id in ts.tomogram.outputs
@@ -200,7 +246,10 @@ class TiltSeriesRegistry:
     # ── Persistence ────────────────────────────────────────────────────────
 
     def load(self) -> None:
-        """Load all TS from on-disk sidecars. Safe to call on a fresh registry."""
+        """Load the registry from disk. Safe to call on a fresh registry.
+
+        Lazy registries read only index.json when it carries the compact
+        frame index; sidecars are hydrated on first access."""
         if not self.index_path.exists():
             logger.debug("No registry index at %s; starting empty", self.index_path)
             return
@@ -220,6 +269,22 @@ class TiltSeriesRegistry:
             )
 
         ts_ids = index.get("tilt_series", [])
+        compact = index.get("frames")
+        if self._lazy and isinstance(compact, dict):
+            for ts_id in ts_ids:
+                pairs = compact.get(ts_id)
+                if pairs is None:
+                    logger.warning("Registry index has no frame entry for %s; skipping", ts_id)
+                    continue
+                self._index_frames(ts_id, [(fid, name) for fid, name in pairs])
+            logger.info(
+                "Indexed %d tilt-series (%d frames) from %s (lazy)",
+                len(self._ts_frames), self.frame_count(), self.index_path,
+            )
+            self._dirty_ts.clear()
+            self._dirty_index = False
+            return
+
         loaded = 0
         for ts_id in ts_ids:
             ts_path = self._ts_path(ts_id)
@@ -227,9 +292,7 @@ class TiltSeriesRegistry:
                 logger.warning("Registry index references missing TS file: %s", ts_path)
                 continue
             try:
-                with open(ts_path) as f:
-                    data = json.load(f)
-                ts = TiltSeries.model_validate(data)
+                ts = self._read_sidecar(ts_path)
                 self._tilt_series[ts.id] = ts
                 self._reindex_ts(ts)
                 loaded += 1
@@ -238,30 +301,37 @@ class TiltSeriesRegistry:
 
         logger.info("Loaded %d tilt-series from %s", loaded, self.registry_dir)
         self._dirty_ts.clear()
-        self._dirty_index = False
+        # Pre-1.1 index without the compact frame section: rewrite it on the
+        # next save so subsequent lazy loads skip the sidecars.
+        self._dirty_index = not isinstance(compact, dict)
+        self._evict()
 
     def save(self, *, force: bool = False) -> None:
         """Flush dirty TS + index to disk atomically (per-file rename)."""
         self.registry_dir.mkdir(parents=True, exist_ok=True)
         self.ts_dir.mkdir(parents=True, exist_ok=True)
 
-        dirty = self._dirty_ts if not force else set(self._tilt_series)
+        dirty = set(self._dirty_ts) if not force else set(self._ts_frames)
         for ts_id in sorted(dirty):
-            ts = self._tilt_series.get(ts_id)
-            if ts is None:
+            if ts_id not in self._ts_frames:
                 continue
+            ts = self.get_tilt_series(ts_id)
             self._atomic_write(self._ts_path(ts_id), ts.model_dump_json(indent=2))
+            self._dirty_ts.discard(ts_id)
 
         if dirty or self._dirty_index or force:
+            ordered = sorted(self._ts_frames)
             index = {
                 "schema_version": list(REGISTRY_SCHEMA_VERSION),
-                "tilt_series": sorted(self._tilt_series),
+                "tilt_series": ordered,
                 "frame_count": self.frame_count(),
+                "frames": {ts_id: [list(pair) for pair in self._ts_frames[ts_id]] for ts_id in ordered},
             }
-            self._atomic_write(self.index_path, json.dumps(index, indent=2))
+            self._atomic_write(self.index_path, json.dumps(index, separators=(",", ":")))
 
         self._dirty_ts.clear()
         self._dirty_index = False
+        self._evict()
 
     async def save_async(self, *, force: bool = False) -> None:
         async with self._save_lock:
@@ -270,22 +340,71 @@ class TiltSeriesRegistry:
 
     # ── Internals ──────────────────────────────────────────────────────────
 
-    def _reindex_ts(self, ts: TiltSeries) -> None:
-        # Wipe any stale entries for this TS, then rebuild.
-        stale_frame_ids = [fid for fid, t in self._frame_index.items() if t.id == ts.id]
-        for fid in stale_frame_ids:
-            self._frame_index.pop(fid, None)
-        stale_names = [name for name, f in self._filename_index.items() if f.tilt_series_id == ts.id]
-        for name in stale_names:
-            self._filename_index.pop(name, None)
+    def _hydrate(self, ts_id: str) -> TiltSeries:
+        """Read + validate one TS sidecar and make it resident."""
+        ts_path = self._ts_path(ts_id)
+        try:
+            ts = self._read_sidecar(ts_path)
+        except FileNotFoundError:
+            raise KeyError(f"Tilt-series {ts_id!r} is indexed but its sidecar {ts_path} is missing") from None
+        if ts.id != ts_id:
+            raise ValueError(f"Sidecar {ts_path} holds TS {ts.id!r}, expected {ts_id!r}")
+        self._tilt_series[ts_id] = ts
+        # A driver process may have rewritten the sidecar since the index
+        # was read; trust the sidecar.
+        self._reindex_ts(ts)
+        self._evict()
+        return ts
+
+    @staticmethod
+    def _read_sidecar(ts_path: Path) -> TiltSeries:
+        with open(ts_path) as f:
+            data = json.load(f)
+        return TiltSeries.model_validate(data)
+
+    def _evict(self) -> None:
+        """Drop least-recently-used clean TS beyond max_resident (lazy only)."""
+        if not self._lazy or self._pin_depth:
+            return
+        excess = len(self._tilt_series) - self._max_resident
+        if excess <= 0:
+            return
+        for ts_id in list(self._tilt_series):
+            if excess <= 0:
+                break
+            if ts_id in self._dirty_ts:
+                continue
+            del self._tilt_series[ts_id]
+            excess -= 1
 
+    def _reindex_ts(self, ts: TiltSeries) -> None:
         seen_ids: Set[str] = set()
+        pairs: List[Tuple[str, str]] = []
         for f in ts.frames:
             if f.id in seen_ids:
                 raise ValueError(f"Duplicate frame id {f.id!r} in TS {ts.id}")
             seen_ids.add(f.id)
-            self._frame_index[f.id] = ts
-            self._filename_index[f.raw_filename] = f
+            pairs.append((f.id, f.raw_filename))
+        self._index_frames(ts.id, pairs)
+
+    def _index_frames(self, ts_id: str, pairs: List[Tuple[str, str]]) -> None:
+        # Wipe any stale entries for this TS, then rebuild.
+        self._drop_index_entries(ts_id)
+        self._ts_frames[ts_id] = pairs
+        for frame_id, raw_filename in pairs:
+            self._frame_index[frame_id] = ts_id
+            self._filename_index[raw_filename] = (ts_id, frame_id)
+
+    def _drop_index_entries(self, ts_id: str) -> None:
+        """Remove `ts_id`'s entries from the reverse indexes. O(frames in TS):
+        _ts_frames records exactly which keys this TS owns. An entry another
+        TS has since claimed (same raw filename) is left alone."""
+        for frame_id, raw_filename in self._ts_frames.get(ts_id, ()):
+            if self._frame_index.get(frame_id) == ts_id:
+                del self._frame_index[frame_id]
+            owner = self._filename_index.get(raw_filename)
+            if owner is not None and owner[0] == ts_id:
+                del self._filename_index[raw_filename]
 
     @staticmethod
     def _atomic_write(path: Path, content: str) -> None:
@@ -308,7 +427,7 @@ class TiltSeriesRegistry:
         """Return a list of integrity problems; empty means the registry is consistent."""
         problems: List[str] = []
         seen_frame_ids: Set[str] = set()
-        for ts in self._tilt_series.values():
+        for ts in self.all_tilt_series():
             if ts.id != ts.mdoc_filename.rsplit(".", 1)[0]:
                 problems.append(
                     f"TS {ts.id!r} id does not match mdoc stem {ts.mdoc_filename!r}"
@@ -340,16 +459,17 @@ class TiltSeriesRegistry:
 _registries: Dict[Path, TiltSeriesRegistry] = {}
 
 
-def get_registry_for(project_path: Path) -> TiltSeriesRegistry:
+def get_registry_for(project_path: Path, *, lazy: bool = True) -> TiltSeriesRegistry:
     """Get or lazily load the registry for a project directory.
 
     First access triggers a disk load (if registry/ exists) or returns an
-    empty registry. Subsequent calls return the same in-memory instance.
+    empty registry. Subsequent calls return the same in-memory instance,
+    whatever `lazy` they pass.
     """
     resolved = project_path.resolve()
     reg = _registries.get(resolved)
     if reg is None:
-        reg = TiltSeriesRegistry(resolved)
+        reg = TiltSeriesRegistry(resolved, lazy=lazy)
         reg.load()
         _registries[resolved] = reg
     return reg
@@ -0,0 +1,268 @@
+"""Columnar per-job tilt table — every per-TS tilt block of a job in one file.
+
+Layout (per job output dir):
+
+    {job_dir}/tilt_series/
+        {ts_id}.star                       # RELION/WarpTools-facing, unchanged
+        tilt_table.npy                     # all rows of all per-TS STARs
+
+The table is a NumPy structured array (one field per STAR column plus the
+`_ts_id` / `_frame_id` key fields) saved as a single `.npy`, so readers can
+memory-map it and slice one TS out without touching the parallel filesystem
+once per tilt-series. It is written by each adapter's `emit_star` from the
+same DataFrames that produce the per-TS STARs.
+
+The per-TS STARs are not generated from the table: RELION and WarpTools
+read `{ts_id}.star` directly and need it on disk before the job runs, so
+the adapters keep writing them and the table is a derived index over them
+for our own readers (the next job's emit, the dashboard).
+
+The STARs stay authoritative: the table records each STAR's (mtime_ns, size)
+as it was when the table was written, and `read_ts_tilts` only answers from
+the table while the STAR still matches, so a hand-edited or re-emitted STAR
+is never shadowed by a stale table.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+TILT_TABLE_FILENAME = "tilt_table.npy"
+
+TS_ID_FIELD = "_ts_id"
+FRAME_ID_FIELD = "_frame_id"
+# Signature of the per-TS STAR the rows were written alongside; -1 if the
+# STAR was missing at write time (never matches, so readers use the STAR).
+STAR_MTIME_FIELD = "_star_mtime_ns"
+STAR_SIZE_FIELD = "_star_size"
+_KEY_FIELDS = (TS_ID_FIELD, FRAME_ID_FIELD, STAR_MTIME_FIELD, STAR_SIZE_FIELD)
+
+# Opened tables keyed by absolute path: ((mtime_ns, size), table). LRU so a
+# long-lived server browsing many jobs does not keep every mmap open.
+_OPEN_TABLES_MAX = 32
+_open_tables: "OrderedDict[str, Tuple[Tuple[int, int], TiltTable]]" = OrderedDict()
+_open_tables_lock = threading.Lock()
+
+
+class TiltTable:
+    """Read side of a tilt table: a memory-mapped structured array plus a
+    ts_id -> row-slice index built once per opened file."""
+
+    def __init__(self, path: Path, data: np.ndarray):
+        self.path = path
+        self._data = data
+        self._columns = [n for n in data.dtype.names if n not in _KEY_FIELDS]
+        self._slices: Dict[str, slice] = {}
+        self._star_sigs: Dict[str, Tuple[int, int]] = {}
+        ts_ids = data[TS_ID_FIELD]
+        if len(ts_ids):
+            # Rows are written grouped by TS, so each TS is one contiguous run.
+            starts = np.flatnonzero(np.r_[True, ts_ids[1:] != ts_ids[:-1]])
+            stops = np.r_[starts[1:], len(ts_ids)]
+            for start, stop in zip(starts, stops):
+                ts_id = str(ts_ids[start])
+                self._slices[ts_id] = slice(int(start), int(stop))
+                self._star_sigs[ts_id] = (int(data[STAR_MTIME_FIELD][start]), int(data[STAR_SIZE_FIELD][start]))
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["TiltTable"]:
+        """Memory-map the table at `path`; None if missing or unreadable."""
+        try:
+            data = np.load(path, mmap_mode="r", allow_pickle=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not open tilt table %s: %s", path, e)
+            return None
+        if data.dtype.names is None or not set(_KEY_FIELDS) <= set(data.dtype.names):
+            logger.warning("Ignoring %s: not a tilt table", path)
+            return None
+        return cls(path, data)
+
+    def ts_ids(self) -> List[str]:
+        return list(self._slices)
+
+    def has_ts(self, ts_id: str) -> bool:
+        return ts_id in self._slices
+
+    def star_signature(self, ts_id: str) -> Tuple[int, int]:
+        """(mtime_ns, size) of `{ts_id}.star` when the table was written."""
+        return self._star_sigs[ts_id]
+
+    def frame_ids(self, ts_id: str) -> List[str]:
+        return [str(v) for v in self._data[FRAME_ID_FIELD][self._slices[ts_id]]]
+
+    def tilts(self, ts_id: str) -> pd.DataFrame:
+        """The per-TS tilt block for `ts_id`, shaped like `starfile.read`
+        returns it (STAR column order, RangeIndex, default str dtype)."""
+        rows = self._data[self._slices[ts_id]]
+        columns = {}
+        for name in self._columns:
+            col = rows[name]
+            if col.dtype.kind == "U":
+                columns[name] = pd.Series(col.tolist())
+            else:
+                columns[name] = pd.Series(np.array(col))
+        return pd.DataFrame(columns)
+
+
+def _field_dtype(series: pd.Series) -> Optional[np.dtype]:
+    """NumPy dtype for one STAR column, or None if it can't round-trip."""
+    kind = series.dtype.kind
+    if kind in "iufb":
+        return series.dtype
+    if kind == "O" and all(isinstance(v, str) for v in series):
+        width = max((len(v) for v in series), default=0)
+        return np.dtype(f"U{max(width, 1)}")
+    return None
+
+
+def write_tilt_table(tilt_dir: Path, per_ts: Mapping[str, pd.DataFrame]) -> Optional[Path]:
+    """Write every per-TS tilt block in `per_ts` (in iteration order) to
+    `{tilt_dir}/tilt_table.npy`. Call it after the per-TS STARs are written:
+    their current (mtime_ns, size) is recorded as the table's freshness key.
+
+    All blocks must share one schema whose columns round-trip through a
+    structured array (numeric, bool, or all-str). Otherwise no table is
+    written and any previous one is removed, so readers fall back to the
+    STARs rather than reading something stale.
+    """
+    tilt_dir = Path(tilt_dir)
+    path = tilt_dir / TILT_TABLE_FILENAME
+    frames = [df for df in per_ts.values()]
+
+    reason = None
+    if not frames:
+        reason = "no tilt-series"
+    else:
+        columns = list(frames[0].columns)
+        if any(list(df.columns) != columns for df in frames[1:]):
+            reason = "per-TS STAR schemas differ"
+        elif any(name in columns for name in _KEY_FIELDS):
+            reason = "reserved column name in STAR"
+
+    fields: List[Tuple[str, np.dtype]] = []
+    if reason is None:
+        merged = pd.concat(frames, ignore_index=True)
+        for name in columns:
+            dtype = _field_dtype(merged[name])
+            if dtype is None:
+                reason = f"column {name!r} has mixed/non-scalar values"
+                break
+            fields.append((name, dtype))
+
+    if reason is not None:
+        logger.info("Not writing tilt table in %s: %s", tilt_dir, reason)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        return None
+
+    ts_col = [ts_id for ts_id, df in per_ts.items() for _ in range(len(df))]
+    if "rlnMicrographMovieName" in columns:
+        frame_col = [Path(str(v)).stem for v in merged["rlnMicrographMovieName"]]
+    else:
+        frame_col = [str(i) for df in frames for i in range(len(df))]
+    key_width = max((len(v) for v in ts_col + frame_col), default=1)
+    dtype = np.dtype(
+        [
+            (TS_ID_FIELD, f"U{key_width}"),
+            (FRAME_ID_FIELD, f"U{key_width}"),
+            (STAR_MTIME_FIELD, np.int64),
+            (STAR_SIZE_FIELD, np.int64),
+        ]
+        + fields
+    )
+
+    star_sigs = {}
+    for ts_id in per_ts:
+        try:
+            st = os.stat(tilt_dir / f"{ts_id}.star")
+            star_sigs[ts_id] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            star_sigs[ts_id] = (-1, -1)
+
+    table = np.empty(len(merged), dtype=dtype)
+    table[TS_ID_FIELD] = ts_col
+    table[FRAME_ID_FIELD] = frame_col
+    table[STAR_MTIME_FIELD] = [star_sigs[ts_id][0] for ts_id in ts_col]
+    table[STAR_SIZE_FIELD] = [star_sigs[ts_id][1] for ts_id in ts_col]
+    for name, _ in fields:
+        table[name] = merged[name].to_numpy()
+
+    fd, tmp = tempfile.mkstemp(dir=str(tilt_dir), prefix=".tmp_", suffix=".npy")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, table, allow_pickle=False)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    logger.info("Wrote tilt table %s (%d TS, %d tilts)", path, len(per_ts), len(table))
+    return path
+
+
+def open_tilt_table(tilt_dir: Path) -> Optional[TiltTable]:
+    """Cached `TiltTable.open` for `{tilt_dir}/tilt_table.npy`; reopened
+    when the file changes."""
+    path = Path(tilt_dir) / TILT_TABLE_FILENAME
+    key = str(path.resolve())
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        with _open_tables_lock:
+            _open_tables.pop(key, None)
+        return None
+    sig = (st.st_mtime_ns, st.st_size)
+    with _open_tables_lock:
+        hit = _open_tables.get(key)
+        if hit is not None and hit[0] == sig:
+            _open_tables.move_to_end(key)
+            return hit[1]
+    table = TiltTable.open(path)
+    with _open_tables_lock:
+        if table is None:
+            _open_tables.pop(key, None)
+            return None
+        _open_tables[key] = (sig, table)
+        _open_tables.move_to_end(key)
+        while len(_open_tables) > _OPEN_TABLES_MAX:
+            _open_tables.popitem(last=False)
+    return table
+
+
+def read_ts_tilts(per_ts_star: Path) -> Optional[pd.DataFrame]:
+    """Tilt block for the per-TS STAR at `per_ts_star`, served from the
+    sibling tilt table when that table is current; None means "read the
+    STAR". The table is current if the STAR's (mtime_ns, size) is exactly
+    the one recorded when the table was written."""
+    per_ts_star = Path(per_ts_star)
+    try:
+        st = os.stat(per_ts_star)
+    except FileNotFoundError:
+        return None
+    table = open_tilt_table(per_ts_star.parent)
+    if table is None:
+        return None
+    ts_id = per_ts_star.stem
+    if not table.has_ts(ts_id):
+        return None
+    if table.star_signature(ts_id) != (st.st_mtime_ns, st.st_size):
+        return None
+    return table.tilts(ts_id)
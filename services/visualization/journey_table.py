@@ -0,0 +1,908 @@
+"""
+Per-project journey table behind the Journey dashboard's TS roster.
+
+The roster shows, per tilt-series, the status of the four preprocessing array
+stages plus a pick / subtomo track per species. Deriving that means reading
+every array job's `.task_manifest.json` and `.task_status/`, the candidate-
+extract preview manifests (or their `tmResults/*_particles.star`), each
+subtomo job's `particles.star` and review sidecar, and the reconstruction's
+`tomograms.star`. That used to happen on every refresh of every open dialog.
+
+`JourneyTable` keeps the derived roster for one project. Each source read is
+memoized against a fingerprint of the files it depends on (mtime/size, plus
+the job's execution status), so a refresh costs a handful of `stat` calls and
+only re-reads what changed. Refreshes are rate-limited to one per
+JOURNEY_RECHECK_SEC no matter how many dashboards read the table; task-status
+events from the pipeline monitor's marker watcher mark the table stale so the
+next read picks them up immediately. Every refresh that moves a row bumps the
+table's version and logs the changed TS names, so a dashboard that already
+rendered version N re-renders only the rows in `changes_since(N)`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+from services.array_progress import get_array_progress_tracker
+from services.models_base import JobStatus, JobType
+from services.project_state import get_project_state
+from services.task_files import read_manifest, resolve_job_dir, scan_statuses
+from services.visualization.preview_orchestrator import MANIFEST_NAME, PREVIEW_SUBDIR, read_preview_manifest
+
+logger = logging.getLogger(__name__)
+
+# Minimum spacing between two fingerprint passes over one project; reads in
+# between are served from the current snapshot.
+JOURNEY_RECHECK_SEC = 1.0
+# Source reads are redone at least this often even when their fingerprint is
+# unchanged — covers the few inputs that are not fingerprinted (e.g. a
+# tomogram's _f32.mrc appearing next to an unchanged tomograms.star).
+JOURNEY_FULL_RESCAN_SEC = 60.0
+# Versions a dashboard can fall behind before it has to rebuild the roster.
+JOURNEY_DELTA_LOG = 64
+
+
+# Per-species overlay colors for the shared tomogram canvas. Indexed by the
+# candidate-extract instance's sorted position so a species keeps its color
+# across re-renders (and matches its checkbox). Maximally-saturated hues that
+# are absent from a greyscale tomogram (no mid-grays) so the dots pop; the
+# .cb-pick-ghost dual halo (dark + light ring) keeps them legible on both the
+# bright and dark ends of the backdrop.
+_SPECIES_OVERLAY_COLORS = [
+    "#ff1744",  # vivid red
+    "#00e5ff",  # vivid cyan
+    "#ffea00",  # vivid yellow
+    "#d500f9",  # vivid magenta-purple
+    "#76ff03",  # neon green
+    "#2979ff",  # vivid blue
+    "#ff9100",  # vivid orange
+    "#f50057",  # vivid pink
+]
+
+
+# ---------------------------------------------------------------------------
+# Discovery helpers
+# ---------------------------------------------------------------------------
+
+
+def _candidate_extract_instances(state) -> list[tuple[str, object]]:
+    out: list[tuple[str, object]] = []
+    for instance_id, job_model in state.jobs.items():
+        if getattr(job_model, "job_type", None) == JobType.TEMPLATE_EXTRACT_PYTOM:
+            out.append((instance_id, job_model))
+    return sorted(out, key=lambda kv: kv[0])
+
+
+def _subtomo_extract_instances(state) -> list[tuple[str, object]]:
+    out: list[tuple[str, object]] = []
+    for instance_id, job_model in state.jobs.items():
+        if getattr(job_model, "job_type", None) == JobType.SUBTOMO_EXTRACTION:
+            out.append((instance_id, job_model))
+    return sorted(out, key=lambda kv: kv[0])
+
+
+def _job_dir_for(instance_id: str, job_model, project_path: Path) -> Optional[Path]:
+    rjn = getattr(job_model, "relion_job_name", None)
+    if rjn:
+        d = project_path / rjn.rstrip("/")
+        if d.is_dir():
+            return d
+    state = get_project_state()
+    mapped = (state.job_path_mapping or {}).get(instance_id)
+    if mapped:
+        d = project_path / mapped.rstrip("/")
+        if d.is_dir():
+            return d
+    return None
+
+
+def _read_tomograms_table(tomograms_star: Path) -> Optional[pd.DataFrame]:
+    if not tomograms_star.exists():
+        return None
+    try:
+        import starfile
+
+        data = starfile.read(tomograms_star, always_dict=True)
+        for v in data.values():
+            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
+                return v
+    except Exception as e:
+        logger.warning("Could not read %s: %s", tomograms_star, e)
+    return None
+
+
+def _resolve_volume_for_3dmod(tomo_row: pd.Series, project_path: Path) -> Optional[Path]:
+    if "rlnTomoReconstructedTomogram" not in tomo_row.index:
+        return None
+    return _resolve_volume_path(str(tomo_row["rlnTomoReconstructedTomogram"]), project_path)
+
+
+def _resolve_volume_path(volume: str, project_path: Path) -> Optional[Path]:
+    """The `_f32.mrc` sibling of a tomograms.star volume if present, else the
+    volume itself; None if neither exists."""
+    p = Path(volume)
+    if not p.is_absolute():
+        p = project_path / p
+    f32 = p.with_name(p.stem + "_f32.mrc")
+    if f32.exists():
+        return f32
+    if p.exists():
+        return p
+    return None
+
+
+def _find_job_by_type(project_state, jt: JobType) -> Optional[tuple[str, object]]:
+    """Return (instance_id, job_model) for the first job matching this type,
+    or None. The match accepts either `job_model.job_type == jt` or an
+    `instance_id` whose base prefix matches `jt.value` (covers `__species`
+    instances)."""
+    for iid, jm in (project_state.jobs or {}).items():
+        if getattr(jm, "job_type", None) == jt or iid.split("__")[0] == jt.value:
+            return iid, jm
+    return None
+
+
+def _split_species_id(instance_id: str) -> Optional[str]:
+    """`templatematching__ribosome` → `ribosome`; bare instance_id → None."""
+    parts = instance_id.split("__", 1)
+    return parts[1] if len(parts) > 1 else None
+
+
+def _resolve_species(state, job_model, instance_id: str):
+    """Find the ParticleSpecies a per-particle job is attached to. Tries:
+    1. `instance_id` suffix (`templatematching__ribosome` → `ribosome`).
+    2. `job_model.species_id` field (set even when instance_id is bare).
+    3. Single-species fallback: if exactly one species exists in the
+       project, attribute the job to it.
+    Returns (species or None, species_id or None)."""
+    sid = _split_species_id(instance_id)
+    if sid:
+        sp = state.get_species(sid)
+        if sp:
+            return sp, sid
+    sid2 = getattr(job_model, "species_id", None)
+    if sid2:
+        sp = state.get_species(sid2)
+        if sp:
+            return sp, sid2
+        return None, sid2
+    if len(state.species_registry) == 1:
+        sp = state.species_registry[0]
+        return sp, sp.id
+    return None, None
+
+
+# ---------------------------------------------------------------------------
+# Per-TS journey collector — feeds the 6-pill sidebar strip
+# ---------------------------------------------------------------------------
+
+
+# (key, label, JobType for array stages, or None for synthetic stages handled below).
+_PILL_STAGES: list[tuple[str, str, Optional[JobType]]] = [
+    ("fs_ctf", "FS/CTF", JobType.FS_MOTION_CTF),
+    ("align", "Align", JobType.TS_ALIGNMENT),
+    ("ctf", "CTF", JobType.TS_CTF),
+    ("recon", "Recon", JobType.TS_RECONSTRUCT),
+    ("pick", "Pick", None),
+    ("subtomo", "Subtomo", None),
+]
+
+# Preprocessing track = the 4 array stages (one shared bar per TS row). The
+# particle stages (pick → subtomo) render as a separate per-species track.
+_PREP_STAGES = _PILL_STAGES[:4]
+
+
+# Legacy-job fallback: when `.task_manifest.json` is absent, derive the TS
+# list from the stage's primary output star (which lists every TS the job
+# touched) and apply a coarse job-level status to all of them. Lets pre-
+# array-tracker projects show real "ok" pills instead of being stuck on
+# "pending" for stages that actually finished.
+_ARRAY_STAGE_OUTPUT_STAR: dict[JobType, str] = {
+    JobType.FS_MOTION_CTF: "fs_motion_and_ctf.star",
+    JobType.TS_ALIGNMENT: "aligned_tilt_series.star",
+    JobType.TS_CTF: "ts_ctf_tilt_series.star",
+    JobType.TS_RECONSTRUCT: "tomograms.star",
+}
+
+
+def _ts_names_from_star(p: Path) -> list[str]:
+    """Return the rlnTomoName column from the first DataFrame in a star file."""
+    if not p.exists():
+        return []
+    try:
+        import starfile
+
+        data = starfile.read(p, always_dict=True)
+        for v in data.values():
+            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
+                return [str(x) for x in v["rlnTomoName"].tolist()]
+    except Exception as e:
+        logger.warning("Could not read TS list from %s: %s", p, e)
+    return []
+
+
+def _coarse_job_status(jm) -> str:
+    es = getattr(jm, "execution_status", None)
+    if es == JobStatus.SUCCEEDED:
+        return "ok"
+    if es == JobStatus.FAILED:
+        return "fail"
+    if es in (JobStatus.RUNNING, JobStatus.QUEUED, JobStatus.SCHEDULED):
+        return "running"
+    return "pending"
+
+
+def _array_stage_status(project_path: Path, jm) -> tuple[list[str], dict[str, str]]:
+    """For an array job, return (ordered TS items, {ts: status_string}).
+
+    Prefers the per-TS array-task tracker (.task_manifest.json + .task_status/)
+    when present. Falls back to the stage's output star + job-level execution
+    status for legacy jobs that ran before the tracker was wired up.
+    """
+    job_dir = resolve_job_dir(jm, project_path)
+    if job_dir is None:
+        return [], {}
+    progress = get_array_progress_tracker().get(job_dir)
+    if progress is not None:
+        return list(progress.items), progress.statuses
+
+    jt = getattr(jm, "job_type", None)
+    primary = _ARRAY_STAGE_OUTPUT_STAR.get(jt)
+    candidates: list[Path] = []
+    if primary:
+        candidates.append(job_dir / primary)
+    candidates.append(job_dir / "tomograms.star")
+    items: list[str] = []
+    for p in candidates:
+        items = _ts_names_from_star(p)
+        if items:
+            break
+    if not items:
+        return [], {}
+    coarse = _coarse_job_status(jm)
+    return items, {ts: coarse for ts in items}
+
+
+def _job_running_or_failed(jm) -> Optional[str]:
+    """For non-array jobs, derive a coarse status from execution_status. Returns
+    'running' / 'fail' / None (None means "fall back to per-TS data check")."""
+    es = getattr(jm, "execution_status", None)
+    if es == JobStatus.RUNNING or es == JobStatus.QUEUED or es == JobStatus.SCHEDULED:
+        return "running"
+    if es == JobStatus.FAILED:
+        return "fail"
+    return None
+
+
+def _zero_pick_tomos_from_tmresults(job_dir: Path) -> set[str]:
+    """Walk `<job_dir>/tmResults/*_particles.star` and return the set of
+    tomograms whose per-TS particles file exists but contains zero data
+    rows. This is the on-disk signal that PyTOM ran on that TS and produced
+    no candidates above cutoff — the supervisor's `pd.concat` merge silently
+    drops these, so they vanish from `candidates.star` and the preview
+    manifest. We surface them here so the journey pill can read "zero"
+    instead of the misleading "pending".
+
+    Fast: each file is header-only (~600 bytes); a 24-TS project takes a
+    few ms. Returns an empty set if `tmResults/` doesn't exist (older
+    project layouts).
+    """
+    tm_dir = job_dir / "tmResults"
+    if not tm_dir.is_dir():
+        return set()
+    out: set[str] = set()
+    for p in tm_dir.glob("*_particles.star"):
+        try:
+            import starfile
+
+            data = starfile.read(p, always_dict=True)
+        except Exception:
+            continue
+        # Find the particles dataframe (first DataFrame in the file).
+        df = None
+        for v in data.values():
+            if isinstance(v, pd.DataFrame):
+                df = v
+                break
+        if df is None or len(df) > 0:
+            continue
+        # Strip the "_particles" suffix to recover the tomo name.
+        stem = p.stem
+        if stem.endswith("_particles"):
+            tomo_name = stem[: -len("_particles")]
+            out.add(tomo_name)
+    return out
+
+
+def _candidate_extract_status_per_ts(job_dir: Path, jm) -> dict[str, str]:
+    """Read the candidate-extract job's preview manifest to bucket TS statuses.
+
+    Buckets:
+      - "ok": manifest entry has picks_json
+      - "fail": tomo listed in summary.errored
+      - "zero": tomo was processed but produced 0 picks above cutoff. Fast
+        path reads summary.zero_picks if present (manifest v10+); otherwise
+        falls back to scanning `tmResults/*_particles.star` for header-only
+        files.
+      - "running" / "pending": defaults based on job state, applied for any
+        TS that's expected (per the staged tomograms.star) but not yet
+        covered by any of the buckets above.
+    """
+    manifest = read_preview_manifest(job_dir) or {}
+    entries = manifest.get("tomograms") or {}
+    summary = manifest.get("summary") or {}
+    errored = {e.get("tomo") for e in (summary.get("errored") or []) if e.get("tomo")}
+
+    # Fast path: orchestrator-recorded zero_picks (v10+). Fallback: scan
+    # tmResults for legacy manifests. The scan is cheap (header-only files)
+    # so we run it unconditionally on miss to recover from old projects.
+    zero_picks: set[str] = set(summary.get("zero_picks") or [])
+    if not zero_picks:
+        zero_picks = _zero_pick_tomos_from_tmresults(job_dir)
+
+    coarse = _job_running_or_failed(jm)
+    out: dict[str, str] = {}
+
+    for tomo_name, entry in entries.items():
+        if tomo_name in errored:
+            out[tomo_name] = "fail"
+        elif entry.get("picks_json"):
+            out[tomo_name] = "ok"
+        elif coarse == "running":
+            out[tomo_name] = "running"
+        else:
+            out[tomo_name] = "pending"
+
+    # Promote zero-pick tomos. These don't appear in `entries` (the
+    # orchestrator only emitted entries for tomos with at least one pick),
+    # so they're additive to the dict.
+    for tomo_name in zero_picks:
+        if tomo_name not in out:
+            out[tomo_name] = "zero"
+
+    return out
+
+
+def _read_subtomo_extracted_ts(job_dir: Path) -> set[str]:
+    """Read job_dir/particles.star and return the set of TS that had at
+    least one row of extracted particles. Tolerant of missing files /
+    parse errors."""
+    particles_star = job_dir / "particles.star"
+    if not particles_star.exists():
+        return set()
+    try:
+        import starfile
+
+        data = starfile.read(particles_star, always_dict=True)
+        df = data.get("particles")
+        if df is None:
+            for v in data.values():
+                if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
+                    df = v
+                    break
+        if df is None or "rlnTomoName" not in df.columns:
+            return set()
+        return {str(t) for t in df["rlnTomoName"].astype(str).unique()}
+    except Exception as e:
+        logger.warning("Could not parse subtomo particles.star %s: %s", particles_star, e)
+        return set()
+
+
+def _subtomo_extract_status_per_ts(job_dir: Path, jm, expected_ts: Optional[set[str]] = None) -> dict[str, str]:
+    """Bucket per-TS status for the subtomo-extraction job.
+
+    Two layouts are supported, in priority order:
+
+      1. **Array layout** (post-conversion): `.task_manifest.json` exists.
+         Per-TS pass/fail from `.task_status/<ts>.{ok,fail}` is the source
+         of truth. An "ok" task that didn't write any row to particles.star
+         is demoted to "zero" (extraction ran but produced 0 particles for
+         that TS — e.g. all picks filtered by max_dose / min_frames).
+
+      2. **Legacy one-shot layout** (no manifest): we don't have per-TS
+         markers. Fall back to particles.star membership crossed with
+         `expected_ts` (typically the union of "ok" picks across upstream
+         candidate-extract instances). A TS in `expected_ts` but absent
+         from particles.star is "zero" iff the job has SUCCEEDED, else
+         "running" / "pending" depending on job state.
+    """
+    extracted = _read_subtomo_extracted_ts(job_dir)
+    out: dict[str, str] = {}
+
+    # ── Layout 1: array layout ─────────────────────────────────────────
+    array_manifest = read_manifest(job_dir)
+    if array_manifest is not None:
+        items = array_manifest.get("items") or []
+        if items:
+            statuses = scan_statuses(job_dir, items)
+            for ts in items:
+                st = statuses.get(ts, "pending")
+                if st == "ok" and ts not in extracted:
+                    # task completed but the TS isn't in particles.star —
+                    # relion_tomo_subtomo ran and produced nothing (all
+                    # candidates filtered out at this stage).
+                    out[ts] = "zero"
+                else:
+                    out[ts] = st
+            return out
+
+    # ── Layout 2: legacy one-shot ──────────────────────────────────────
+    for ts in extracted:
+        out[ts] = "ok"
+
+    if expected_ts:
+        es = getattr(jm, "execution_status", None)
+        job_running = es in (JobStatus.RUNNING, JobStatus.QUEUED, JobStatus.SCHEDULED)
+        job_succeeded = es == JobStatus.SUCCEEDED
+        for ts in expected_ts:
+            if ts in extracted:
+                continue
+            if job_succeeded:
+                out[ts] = "zero"
+            elif job_running:
+                out[ts] = "running"
+            # Else: leave unset; caller defaults to "pending".
+
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Fingerprinted source reads
+# ---------------------------------------------------------------------------
+
+
+def _sig(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of `path`, None if it doesn't exist. A directory's
+    mtime moves whenever an entry is created, renamed or removed in it."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _SourceCache:
+    """One project's source reads, memoized on a caller-built fingerprint."""
+
+    def __init__(self) -> None:
+        # key -> (fingerprint, monotonic read time, value)
+        self._entries: Dict[Hashable, Tuple[Hashable, float, Any]] = {}
+        self._touched: set = set()
+
+    def get(self, key: Hashable, fingerprint: Hashable, compute: Callable[[], Any]) -> Any:
+        self._touched.add(key)
+        now = time.monotonic()
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] == fingerprint and now - hit[1] < JOURNEY_FULL_RESCAN_SEC:
+            return hit[2]
+        value = compute()
+        self._entries[key] = (fingerprint, now, value)
+        return value
+
+    def prune(self) -> None:
+        """Forget entries nothing asked for since the last prune (removed
+        jobs, superseded expected-TS sets)."""
+        for key in self._entries.keys() - self._touched:
+            del self._entries[key]
+        self._touched = set()
+
+
+def _array_stage_cached(cache: _SourceCache, project_path: Path, iid: str, jm) -> tuple[list[str], dict[str, str]]:
+    job_dir = resolve_job_dir(jm, project_path)
+    if job_dir is None:
+        return [], {}
+    primary = _ARRAY_STAGE_OUTPUT_STAR.get(getattr(jm, "job_type", None))
+    fingerprint = (
+        str(job_dir),
+        getattr(jm, "execution_status", None),
+        _sig(job_dir),  # task_{idx}.out appearing flips pending -> running
+        _sig(job_dir / ".task_manifest.json"),
+        _sig(job_dir / ".task_status"),
+        _sig(job_dir / primary) if primary else None,
+        _sig(job_dir / "tomograms.star"),
+    )
+    return cache.get(("array", iid), fingerprint, lambda: _array_stage_status(project_path, jm))
+
+
+def _candidate_extract_cached(cache: _SourceCache, iid: str, jm, job_dir: Path) -> tuple[dict[str, str], dict]:
+    """(per-TS pick status, preview manifest) of one candidate-extract job."""
+    fingerprint = (
+        str(job_dir),
+        _job_running_or_failed(jm),
+        _sig(job_dir / PREVIEW_SUBDIR / MANIFEST_NAME),
+        _sig(job_dir / "tmResults"),
+    )
+    return cache.get(
+        ("pick", iid),
+        fingerprint,
+        lambda: (_candidate_extract_status_per_ts(job_dir, jm), read_preview_manifest(job_dir) or {}),
+    )
+
+
+def _subtomo_extract_cached(
+    cache: _SourceCache, iid: str, jm, job_dir: Path, expected_ts: Optional[set[str]]
+) -> dict[str, str]:
+    expected = frozenset(expected_ts or ())
+    fingerprint = (
+        str(job_dir),
+        getattr(jm, "execution_status", None),
+        _sig(job_dir / ".task_manifest.json"),
+        _sig(job_dir / ".task_status"),
+        _sig(job_dir / "particles.star"),
+    )
+    return cache.get(
+        ("subtomo", iid, expected),
+        fingerprint,
+        lambda: _subtomo_extract_status_per_ts(job_dir, jm, expected_ts=set(expected)),
+    )
+
+
+def _reviewed_counts_cached(cache: _SourceCache, iid: str, job_dir: Path) -> dict[str, int]:
+    from services.visualization import picks_filter
+
+    fingerprint = (str(job_dir), picks_filter.curation_signature(job_dir))
+    return cache.get(("reviewed", iid), fingerprint, lambda: picks_filter.read_reviewed_counts(job_dir))
+
+
+def _collect_dashboard_journey(
+    project_state, project_path: Path, cache: Optional[_SourceCache] = None
+) -> tuple[dict[str, dict[str, str]], list[str]]:
+    """Collect per-TS status across the 6 dashboard stages.
+
+    Returns:
+        journey: {ts_name: {stage_key: status_string}} where status is one of
+                 "ok" / "fail" / "running" / "pending".
+        ts_names: ordered list of all tilt series in the project (union across
+                  array-job manifests). Order follows the first stage that
+                  declares a given TS.
+
+    Source reads go through `cache` (a throwaway one if None).
+    """
+    if cache is None:
+        cache = _SourceCache()
+    journey: dict[str, dict[str, str]] = {}
+    ts_order: list[str] = []
+    seen: set[str] = set()
+
+    # Walk the 4 array stages first so ts_order reflects pipeline order.
+    for key, _label, jt in _PILL_STAGES:
+        if jt is None:
+            continue
+        for iid, jm in (project_state.jobs or {}).items():
+            if getattr(jm, "job_type", None) != jt and iid.split("__")[0] != jt.value:
+                continue
+            items, statuses = _array_stage_cached(cache, project_path, iid, jm)
+            if not items:
+                continue
+            for ts_name in items:
+                if ts_name not in seen:
+                    ts_order.append(ts_name)
+                    seen.add(ts_name)
+                journey.setdefault(ts_name, {})[key] = statuses.get(ts_name, "pending")
+            break  # one job per array stage
+
+    # Pick stage: combine across all candidate-extract instances. Promotion
+    # order keeps "ok" winning over "zero" (multi-species: if one species
+    # produced picks here and another didn't, the row is genuinely "ok").
+    pick_combined: dict[str, str] = {}
+    pick_order = {"ok": 5, "running": 4, "zero": 3, "fail": 2, "pending": 1}
+    for iid, jm in _candidate_extract_instances(project_state):
+        jd = _job_dir_for(iid, jm, project_path)
+        if jd is None:
+            continue
+        statuses, _manifest = _candidate_extract_cached(cache, iid, jm, jd)
+        for ts_name, st in statuses.items():
+            cur = pick_combined.get(ts_name)
+            if cur is None or pick_order.get(st, 0) > pick_order.get(cur, 0):
+                pick_combined[ts_name] = st
+            if ts_name not in seen:
+                ts_order.append(ts_name)
+                seen.add(ts_name)
+    for ts_name, st in pick_combined.items():
+        journey.setdefault(ts_name, {})["pick"] = st
+
+    # Subtomo stage: combine across all subtomo-extract instances. Pass the
+    # "ok" pick set as `expected_ts` so the predicate can infer zero-state
+    # for TS that should have been extracted but didn't make it into
+    # particles.star (e.g. filtered out by max_dose / min_frames).
+    picked_ok: set[str] = {ts for ts, st in pick_combined.items() if st == "ok"}
+    subtomo_combined: dict[str, str] = {}
+    subtomo_order = {"ok": 5, "running": 4, "zero": 3, "fail": 2, "pending": 1}
+    for iid, jm in _subtomo_extract_instances(project_state):
+        jd = _job_dir_for(iid, jm, project_path)
+        if jd is None:
+            continue
+        statuses = _subtomo_extract_cached(cache, iid, jm, jd, picked_ok)
+        for ts_name, st in statuses.items():
+            cur = subtomo_combined.get(ts_name)
+            if cur is None or subtomo_order.get(st, 0) > subtomo_order.get(cur, 0):
+                subtomo_combined[ts_name] = st
+            if ts_name not in seen:
+                ts_order.append(ts_name)
+                seen.add(ts_name)
+    for ts_name, st in subtomo_combined.items():
+        journey.setdefault(ts_name, {})["subtomo"] = st
+
+    # Fill missing pills with "pending" so renderers don't have to defend.
+    for ts_name in ts_order:
+        row = journey.setdefault(ts_name, {})
+        for key, _label, _jt in _PILL_STAGES:
+            row.setdefault(key, "pending")
+
+    return journey, ts_order
+
+
+def _species_label_for(jm, iid: str, manifest: dict) -> str:
+    """Display label for a species: manifest species_name → instance suffix →
+    job_model.species_id → bare instance id."""
+    return str(
+        (manifest.get("template") or {}).get("species_name")
+        or _split_species_id(iid)
+        or getattr(jm, "species_id", None)
+        or iid
+    )
+
+
+def _matching_subtomo_instance(state, species_id):
+    """The SUBTOMO_EXTRACTION instance attached to this species_id, or None."""
+    for s_iid, s_jm in _subtomo_extract_instances(state):
+        _, s_sid = _resolve_species(state, s_jm, s_iid)
+        if s_sid == species_id:
+            return s_iid, s_jm
+    return None
+
+
+def _recon_mrc_map(state, project_path: Path, cache: Optional[_SourceCache] = None) -> dict[str, str]:
+    """{ts_name: reconstructed-tomogram path} read once from the recon job's
+    tomograms.star, so the roster info popover can list the volume without a
+    per-row disk read."""
+    rec = _find_job_by_type(state, JobType.TS_RECONSTRUCT)
+    if not rec:
+        return {}
+    jd = _job_dir_for(rec[0], rec[1], project_path)
+    if jd is None:
+        return {}
+    if cache is None:
+        cache = _SourceCache()
+    star = jd / "tomograms.star"
+    return cache.get(("recon", rec[0]), (str(jd), _sig(star)), lambda: _read_recon_mrc_map(star, project_path))
+
+
+def _read_recon_mrc_map(tomograms_star: Path, project_path: Path) -> dict[str, str]:
+    df = _read_tomograms_table(tomograms_star)
+    if df is None or "rlnTomoReconstructedTomogram" not in df.columns:
+        return {}
+    out: dict[str, str] = {}
+    names = df["rlnTomoName"].astype(str)
+    volumes = df["rlnTomoReconstructedTomogram"].astype(str)
+    for name, volume in zip(names, volumes):
+        mrc = _resolve_volume_path(volume, project_path)
+        if mrc:
+            out[name] = str(mrc)
+    return out
+
+
+def _collect_species_journey(
+    project_state, project_path: Path, cache: Optional[_SourceCache] = None
+) -> dict[str, list[dict]]:
+    """Per-TS per-species particle-track data for the roster.
+
+    {ts: [{idx, label, color, species_id, pick_status, subtomo_status, n_picks,
+    ce_star, subtomo_star, pixel_size_ang, tomo_dims}]}. Species order + color
+    follow `_candidate_extract_instances` enumeration, so the roster dot matches
+    the canvas overlay and the species tabs everywhere."""
+    if cache is None:
+        cache = _SourceCache()
+    out: dict[str, list[dict]] = {}
+    for idx, (iid, jm) in enumerate(_candidate_extract_instances(project_state)):
+        jd = _job_dir_for(iid, jm, project_path)
+        if jd is None:
+            continue
+        color = _SPECIES_OVERLAY_COLORS[idx % len(_SPECIES_OVERLAY_COLORS)]
+        _, species_id = _resolve_species(project_state, jm, iid)
+        pick_status, manifest = _candidate_extract_cached(cache, iid, jm, jd)
+        entries = manifest.get("tomograms") or {}
+        label = _species_label_for(jm, iid, manifest)
+        sub_match = _matching_subtomo_instance(project_state, species_id)
+        sub_status: dict[str, str] = {}
+        sub_star = None
+        reviewed: dict[str, int] = {}
+        if sub_match is not None:
+            sub_jd = _job_dir_for(sub_match[0], sub_match[1], project_path)
+            if sub_jd is not None:
+                sub_star = str(sub_jd / "particles.star")
+                reviewed = _reviewed_counts_cached(cache, sub_match[0], sub_jd)
+                picked_ok = {ts for ts, st in pick_status.items() if st == "ok"}
+                sub_status = _subtomo_extract_cached(cache, sub_match[0], sub_match[1], sub_jd, picked_ok)
+        ce_star = str(jd / "candidates.star")
+        for ts in set(pick_status) | set(sub_status):
+            entry = entries.get(ts) or {}
+            out.setdefault(ts, []).append(
+                {
+                    "idx": idx,
+                    "label": label,
+                    "color": color,
+                    "species_id": species_id,
+                    "pick_status": pick_status.get(ts, "pending"),
+                    "subtomo_status": sub_status.get(ts, "pending"),
+                    "n_picks": entry.get("n_picks"),
+                    "filtered_count": reviewed.get(ts),  # kept count if reviewed, else None
+                    "ce_star": ce_star,
+                    "subtomo_star": sub_star,
+                    "pixel_size_ang": entry.get("pixel_size_ang"),
+                    "tomo_dims": entry.get("tomo_dims_xyz_px"),
+                }
+            )
+    for ts in out:
+        out[ts].sort(key=lambda s: s["idx"])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Journey table
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class JourneySnapshot:
+    """One version of a project's journey. Shared by every reader of that
+    version, so treat the containers as read-only."""
+
+    version: int
+    ts_names: List[str] = field(default_factory=list)
+    journey: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    species: Dict[str, List[dict]] = field(default_factory=dict)
+    recon_mrc: Dict[str, str] = field(default_factory=dict)
+
+
+class JourneyTable:
+    """Incrementally maintained journey of one project.
+
+    `snapshot` re-fingerprints the sources at most once per
+    JOURNEY_RECHECK_SEC (sooner after `invalidate`) and otherwise hands back
+    the current snapshot as is.
+    """
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path)
+        try:
+            self.resolved_path = self.project_path.resolve()
+        except OSError:
+            self.resolved_path = self.project_path
+        self._sources = _SourceCache()
+        self._snapshot = JourneySnapshot(version=0)
+        # (version, TS names whose row changed, or None if the TS list did)
+        self._deltas: Deque[Tuple[int, Optional[frozenset]]] = deque(maxlen=JOURNEY_DELTA_LOG)
+        self._checked_at = float("-inf")
+        self._stale = True
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    def _due(self) -> bool:
+        return self._stale or time.monotonic() - self._checked_at >= JOURNEY_RECHECK_SEC
+
+    def snapshot(self, state) -> JourneySnapshot:
+        if not self._due():
+            return self._snapshot
+        with self._lock:
+            if self._due():
+                # Cleared before the refresh so an event arriving during it
+                # leaves the table stale for the next reader.
+                self._stale = False
+                self._checked_at = time.monotonic()
+                try:
+                    self._refresh(state)
+                except Exception:
+                    logger.exception("Journey refresh failed for %s", self.project_path)
+        return self._snapshot
+
+    def changes_since(self, version: int) -> Optional[set[str]]:
+        """TS names whose row changed after `version`. None means rebuild
+        everything: the TS list changed, or `version` is older than the
+        delta log reaches back."""
+        current = self._snapshot.version
+        if version == current:
+            return set()
+        deltas = [d for d in list(self._deltas) if version < d[0] <= current]
+        if version > current or len(deltas) != current - version:
+            return None
+        changed: set[str] = set()
+        for _, names in deltas:
+            if names is None:
+                return None
+            changed |= names
+        return changed
+
+    def _refresh(self, state) -> None:
+        t0 = time.perf_counter()
+        journey, ts_names = _collect_dashboard_journey(state, self.project_path, self._sources)
+        species = _collect_species_journey(state, self.project_path, self._sources)
+        recon_mrc = _recon_mrc_map(state, self.project_path, self._sources)
+        self._sources.prune()
+
+        old = self._snapshot
+        changed: Optional[frozenset]
+        if ts_names != old.ts_names:
+            changed = None
+        else:
+            changed = frozenset(
+                ts
+                for ts in ts_names
+                if journey.get(ts) != old.journey.get(ts)
+                or species.get(ts) != old.species.get(ts)
+                or recon_mrc.get(ts) != old.recon_mrc.get(ts)
+            )
+            if not changed:
+                return
+        version = old.version + 1
+        # Log first, publish second: a reader that sees the new version
+        # always finds its delta.
+        self._deltas.append((version, changed))
+        self._snapshot = JourneySnapshot(version, ts_names, journey, species, recon_mrc)
+        logger.debug(
+            "Journey[%s] v%d: %s in %.0f ms",
+            self.project_path.name,
+            version,
+            "TS list changed" if changed is None else f"{len(changed)} TS changed",
+            (time.perf_counter() - t0) * 1000,
+        )
+
+
+class JourneyService:
+    """Process-wide journey tables, one per project, shared by every open
+    dashboard."""
+
+    def __init__(self):
+        self._tables: Dict[Path, JourneyTable] = {}
+        self._lock = threading.Lock()
+
+    def table(self, project_path) -> JourneyTable:
+        key = Path(project_path)
+        table = self._tables.get(key)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(key)
+                if table is None:
+                    table = self._tables[key] = JourneyTable(key)
+        return table
+
+    def snapshot(self, state=None) -> JourneySnapshot:
+        """Current journey of `state`'s project (the active project if None)."""
+        state = state if state is not None else get_project_state()
+        return self.table(state.project_path).snapshot(state)
+
+    def invalidate(self, project_path) -> None:
+        resolved = Path(project_path)
+        for key, table in list(self._tables.items()):
+            if key == resolved or table.resolved_path == resolved:
+                table.invalidate()
+
+    def on_marker(self, project_path: Path, directory: Path, name: str) -> None:
+        """PipelineMonitor marker listener: a task-status or exit marker
+        landed in one of the project's job dirs."""
+        self.invalidate(project_path)
+
+
+_journey_service: Optional[JourneyService] = None
+
+
+def get_journey_service() -> JourneyService:
+    global _journey_service
+    if _journey_service is None:
+        _journey_service = JourneyService()
+    return _journey_service
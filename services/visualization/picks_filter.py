@@ -3,43 +3,61 @@
 The candidate-extract dashboard's subtomo gallery is the natural place to
 keep/drop individual picks: the user can see each particle's cutout next to
 the template + low-score noise references, and decide whether it looks
-real. "Save picks" persists that decision as an alt-output file pair next to
-the SUBTOMO_EXTRACTION job's canonical outputs:
+real. "Save picks" persists that decision next to the SUBTOMO_EXTRACTION
+job's canonical outputs:
 
     <subtomo_job_dir>/particles.star               (original; never touched)
     <subtomo_job_dir>/optimisation_set.star        (original; never touched)
-    <subtomo_job_dir>/particles_filtered.star      (curator subset)
+    <subtomo_job_dir>/curation_journal.jsonl       (append-only per-TS decisions)
+    <subtomo_job_dir>/particles_filtered.star      (curator subset, materialized)
     <subtomo_job_dir>/optimisation_set_filtered.star  (points at filtered particles)
 
-The filtered file is declared as a second OutputSlot on
+The filtered files are declared as second OutputSlots on
 SubtomoExtractionParams with `prefer_if_exists=True`, so downstream consumers
-(ReconstructParticle, Class3D, …) automatically use it when present via the
+(ReconstructParticle, Class3D, …) automatically use them when present via the
 existing path-resolution scoring — no driver changes needed.
 
-Per-TS incrementally: a save only affects one TS at a time, but the filtered
-file is a project-level artifact spanning all TSs in the subtomo job. The
-save function reads the existing filtered file (if any) to preserve
-previously-curated TSs, swaps in the freshly-computed kept rows for the
-current TS, and writes back. Untouched TSs default to "all kept" (=
-original-particles rows).
+Per-TS journal: a save only affects one TS, so it appends one line to the
+journal — `{"op": "set", "ts": ..., "keys": [...]}` carrying the integer
+coordinate keys of the kept picks, or `{"op": "revert", "ts": ...}`. The
+journal replays (incrementally, from the last offset read) into a per-TS
+index of kept keys; TSs without an entry are implicitly "all kept".
+particles_filtered.star is materialized from the original particles.star
+plus that index by `ensure_filtered_materialized`, which writes the
+particles file before the optimisation set pointing at it, and is a no-op
+until the journal or the original changes. Saves and per-TS reverts
+materialize right away, so the pair on disk always reflects the journal
+for a running scheme or an external reader; pipeline deploy, retries and
+aggregation merge call it again as a cheap safety net.
 
 Mapping pick_idx (gallery, score-sorted candidate-extract order) → row in
 subtomo's particles.star happens by Å-coord matching, mirroring the join
 logic in subtomo_link.py: candidate-extract's rlnCenteredCoordinate{X,Y,Z}Angst
-on its candidates.star → same columns on subtomo's particles.star, rounded
-to one decimal.
+on its candidates.star → same columns on subtomo's particles.star, as
+`_coord_keys` integer keys (0.1 Å).
+
+Projects curated before the journal existed have a particles_filtered.star
+plus a `curation_reviewed.json` sidecar; the first access converts them to a
+journal (see `_migrate_legacy`).
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from services.visualization.subtomo_link import _coord_key, _read_subtomo_particles
+from services.configs.starfile_service import StarfileService
+from services.models_base import JobType
+from services.visualization.subtomo_link import _COORD_COLS, _coord_keys, _read_subtomo_particles
 
 logger = logging.getLogger(__name__)
 
@@ -47,184 +65,336 @@ OPTIMISATION_SET_NAME = "optimisation_set.star"
 OPTIMISATION_SET_FILTERED_NAME = "optimisation_set_filtered.star"
 PARTICLES_NAME = "particles.star"
 PARTICLES_FILTERED_NAME = "particles_filtered.star"
-# {ts_name: kept_count} for TS the user has explicitly curated. The filtered
-# star can't distinguish "reviewed, kept all" from "never reviewed" (both have
-# all rows), so this sidecar records review intent + kept count for the roster.
+JOURNAL_NAME = "curation_journal.jsonl"
+JOURNAL_VERSION = 1
+# {journal, particles} signatures particles_filtered.star was materialized from.
+MATERIALIZED_STAMP_NAME = ".curation_materialized.json"
+# Pre-journal {ts_name: kept_count} review sidecar; only read for migration.
 REVIEWED_SIDECAR_NAME = "curation_reviewed.json"
 
+# The journal is rewritten to one record per curated TS once it holds at
+# least this many records and more than twice as many as it needs.
+JOURNAL_COMPACT_MIN_RECORDS = 256
 
-def _read_candidates_for_ts(candidates_star: Path, ts_name: str) -> Optional[pd.DataFrame]:
-    """Read candidates.star, filter to one TS, sort by score-desc to match
-    the gallery's pick_idx order. Returns None if the star is missing or
-    the score column isn't present."""
-    if not candidates_star.exists():
+
+def _sig(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
         return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp_", suffix=path.suffix)
     try:
-        import starfile
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
-        data = starfile.read(candidates_star, always_dict=True)
-    except Exception as e:
-        logger.warning("Could not read candidates.star %s: %s", candidates_star, e)
-        return None
-    parts = data.get("particles")
-    if parts is None:
-        for v in data.values():
-            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
-                parts = v
-                break
-    if parts is None or not isinstance(parts, pd.DataFrame):
-        return None
-    for_ts = parts[parts["rlnTomoName"] == ts_name]
-    # Sort score-desc to match write_picks_data's order in picks.json.
-    # SCORE_COL_PRIORITY (preview_orchestrator) is (LCC, AutopickFigureOfMerit, ProbDist).
-    for col in ("rlnLCCmax", "rlnAutopickFigureOfMerit", "rlnMaxValueProbDistribution"):
-        if col in for_ts.columns:
-            for_ts = for_ts.sort_values(col, ascending=False).reset_index(drop=True)
-            break
-    else:
-        for_ts = for_ts.reset_index(drop=True)
-    return for_ts
 
+def _keys_isin(keys: np.ndarray, kept: np.ndarray) -> np.ndarray:
+    """Row-wise membership of (N, 3) int64 keys in (M, 3) int64 keys."""
+    if not len(keys) or not len(kept):
+        return np.zeros(len(keys), dtype=bool)
+    probe = pd.MultiIndex.from_arrays(list(np.asarray(keys).T))
+    return probe.isin(pd.MultiIndex.from_arrays(list(np.asarray(kept).T)))
 
-def derive_keep_state_for_ts(
-    subtomo_job_dir: Path, candidate_extract_job_dir: Path, ts_name: str, n_picks_for_ts: int
-) -> Optional[set[int]]:
-    """Look up which pick_idx values are currently kept in the filtered file.
 
-    Returns:
-      - None if no filtered file exists (= all picks implicitly kept).
-      - set[int] of pick_idx values (0-based, matching picks.json order) that
-        are present in particles_filtered.star for this TS.
+def _frame_keys(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """(keys, finite) for the Å-coord columns of `df`: (N, 3) int64 keys
+    (zero where not finite) and the mask of rows whose coords all parse."""
+    xyz = np.column_stack([pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64) for c in _COORD_COLS])
+    finite = np.isfinite(xyz).all(axis=1)
+    keys = np.zeros((len(df), 3), dtype=np.int64)
+    keys[finite] = _coord_keys(xyz[finite])
+    return keys, finite
 
-    A non-None empty set means "all picks dropped for this TS" — distinct
-    from None. The two states encode different intents and persist differently
-    (None = no curation yet; empty = explicitly dropped all).
-    """
-    filtered = subtomo_job_dir / PARTICLES_FILTERED_NAME
-    if not filtered.exists():
-        return None
 
-    cands = _read_candidates_for_ts(candidate_extract_job_dir / "candidates.star", ts_name)
-    if cands is None or cands.empty:
-        return set()
+# ── Journal index ────────────────────────────────────────────────────────
 
-    coord_cols = ("rlnCenteredCoordinateXAngst", "rlnCenteredCoordinateYAngst", "rlnCenteredCoordinateZAngst")
-    if not all(c in cands.columns for c in coord_cols):
-        # No Å coords on candidates → can't match. Treat as "no filter info".
-        return None
 
-    df_filt = _read_subtomo_particles(filtered, subtomo_job_dir)
-    if df_filt is None:
-        return None
-    if not all(c in df_filt.columns for c in coord_cols):
-        return None
+class _Curation:
+    """Replayed state of one job's journal: kept keys per curated TS."""
 
-    filt_for_ts = df_filt[df_filt["rlnTomoName"] == ts_name]
-    if filt_for_ts.empty:
-        return set()  # explicitly nothing kept for this TS
+    def __init__(self, ident: Optional[tuple[int, int]] = None):
+        self.ident = ident  # (st_dev, st_ino) of the journal replayed
+        self.offset = 0  # bytes of whole lines replayed so far
+        self.records = 0
+        self.kept: dict[str, np.ndarray] = {}  # ts_name -> (k, 3) int64
+        self.counts: dict[str, int] = {}  # ts_name -> kept subtomo rows
 
-    kept_keys: set[tuple[int, int, int]] = set()
-    for _, row in filt_for_ts.iterrows():
-        try:
-            kept_keys.add(_coord_key(row[coord_cols[0]], row[coord_cols[1]], row[coord_cols[2]]))
-        except (TypeError, ValueError):
-            continue
+    def apply(self, rec: dict) -> None:
+        if not isinstance(rec, dict) or rec.get("v") != JOURNAL_VERSION:
+            return
+        ts_name = str(rec.get("ts"))
+        if rec.get("op") == "set":
+            keys = np.asarray(rec.get("keys") or [], dtype=np.int64).reshape(-1, 3)
+            self.kept[ts_name] = keys
+            self.counts[ts_name] = int(rec.get("kept", len(keys)))
+        elif rec.get("op") == "revert":
+            self.kept.pop(ts_name, None)
+            self.counts.pop(ts_name, None)
+        self.records += 1
 
-    kept_pick_indices: set[int] = set()
-    n = min(n_picks_for_ts, len(cands))
-    for i in range(n):
-        row = cands.iloc[i]
-        try:
-            key = _coord_key(row[coord_cols[0]], row[coord_cols[1]], row[coord_cols[2]])
-        except (TypeError, ValueError):
-            continue
-        if key in kept_keys:
-            kept_pick_indices.add(i)
-    return kept_pick_indices
 
+# Replayed journals keyed by resolved job dir; legacy (journal-less)
+# curations keyed the same way with the files' signatures they came from.
+_curations: dict[str, _Curation] = {}
+_legacy: dict[str, tuple[tuple, _Curation]] = {}
+_locks: dict[str, threading.RLock] = {}
+_locks_guard = threading.Lock()
 
-def save_filtered_picks_for_ts(
-    subtomo_job_dir: Path, candidate_extract_job_dir: Path, ts_name: str, kept_pick_indices: set[int]
-) -> dict:
-    """Write/update particles_filtered.star + optimisation_set_filtered.star.
 
-    Semantics:
-      - For the current TS: kept rows are the subtomo rows whose Å-coord
-        matches a kept pick (by `kept_pick_indices` → candidates.star Å
-        lookup → particles.star Å match).
-      - For OTHER TSs: rows are preserved from any existing filtered file,
-        OR from the original particles.star if no prior filter file exists
-        (= effectively "all kept" for those TSs).
+def _job_key(subtomo_job_dir: Path) -> str:
+    return str(Path(subtomo_job_dir).resolve())
 
-    Returns a small status dict: {"kept_for_ts": int, "total_kept": int,
-    "filtered_path": str, "optset_path": str}.
-    """
-    orig_particles = subtomo_job_dir / PARTICLES_NAME
-    if not orig_particles.exists():
-        raise FileNotFoundError(f"Original subtomo particles.star not found: {orig_particles}")
 
-    cands = _read_candidates_for_ts(candidate_extract_job_dir / "candidates.star", ts_name)
-    if cands is None:
-        raise RuntimeError(f"Could not read candidates for {ts_name} from {candidate_extract_job_dir}")
+def _job_lock(subtomo_job_dir: Path) -> threading.RLock:
+    key = _job_key(subtomo_job_dir)
+    with _locks_guard:
+        return _locks.setdefault(key, threading.RLock())
 
-    coord_cols = ("rlnCenteredCoordinateXAngst", "rlnCenteredCoordinateYAngst", "rlnCenteredCoordinateZAngst")
-    kept_keys: set[tuple[int, int, int]] = set()
-    for i in sorted(kept_pick_indices):
-        if i < 0 or i >= len(cands):
-            continue
-        row = cands.iloc[i]
+
+def _set_record(ts_name: str, keys: np.ndarray, kept_count: int) -> dict:
+    return {
+        "v": JOURNAL_VERSION,
+        "ts": ts_name,
+        "op": "set",
+        "at": round(time.time(), 3),
+        "kept": int(kept_count),
+        "keys": np.asarray(keys, dtype=np.int64).ravel().tolist(),
+    }
+
+
+def _append_records(subtomo_job_dir: Path, records: list[dict]) -> None:
+    payload = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+    with open(subtomo_job_dir / JOURNAL_NAME, "a") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _replay(subtomo_job_dir: Path) -> Optional[_Curation]:
+    """Journal index for `subtomo_job_dir`, reading only the lines appended
+    since the last call; None when there is no journal. Caller holds the
+    job lock."""
+    key = _job_key(subtomo_job_dir)
+    path = subtomo_job_dir / JOURNAL_NAME
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _curations.pop(key, None)
+        return None
+    ident = (st.st_dev, st.st_ino)
+    cur = _curations.get(key)
+    if cur is None or cur.ident != ident or st.st_size < cur.offset:
+        cur = _Curation(ident)
+    if st.st_size > cur.offset:
+        with open(path, "rb") as f:
+            f.seek(cur.offset)
+            chunk = f.read(st.st_size - cur.offset)
+        # A line still being appended by another process is picked up next time.
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                cur.apply(json.loads(line))
+            except ValueError as e:
+                logger.warning("Skipping unreadable line in %s: %s", path, e)
+        cur.offset += end
+    _curations[key] = cur
+    return cur
+
+
+def _legacy_curation(subtomo_job_dir: Path) -> Optional[_Curation]:
+    """Curation encoded by a pre-journal particles_filtered.star (+ review
+    sidecar), or None if there is none. TSs named in the sidecar are the
+    curated ones; without a sidecar, those whose row count differs from the
+    original."""
+    filtered = subtomo_job_dir / PARTICLES_FILTERED_NAME
+    sig = (_sig(filtered), _sig(subtomo_job_dir / REVIEWED_SIDECAR_NAME), _sig(subtomo_job_dir / PARTICLES_NAME))
+    if sig[0] is None:
+        return None
+    key = _job_key(subtomo_job_dir)
+    hit = _legacy.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+
+    df = _read_subtomo_particles(filtered, subtomo_job_dir)
+    if df is None or not all(c in df.columns for c in _COORD_COLS):
+        return None
+    tomo = df["rlnTomoName"].astype(str).to_numpy()
+    keys, finite = _frame_keys(df)
+    counts = pd.Series(tomo).value_counts()
+
+    reviewed = _read_legacy_sidecar(subtomo_job_dir)
+    if reviewed is not None:
+        curated = list(reviewed)
+    else:
+        _, totals = _subtomo_keys_by_ts(subtomo_job_dir)
+        names = set(totals) | set(counts.index)
+        curated = sorted(n for n in names if int(counts.get(n, 0)) != totals.get(n, 0))
+
+    cur = _Curation()
+    for ts_name in curated:
+        sel = (tomo == ts_name) & finite
+        n_rows = int(counts.get(ts_name, 0))
+        cur.apply(_set_record(ts_name, keys[sel], reviewed.get(ts_name, n_rows) if reviewed else n_rows))
+    _legacy[key] = (sig, cur)
+    return cur
+
+
+def _read_legacy_sidecar(subtomo_job_dir: Path) -> Optional[dict[str, int]]:
+    p = subtomo_job_dir / REVIEWED_SIDECAR_NAME
+    try:
+        data = json.loads(p.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    out: dict[str, int] = {}
+    for k, v in data.items():
         try:
-            kept_keys.add(_coord_key(row[coord_cols[0]], row[coord_cols[1]], row[coord_cols[2]]))
+            out[str(k)] = int(v)
         except (TypeError, ValueError):
             continue
+    return out
+
 
-    import starfile
+def _migrate_legacy(subtomo_job_dir: Path) -> Optional[_Curation]:
+    """Write the journal for a pre-journal curation (caller holds the job
+    lock). The existing particles_filtered.star is stamped as materialized
+    so it is not rewritten until the curation changes."""
+    legacy = _legacy_curation(subtomo_job_dir)
+    if legacy is None:
+        return None
+    records = [_set_record(ts, legacy.kept[ts], legacy.counts[ts]) for ts in legacy.kept]
+    _append_records(subtomo_job_dir, records)
+    _write_stamp(subtomo_job_dir)
+    try:
+        (subtomo_job_dir / REVIEWED_SIDECAR_NAME).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("Could not remove legacy review sidecar in %s: %s", subtomo_job_dir, e)
+    _legacy.pop(_job_key(subtomo_job_dir), None)
+    logger.info("Converted curation in %s to %s (%d TS)", subtomo_job_dir, JOURNAL_NAME, len(records))
+    return _replay(subtomo_job_dir)
+
+
+def _load_curation(subtomo_job_dir: Path, migrate: bool = False) -> Optional[_Curation]:
+    """Current curation of a subtomo job: the journal if there is one,
+    else a legacy filtered set (converted to a journal when `migrate`)."""
+    subtomo_job_dir = Path(subtomo_job_dir)
+    with _job_lock(subtomo_job_dir):
+        cur = _replay(subtomo_job_dir)
+        if cur is not None:
+            return cur
+        if migrate:
+            return _migrate_legacy(subtomo_job_dir)
+        return _legacy_curation(subtomo_job_dir)
+
+
+def _maybe_compact(subtomo_job_dir: Path, cur: _Curation) -> None:
+    """Rewrite the journal as one record per curated TS once superseded
+    records dominate it (caller holds the job lock)."""
+    if cur.records < JOURNAL_COMPACT_MIN_RECORDS or cur.records <= 2 * len(cur.kept):
+        return
+    was_current = _stamp_current(subtomo_job_dir)
+    records = [_set_record(ts, cur.kept[ts], cur.counts[ts]) for ts in cur.kept]
+    _atomic_write_text(
+        subtomo_job_dir / JOURNAL_NAME, "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+    )
+    _curations.pop(_job_key(subtomo_job_dir), None)
+    _replay(subtomo_job_dir)
+    if was_current:
+        # Same curation, new journal file: the filtered star is still valid.
+        _write_stamp(subtomo_job_dir)
+
+
+# ── Original particles index ─────────────────────────────────────────────
+
+# Resolved particles.star -> ((mtime_ns, size), keys by TS, row counts by TS).
+_subtomo_index: dict[str, tuple[tuple[int, int], dict[str, np.ndarray], dict[str, int]]] = {}
+
+
+def _subtomo_keys_by_ts(subtomo_job_dir: Path) -> tuple[dict[str, np.ndarray], dict[str, int]]:
+    """({ts_name: keys of the rows with finite coords}, {ts_name: row count})
+    for the original particles.star, cached on its (mtime, size)."""
+    particles = subtomo_job_dir / PARTICLES_NAME
+    sig = _sig(particles)
+    if sig is None:
+        return {}, {}
+    key = str(particles.resolve())
+    hit = _subtomo_index.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1], hit[2]
+
+    svc = StarfileService()
+    df = None
+    for block in ("particles", None):
+        df = svc.read_block(particles, block=block, columns=["rlnTomoName", *_COORD_COLS])
+        if df is not None:
+            break
+    if df is None:
+        raise RuntimeError(f"Subtomo particles missing Å coord columns: {_COORD_COLS}")
 
-    # Source for OTHER TSs: existing filtered (preserve prior curation) else original.
-    existing_filtered = subtomo_job_dir / PARTICLES_FILTERED_NAME
-    source_for_others = existing_filtered if existing_filtered.exists() else orig_particles
+    tomo = df["rlnTomoName"].astype(str).to_numpy()
+    keys, finite = _frame_keys(df)
+    keys_by_ts: dict[str, np.ndarray] = {}
+    totals: dict[str, int] = {}
+    order = np.argsort(tomo, kind="stable")
+    names, starts, sizes = np.unique(tomo[order], return_index=True, return_counts=True)
+    for name, start, size in zip(names, starts, sizes):
+        rows = order[start : start + size]
+        keys_by_ts[str(name)] = keys[rows[finite[rows]]]
+        totals[str(name)] = int(size)
+    _subtomo_index[key] = (sig, keys_by_ts, totals)
+    return keys_by_ts, totals
 
-    df_others_src = _read_subtomo_particles(source_for_others, subtomo_job_dir)
-    if df_others_src is None:
-        raise RuntimeError(f"Could not read subtomo particles at {source_for_others}")
-    df_other_ts = df_others_src[df_others_src["rlnTomoName"] != ts_name]
 
-    # Source for THIS TS: always original — re-filter from scratch every save
-    # so a prior accidental keep/drop doesn't bleed forward.
-    df_orig = _read_subtomo_particles(orig_particles, subtomo_job_dir)
-    if df_orig is None:
-        raise RuntimeError(f"Could not read original subtomo particles at {orig_particles}")
-    df_this_ts = df_orig[df_orig["rlnTomoName"] == ts_name]
+# ── Materialization ──────────────────────────────────────────────────────
 
-    if not all(c in df_this_ts.columns for c in coord_cols):
-        raise RuntimeError(f"Subtomo particles missing Å coord columns: {coord_cols}")
 
-    def _row_in_kept(r) -> bool:
-        try:
-            return _coord_key(r[coord_cols[0]], r[coord_cols[1]], r[coord_cols[2]]) in kept_keys
-        except (TypeError, ValueError, KeyError):
-            return False
+def _current_stamp(subtomo_job_dir: Path) -> dict:
+    return {
+        "version": JOURNAL_VERSION,
+        "journal": _sig(subtomo_job_dir / JOURNAL_NAME),
+        "particles": _sig(subtomo_job_dir / PARTICLES_NAME),
+    }
 
-    df_this_ts_kept = df_this_ts[df_this_ts.apply(_row_in_kept, axis=1)]
 
-    df_combined = pd.concat([df_other_ts, df_this_ts_kept], ignore_index=True)
+def _stamp_current(subtomo_job_dir: Path) -> bool:
+    if not (subtomo_job_dir / PARTICLES_FILTERED_NAME).exists():
+        return False
+    if not (subtomo_job_dir / OPTIMISATION_SET_FILTERED_NAME).exists():
+        return False
+    try:
+        stamp = json.loads((subtomo_job_dir / MATERIALIZED_STAMP_NAME).read_text())
+    except (OSError, ValueError):
+        return False
+    current = json.loads(json.dumps(_current_stamp(subtomo_job_dir)))
+    return stamp == current
 
-    # Preserve the original optics + particles blocks structure — overwrite
-    # only the particles table. Other blocks (data_optics, data_general, …)
-    # remain identical to the source.
-    orig_data = starfile.read(orig_particles, always_dict=True)
-    if "particles" in orig_data:
-        orig_data["particles"] = df_combined
-    else:
-        # Single-block .star — find the particles-like block and swap.
-        for k, v in list(orig_data.items()):
-            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
-                orig_data[k] = df_combined
-                break
 
-    out_particles = subtomo_job_dir / PARTICLES_FILTERED_NAME
-    starfile.write(orig_data, out_particles, overwrite=True)
+def _write_stamp(subtomo_job_dir: Path) -> None:
+    try:
+        _atomic_write_text(subtomo_job_dir / MATERIALIZED_STAMP_NAME, json.dumps(_current_stamp(subtomo_job_dir)))
+    except OSError as e:
+        logger.warning("Could not write %s in %s: %s", MATERIALIZED_STAMP_NAME, subtomo_job_dir, e)
+
 
+def _write_filtered_optset(subtomo_job_dir: Path) -> Path:
     # optimisation_set.star is a tiny RELION key-value star (one block, one
     # row per key like `_rlnTomoParticlesFile particles.star`). Rewriting it
     # textually is safer than going through starfile (which is fussy about
@@ -253,80 +423,308 @@ def save_filtered_picks_for_ts(
             f"optimisation_set.star at {orig_opt} has no _rlnTomoParticlesFile line — "
             "filtered set would not be loaded by downstream consumers"
         )
-    out_opt.write_text("\n".join(out_lines) + "\n")
+    text = "\n".join(out_lines) + "\n"
+    try:
+        unchanged = out_opt.read_text() == text
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        _atomic_write_text(out_opt, text)
+    return out_opt
+
+
+def ensure_filtered_materialized(subtomo_job_dir: Path) -> bool:
+    """Bring particles_filtered.star + optimisation_set_filtered.star up to
+    date with the curation journal. Cheap when nothing changed since the last
+    materialization (a few `stat`s). Returns False when the job has no
+    curation (consumers should read the original set)."""
+    subtomo_job_dir = Path(subtomo_job_dir)
+    with _job_lock(subtomo_job_dir):
+        cur = _load_curation(subtomo_job_dir, migrate=True)
+        if cur is None or not cur.kept:
+            return False
+        if _stamp_current(subtomo_job_dir):
+            return True
+
+        orig_particles = subtomo_job_dir / PARTICLES_NAME
+        if not orig_particles.exists():
+            raise FileNotFoundError(f"Original subtomo particles.star not found: {orig_particles}")
+
+        import starfile
+
+        # Preserve the original optics + particles blocks structure — swap
+        # only the particles table. Other blocks (data_optics, data_general, …)
+        # remain identical to the source.
+        orig_data = starfile.read(orig_particles, always_dict=True)
+        block = "particles" if isinstance(orig_data.get("particles"), pd.DataFrame) else None
+        if block is None:
+            # Single-block .star — find the particles-like block and swap.
+            for k, v in orig_data.items():
+                if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
+                    block = k
+                    break
+        if block is None:
+            raise RuntimeError(f"No particles block in {orig_particles}")
+        df = orig_data[block]
+        if not all(c in df.columns for c in _COORD_COLS):
+            raise RuntimeError(f"Subtomo particles missing Å coord columns: {_COORD_COLS}")
+
+        # Uncurated TSs keep every row; curated ones keep the rows whose
+        # (TS, key) is in the journal. Original row order is preserved.
+        tomo = df["rlnTomoName"].astype(str).to_numpy()
+        keys, finite = _frame_keys(df)
+        curated = np.isin(tomo, list(cur.kept))
+        kept_tomo = np.concatenate([np.full(len(k), ts, dtype=object) for ts, k in cur.kept.items()])
+        kept_keys = np.concatenate(list(cur.kept.values())).reshape(-1, 3)
+        probe = pd.MultiIndex.from_arrays([tomo, keys[:, 0], keys[:, 1], keys[:, 2]])
+        wanted = pd.MultiIndex.from_arrays([kept_tomo, kept_keys[:, 0], kept_keys[:, 1], kept_keys[:, 2]])
+        keep = ~curated | (finite & probe.isin(wanted))
+        orig_data[block] = df[keep].reset_index(drop=True)
+
+        out_particles = subtomo_job_dir / PARTICLES_FILTERED_NAME
+        fd, tmp = tempfile.mkstemp(dir=str(subtomo_job_dir), prefix=".tmp_", suffix=".star")
+        os.close(fd)
+        try:
+            starfile.write(orig_data, tmp, overwrite=True)
+            os.replace(tmp, out_particles)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        _write_filtered_optset(subtomo_job_dir)
+        _write_stamp(subtomo_job_dir)
+        logger.info(
+            "Materialized %s in %s (%d/%d rows, %d curated TS)",
+            PARTICLES_FILTERED_NAME,
+            subtomo_job_dir,
+            int(keep.sum()),
+            len(df),
+            len(cur.kept),
+        )
+        return True
+
+
+def materialize_project_curations(project_state, project_path: Path) -> None:
+    """`ensure_filtered_materialized` for every SUBTOMO_EXTRACTION job of a
+    project. Called before anything is submitted (scheme deploy, retries) so
+    the jobs of that run read current curated sets. Blocking."""
+    project_path = Path(project_path)
+    for instance_id, job_model in (project_state.jobs or {}).items():
+        if getattr(job_model, "job_type", None) != JobType.SUBTOMO_EXTRACTION:
+            continue
+        rjn = getattr(job_model, "relion_job_name", None) or (project_state.job_path_mapping or {}).get(instance_id)
+        if rjn and (project_path / rjn.rstrip("/")).is_dir():
+            ensure_filtered_materialized(project_path / rjn.rstrip("/"))
+
+
+def curated_output_pending(path: Path) -> bool:
+    """True if `path` is a subtomo job's particles_filtered.star that is not
+    on disk yet but will be materialized from its curation journal before
+    anything consumes it (path resolution treats it as existing)."""
+    path = Path(path)
+    if path.name != PARTICLES_FILTERED_NAME:
+        return False
+    return (path.parent / JOURNAL_NAME).exists() and (path.parent / OPTIMISATION_SET_FILTERED_NAME).exists()
+
 
-    # Mark this TS reviewed (+ record kept count) for the roster's review column.
-    _update_reviewed_sidecar(subtomo_job_dir, ts_name, int(len(df_this_ts_kept)))
+def curation_signature(subtomo_job_dir: Path) -> tuple:
+    """Stat signature of everything a job's curation is read from; changes
+    whenever `read_reviewed_counts` may."""
+    subtomo_job_dir = Path(subtomo_job_dir)
+    return (
+        _sig(subtomo_job_dir / JOURNAL_NAME),
+        _sig(subtomo_job_dir / PARTICLES_FILTERED_NAME),
+        _sig(subtomo_job_dir / REVIEWED_SIDECAR_NAME),
+    )
 
+
+# ── Gallery API ──────────────────────────────────────────────────────────
+
+
+def _read_candidates_for_ts(candidates_star: Path, ts_name: str) -> Optional[pd.DataFrame]:
+    """Read candidates.star, filter to one TS, sort by score-desc to match
+    the gallery's pick_idx order. Returns None if the star is missing or
+    the score column isn't present."""
+    if not candidates_star.exists():
+        return None
+    # Only this TS's rows are tokenised; repeat saves/loads hit the cache.
+    svc = StarfileService()
+    try:
+        for_ts = svc.read_block(candidates_star, block="particles", where={"rlnTomoName": ts_name})
+        if for_ts is None:
+            for_ts = svc.read_block(candidates_star, where={"rlnTomoName": ts_name})
+    except Exception as e:
+        logger.warning("Could not read candidates.star %s: %s", candidates_star, e)
+        return None
+    if for_ts is None:
+        return None
+    # Sort score-desc to match write_picks_data's order in picks.json.
+    # SCORE_COL_PRIORITY (preview_orchestrator) is (LCC, AutopickFigureOfMerit, ProbDist).
+    for col in ("rlnLCCmax", "rlnAutopickFigureOfMerit", "rlnMaxValueProbDistribution"):
+        if col in for_ts.columns:
+            for_ts = for_ts.sort_values(col, ascending=False).reset_index(drop=True)
+            break
+    else:
+        for_ts = for_ts.reset_index(drop=True)
+    return for_ts
+
+
+def derive_keep_state_for_ts(
+    subtomo_job_dir: Path, candidate_extract_job_dir: Path, ts_name: str, n_picks_for_ts: int
+) -> Optional[set[int]]:
+    """Look up which pick_idx values are currently kept by the curation.
+
+    Returns:
+      - None if the job has no curation (= all picks implicitly kept).
+      - set[int] of pick_idx values (0-based, matching picks.json order) that
+        are kept for this TS: the journal's keys if this TS was curated,
+        else every pick that has a row in the original particles.star.
+
+    A non-None empty set means "all picks dropped for this TS" — distinct
+    from None. The two states encode different intents and persist differently
+    (None = no curation yet; empty = explicitly dropped all).
+    """
+    cur = _load_curation(subtomo_job_dir)
+    if cur is None or not cur.kept:
+        return None
+
+    cands = _read_candidates_for_ts(candidate_extract_job_dir / "candidates.star", ts_name)
+    if cands is None or cands.empty:
+        return set()
+    if not all(c in cands.columns for c in _COORD_COLS):
+        # No Å coords on candidates → can't match. Treat as "no filter info".
+        return None
+
+    kept = cur.kept.get(ts_name)
+    if kept is None:
+        try:
+            kept = _subtomo_keys_by_ts(subtomo_job_dir)[0].get(ts_name)
+        except Exception as e:
+            logger.warning("Could not index %s: %s", subtomo_job_dir / PARTICLES_NAME, e)
+            return None
+    if kept is None or not len(kept):
+        return set()  # explicitly nothing kept for this TS
+
+    keys, finite = _frame_keys(cands.iloc[: min(n_picks_for_ts, len(cands))])
+    hit = finite & _keys_isin(keys, kept)
+    return {int(i) for i in np.flatnonzero(hit)}
+
+
+def save_filtered_picks_for_ts(
+    subtomo_job_dir: Path, candidate_extract_job_dir: Path, ts_name: str, kept_pick_indices: set[int]
+) -> dict:
+    """Record the kept picks of one TS in the curation journal.
+
+    Semantics:
+      - For the current TS: kept rows are the subtomo rows whose Å-coord
+        matches a kept pick (by `kept_pick_indices` → candidates.star Å
+        lookup → particles.star Å match). Each save replaces the TS's
+        previous decision outright.
+      - Other TSs keep their journal entries, or all their original rows if
+        they were never curated.
+
+    The filtered particles / optimisation-set pair is re-materialized
+    before returning, so it never lags the journal. Blocking; call it off
+    the event loop.
+
+    Returns a small status dict: {"kept_for_ts": int, "total_kept": int,
+    "filtered_path": str, "optset_path": str}.
+    """
+    subtomo_job_dir = Path(subtomo_job_dir)
+    orig_particles = subtomo_job_dir / PARTICLES_NAME
+    if not orig_particles.exists():
+        raise FileNotFoundError(f"Original subtomo particles.star not found: {orig_particles}")
+
+    cands = _read_candidates_for_ts(candidate_extract_job_dir / "candidates.star", ts_name)
+    if cands is None:
+        raise RuntimeError(f"Could not read candidates for {ts_name} from {candidate_extract_job_dir}")
+    if not all(c in cands.columns for c in _COORD_COLS):
+        raise RuntimeError(f"Candidates missing Å coord columns: {_COORD_COLS}")
+
+    idx = np.array(sorted(i for i in kept_pick_indices if 0 <= i < len(cands)), dtype=np.int64)
+    keys, finite = _frame_keys(cands.iloc[idx])
+    kept_keys = np.unique(keys[finite], axis=0) if finite.any() else np.empty((0, 3), dtype=np.int64)
+
+    keys_by_ts, totals = _subtomo_keys_by_ts(subtomo_job_dir)
+    ts_keys = keys_by_ts.get(ts_name, np.empty((0, 3), dtype=np.int64))
+    kept_for_ts = int(_keys_isin(ts_keys, kept_keys).sum())
+
+    with _job_lock(subtomo_job_dir):
+        if _load_curation(subtomo_job_dir, migrate=True) is None:
+            # First curation of this job: any filtered files on disk predate it.
+            (subtomo_job_dir / MATERIALIZED_STAMP_NAME).unlink(missing_ok=True)
+        _append_records(subtomo_job_dir, [_set_record(ts_name, kept_keys, kept_for_ts)])
+        cur = _replay(subtomo_job_dir)
+        _maybe_compact(subtomo_job_dir, cur)
+        counts = dict(cur.counts)
+        ensure_filtered_materialized(subtomo_job_dir)
+
+    total_kept = sum(counts.values()) + sum(n for ts, n in totals.items() if ts not in counts)
     return {
-        "kept_for_ts": int(len(df_this_ts_kept)),
-        "total_kept": int(len(df_combined)),
-        "filtered_path": str(out_particles),
-        "optset_path": str(out_opt),
+        "kept_for_ts": kept_for_ts,
+        "total_kept": int(total_kept),
+        "filtered_path": str(subtomo_job_dir / PARTICLES_FILTERED_NAME),
+        "optset_path": str(subtomo_job_dir / OPTIMISATION_SET_FILTERED_NAME),
     }
 
 
 def resolve_canonical_optset(subtomo_job_dir: Path) -> Path:
     """The optimisation_set a downstream consumer should read: the curated
-    `_filtered` one if it exists, else the original. Single definition of
-    "which star is canonical", shared by the IO-slot resolver's intent and by
-    cross-project aggregation (PICKS_FILTER_AGGREGATION_ROADMAP.md §factor out)."""
-    filtered = subtomo_job_dir / OPTIMISATION_SET_FILTERED_NAME
-    if filtered.exists():
-        return filtered
+    `_filtered` one if the job has a curation (materialized on the way), else
+    the original. Single definition of "which star is canonical", shared by
+    the IO-slot resolver's intent and by cross-project aggregation
+    (PICKS_FILTER_AGGREGATION_ROADMAP.md §factor out)."""
+    if ensure_filtered_materialized(subtomo_job_dir):
+        return subtomo_job_dir / OPTIMISATION_SET_FILTERED_NAME
     return subtomo_job_dir / OPTIMISATION_SET_NAME
 
 
 def has_filtered_set(subtomo_job_dir: Path) -> bool:
-    """True if a curated particles_filtered.star exists for this subtomo job."""
-    return (subtomo_job_dir / PARTICLES_FILTERED_NAME).exists()
+    """True if this subtomo job has a curation (materialized or not).
+    Cheap: a pre-journal filtered set counts without being read."""
+    subtomo_job_dir = Path(subtomo_job_dir)
+    with _job_lock(subtomo_job_dir):
+        cur = _replay(subtomo_job_dir)
+    if cur is None:
+        return (subtomo_job_dir / PARTICLES_FILTERED_NAME).exists()
+    return bool(cur.kept)
 
 
 def read_reviewed_counts(subtomo_job_dir: Path) -> dict[str, int]:
     """{ts_name: kept_count} for TS the user has curated in this subtomo job.
-    Empty when nothing has been reviewed (no sidecar)."""
-    p = subtomo_job_dir / REVIEWED_SIDECAR_NAME
-    if not p.exists():
-        return {}
-    try:
-        data = json.loads(p.read_text())
-    except (OSError, ValueError):
-        return {}
-    if not isinstance(data, dict):
-        return {}
-    out: dict[str, int] = {}
-    for k, v in data.items():
-        try:
-            out[str(k)] = int(v)
-        except (TypeError, ValueError):
-            continue
-    return out
-
-
-def _update_reviewed_sidecar(subtomo_job_dir: Path, ts_name: str, kept_count: int) -> None:
-    data = read_reviewed_counts(subtomo_job_dir)
-    data[ts_name] = kept_count
-    try:
-        (subtomo_job_dir / REVIEWED_SIDECAR_NAME).write_text(json.dumps(data))
-    except OSError as e:
-        logger.warning("Could not write review sidecar in %s: %s", subtomo_job_dir, e)
+    Empty when nothing has been reviewed."""
+    cur = _load_curation(subtomo_job_dir)
+    return dict(cur.counts) if cur is not None else {}
 
 
 def discard_filter(subtomo_job_dir: Path) -> bool:
-    """Delete the filtered file pair, reverting downstream consumers to the
-    original. Returns True if at least one file was removed.
+    """Delete the curation and the filtered file pair, reverting downstream
+    consumers to the original. Returns True if at least one file was removed.
 
     This is the WHOLE-species reset (every TS). For reverting a single
     tilt-series while keeping the rest curated, use `discard_ts_filter`."""
+    subtomo_job_dir = Path(subtomo_job_dir)
     removed = False
-    for name in (PARTICLES_FILTERED_NAME, OPTIMISATION_SET_FILTERED_NAME, REVIEWED_SIDECAR_NAME):
-        p = subtomo_job_dir / name
-        if p.exists():
-            try:
-                p.unlink()
-                removed = True
-            except OSError as e:
-                logger.warning("Failed to remove %s: %s", p, e)
+    with _job_lock(subtomo_job_dir):
+        for name in (
+            PARTICLES_FILTERED_NAME,
+            OPTIMISATION_SET_FILTERED_NAME,
+            JOURNAL_NAME,
+            MATERIALIZED_STAMP_NAME,
+            REVIEWED_SIDECAR_NAME,
+        ):
+            p = subtomo_job_dir / name
+            if p.exists():
+                try:
+                    p.unlink()
+                    removed = True
+                except OSError as e:
+                    logger.warning("Failed to remove %s: %s", p, e)
+        key = _job_key(subtomo_job_dir)
+        _curations.pop(key, None)
+        _legacy.pop(key, None)
     return removed
 
 
@@ -335,56 +733,26 @@ def discard_ts_filter(subtomo_job_dir: Path, ts_name: str) -> str:
     every other TS's curation intact — the per-tomogram counterpart to
     `discard_filter`.
 
-    If removing this TS leaves nothing curated, the whole filtered pair is
+    If removing this TS leaves nothing curated, the whole curation is
     deleted (a clean full revert). Returns:
-      - "noop"        : no filtered set exists, nothing to do
-      - "removed_all" : no curation remained → filtered pair deleted
+      - "noop"        : no curation exists, nothing to do
+      - "removed_all" : no curation remained → curation + filtered pair deleted
       - "reverted_ts" : this TS reset to original, other TSs still curated
     """
-    filtered = subtomo_job_dir / PARTICLES_FILTERED_NAME
-    if not filtered.exists():
-        return "noop"
-
-    # Drop this TS from the review sidecar. If nothing remains reviewed, the
-    # filtered set no longer represents any curation → remove it wholesale.
-    reviewed = read_reviewed_counts(subtomo_job_dir)
-    reviewed.pop(ts_name, None)
-    if not reviewed:
-        discard_filter(subtomo_job_dir)
-        return "removed_all"
-
-    orig_particles = subtomo_job_dir / PARTICLES_NAME
-    if not orig_particles.exists():
-        raise FileNotFoundError(f"Original subtomo particles.star not found: {orig_particles}")
-
-    df_filt = _read_subtomo_particles(filtered, subtomo_job_dir)
-    df_orig = _read_subtomo_particles(orig_particles, subtomo_job_dir)
-    if df_filt is None or df_orig is None:
-        raise RuntimeError("Could not read particles for per-TS discard")
-
-    # Keep other TSs as-curated; replace this TS's rows with its full original set.
-    df_other = df_filt[df_filt["rlnTomoName"] != ts_name]
-    df_this_orig = df_orig[df_orig["rlnTomoName"] == ts_name]
-    df_combined = pd.concat([df_other, df_this_orig], ignore_index=True)
-
-    import starfile
-
-    orig_data = starfile.read(orig_particles, always_dict=True)
-    if "particles" in orig_data:
-        orig_data["particles"] = df_combined
-    else:
-        for k, v in list(orig_data.items()):
-            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
-                orig_data[k] = df_combined
-                break
-    starfile.write(orig_data, filtered, overwrite=True)
-
-    # Persist the trimmed sidecar (optimisation_set_filtered.star already points
-    # at particles_filtered.star and is unchanged).
-    try:
-        (subtomo_job_dir / REVIEWED_SIDECAR_NAME).write_text(json.dumps(reviewed))
-    except OSError as e:
-        logger.warning("Could not write review sidecar in %s: %s", subtomo_job_dir, e)
+    subtomo_job_dir = Path(subtomo_job_dir)
+    with _job_lock(subtomo_job_dir):
+        cur = _load_curation(subtomo_job_dir, migrate=True)
+        if cur is None or not cur.kept:
+            return "noop"
+        if not set(cur.kept) - {ts_name}:
+            discard_filter(subtomo_job_dir)
+            return "removed_all"
+        if ts_name in cur.kept:
+            _append_records(
+                subtomo_job_dir, [{"v": JOURNAL_VERSION, "ts": ts_name, "op": "revert", "at": round(time.time(), 3)}]
+            )
+            _maybe_compact(subtomo_job_dir, _replay(subtomo_job_dir))
+            ensure_filtered_materialized(subtomo_job_dir)
     return "reverted_ts"
 
 
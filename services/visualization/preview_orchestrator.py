@@ -13,13 +13,18 @@ for projects with hundreds of tomograms.
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable, Optional
 
 import numpy as np
 
+from services.computing.cpus import usable_cpus
 from services.visualization.imod_vis import (
     _get_binned_tomo_size,
     _get_imod_coords,
@@ -35,7 +40,12 @@ from services.visualization.preview_render import (
     render_xz_slab_preview,
     write_picks_data,
 )
-from services.visualization.subtomo_link import build_pick_to_mrcs_index, lookup_for_pick, subtomo_particles_stars
+from services.visualization.subtomo_link import (
+    PickIndex,
+    build_pick_to_mrcs_index,
+    lookup_for_pick,
+    subtomo_particles_stars,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +84,11 @@ MANIFEST_VERSION = 12  # v12: server-rendered X/Y top-down slab (entry.xy_slab_p
 #     pill state. Derived by scanning the upstream `tomograms.star` for
 #     tomos missing from `particles.star`'s `rlnTomoName` column.
 
+# Preview rendering pool: worker count cap, and how many workers may read
+# volumes / .mrcs stacks at the same time.
+PREVIEW_MAX_WORKERS = 8
+PREVIEW_IO_CONCURRENCY = 4
+
 SCORE_COL_PRIORITY = ("rlnLCCmax", "rlnAutopickFigureOfMerit", "rlnMaxValueProbDistribution")
 
 
@@ -201,6 +216,111 @@ def _render_one_tomogram(
     }
 
 
+# Volume / .mrcs reads are the expensive part of a tomogram's preview and
+# all of them hit the same parallel filesystem; more concurrent readers than
+# this makes every one of them slower on Lustre. Set per worker (thread or
+# process) by the pool initializer; unset (serial path) means unbounded.
+_worker_local = threading.local()
+
+
+def _init_preview_worker(io_slots) -> None:
+    _worker_local.io_slots = io_slots
+
+
+def _io_slot():
+    io_slots = getattr(_worker_local, "io_slots", None)
+    return io_slots if io_slots is not None else contextlib.nullcontext()
+
+
+def _default_preview_workers() -> int:
+    return max(1, min(PREVIEW_MAX_WORKERS, usable_cpus()))
+
+
+def _render_tomogram_job(job: dict) -> dict:
+    """Render every preview artefact for one tomogram.
+
+    Module-level and fed plain picklable inputs so it can run in a spawned
+    ProcessPoolExecutor worker as well as a thread. Returns {"tomo", "entry"} on success or
+    {"tomo", "error"} on failure — never raises.
+    """
+    tomo_name = job["tomo_name"]
+    tomo_row = job["tomo_row"]
+    tomo_particles = job["tomo_particles"]
+    score_col = job["score_col"]
+    mrc_path = job["mrc_path"]
+    project_root = job["project_root"]
+    tomo_out_dir = job["tomo_out_dir"]
+    subtomo_index = job["subtomo_index"]
+    try:
+        pixel_size = _get_pixel_size(tomo_row)
+        tomo_size = _get_binned_tomo_size(tomo_row, project_root=project_root)
+        coords = _get_imod_coords(tomo_particles, tomo_size, pixel_size)
+        scores = tomo_particles[score_col].values.astype(float) if score_col else None
+
+        # Pull centered-Å coords for the subtomo lookup. Same column names
+        # as the SUBTOMO_EXTRACTION job uses, so we get exact-match keys.
+        ang_cols = ("rlnCenteredCoordinateXAngst", "rlnCenteredCoordinateYAngst", "rlnCenteredCoordinateZAngst")
+        coords_ang = None
+        if all(c in tomo_particles.columns for c in ang_cols):
+            coords_ang = tomo_particles[list(ang_cols)].values.astype(float)
+
+        # Score-desc sort applied here so the sprite-atlas index aligns
+        # with the post-sort pick indices in picks.json — write_picks_data
+        # repeats the same sort internally, producing the same order.
+        if scores is not None and len(scores):
+            order = np.argsort(-np.asarray(scores, dtype=float))
+        else:
+            order = np.arange(len(coords))
+        coords_ang_sorted = coords_ang[order] if coords_ang is not None else None
+
+        entry = _render_one_tomogram(
+            pick_coords_xyz=np.asarray(coords),
+            scores=scores,
+            score_field=score_col,
+            tomo_dims_xyz=tuple(int(v) for v in tomo_size),
+            pixel_size_ang=pixel_size,
+            out_dir=tomo_out_dir,
+        )
+        entry["tomo_mrc"] = str(mrc_path) if mrc_path else None
+        warp_png = _find_warp_tomo_preview(project_root, tomo_name, mrc_path)
+        entry["warp_tomo_preview"] = str(warp_png) if warp_png else None
+        entry["xz_preview"] = None
+        entry["xy_slab_preview"] = None
+        if mrc_path is not None:
+            with _io_slot():
+                xz_png = render_xz_slab_preview(mrc_path, tomo_out_dir / "xz_preview.png")
+                xy_png = render_xy_slab_preview(mrc_path, tomo_out_dir / "xy_slab_preview.png")
+            if xz_png is not None:
+                entry["xz_preview"] = str(xz_png)
+            if xy_png is not None:
+                entry["xy_slab_preview"] = str(xy_png)
+
+        # Per-pick cutout sprite atlas (joined to subtomo .mrcs via Å coords).
+        entry["cutout_atlas"] = None
+        entry["cutout_index"] = None
+        entry["cutout_n_ok"] = 0
+        entry["cutout_failures"] = []
+        if coords_ang_sorted is not None and job["have_subtomo_index"]:
+            pick_to_mrcs = []
+            for x_a, y_a, z_a in coords_ang_sorted:
+                info = lookup_for_pick(subtomo_index, tomo_name, x_a, y_a, z_a)
+                pick_to_mrcs.append(info)
+            with _io_slot():
+                meta = render_pick_cutouts_atlas(
+                    pick_to_mrcs, tomo_out_dir / "cutout_atlas.png", tomo_out_dir / "cutout_index.json"
+                )
+            if meta is not None:
+                entry["cutout_atlas"] = meta["atlas_path"]
+                entry["cutout_index"] = meta["index_path"]
+                entry["cutout_n_ok"] = meta["n_ok"]
+                entry["cutout_failures"] = meta.get("failures") or []
+
+        return {"tomo": tomo_name, "entry": entry}
+    except Exception as e:
+        logger.warning("Preview render failed for %s: %s", tomo_name, e)
+        return {"tomo": tomo_name, "error": str(e)}
+
+
 def _entry_outputs(entry: dict) -> list:
     out = []
     if entry.get("picks_json"):
@@ -225,6 +345,9 @@ def generate_candidate_previews(
     project_state=None,
     instance_id: Optional[str] = None,
     job_model=None,
+    max_workers: Optional[int] = None,
+    io_concurrency: Optional[int] = None,
+    use_processes: bool = False,
 ) -> dict:
     """Build per-tomo picks.json + sprite-atlas + manifest for one extract job.
 
@@ -237,6 +360,15 @@ def generate_candidate_previews(
     the gallery. The species linkage chain (instance_id suffix →
     job_model.species_id → single-species fallback) lives in
     services.templating.template_metadata.resolve_species_from_job.
+
+    Tomograms that need rendering go to a pool of `max_workers` (default:
+    min(PREVIEW_MAX_WORKERS, CPUs)) threads, or spawned processes when
+    `use_processes` is set. Only single-threaded callers (the extract
+    driver) should ask for processes: the web server imports main.py in
+    every spawned child and must not fork itself. At most `io_concurrency`
+    (default PREVIEW_IO_CONCURRENCY) of them read volumes at once. Cached
+    tomograms are settled up front without touching their volumes.
+    `progress_cb(done, total, tomo_name)` fires as each tomogram settles.
     """
     candidates_star = Path(candidates_star)
     tomograms_star = Path(tomograms_star)
@@ -255,7 +387,7 @@ def generate_candidate_previews(
 
     # Cross-job pick → .mrcs index (built once, reused per tomo). Cheap miss
     # if no SUBTOMO_EXTRACTION jobs exist.
-    subtomo_index: dict = {}
+    subtomo_index = PickIndex.empty()
     if project_state is not None and project_root is not None:
         try:
             subtomo_index = build_pick_to_mrcs_index(output_dir, project_state, project_root)
@@ -266,7 +398,7 @@ def generate_candidate_previews(
     # when a SUBTOMO_EXTRACTION job lands after this candidate-extract job
     # already cached an empty-cutout manifest. Built once so the per-tomo
     # loop is O(1) per entry.
-    tomos_with_subtomo: set[str] = {k[0] for k in subtomo_index.keys()}
+    tomos_with_subtomo: set[str] = subtomo_index.tomos()
     # particles.star files behind the cutout join — added to per-tomo staleness
     # below so a preview cached mid-extraction rebuilds once the subtomo job
     # finishes (candidates.star, the only thing `sources` otherwise watches, is
@@ -283,16 +415,31 @@ def generate_candidate_previews(
     prior_entries = (prior.get("tomograms") or {}) if prior.get("version") == MANIFEST_VERSION else {}
 
     total = len(tomo_names)
-    for i, tomo_name in enumerate(tomo_names):
+    done = 0
+
+    def _report(tomo_name: str) -> None:
+        nonlocal done
+        done += 1
         if progress_cb is not None:
             try:
-                progress_cb(i, total, tomo_name)
+                progress_cb(done, total, tomo_name)
             except Exception:
                 pass
 
+    # Per-tomo slices built once: a boolean mask per tomogram over the full
+    # particles table, or the whole subtomo index shipped to every worker,
+    # would both scale with #tomograms x table size.
+    particles_by_tomo = dict(tuple(particles_df.groupby("rlnTomoName", sort=False)))
+    subtomo_by_tomo = subtomo_index.split_by_tomo()
+
+    # Pass 1 (cheap, no volume reads): settle errors and cache hits, queue
+    # the rest for rendering.
+    jobs: list[dict] = []
+    for tomo_name in tomo_names:
         tomo_row = tomo_lookup.get(tomo_name)
         if tomo_row is None:
             errored.append({"tomo": tomo_name, "error": "missing from tomograms.star"})
+            _report(tomo_name)
             continue
 
         mrc_path = _resolve_tomo_mrc(tomo_row, project_root)
@@ -331,76 +478,78 @@ def generate_candidate_previews(
             ):
                 skipped_cached.append(tomo_name)
                 tomo_entries[tomo_name] = prior_entry
+                _report(tomo_name)
                 continue
 
-        try:
-            pixel_size = _get_pixel_size(tomo_row)
-            tomo_size = _get_binned_tomo_size(tomo_row, project_root=project_root)
-            tomo_particles = particles_df[particles_df["rlnTomoName"] == tomo_name]
-            coords = _get_imod_coords(tomo_particles, tomo_size, pixel_size)
-            scores = tomo_particles[score_col].values.astype(float) if score_col else None
-
-            # Pull centered-Å coords for the subtomo lookup. Same column names
-            # as the SUBTOMO_EXTRACTION job uses, so we get exact-match keys.
-            ang_cols = ("rlnCenteredCoordinateXAngst", "rlnCenteredCoordinateYAngst", "rlnCenteredCoordinateZAngst")
-            coords_ang = None
-            if all(c in tomo_particles.columns for c in ang_cols):
-                coords_ang = tomo_particles[list(ang_cols)].values.astype(float)
-
-            # Score-desc sort applied here so the sprite-atlas index aligns
-            # with the post-sort pick indices in picks.json — write_picks_data
-            # repeats the same sort internally, producing the same order.
-            if scores is not None and len(scores):
-                order = np.argsort(-np.asarray(scores, dtype=float))
-            else:
-                order = np.arange(len(coords))
-            coords_ang_sorted = coords_ang[order] if coords_ang is not None else None
-
-            entry = _render_one_tomogram(
-                pick_coords_xyz=np.asarray(coords),
-                scores=scores,
-                score_field=score_col,
-                tomo_dims_xyz=tuple(int(v) for v in tomo_size),
-                pixel_size_ang=pixel_size,
-                out_dir=tomo_out_dir,
-            )
-            entry["tomo_mrc"] = str(mrc_path) if mrc_path else None
-            warp_png = _find_warp_tomo_preview(project_root, tomo_name, mrc_path)
-            entry["warp_tomo_preview"] = str(warp_png) if warp_png else None
-            entry["xz_preview"] = None
-            entry["xy_slab_preview"] = None
-            if mrc_path is not None:
-                xz_png = render_xz_slab_preview(mrc_path, tomo_out_dir / "xz_preview.png")
-                if xz_png is not None:
-                    entry["xz_preview"] = str(xz_png)
-                xy_png = render_xy_slab_preview(mrc_path, tomo_out_dir / "xy_slab_preview.png")
-                if xy_png is not None:
-                    entry["xy_slab_preview"] = str(xy_png)
-
-            # Per-pick cutout sprite atlas (joined to subtomo .mrcs via Å coords).
-            entry["cutout_atlas"] = None
-            entry["cutout_index"] = None
-            entry["cutout_n_ok"] = 0
-            entry["cutout_failures"] = []
-            if coords_ang_sorted is not None and subtomo_index:
-                pick_to_mrcs = []
-                for x_a, y_a, z_a in coords_ang_sorted:
-                    info = lookup_for_pick(subtomo_index, tomo_name, x_a, y_a, z_a)
-                    pick_to_mrcs.append(info)
-                meta = render_pick_cutouts_atlas(
-                    pick_to_mrcs, tomo_out_dir / "cutout_atlas.png", tomo_out_dir / "cutout_index.json"
-                )
-                if meta is not None:
-                    entry["cutout_atlas"] = meta["atlas_path"]
-                    entry["cutout_index"] = meta["index_path"]
-                    entry["cutout_n_ok"] = meta["n_ok"]
-                    entry["cutout_failures"] = meta.get("failures") or []
+        jobs.append(
+            {
+                "tomo_name": tomo_name,
+                "tomo_row": tomo_row,
+                "tomo_particles": (
+                    particles_by_tomo[tomo_name]
+                    if tomo_name in particles_by_tomo
+                    else particles_df[particles_df["rlnTomoName"] == tomo_name]
+                ),
+                "score_col": score_col,
+                "mrc_path": mrc_path,
+                "project_root": project_root,
+                "tomo_out_dir": tomo_out_dir,
+                "subtomo_index": subtomo_by_tomo.get(tomo_name, PickIndex.empty()),
+                "have_subtomo_index": bool(subtomo_index),
+            }
+        )
 
-            tomo_entries[tomo_name] = entry
+    # Pass 2: render. One worker per tomogram in flight; volume reads
+    # additionally share `io_concurrency` slots across the pool.
+    workers = min(max_workers or _default_preview_workers(), len(jobs))
+    io_limit = io_concurrency or PREVIEW_IO_CONCURRENCY
+    results: list[dict] = []
+    if workers <= 1:
+        for job in jobs:
+            results.append(_render_tomogram_job(job))
+            _report(job["tomo_name"])
+    else:
+        if use_processes:
+            ctx = multiprocessing.get_context("spawn")
+            io_slots = ctx.BoundedSemaphore(io_limit)
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=ctx, initializer=_init_preview_worker, initargs=(io_slots,)
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="preview-render",
+                initializer=_init_preview_worker,
+                initargs=(threading.BoundedSemaphore(io_limit),),
+            )
+        logger.info(
+            "Rendering %d tomogram previews on %d %s (I/O slots: %d)",
+            len(jobs),
+            workers,
+            "processes" if use_processes else "threads",
+            io_limit,
+        )
+        with executor:
+            futures = {executor.submit(_render_tomogram_job, job): job["tomo_name"] for job in jobs}
+            for fut in as_completed(futures):
+                try:
+                    results.append(fut.result())
+                except Exception as e:  # worker died (OOM kill, etc.)
+                    results.append({"tomo": futures[fut], "error": str(e)})
+                _report(futures[fut])
+
+    rendered = {r["tomo"]: r for r in results}
+    for tomo_name in tomo_names:
+        r = rendered.get(tomo_name)
+        if r is None:
+            continue
+        if "entry" in r:
+            tomo_entries[tomo_name] = r["entry"]
             ok.append(tomo_name)
-        except Exception as e:
-            logger.warning("Preview render failed for %s: %s", tomo_name, e)
-            errored.append({"tomo": tomo_name, "error": str(e)})
+        else:
+            errored.append({"tomo": tomo_name, "error": r["error"]})
+    # Manifest order follows tomo_names, as when tomograms were rendered in turn.
+    tomo_entries = {t: tomo_entries[t] for t in tomo_names if t in tomo_entries}
 
     if progress_cb is not None:
         try:
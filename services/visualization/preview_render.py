@@ -9,8 +9,14 @@ no matplotlib.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +25,9 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
+PICKS_COLUMNS = ("i", "x", "y", "z", "score", "z_pct", "nn_px")
+
+
 def write_picks_data(
     pick_coords_xyz: np.ndarray,
     scores: Optional[np.ndarray],
@@ -26,12 +35,17 @@ def write_picks_data(
     tomo_dims_xyz: tuple,
     out_path: Path,
 ) -> dict:
-    """Write per-tomogram picks.json: [{i, x, y, z, score?, z_pct?, nn_px?}, ...].
+    """Write per-tomogram picks.json as parallel arrays:
+    {"columns": {"i": [...], "x": [...], "y": [...], "z": [...],
+    "score"?: [...], "z_pct"?: [...], "nn_px"?: [...]}}.
 
     Sorted score-descending so the UI can take "best K" / "worst K" slices
     without re-sorting client-side. Per-pick z-percentile and nearest-neighbor
     distance are precomputed here so the hover-details panel can read them
-    cheaply on every mouse-move.
+    cheaply on every mouse-move. Columnar so 20-50k-pick tomograms cost a few
+    array conversions instead of one dict per pick; the arrays feed Plotly
+    traces as-is. `nn_px` is null where undefined. Readers go through
+    `picks_columns` / `pick_row`.
     """
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -45,26 +59,56 @@ def write_picks_data(
     z_pct = _z_percentile(pick_coords_xyz)
     nn_px = _nearest_neighbor_distances(pick_coords_xyz.astype(float))
 
-    picks = []
-    for i in range(n):
-        pt = pick_coords_xyz[i]
-        entry = {"i": int(i), "x": int(pt[0]), "y": int(pt[1]), "z": int(pt[2])}
-        if scores is not None and i < len(scores):
-            entry["score"] = float(scores[i])
-        if z_pct is not None:
-            entry["z_pct"] = float(z_pct[i])
-        if nn_px is not None and np.isfinite(nn_px[i]):
-            entry["nn_px"] = float(nn_px[i])
-        picks.append(entry)
+    # astype(int64) truncates toward zero, same as int() per pick did.
+    xyz = np.asarray(pick_coords_xyz).reshape(n, -1)[:, :3].astype(np.int64) if n else np.zeros((0, 3), np.int64)
+    columns: dict = {
+        "i": list(range(n)),
+        "x": xyz[:, 0].tolist(),
+        "y": xyz[:, 1].tolist(),
+        "z": xyz[:, 2].tolist(),
+    }
+    if scores is not None and len(scores) and n:
+        score_list = np.asarray(scores, dtype=float)[:n].tolist()
+        columns["score"] = score_list + [None] * (n - len(score_list))
+    if z_pct is not None:
+        columns["z_pct"] = z_pct.astype(float).tolist()
+    if nn_px is not None:
+        columns["nn_px"] = [v if np.isfinite(v) else None for v in nn_px.tolist()]
 
     payload = {
+        "format": "columnar",
         "score_field": score_field,
         "tomo_dims_xyz_px": [int(v) for v in tomo_dims_xyz],
-        "n": len(picks),
-        "picks": picks,
+        "n": n,
+        "columns": columns,
     }
     out_path.write_text(json.dumps(payload))
-    return {"json_path": str(out_path), "n": len(picks)}
+    return {"json_path": str(out_path), "n": n}
+
+
+def picks_columns(payload: dict) -> dict:
+    """Parallel-array view of a picks.json payload, for either layout:
+    columnar (current) or a `picks` list of per-pick dicts (written before
+    the columnar switch and still on disk in cached previews)."""
+    cols = payload.get("columns")
+    if cols is not None:
+        return cols
+    rows = payload.get("picks") or []
+    return {k: [p.get(k) for p in rows] for k in PICKS_COLUMNS if any(k in p for p in rows)}
+
+
+def picks_count(cols: dict) -> int:
+    """Number of picks in a `picks_columns` view."""
+    return len(next(iter(cols.values()), ()))
+
+
+def pick_row(cols: dict, i: int) -> Optional[dict]:
+    """Pick `i` of a `picks_columns` view as a dict (None cells dropped, as
+    the old per-pick writer did); None if out of range. For single-pick
+    displays."""
+    if not 0 <= i < picks_count(cols):
+        return None
+    return {k: v[i] for k, v in cols.items() if v[i] is not None}
 
 
 def _z_percentile(coords: np.ndarray) -> Optional[np.ndarray]:
@@ -79,21 +123,32 @@ def _z_percentile(coords: np.ndarray) -> Optional[np.ndarray]:
 def _nearest_neighbor_distances(coords: np.ndarray, chunk: int = 256) -> Optional[np.ndarray]:
     """Per-pick distance to nearest other pick (3D, in pixels).
 
-    O(N^2) but chunked so peak memory stays bounded — for typical hundreds of
-    picks per tomo this is sub-millisecond; handles ten-thousand-pick edge
-    cases without blowing memory.
+    KD-tree query (O(N log N)); tens of thousands of picks take milliseconds.
+    Falls back to chunked brute force, which keeps peak memory bounded, if
+    scipy is unavailable.
     """
     n = len(coords)
     if n <= 1:
         return None
+    coords = np.asarray(coords, dtype=float)
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        cKDTree = None
+    if cKDTree is not None:
+        # k=2: the nearest hit is the pick itself (distance 0), the second
+        # is its nearest neighbour — a coincident duplicate gives 0, as in
+        # the brute-force path.
+        dist, _ = cKDTree(coords).query(coords, k=2)
+        return dist[:, 1].astype(float)
+
     out = np.empty(n, dtype=float)
     for start in range(0, n, chunk):
         end = min(start + chunk, n)
         block = coords[start:end]
         diff = block[:, None, :] - coords[None, :, :]
         d = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
-        for j, i in enumerate(range(start, end)):
-            d[j, i] = np.inf  # mask self-pair
+        d[np.arange(end - start), np.arange(start, end)] = np.inf  # mask self-pair
         out[start:end] = d.min(axis=1)
     return out
 
@@ -110,158 +165,365 @@ def is_output_stale(target: Path, sources) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# X/Z slab preview — server-side rendered once per tomogram, cached as PNG.
-# This is NOT a Z-MIP / per-pick rendering (which §3.1 forbids); it's the
-# X/Z analogue of the WarpTools-emitted top-down PNG, generated once with a
-# bounded read budget. Volume bytes touched per tomogram are capped so we
-# don't read 2 GB MRCs end-to-end on Lustre.
+# Tomogram views — X/Y, X/Z and Y/Z slab PNGs plus polarity / histogram
+# stats, all derived from ONE bounded mmap pass over the reconstruction and
+# cached next to it. This is NOT a Z-MIP / per-pick rendering (which §3.1
+# forbids); the slabs are the analogue of the WarpTools-emitted top-down
+# PNG, generated once with a bounded read budget so we don't read 2 GB MRCs
+# end-to-end on Lustre. The preview orchestrator, the recon canvas and the
+# dashboard polarity chip all read the same cache, so a volume is touched
+# once per (mtime, size) no matter how many views of it are shown.
+#
+# Cache layout, beside the MRC:
+#     <recon_dir>/.cb_views/<mrc_stem>/{xy,xz,yz}.png + views.json
+# views.json is written last and carries the staleness key. Read-only recon
+# dirs fall back to a per-user dir under the system temp dir, one subdir per
+# volume, pruned to the FALLBACK_VIEWS_MAX most recently written.
 # ---------------------------------------------------------------------------
 
+TOMO_VIEWS_VERSION = 2
+TOMO_VIEWS_DIRNAME = ".cb_views"
+SLAB_BYTE_BUDGET = 50 * 1024 * 1024
+VIEW_MAX_DIM = 1024
+HISTOGRAM_BINS = 64
+FALLBACK_VIEWS_MAX = 64
+VIEWS_MEMO_MAX = 256
 
-def render_xz_slab_preview(
-    mrc_path: Path, out_path: Path, *, max_dim: int = 1024, slab_byte_budget: int = 50 * 1024 * 1024
-) -> Optional[Path]:
-    """Render an X/Z preview PNG by averaging a central Y-slab of the tomogram.
+# In-process LRU memo: resolved MRC path -> (staleness key, TomogramViews).
+_views_memo: "OrderedDict[str, tuple[dict, TomogramViews]]" = OrderedDict()
 
-    Reads only the central few Y-slices via mmap so the byte cost is bounded
-    regardless of tomogram size. Slab thickness adapts: ~2% of Y, capped so
-    that the (slices * Z * X) byte read stays under `slab_byte_budget`.
-    Robust-percentile normalized for visibility. Returns the written path,
-    or None if the read fails.
-    """
+
+@dataclass
+class TomogramViews:
+    """Derived images + stats for one reconstruction. `stats` carries
+    polarity (pct_bright / pct_dark / polarity / slab_shape, sampled from the
+    centre Z slice) and a `histogram` of that slice."""
+
+    mrc_path: Path
+    xy_png: Optional[Path]
+    xz_png: Optional[Path]
+    yz_png: Optional[Path]
+    stats: dict
+
+
+def _views_cache_dir(mrc_path: Path) -> Path:
+    return mrc_path.parent / TOMO_VIEWS_DIRNAME / mrc_path.stem
+
+
+def _fallback_views_root() -> Path:
+    return Path(tempfile.gettempdir()) / f"cb_views_{os.getuid()}"
+
+
+def _fallback_views_dir(mrc_path: Path) -> Path:
+    digest = hashlib.sha1(str(mrc_path.resolve()).encode()).hexdigest()[:16]
+    return _fallback_views_root() / f"{mrc_path.stem}_{digest}"
+
+
+def _prune_fallback_views(keep: Path) -> None:
     try:
-        import mrcfile
-        from PIL import Image
-    except ImportError as e:
-        logger.warning("X/Z preview deps unavailable: %s", e)
-        return None
+        dirs = [d for d in _fallback_views_root().iterdir() if d.is_dir() and d != keep]
+        dirs.sort(key=lambda d: d.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for stale in dirs[FALLBACK_VIEWS_MAX - 1 :]:
+        shutil.rmtree(stale, ignore_errors=True)
 
-    out_path = Path(out_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
 
+def _remember_views(memo_key: str, key: dict, views: "TomogramViews") -> None:
+    _views_memo[memo_key] = (key, views)
+    _views_memo.move_to_end(memo_key)
+    while len(_views_memo) > VIEWS_MEMO_MAX:
+        _views_memo.popitem(last=False)
+
+
+def _views_key(mrc_path: Path, max_dim: int, slab_byte_budget: int) -> Optional[dict]:
     try:
-        with mrcfile.mmap(str(mrc_path), mode="r") as m:
-            data = m.data
-            if data.ndim != 3:
-                logger.warning("Skipping X/Z preview, MRC is not 3D: %s", mrc_path)
-                return None
-            nz, ny, nx = data.shape
-            slab_per_slice_bytes = nz * nx * data.dtype.itemsize
-            if slab_per_slice_bytes <= 0:
-                return None
-            max_slices_by_budget = max(1, slab_byte_budget // slab_per_slice_bytes)
-            target_slices = max(3, ny // 50)
-            n_slices = int(min(max_slices_by_budget, target_slices, ny))
-            half = n_slices // 2
-            y_lo = max(0, (ny // 2) - half)
-            y_hi = min(ny, y_lo + n_slices)
-            # Always copy out — see §3.5 mmap view trap. Cast to float32 inside
-            # the with-block so the mmap is still valid when np.array is called.
-            slab = np.array(data[:, y_lo:y_hi, :], dtype=np.float32, copy=True)
-    except Exception as e:
-        logger.warning("X/Z slab read failed for %s: %s", mrc_path, e)
+        st = mrc_path.stat()
+    except OSError:
         return None
+    return {
+        "version": TOMO_VIEWS_VERSION,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "max_dim": max_dim,
+        "slab_byte_budget": slab_byte_budget,
+    }
+
+
+def _slab_bounds(n: int, per_slice_bytes: int, budget: int) -> tuple[int, int]:
+    """Central slab along an axis of length n: ~2% of n (min 3), capped so
+    slices * per_slice_bytes stays under budget."""
+    max_slices_by_budget = max(1, budget // per_slice_bytes)
+    target_slices = max(3, n // 50)
+    n_slices = int(min(max_slices_by_budget, target_slices, n))
+    lo = max(0, (n // 2) - n_slices // 2)
+    return lo, min(n, lo + n_slices)
+
+
+def _sampled_planes(nz: int, per_plane_bytes: int, budget: int) -> list[int]:
+    """Z indices for the Y/Z view: evenly spaced whole Z-planes (each one
+    contiguous on disk), as many as fit under budget."""
+    n = int(min(nz, max(1, budget // per_plane_bytes)))
+    return sorted({int(z) for z in np.linspace(0, nz - 1, n).round()})
+
+
+def _slab_to_image(img2d: np.ndarray, max_dim: int, size_wh: Optional[tuple[int, int]] = None):
+    """1-99 percentile clip → uint8 → flipud → PIL, downscaled to max_dim.
+
+    Tomograms have a tiny dynamic range with rare extreme outliers — fixed
+    min/max gives a flat washed-out result; the percentile clip mimics the
+    WarpTools preview's contrast. Every view (and the template thumb and
+    cutout tiles) shares this pipeline so polarity is consistent and the
+    dashboard's invert toggle flips them as a unit.
+
+    Image row 0 is the *top* of the plot; array row 0 is coordinate 0, which
+    the IMOD-up convention puts at the bottom. Hence the flip.
+
+    `size_wh` is the logical (w, h) when the array was sampled with a stride.
+    """
+    from PIL import Image
 
-    img2d = slab.mean(axis=1)  # shape (Z, X)
-    # Tomograms have a tiny dynamic range with rare extreme outliers — fixed
-    # min/max gives a flat washed-out result. 1-99 percentile clip mimics the
-    # WarpTools preview's contrast.
     lo = float(np.percentile(img2d, 1.0))
     hi = float(np.percentile(img2d, 99.0))
     if hi <= lo:
         hi = lo + 1.0
     norm = np.clip((img2d - lo) / (hi - lo), 0.0, 1.0)
-    u8 = (norm * 255.0).astype(np.uint8)
-
-    # Output orientation: image row 0 is at the *top* of the plot when the UI
-    # anchors at y=z_dim. With shape (Z, X), row 0 == z=0; we want z=0 at the
-    # bottom of the X/Z scatter (matches the IMOD-up convention). Flip.
-    u8 = np.flipud(u8)
+    u8 = np.flipud((norm * 255.0).astype(np.uint8))
 
     img = Image.fromarray(u8, mode="L")
-    h, w = u8.shape
+    w, h = size_wh or (u8.shape[1], u8.shape[0])
     if max(h, w) > max_dim:
         scale = max_dim / float(max(h, w))
-        new_w = max(1, int(round(w * scale)))
-        new_h = max(1, int(round(h * scale)))
-        img = img.resize((new_w, new_h), Image.LANCZOS)
-    img.save(str(out_path), format="PNG", optimize=True)
+        w = max(1, int(round(w * scale)))
+        h = max(1, int(round(h * scale)))
+    if (w, h) != img.size:
+        img = img.resize((w, h), Image.LANCZOS)
+    return img
+
+
+def _save_png_atomic(img, out_path: Path) -> Path:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    img.save(str(tmp), format="PNG", optimize=True)
+    os.replace(tmp, out_path)
     return out_path
 
 
-def render_xy_slab_preview(
-    mrc_path: Path, out_path: Path, *, max_dim: int = 1024, slab_byte_budget: int = 50 * 1024 * 1024
-) -> Optional[Path]:
-    """Render an X/Y top-down preview PNG by averaging a central Z-slab.
-
-    Bytewise mirror of `render_xz_slab_preview` — same percentile clip, same
-    byte budget, same uint8 conversion — so template, X/Y slab, X/Z slab, and
-    subtomo cutouts all share polarity (low density → dark, high → bright).
-    Replaces the WarpTools-rendered tomogram PNG in the dashboard, which used
-    WarpTools' own convention and so could be inverted relative to the other
-    three renderings. The dashboard's invert toggle then flips all four at
-    once via CSS.
-
-    The slab is centered on Z (since the picker's per-pick z is rarely at the
-    z-midplane, but the central Z-slab covers the cellular layer for plunge-
-    frozen samples). Adapts thickness so the total bytes read stays under
-    `slab_byte_budget`.
+def polarity_stats(center: np.ndarray) -> dict:
+    """%bright / %dark voxel fractions of a centre Z slice and the polarity
+    class. Margins picked from the doc example: GT had 6.6%/6.8% =
+    essentially symmetric. >1.5x ratio + >8% absolute = clear skew."""
+    mean = float(center.mean())
+    std = float(center.std()) or 1.0
+    upper = mean + 1.5 * std
+    lower = mean - 1.5 * std
+    n = float(center.size)
+    pct_bright = 100.0 * float((center > upper).sum()) / n
+    pct_dark = 100.0 * float((center < lower).sum()) / n
+    if pct_bright > 1.5 * pct_dark and pct_bright > 8.0:
+        polarity = "bright"
+    elif pct_dark > 1.5 * pct_bright and pct_dark > 8.0:
+        polarity = "dark"
+    else:
+        polarity = "symmetric"
+    return {"pct_bright": pct_bright, "pct_dark": pct_dark, "polarity": polarity, "slab_shape": list(center.shape)}
+
+
+def _histogram(center: np.ndarray) -> dict:
+    finite = center[np.isfinite(center)]
+    if finite.size == 0:
+        return {"edges": [], "counts": []}
+    lo, hi = np.percentile(finite, [0.1, 99.9])
+    if hi <= lo:
+        hi = lo + 1.0
+    counts, edges = np.histogram(finite, bins=HISTOGRAM_BINS, range=(float(lo), float(hi)))
+    return {"edges": [float(v) for v in edges], "counts": [int(v) for v in counts]}
+
+
+def _read_views_cache(cache_dir: Path, key: dict, mrc_path: Path) -> Optional[TomogramViews]:
+    try:
+        meta = json.loads((cache_dir / "views.json").read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get("key") != key:
+        return None
+    pngs = {}
+    for view in ("xy", "xz", "yz"):
+        p = cache_dir / f"{view}.png"
+        if meta.get(view) and not p.exists():
+            return None
+        pngs[view] = p if meta.get(view) else None
+    return TomogramViews(mrc_path, pngs["xy"], pngs["xz"], pngs["yz"], meta.get("stats") or {})
+
+
+def cached_tomogram_views(
+    mrc_path: Path, *, max_dim: int = VIEW_MAX_DIM, slab_byte_budget: int = SLAB_BYTE_BUDGET
+) -> Optional[TomogramViews]:
+    """Views for `mrc_path` if already rendered for its current
+    (mtime, size); None otherwise. Never reads the volume."""
+    mrc_path = Path(mrc_path)
+    key = _views_key(mrc_path, max_dim, slab_byte_budget)
+    if key is None:
+        return None
+    memo_key = str(mrc_path.resolve())
+    hit = _views_memo.get(memo_key)
+    if hit is not None and hit[0] == key:
+        _views_memo.move_to_end(memo_key)
+        return hit[1]
+    views = _read_views_cache(_views_cache_dir(mrc_path), key, mrc_path)
+    if views is None:
+        views = _read_views_cache(_fallback_views_dir(mrc_path), key, mrc_path)
+    if views is not None:
+        _remember_views(memo_key, key, views)
+    return views
+
+
+def render_tomogram_views(
+    mrc_path: Path, *, max_dim: int = VIEW_MAX_DIM, slab_byte_budget: int = SLAB_BYTE_BUDGET, force: bool = False
+) -> Optional[TomogramViews]:
+    """Return the X/Y, X/Z, Y/Z slab PNGs + stats for `mrc_path`, rendering
+    them in one bounded pass if the cache is missing or stale.
+
+    Reads, from a single mmap:
+      - a central Z-slab (~2% of Z, under `slab_byte_budget`) → X/Y view;
+        its centre slice also feeds the polarity stats and histogram;
+      - a central Y-slab under the same budget → X/Z view;
+      - whole Z-planes spaced evenly through the depth under the same
+        budget, each cropped to a central X-band and the stack stretched
+        back to Z → Y/Z view.
+    Every read is of whole contiguous Z-planes or Y-bands within a plane;
+    nothing strides across rows of the full volume.
+    Returns None if the volume can't be read or isn't 3D.
     """
     try:
         import mrcfile
-        from PIL import Image
     except ImportError as e:
-        logger.warning("X/Y preview deps unavailable: %s", e)
+        logger.warning("Tomogram view deps unavailable: %s", e)
         return None
 
-    out_path = Path(out_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+    mrc_path = Path(mrc_path)
+    if not force:
+        views = cached_tomogram_views(mrc_path, max_dim=max_dim, slab_byte_budget=slab_byte_budget)
+        if views is not None:
+            return views
+    key = _views_key(mrc_path, max_dim, slab_byte_budget)
+    if key is None:
+        return None
 
     try:
         with mrcfile.mmap(str(mrc_path), mode="r") as m:
             data = m.data
             if data.ndim != 3:
-                logger.warning("Skipping X/Y preview, MRC is not 3D: %s", mrc_path)
+                logger.warning("Skipping tomogram views, MRC is not 3D: %s", mrc_path)
                 return None
             nz, ny, nx = data.shape
-            slab_per_slice_bytes = ny * nx * data.dtype.itemsize
-            if slab_per_slice_bytes <= 0:
+            itemsize = data.dtype.itemsize
+            if nz * ny * nx * itemsize <= 0:
                 return None
-            max_slices_by_budget = max(1, slab_byte_budget // slab_per_slice_bytes)
-            target_slices = max(3, nz // 50)
-            n_slices = int(min(max_slices_by_budget, target_slices, nz))
-            half = n_slices // 2
-            z_lo = max(0, (nz // 2) - half)
-            z_hi = min(nz, z_lo + n_slices)
-            slab = np.array(data[z_lo:z_hi, :, :], dtype=np.float32, copy=True)
+            # Always copy out — see §3.5 mmap view trap. Cast to float32 inside
+            # the with-block so the mmap is still valid when np.array is called.
+            z_lo, z_hi = _slab_bounds(nz, ny * nx * itemsize, slab_byte_budget)
+            xy_slab = np.array(data[z_lo:z_hi, :, :], dtype=np.float32, copy=True)
+            y_lo, y_hi = _slab_bounds(ny, nz * nx * itemsize, slab_byte_budget)
+            xz_slab = np.array(data[:, y_lo:y_hi, :], dtype=np.float32, copy=True)
+            x_lo, x_hi = _slab_bounds(nx, nz * ny * itemsize, slab_byte_budget)
+            yz_rows = []
+            for z in _sampled_planes(nz, ny * nx * itemsize, slab_byte_budget):
+                # Planes the X/Y slab already holds are not read again.
+                if z_lo <= z < z_hi:
+                    band = xy_slab[z - z_lo, :, x_lo:x_hi]
+                else:
+                    band = np.array(data[z, :, x_lo:x_hi], dtype=np.float32, copy=True)
+                yz_rows.append(band.mean(axis=1))
+            yz_plane = np.stack(yz_rows)
     except Exception as e:
-        logger.warning("X/Y slab read failed for %s: %s", mrc_path, e)
+        logger.warning("Tomogram view read failed for %s: %s", mrc_path, e)
         return None
 
-    img2d = slab.mean(axis=0)  # shape (Y, X)
-    lo = float(np.percentile(img2d, 1.0))
-    hi = float(np.percentile(img2d, 99.0))
-    if hi <= lo:
-        hi = lo + 1.0
-    norm = np.clip((img2d - lo) / (hi - lo), 0.0, 1.0)
-    u8 = (norm * 255.0).astype(np.uint8)
-
-    # IMOD-up convention: Y=0 at the *bottom* of the displayed image (the
-    # dashboard's CSS positions overlay dots with `top: (1.0 - y/y_dim)`).
-    # Array row 0 currently == y=0; flipud so row 0 == y=Y_max == top of PNG.
-    u8 = np.flipud(u8)
+    # Polarity samples the centre Z slice (cropped to 1024x1024), which the
+    # X/Y slab always contains.
+    cy, cx = ny // 2, nx // 2
+    center = xy_slab[nz // 2 - z_lo, max(0, cy - 512) : min(ny, cy + 512), max(0, cx - 512) : min(nx, cx + 512)]
+    stats = polarity_stats(center) if center.size else {}
+    if center.size:
+        stats["histogram"] = _histogram(center)
+    stats["shape_zyx"] = [nz, ny, nx]
+
+    images = {
+        "xy": _slab_to_image(xy_slab.mean(axis=0), max_dim),
+        "xz": _slab_to_image(xz_slab.mean(axis=1), max_dim),
+        "yz": _slab_to_image(yz_plane, max_dim, size_wh=(ny, nz)),
+    }
 
-    img = Image.fromarray(u8, mode="L")
-    h, w = u8.shape
-    if max(h, w) > max_dim:
-        scale = max_dim / float(max(h, w))
-        new_w = max(1, int(round(w * scale)))
-        new_h = max(1, int(round(h * scale)))
-        img = img.resize((new_w, new_h), Image.LANCZOS)
-    img.save(str(out_path), format="PNG", optimize=True)
+    cache_dir = _views_cache_dir(mrc_path)
+    try:
+        paths = _write_views_cache(cache_dir, key, stats, images)
+    except OSError as e:
+        # Read-only recon dir: cache under the per-user fallback instead.
+        fallback = _fallback_views_dir(mrc_path)
+        logger.info("Tomogram view cache not writable at %s (%s); using %s", cache_dir, e, fallback)
+        try:
+            paths = _write_views_cache(fallback, key, stats, images)
+        except OSError as e2:
+            logger.warning("Tomogram view fallback cache not writable at %s: %s", fallback, e2)
+            return None
+        _prune_fallback_views(fallback)
+
+    views = TomogramViews(mrc_path, paths["xy"], paths["xz"], paths["yz"], stats)
+    _remember_views(str(mrc_path.resolve()), key, views)
+    return views
+
+
+def _write_views_cache(cache_dir: Path, key: dict, stats: dict, images: dict) -> dict:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    paths = {view: _save_png_atomic(img, cache_dir / f"{view}.png") for view, img in images.items()}
+    meta = {"key": key, "stats": stats, **{view: True for view in paths}}
+    tmp = cache_dir / f".views.json.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, cache_dir / "views.json")
+    return paths
+
+
+def _copy_view(src: Optional[Path], out_path: Path) -> Optional[Path]:
+    if src is None:
+        return None
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if out_path.resolve() != src.resolve():
+        tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, out_path)
     return out_path
 
 
+def render_xz_slab_preview(
+    mrc_path: Path, out_path: Path, *, max_dim: int = VIEW_MAX_DIM, slab_byte_budget: int = SLAB_BYTE_BUDGET
+) -> Optional[Path]:
+    """Write the X/Z preview PNG (central Y-slab average) to `out_path`.
+
+    Served from `render_tomogram_views`, so the volume is read at most once
+    for all views. Returns the written path, or None if the read fails.
+    """
+    views = render_tomogram_views(mrc_path, max_dim=max_dim, slab_byte_budget=slab_byte_budget)
+    return _copy_view(views.xz_png, out_path) if views is not None else None
+
+
+def render_xy_slab_preview(
+    mrc_path: Path, out_path: Path, *, max_dim: int = VIEW_MAX_DIM, slab_byte_budget: int = SLAB_BYTE_BUDGET
+) -> Optional[Path]:
+    """Write the X/Y top-down preview PNG (central Z-slab average) to `out_path`.
+
+    Same percentile clip and uint8 pipeline as the X/Z slab, template thumb
+    and subtomo cutouts, so all share polarity (low density → dark, high →
+    bright). Replaces the WarpTools-rendered tomogram PNG in the dashboard,
+    which used WarpTools' own convention and so could be inverted relative to
+    the other renderings. The slab is centered on Z (the central Z-slab
+    covers the cellular layer for plunge-frozen samples).
+    """
+    views = render_tomogram_views(mrc_path, max_dim=max_dim, slab_byte_budget=slab_byte_budget)
+    return _copy_view(views.xy_png, out_path) if views is not None else None
+
+
 # ---------------------------------------------------------------------------
 # Subtomo cutout sprite-atlas — turns each pick's per-particle .mrcs (the
 # 2D tilt-stack from `relion_tomo_subtomo`) into a small thumbnail; packs
@@ -17,16 +17,26 @@ The subtomo job's `particles.star` exposes:
 We index those rows by (tomo, rounded-Å triplet) so a candidate pick (also
 in centered Å) finds its `.mrcs` in O(1). Picks without a match (e.g., the
 candidate set was filtered before subtomo extraction) just don't get a tile.
+
+The per-job part of the index is columnar (tomo, integer coord keys, raw
+image name, raw visible-frames cell) and persisted next to the job's
+particles.star as `.pick_index.npz`, so regenerating previews doesn't
+re-read and re-key a 200k-row STAR. Paths and visible-frame lists are only
+materialised for picks that are actually looked up.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
+from services.configs.starfile_service import StarfileService
 from services.models_base import JobType
 
 logger = logging.getLogger(__name__)
@@ -36,16 +46,29 @@ logger = logging.getLogger(__name__)
 # .star file, and the candidate-extract pipeline doesn't introduce drift, so
 # bit-exact match would also work. Round-to-tenths is a defensive margin.
 _COORD_DECIMALS = 1
+_COORD_SCALE = 10**_COORD_DECIMALS
+
+_COORD_COLS = ("rlnCenteredCoordinateXAngst", "rlnCenteredCoordinateYAngst", "rlnCenteredCoordinateZAngst")
+
+PICK_INDEX_FILENAME = ".pick_index.npz"
+PICK_INDEX_VERSION = 1
 
 
 def _coord_key(x: float, y: float, z: float) -> tuple[int, int, int]:
+    # Scale then round-half-even, exactly what `_coord_keys` does with
+    # np.rint, so scalar lookups hit keys built in bulk.
     return (
-        int(round(float(x), _COORD_DECIMALS) * 10**_COORD_DECIMALS),
-        int(round(float(y), _COORD_DECIMALS) * 10**_COORD_DECIMALS),
-        int(round(float(z), _COORD_DECIMALS) * 10**_COORD_DECIMALS),
+        int(round(float(x) * _COORD_SCALE)),
+        int(round(float(y) * _COORD_SCALE)),
+        int(round(float(z) * _COORD_SCALE)),
     )
 
 
+def _coord_keys(xyz: np.ndarray) -> np.ndarray:
+    """Vectorised `_coord_key` over an (N, 3) float array -> (N, 3) int64."""
+    return np.rint(np.asarray(xyz, dtype=np.float64) * _COORD_SCALE).astype(np.int64)
+
+
 def _parse_visible_frames(raw) -> Optional[list[int]]:
     """Parse a `rlnTomoVisibleFrames` cell like "[0,1,1,...]" into a list of ints."""
     if raw is None:
@@ -121,45 +144,211 @@ def subtomo_particles_stars(project_state, project_path) -> list[Path]:
     return [s for s in stars if s.exists()]
 
 
+class PickIndex:
+    """(tomo, coord_key) -> subtomo `.mrcs` lookup over columnar arrays.
+
+    Rows are kept in job order; on a key collision the later row wins, so
+    the lex-greater (newer) subtomo job is the one a pick resolves to. The
+    key dict is built lazily on first lookup, and each hit is turned into
+    the `{mrcs, visible_frames, src_job_dir}` dict the atlas renderer takes.
+    Instances are plain arrays + strings and pickle cheaply to workers.
+    """
+
+    def __init__(
+        self,
+        tomo: np.ndarray,
+        keys: np.ndarray,
+        image: np.ndarray,
+        visible: np.ndarray,
+        job: np.ndarray,
+        job_dirs: list[str],
+        project_path: Optional[str],
+    ):
+        self.tomo = tomo
+        self.keys = keys
+        self.image = image
+        self.visible = visible
+        self.job = job
+        self.job_dirs = job_dirs
+        self.project_path = project_path
+        self._lookup: Optional[dict] = None
+
+    @classmethod
+    def empty(cls, project_path: Optional[str] = None) -> "PickIndex":
+        return cls(
+            np.empty(0, dtype="U1"),
+            np.empty((0, 3), dtype=np.int64),
+            np.empty(0, dtype="U1"),
+            np.empty(0, dtype="U1"),
+            np.empty(0, dtype=np.int32),
+            [],
+            project_path,
+        )
+
+    def __len__(self) -> int:
+        # Indexed rows (colliding keys counted once per job that has them).
+        return len(self.tomo)
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state["_lookup"] = None
+        return state
+
+    def _get_lookup(self) -> dict:
+        if self._lookup is None:
+            keys = map(tuple, self.keys.tolist())
+            self._lookup = dict(zip(zip(self.tomo.tolist(), keys), range(len(self.tomo))))
+        return self._lookup
+
+    def tomos(self) -> set[str]:
+        return set(np.unique(self.tomo).tolist())
+
+    def _take(self, rows: np.ndarray) -> "PickIndex":
+        return PickIndex(
+            self.tomo[rows],
+            self.keys[rows],
+            self.image[rows],
+            self.visible[rows],
+            self.job[rows],
+            self.job_dirs,
+            self.project_path,
+        )
+
+    def split_by_tomo(self) -> dict[str, "PickIndex"]:
+        """One sub-index per tomogram (row order, and so collision order, kept)."""
+        if not len(self.tomo):
+            return {}
+        groups = pd.Series(self.tomo).groupby(self.tomo, sort=False).indices
+        return {str(t): self._take(rows) for t, rows in groups.items()}
+
+    def get(self, tomo_name: str, key: tuple[int, int, int]) -> Optional[dict]:
+        row = self._get_lookup().get((tomo_name, key))
+        if row is None:
+            return None
+        mrcs_path = Path(str(self.image[row]))
+        if not mrcs_path.is_absolute() and self.project_path is not None:
+            mrcs_path = Path(self.project_path) / mrcs_path
+        visible = str(self.visible[row])
+        return {
+            "mrcs": mrcs_path,
+            "visible_frames": _parse_visible_frames(visible) if visible else None,
+            "src_job_dir": Path(self.job_dirs[int(self.job[row])]),
+        }
+
+
+def _read_job_pick_columns(particles_star: Path) -> Optional[dict[str, np.ndarray]]:
+    """Key columns of one subtomo job's particles.star, as arrays."""
+    svc = StarfileService()
+    base = ["rlnTomoName", "rlnImageName", *_COORD_COLS]
+    df = None
+    for block in ("particles", None):
+        for cols in (base + ["rlnTomoVisibleFrames"], base):
+            df = svc.read_block(particles_star, block=block, columns=cols)
+            if df is not None:
+                break
+        if df is not None:
+            break
+    if df is None:
+        return None
+
+    xyz = np.column_stack([pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64) for c in _COORD_COLS])
+    ok = np.isfinite(xyz).all(axis=1)
+    if "rlnTomoVisibleFrames" in df.columns:
+        visible = df["rlnTomoVisibleFrames"].astype(str).to_numpy()[ok]
+    else:
+        visible = np.full(int(ok.sum()), "")
+    return {
+        "tomo": np.asarray(df["rlnTomoName"].astype(str).to_numpy()[ok], dtype=str),
+        "keys": _coord_keys(xyz[ok]),
+        "image": np.asarray(df["rlnImageName"].astype(str).to_numpy()[ok], dtype=str),
+        "visible": np.asarray(visible, dtype=str),
+    }
+
+
+def _load_job_pick_index(job_dir: Path) -> Optional[dict[str, np.ndarray]]:
+    """Per-job columns from `.pick_index.npz`, rebuilt when particles.star
+    changes (mtime/size recorded in the file)."""
+    particles_star = job_dir / "particles.star"
+    try:
+        st = os.stat(particles_star)
+    except FileNotFoundError:
+        return None
+    sig = np.array([PICK_INDEX_VERSION, st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+    cache_path = job_dir / PICK_INDEX_FILENAME
+    try:
+        with np.load(cache_path, allow_pickle=False) as z:
+            if np.array_equal(z["sig"], sig):
+                return {k: z[k] for k in ("tomo", "keys", "image", "visible")}
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable pick index %s: %s", cache_path, e)
+
+    try:
+        cols = _read_job_pick_columns(particles_star)
+    except Exception as e:
+        logger.warning("Could not read %s: %s", particles_star, e)
+        return None
+    if cols is None:
+        return None
+
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(job_dir), prefix=".tmp_", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, sig=sig, **cols)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        logger.debug("Could not persist pick index %s: %s", cache_path, e)
+    return cols
+
+
 def build_pick_to_mrcs_index(
     candidate_extract_job_dir: Path, project_state, project_path: Path
-) -> dict[tuple[str, tuple[int, int, int]], dict]:
-    """Build a {(tomo_name, coord_key): {mrcs, visible_frames, src_job_dir}} lookup.
+) -> PickIndex:
+    """Build a (tomo_name, coord_key) -> {mrcs, visible_frames, src_job_dir} lookup.
 
-    Walks every SUBTOMO_EXTRACTION job in the project, reads its particles.star,
-    and indexes by (tomo, coord_key). Later subtomo jobs win on key collision —
-    this is a heuristic but matches the user expectation that "the most recent
-    extraction is the one I care about."
+    Walks every SUBTOMO_EXTRACTION job in the project and stacks the
+    columnar per-job index of each (persisted, see `_load_job_pick_index`).
+    Later subtomo jobs win on key collision — this is a heuristic but
+    matches the user expectation that "the most recent extraction is the
+    one I care about."
     """
-    index: dict[tuple[str, tuple[int, int, int]], dict] = {}
-
+    project = str(project_path) if project_path is not None else None
+    parts: list[dict[str, np.ndarray]] = []
+    job_dirs: list[str] = []
     for job_dir in _subtomo_job_dirs(project_state, project_path):
-        df = _read_subtomo_particles(job_dir / "particles.star", job_dir)
-        if df is None:
-            continue
-        if "rlnImageName" not in df.columns or "rlnTomoName" not in df.columns:
-            continue
-        coord_cols = ("rlnCenteredCoordinateXAngst", "rlnCenteredCoordinateYAngst", "rlnCenteredCoordinateZAngst")
-        if not all(c in df.columns for c in coord_cols):
+        cols = _load_job_pick_index(job_dir)
+        if cols is None or not len(cols["tomo"]):
             continue
+        cols["job"] = np.full(len(cols["tomo"]), len(job_dirs), dtype=np.int32)
+        job_dirs.append(str(job_dir))
+        parts.append(cols)
+
+    if not parts:
+        return PickIndex.empty(project)
+    return PickIndex(
+        _concat_str([p["tomo"] for p in parts]),
+        np.concatenate([p["keys"] for p in parts]),
+        _concat_str([p["image"] for p in parts]),
+        _concat_str([p["visible"] for p in parts]),
+        np.concatenate([p["job"] for p in parts]),
+        job_dirs,
+        project,
+    )
 
-        for _, row in df.iterrows():
-            tomo = str(row["rlnTomoName"])
-            try:
-                key = _coord_key(row[coord_cols[0]], row[coord_cols[1]], row[coord_cols[2]])
-            except (TypeError, ValueError):
-                continue
-            mrcs_path = Path(str(row["rlnImageName"]))
-            if not mrcs_path.is_absolute():
-                mrcs_path = Path(project_path) / mrcs_path
-            visible = (
-                _parse_visible_frames(row.get("rlnTomoVisibleFrames")) if "rlnTomoVisibleFrames" in df.columns else None
-            )
-            index[(tomo, key)] = {"mrcs": mrcs_path, "visible_frames": visible, "src_job_dir": job_dir}
 
-    return index
+def _concat_str(arrays: Iterable[np.ndarray]) -> np.ndarray:
+    return np.concatenate([np.asarray(a, dtype=str) for a in arrays])
 
 
-def lookup_for_pick(pick_index: dict, tomo_name: str, x_ang: float, y_ang: float, z_ang: float) -> Optional[dict]:
+def lookup_for_pick(pick_index: PickIndex, tomo_name: str, x_ang: float, y_ang: float, z_ang: float) -> Optional[dict]:
     """Look up a candidate pick's matching subtomo entry; returns None on miss."""
-    return pick_index.get((tomo_name, _coord_key(x_ang, y_ang, z_ang)))
+    return pick_index.get(tomo_name, _coord_key(x_ang, y_ang, z_ang))
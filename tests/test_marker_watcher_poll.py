@@ -0,0 +1,39 @@
+"""Polled .task_status/ dirs: racily-clean listings are redone."""
+
+import os
+
+from services.scheduling_and_orchestration import marker_watcher as mw
+
+
+def _touch_keeping_dir_mtime(d, name):
+    st = os.stat(d)
+    (d / name).write_text("")
+    os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_same_tick_marker_is_seen_on_next_pass(tmp_path):
+    tasks = tmp_path / mw.TASK_STATUS_DIR
+    tasks.mkdir()
+    dirs = [(tasks, mw._TASKS)]
+    first = mw.MarkerWatcher._stat_dirs(dirs, {})
+    assert first[tasks][1] == frozenset()
+
+    # A coarse-mtime filesystem: the marker lands without moving the dir mtime.
+    _touch_keeping_dir_mtime(tasks, "TS_01.ok")
+    second = mw.MarkerWatcher._stat_dirs(dirs, first)
+    assert second[tasks][1] == frozenset({"TS_01.ok"})
+
+
+def test_settled_dir_is_not_relisted(tmp_path, monkeypatch):
+    tasks = tmp_path / mw.TASK_STATUS_DIR
+    tasks.mkdir()
+    old = 1_000_000_000 * 10**9
+    os.utime(tasks, ns=(old, old))
+    dirs = [(tasks, mw._TASKS)]
+    first = mw.MarkerWatcher._stat_dirs(dirs, {})
+
+    def no_listing(_):
+        raise AssertionError("settled .task_status/ was listed again")
+
+    monkeypatch.setattr(mw.os, "listdir", no_listing)
+    assert mw.MarkerWatcher._stat_dirs(dirs, first)[tasks] == first[tasks]
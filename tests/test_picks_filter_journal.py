@@ -0,0 +1,100 @@
+"""Curation journal: saves keep the filtered pair in step, replay and compaction."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import starfile
+
+from services.visualization import picks_filter as pf
+
+TS_NAMES = ("TS_01", "TS_02", "TS_03")
+N_PER_TS = 50
+
+
+def _job_dirs(tmp_path):
+    sub = tmp_path / "sub"
+    ce = tmp_path / "ce"
+    sub.mkdir()
+    ce.mkdir()
+    rng = np.random.default_rng(0)
+    rows = [(ts, *np.round(rng.uniform(-500, 500, 3), 1), rng.uniform()) for ts in TS_NAMES for _ in range(N_PER_TS)]
+    cands = pd.DataFrame(rows, columns=["rlnTomoName", *pf._COORD_COLS, "rlnLCCmax"])
+    starfile.write({"particles": cands}, ce / "candidates.star")
+    particles = cands.drop(columns=["rlnLCCmax"])
+    particles["rlnImageName"] = [f"x{i}.mrcs" for i in range(len(particles))]
+    optics = pd.DataFrame({"rlnOpticsGroup": [1], "rlnTomoTiltSeriesPixelSize": [1.0]})
+    starfile.write({"optics": optics, "particles": particles}, sub / pf.PARTICLES_NAME)
+    (sub / pf.OPTIMISATION_SET_NAME).write_text(
+        "data_\n_rlnTomoParticlesFile particles.star\n_rlnTomoTomogramsFile tomograms.star\n"
+    )
+    return sub, ce
+
+
+def _filtered_rows(sub) -> int:
+    return len(starfile.read(sub / pf.PARTICLES_FILTERED_NAME, always_dict=True)["particles"])
+
+
+def test_save_materializes_particles_with_optset(tmp_path):
+    sub, ce = _job_dirs(tmp_path)
+    result = pf.save_filtered_picks_for_ts(sub, ce, "TS_01", set(range(10)))
+    assert result["kept_for_ts"] == 10
+    assert result["total_kept"] == 10 + 2 * N_PER_TS
+    assert "particles_filtered.star" in (sub / pf.OPTIMISATION_SET_FILTERED_NAME).read_text()
+    assert _filtered_rows(sub) == result["total_kept"]
+
+    pf.save_filtered_picks_for_ts(sub, ce, "TS_02", {0, 5, 49})
+    assert _filtered_rows(sub) == 10 + 3 + N_PER_TS
+
+
+def test_materialize_is_noop_when_journal_unchanged(tmp_path):
+    sub, ce = _job_dirs(tmp_path)
+    pf.save_filtered_picks_for_ts(sub, ce, "TS_01", set(range(10)))
+    before = (sub / pf.PARTICLES_FILTERED_NAME).stat().st_mtime_ns
+    assert pf.ensure_filtered_materialized(sub)
+    assert (sub / pf.PARTICLES_FILTERED_NAME).stat().st_mtime_ns == before
+
+
+def test_journal_replay_tracks_per_ts_decisions(tmp_path):
+    sub, ce = _job_dirs(tmp_path)
+    assert pf.derive_keep_state_for_ts(sub, ce, "TS_01", N_PER_TS) is None
+    pf.save_filtered_picks_for_ts(sub, ce, "TS_01", set(range(10)))
+    pf.save_filtered_picks_for_ts(sub, ce, "TS_02", {1, 2})
+    assert pf.derive_keep_state_for_ts(sub, ce, "TS_01", N_PER_TS) == set(range(10))
+    assert pf.derive_keep_state_for_ts(sub, ce, "TS_03", N_PER_TS) == set(range(N_PER_TS))
+    assert pf.read_reviewed_counts(sub) == {"TS_01": 10, "TS_02": 2}
+
+    assert pf.discard_ts_filter(sub, "TS_01") == "reverted_ts"
+    assert pf.derive_keep_state_for_ts(sub, ce, "TS_01", N_PER_TS) == set(range(N_PER_TS))
+    assert _filtered_rows(sub) == 2 + 2 * N_PER_TS
+
+    assert pf.discard_ts_filter(sub, "TS_02") == "removed_all"
+    for name in (pf.JOURNAL_NAME, pf.PARTICLES_FILTERED_NAME, pf.OPTIMISATION_SET_FILTERED_NAME):
+        assert not (sub / name).exists()
+    assert pf.discard_ts_filter(sub, "TS_02") == "noop"
+
+
+def test_journal_compaction_keeps_latest_decision(tmp_path, monkeypatch):
+    monkeypatch.setattr(pf, "JOURNAL_COMPACT_MIN_RECORDS", 8)
+    sub, ce = _job_dirs(tmp_path)
+    for i in range(12):
+        pf.save_filtered_picks_for_ts(sub, ce, "TS_03", set(range(i)))
+    assert len((sub / pf.JOURNAL_NAME).read_text().splitlines()) < 8
+    assert pf.read_reviewed_counts(sub) == {"TS_03": 11}
+    assert _filtered_rows(sub) == 11 + 2 * N_PER_TS
+
+
+def test_legacy_filtered_set_migrates_to_journal(tmp_path):
+    sub, ce = _job_dirs(tmp_path)
+    data = starfile.read(sub / pf.PARTICLES_NAME, always_dict=True)
+    particles = data["particles"]
+    legacy = particles[(particles["rlnTomoName"] != "TS_02") | (particles.index % 2 == 0)]
+    starfile.write({"optics": data["optics"], "particles": legacy}, sub / pf.PARTICLES_FILTERED_NAME)
+    (sub / pf.REVIEWED_SIDECAR_NAME).write_text(json.dumps({"TS_02": 25}))
+
+    assert pf.has_filtered_set(sub)
+    assert pf.read_reviewed_counts(sub) == {"TS_02": 25}
+    assert pf.ensure_filtered_materialized(sub)
+    assert (sub / pf.JOURNAL_NAME).exists()
+    assert not (sub / pf.REVIEWED_SIDECAR_NAME).exists()
+    assert _filtered_rows(sub) == len(legacy)
@@ -0,0 +1,63 @@
+"""PipelineMonitor scheduling: ticks while a reconcile is in flight."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from services import project_state
+from services.scheduling_and_orchestration import pipeline_monitor
+from services.scheduling_and_orchestration.pipeline_monitor import PipelineMonitor
+
+
+def _run_loop_with_slow_reconcile(monkeypatch, kick_midway: bool) -> tuple[int, int]:
+    project = Path("/tmp/crboost-test-project")
+    monkeypatch.setattr(project_state, "_project_states", {project: SimpleNamespace(pipeline_active=True, jobs={})})
+    monkeypatch.setattr(pipeline_monitor, "TICK_INTERVAL_SEC", 10.0)
+
+    async def scenario():
+        monitor = PipelineMonitor(backend=None)
+        reconciles = 0
+        ticks = 0
+
+        async def slow_reconcile(path):
+            nonlocal reconciles
+            reconciles += 1
+            await asyncio.sleep(0.5)
+            return {}
+
+        monitor._reconcile_one = slow_reconcile
+        tick_once = monitor._tick_once
+
+        async def counting_tick():
+            nonlocal ticks
+            ticks += 1
+            await tick_once()
+
+        monitor._tick_once = counting_tick
+        loop_task = asyncio.create_task(monitor._loop())
+        await asyncio.sleep(0.2)
+        if kick_midway:
+            monitor.kick(project)
+        await asyncio.sleep(0.6)
+        monitor._stopping.set()
+        monitor._wakeup.set()
+        await loop_task
+        for task in list(monitor._inflight.values()):
+            task.cancel()
+        return ticks, reconciles
+
+    return asyncio.run(scenario())
+
+
+def test_loop_does_not_spin_while_reconcile_in_flight(monkeypatch):
+    ticks, reconciles = _run_loop_with_slow_reconcile(monkeypatch, kick_midway=False)
+    assert reconciles == 1
+    # One tick per SCHEDULER_WAKE_SEC at most, plus the wakeup when the
+    # reconcile finishes; a spinning loop ticks tens of thousands of times.
+    assert ticks <= 5
+
+
+def test_kick_during_reconcile_runs_one_follow_up(monkeypatch):
+    ticks, reconciles = _run_loop_with_slow_reconcile(monkeypatch, kick_midway=True)
+    assert reconciles == 2
+    assert ticks <= 5
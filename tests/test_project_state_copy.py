@@ -0,0 +1,27 @@
+"""Cold project-state sections survive copying a lazily loaded state."""
+
+import copy
+
+from services.project_state import ProjectState
+
+
+def _saved_and_loaded(tmp_path) -> ProjectState:
+    state = ProjectState(project_name="copy-test", project_path=tmp_path)
+    state.tilt_metadata = {"TS_01_001": {"TiltAngle": -3.0}}
+    state.save(tmp_path / "project_params.json")
+    return ProjectState.load(tmp_path / "project_params.json")
+
+
+def test_model_copy_then_access_keeps_original_sections(tmp_path):
+    loaded = _saved_and_loaded(tmp_path)
+    clone = loaded.model_copy()
+    assert clone.tilt_metadata == {"TS_01_001": {"TiltAngle": -3.0}}
+    assert loaded.tilt_metadata == {"TS_01_001": {"TiltAngle": -3.0}}
+
+
+def test_deep_copy_then_access_keeps_original_sections(tmp_path):
+    loaded = _saved_and_loaded(tmp_path)
+    clone = copy.deepcopy(loaded)
+    assert clone.tilt_metadata == {"TS_01_001": {"TiltAngle": -3.0}}
+    assert loaded.tilt_metadata == {"TS_01_001": {"TiltAngle": -3.0}}
+    assert loaded.import_position_details == clone.import_position_details
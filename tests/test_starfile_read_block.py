@@ -0,0 +1,96 @@
+"""StarfileService.read_block: parity with starfile.read, and the cache bound."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import starfile
+
+from services.configs import starfile_service as ss
+
+N_PER_TS = 20
+
+
+@pytest.fixture
+def star_path(tmp_path):
+    rng = np.random.default_rng(1)
+    n = 3 * N_PER_TS
+    particles = pd.DataFrame(
+        {
+            "rlnTomoName": np.repeat(["TS_01", "TS_02", "TS_10"], N_PER_TS),
+            "rlnCoordinateX": np.round(rng.uniform(0, 4000, n), 3),
+            "rlnCoordinateY": np.round(rng.uniform(0, 4000, n), 3),
+            "rlnClassNumber": rng.integers(1, 4, n),
+            "rlnImageName": [f"subtomo/p{i:05d}.mrcs" for i in range(n)],
+        }
+    )
+    optics = pd.DataFrame({"rlnOpticsGroup": [1], "rlnOpticsGroupName": ["opticsGroup1"]})
+    general = {"rlnTomoSubTomosAre2DStacks": 1}
+    path = tmp_path / "particles.star"
+    starfile.write({"general": general, "optics": optics, "particles": particles}, path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(ss, "_block_cache", type(ss._block_cache)())
+    monkeypatch.setattr(ss, "_block_cache_bytes", 0)
+
+
+def test_full_block_matches_starfile(star_path):
+    ref = starfile.read(star_path, always_dict=True)
+    svc = ss.StarfileService()
+    for name in ("optics", "particles"):
+        pd.testing.assert_frame_equal(svc.read_block(star_path, name), ref[name])
+
+
+def test_columns_and_where_match_filtered_starfile(star_path):
+    ref = starfile.read(star_path, always_dict=True)["particles"]
+    cols = ["rlnCoordinateX", "rlnClassNumber", "rlnImageName"]
+    got = ss.StarfileService().read_block(star_path, "particles", columns=cols, where={"rlnTomoName": "TS_01"})
+    want = ref.loc[ref["rlnTomoName"] == "TS_01", cols].reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, want)
+    # Exact token match: "TS_1" must not pick up TS_10 / TS_01 by substring.
+    assert ss.StarfileService().read_block(star_path, "particles", where={"rlnTomoName": "TS_1"}).empty
+
+
+def test_block_selection_and_missing(star_path):
+    svc = ss.StarfileService()
+    first = svc.read_block(star_path, columns=["rlnOpticsGroupName"])
+    assert first["rlnOpticsGroupName"].tolist() == ["opticsGroup1"]
+    by_cols = svc.read_block(star_path, columns=["rlnImageName"])
+    assert len(by_cols) == 3 * N_PER_TS
+    assert svc.read_block(star_path, "nope") is None
+    assert svc.read_block(star_path, "optics", columns=["rlnImageName"]) is None
+    with pytest.raises(FileNotFoundError):
+        svc.read_block(star_path.with_name("missing.star"), "particles")
+
+
+def test_cached_result_is_a_copy_and_tracks_rewrites(star_path):
+    svc = ss.StarfileService()
+    a = svc.read_block(star_path, "particles")
+    a.loc[0, "rlnClassNumber"] = 99
+    assert svc.read_block(star_path, "particles").loc[0, "rlnClassNumber"] != 99
+
+    data = starfile.read(star_path, always_dict=True)
+    data["particles"] = data["particles"].iloc[:5]
+    starfile.write(data, star_path)
+    assert len(svc.read_block(star_path, "particles")) == 5
+
+
+def test_cache_is_bounded_by_bytes(star_path, monkeypatch):
+    svc = ss.StarfileService()
+    size = int(svc.read_block(star_path, "particles").memory_usage(deep=True).sum())
+    ss._block_cache.clear()
+    ss._block_cache_bytes = 0
+
+    monkeypatch.setattr(ss, "_BLOCK_CACHE_MAX_ENTRY_BYTES", size - 1)
+    svc.read_block(star_path, "particles")
+    assert len(ss._block_cache) == 0
+
+    monkeypatch.setattr(ss, "_BLOCK_CACHE_MAX_ENTRY_BYTES", size)
+    monkeypatch.setattr(ss, "_BLOCK_CACHE_MAX_BYTES", size + size // 2)
+    svc.read_block(star_path, "particles")
+    svc.read_block(star_path, "particles", columns=["rlnTomoName", "rlnImageName"])
+    assert len(ss._block_cache) == 1
+    assert ss._block_cache_bytes <= ss._BLOCK_CACHE_MAX_BYTES
+    assert ss._block_cache_bytes == sum(nbytes for _, nbytes in ss._block_cache.values())
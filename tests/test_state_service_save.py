@@ -0,0 +1,108 @@
+"""StateService.save_project: coalesced writes and durability barriers."""
+
+import asyncio
+import time
+
+import pytest
+
+from services import project_state
+from services.project_state import ProjectState, StateService
+
+WINDOW = 0.05
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    state = ProjectState(project_name="save-test", project_path=tmp_path.resolve())
+    monkeypatch.setattr(project_state, "_project_states", {tmp_path.resolve(): state})
+    monkeypatch.setattr(project_state, "SAVE_COALESCE_SEC", WINDOW)
+    return tmp_path, state
+
+
+def _writes(svc: StateService, tmp_path) -> int:
+    metrics = svc.get_save_metrics().get(tmp_path.resolve() / "project_params.json")
+    return metrics.writes if metrics else 0
+
+
+def test_burst_of_requests_is_one_write(project):
+    tmp_path, _ = project
+
+    async def scenario():
+        svc = StateService()
+        for _ in range(10):
+            await svc.save_project(project_path=tmp_path, force=True)
+        assert _writes(svc, tmp_path) == 0
+        await asyncio.sleep(WINDOW * 4)
+        return svc
+
+    svc = asyncio.run(scenario())
+    metrics = svc.get_save_metrics()[tmp_path.resolve() / "project_params.json"]
+    assert (metrics.requests, metrics.writes) == (10, 1)
+    assert ProjectState.load(tmp_path / "project_params.json").project_name == "save-test"
+
+
+def test_clean_state_is_not_written(project):
+    tmp_path, _ = project
+
+    async def scenario():
+        svc = StateService()
+        await svc.save_project(project_path=tmp_path)
+        await asyncio.sleep(WINDOW * 2)
+        return svc
+
+    assert _writes(asyncio.run(scenario()), tmp_path) == 0
+    assert not (tmp_path / "project_params.json").exists()
+
+
+def test_durable_save_writes_now_and_cancels_the_timer(project):
+    tmp_path, _ = project
+
+    async def scenario():
+        svc = StateService()
+        await svc.save_project(project_path=tmp_path, force=True)
+        await svc.save_project(project_path=tmp_path, durable=True)
+        assert _writes(svc, tmp_path) == 1
+        assert (tmp_path / "project_params.json").exists()
+        await asyncio.sleep(WINDOW * 3)
+        assert _writes(svc, tmp_path) == 1
+
+    asyncio.run(scenario())
+
+
+def test_request_during_write_gets_its_own_write(project, monkeypatch):
+    tmp_path, state = project
+    original_save = ProjectState.save
+
+    def slow_save(self, path=None):
+        time.sleep(WINDOW * 2)
+        original_save(self, path)
+
+    monkeypatch.setattr(ProjectState, "save", slow_save)
+
+    async def scenario():
+        svc = StateService()
+        state.mark_dirty()
+        flushing = asyncio.create_task(svc.flush_project(tmp_path))
+        await asyncio.sleep(WINDOW / 2)
+        state.project_name = "renamed"
+        await svc.save_project(project_path=tmp_path, force=True)
+        await flushing
+        assert _writes(svc, tmp_path) == 1
+        await asyncio.sleep(WINDOW * 5)
+        assert _writes(svc, tmp_path) == 2
+
+    asyncio.run(scenario())
+    assert ProjectState.load(tmp_path / "project_params.json").project_name == "renamed"
+
+
+def test_flush_all_writes_pending_saves(project):
+    tmp_path, _ = project
+
+    async def scenario():
+        svc = StateService()
+        await svc.save_project(project_path=tmp_path, force=True)
+        await svc.flush_all()
+        assert _writes(svc, tmp_path) == 1
+        assert not svc._pending_saves
+
+    asyncio.run(scenario())
@@ -0,0 +1,103 @@
+"""Pick -> .mrcs index: persisted .pick_index.npz round-trip, staleness, lookups."""
+
+import os
+import pickle
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import starfile
+
+from services.models_base import JobType
+from services.visualization import subtomo_link as sl
+
+
+def _write_particles(job_dir: Path, picks: dict, visible=True) -> None:
+    tomos = [t for t, coords in picks.items() for _ in coords]
+    coords = np.asarray([c for cs in picks.values() for c in cs], dtype=float)
+    df = pd.DataFrame(
+        {
+            "rlnTomoName": tomos,
+            sl._COORD_COLS[0]: coords[:, 0],
+            sl._COORD_COLS[1]: coords[:, 1],
+            sl._COORD_COLS[2]: coords[:, 2],
+            "rlnImageName": [f"{job_dir.name}/Subtomograms/{t}_{i}.mrcs" for i, t in enumerate(tomos)],
+        }
+    )
+    if visible:
+        df["rlnTomoVisibleFrames"] = "[0,1,1]"
+    starfile.write({"particles": df}, job_dir / "particles.star")
+
+
+def _project(tmp_path, n_jobs=2):
+    jobs = {}
+    for i in range(1, n_jobs + 1):
+        name = f"External/job{i:03d}"
+        (tmp_path / name).mkdir(parents=True)
+        jobs[f"subtomo_{i}"] = SimpleNamespace(job_type=JobType.SUBTOMO_EXTRACTION, relion_job_name=name + "/")
+    jobs["other"] = SimpleNamespace(job_type=JobType.TEMPLATE_EXTRACT_PYTOM, relion_job_name="External/job099/")
+    return SimpleNamespace(jobs=jobs, job_path_mapping={})
+
+
+def test_index_round_trips_through_npz(tmp_path, monkeypatch):
+    state = _project(tmp_path, 1)
+    job = tmp_path / "External/job001"
+    _write_particles(job, {"TS_01": [[10.0, -20.5, 3.1], [100.2, 0.0, -7.7]]})
+
+    first = sl.build_pick_to_mrcs_index(tmp_path, state, tmp_path)
+    assert (job / sl.PICK_INDEX_FILENAME).exists()
+
+    def no_star_read(_):
+        raise AssertionError("particles.star re-read despite a current pick index")
+
+    monkeypatch.setattr(sl, "_read_job_pick_columns", no_star_read)
+    second = sl.build_pick_to_mrcs_index(tmp_path, state, tmp_path)
+    assert len(second) == len(first) == 2
+    hit = sl.lookup_for_pick(second, "TS_01", 100.2, 0.0, -7.7)
+    assert hit == {
+        "mrcs": tmp_path / "job001/Subtomograms/TS_01_1.mrcs",
+        "visible_frames": [0, 1, 1],
+        "src_job_dir": job,
+    }
+    assert sl.lookup_for_pick(second, "TS_01", 100.2, 0.0, -7.9) is None
+    assert sl.lookup_for_pick(second, "TS_02", 100.2, 0.0, -7.7) is None
+
+
+def test_rewritten_particles_star_rebuilds_index(tmp_path):
+    state = _project(tmp_path, 1)
+    job = tmp_path / "External/job001"
+    _write_particles(job, {"TS_01": [[1.0, 2.0, 3.0]]})
+    sl.build_pick_to_mrcs_index(tmp_path, state, tmp_path)
+
+    _write_particles(job, {"TS_01": [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]}, visible=False)
+    st = os.stat(job / "particles.star")
+    os.utime(job / "particles.star", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    index = sl.build_pick_to_mrcs_index(tmp_path, state, tmp_path)
+    assert len(index) == 2
+    assert sl.lookup_for_pick(index, "TS_01", 4.0, 5.0, 6.0)["visible_frames"] is None
+
+
+def test_unreadable_cache_is_rebuilt(tmp_path):
+    state = _project(tmp_path, 1)
+    job = tmp_path / "External/job001"
+    _write_particles(job, {"TS_01": [[1.0, 2.0, 3.0]]})
+    (job / sl.PICK_INDEX_FILENAME).write_bytes(b"not an npz")
+    index = sl.build_pick_to_mrcs_index(tmp_path, state, tmp_path)
+    assert sl.lookup_for_pick(index, "TS_01", 1.0, 2.0, 3.0) is not None
+    with np.load(job / sl.PICK_INDEX_FILENAME, allow_pickle=False) as z:
+        assert z["sig"][0] == sl.PICK_INDEX_VERSION
+
+
+def test_later_job_wins_collisions_and_split_keeps_order(tmp_path):
+    state = _project(tmp_path, 2)
+    _write_particles(tmp_path / "External/job001", {"TS_01": [[1.0, 2.0, 3.0], [9.0, 9.0, 9.0]]})
+    _write_particles(tmp_path / "External/job002", {"TS_01": [[1.0, 2.0, 3.0]], "TS_02": [[1.0, 2.0, 3.0]]})
+
+    index = sl.build_pick_to_mrcs_index(tmp_path, state, tmp_path)
+    assert sl.lookup_for_pick(index, "TS_01", 1.0, 2.0, 3.0)["src_job_dir"].name == "job002"
+    assert sl.lookup_for_pick(index, "TS_01", 9.0, 9.0, 9.0)["src_job_dir"].name == "job001"
+
+    per_tomo = sl.PickIndex.split_by_tomo(pickle.loads(pickle.dumps(index)))
+    assert set(per_tomo) == {"TS_01", "TS_02"}
+    assert sl.lookup_for_pick(per_tomo["TS_01"], "TS_01", 1.0, 2.0, 3.0)["src_job_dir"].name == "job002"
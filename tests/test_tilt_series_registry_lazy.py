@@ -0,0 +1,115 @@
+"""Lazy TiltSeriesRegistry: index-only load, LRU eviction, pinning, reindex."""
+
+from pathlib import Path
+
+import pytest
+
+from services.tilt_series.models import Frame, TiltSeries
+from services.tilt_series.registry import TiltSeriesRegistry
+
+
+def _ts(ts_id: str, n_frames: int = 3) -> TiltSeries:
+    frames = [
+        Frame(
+            id=f"{ts_id}_{i:03d}",
+            tilt_series_id=ts_id,
+            raw_path=Path(f"/raw/{ts_id}_{i:03d}.eer"),
+            raw_filename=f"{ts_id}_{i:03d}.eer",
+            tilt_index=i,
+            nominal_tilt_angle_deg=3.0 * i,
+        )
+        for i in range(n_frames)
+    ]
+    return TiltSeries(
+        id=ts_id, mdoc_path=Path(f"/raw/{ts_id}.mdoc"), mdoc_filename=f"{ts_id}.mdoc",
+        stage_position=0, beam_position=0, frames=frames,
+    )
+
+
+def _saved_project(tmp_path, n_ts: int) -> Path:
+    reg = TiltSeriesRegistry(tmp_path)
+    for i in range(n_ts):
+        reg.add_tilt_series(_ts(f"TS_{i:02d}"))
+    reg.save()
+    return tmp_path
+
+
+def _count_sidecar_reads(monkeypatch) -> list:
+    reads = []
+    original = TiltSeriesRegistry._read_sidecar
+
+    def counting(ts_path):
+        reads.append(Path(ts_path).stem)
+        return original(ts_path)
+
+    monkeypatch.setattr(TiltSeriesRegistry, "_read_sidecar", staticmethod(counting))
+    return reads
+
+
+def test_lazy_load_reads_only_the_index(tmp_path, monkeypatch):
+    _saved_project(tmp_path, 5)
+    reads = _count_sidecar_reads(monkeypatch)
+    reg = TiltSeriesRegistry(tmp_path, lazy=True)
+    reg.load()
+    assert reads == []
+    assert reg.resident_count() == 0
+    assert reg.frame_count() == 15
+    assert reg.frame_by_filename("TS_03_001.eer").tilt_series_id == "TS_03"
+    assert reads == ["TS_03"]
+
+
+def test_lru_eviction_bounds_resident_set(tmp_path):
+    _saved_project(tmp_path, 6)
+    reg = TiltSeriesRegistry(tmp_path, lazy=True, max_resident=2)
+    reg.load()
+    for ts in reg.all_tilt_series():
+        assert ts.frame_count == 3
+    assert reg.resident_count() == 2
+
+
+def test_pinned_keeps_batch_resident(tmp_path, monkeypatch):
+    _saved_project(tmp_path, 6)
+    reads = _count_sidecar_reads(monkeypatch)
+    reg = TiltSeriesRegistry(tmp_path, lazy=True, max_resident=2)
+    reg.load()
+    ids = reg.tilt_series_ids()
+    with reg.pinned():
+        for ts_id in ids:
+            reg.get_tilt_series(ts_id)
+        for ts_id in ids:
+            reg.get_tilt_series(ts_id)
+        assert reg.resident_count() == 6
+    assert sorted(reads) == ids
+    assert reg.resident_count() == 2
+
+
+def test_dirty_series_survive_eviction_until_saved(tmp_path):
+    _saved_project(tmp_path, 4)
+    reg = TiltSeriesRegistry(tmp_path, lazy=True, max_resident=1)
+    reg.load()
+    first = reg.get_tilt_series("TS_00")
+    first.is_selected = False
+    reg._dirty_ts.add("TS_00")
+    for ts_id in ("TS_01", "TS_02", "TS_03"):
+        reg.get_tilt_series(ts_id)
+    assert reg.get_tilt_series("TS_00") is first
+    reg.save()
+    assert reg.resident_count() == 1
+    reloaded = TiltSeriesRegistry(tmp_path, lazy=True)
+    reloaded.load()
+    assert reloaded.get_tilt_series("TS_00").is_selected is False
+
+
+def test_reindex_replaces_only_the_series_own_entries(tmp_path):
+    reg = TiltSeriesRegistry(tmp_path, lazy=True)
+    reg.add_tilt_series(_ts("TS_A", 4))
+    reg.add_tilt_series(_ts("TS_B", 2))
+    reg.add_tilt_series(_ts("TS_A", 2), overwrite=True)
+    assert reg.frame_count() == 4
+    with pytest.raises(KeyError):
+        reg.get_frame("TS_A_003")
+    assert reg.get_frame("TS_B_001").tilt_series_id == "TS_B"
+    reg.remove_tilt_series("TS_B")
+    with pytest.raises(KeyError):
+        reg.frame_by_filename("TS_B_000.eer")
+    assert reg.frame_by_filename("TS_A_001.eer").id == "TS_A_001"
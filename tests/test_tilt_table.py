@@ -0,0 +1,84 @@
+"""Tilt table: round-trip against the per-TS STARs, freshness, cache bound."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import starfile
+
+from services.tilt_series import tilt_table as tt
+
+
+def _tilts(ts_id: str, n: int = 4) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "rlnMicrographMovieName": [f"frames/{ts_id}_{i:03d}.eer" for i in range(n)],
+            "rlnTomoNominalStageTiltAngle": np.arange(n, dtype=float) * 3.0,
+            "rlnMicrographPreExposure": np.arange(n, dtype=float) * 2.5,
+            "rlnTomoTiltMovieFrameCount": np.full(n, 40, dtype=int),
+        }
+    )
+
+
+def _emit(tilt_dir, ts_ids=("TS_01", "TS_02")):
+    per_ts = {ts_id: _tilts(ts_id, 3 + i) for i, ts_id in enumerate(ts_ids)}
+    for ts_id, df in per_ts.items():
+        starfile.write({ts_id: df}, tilt_dir / f"{ts_id}.star")
+    return tt.write_tilt_table(tilt_dir, per_ts)
+
+
+def test_round_trip_matches_star(tmp_path):
+    assert _emit(tmp_path) == tmp_path / tt.TILT_TABLE_FILENAME
+    for ts_id in ("TS_01", "TS_02"):
+        star = tmp_path / f"{ts_id}.star"
+        from_table = tt.read_ts_tilts(star)
+        assert from_table is not None
+        pd.testing.assert_frame_equal(from_table, starfile.read(star), check_dtype=False)
+    table = tt.open_tilt_table(tmp_path)
+    assert table.ts_ids() == ["TS_01", "TS_02"]
+    assert table.frame_ids("TS_01") == ["TS_01_000", "TS_01_001", "TS_01_002"]
+
+
+def test_changed_star_is_not_shadowed(tmp_path):
+    _emit(tmp_path)
+    star = tmp_path / "TS_01.star"
+    edited = _tilts("TS_01", 3)
+    edited["rlnMicrographPreExposure"] += 1.0
+    starfile.write({"TS_01": edited}, star)
+    st = os.stat(star)
+    os.utime(star, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert tt.read_ts_tilts(star) is None
+    assert tt.read_ts_tilts(tmp_path / "TS_02.star") is not None
+
+    # Even an older-looking STAR is stale if its signature differs.
+    os.utime(star, ns=(1, 1))
+    assert tt.read_ts_tilts(star) is None
+
+
+def test_unknown_ts_and_missing_table_fall_back(tmp_path):
+    _emit(tmp_path)
+    starfile.write({"TS_09": _tilts("TS_09")}, tmp_path / "TS_09.star")
+    assert tt.read_ts_tilts(tmp_path / "TS_09.star") is None
+    (tmp_path / tt.TILT_TABLE_FILENAME).unlink()
+    assert tt.read_ts_tilts(tmp_path / "TS_01.star") is None
+
+
+def test_mismatched_schemas_remove_old_table(tmp_path):
+    _emit(tmp_path)
+    per_ts = {"TS_01": _tilts("TS_01"), "TS_02": _tilts("TS_02").drop(columns=["rlnMicrographPreExposure"])}
+    assert tt.write_tilt_table(tmp_path, per_ts) is None
+    assert not (tmp_path / tt.TILT_TABLE_FILENAME).exists()
+
+
+def test_open_tables_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(tt, "_OPEN_TABLES_MAX", 2)
+    monkeypatch.setattr(tt, "_open_tables", type(tt._open_tables)())
+    dirs = []
+    for i in range(4):
+        d = tmp_path / f"job{i}"
+        d.mkdir()
+        _emit(d)
+        assert tt.open_tilt_table(d) is not None
+        dirs.append(d)
+    assert len(tt._open_tables) == 2
+    assert tt.open_tilt_table(dirs[-1]) is tt.open_tilt_table(dirs[-1])
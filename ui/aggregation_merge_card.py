@@ -817,16 +817,19 @@ async def _pick_manual_path() -> None:
 # ---------------------------------------------------------------------------
 
 
-def _run_merge_sync(merged_dir: Path, sources: list) -> dict:
+def _run_merge_sync(merged_dir: Path, aggregation_sources: list) -> dict:
     from drivers.subtomo_merge import merge_optimisation_sets_into_jobdir
 
+    # Resolving the canonical optsets may materialize curated particle sets
+    # (full STAR read + write per source), so it runs here, off the loop.
+    sources = _build_merge_sources(aggregation_sources)
     merged_dir.mkdir(parents=True, exist_ok=True)
     return merge_optimisation_sets_into_jobdir(
         job_dir=merged_dir, additional_sources=sources, allow_no_primary=True
     )
 
 
-def _build_merge_sources(state) -> list:
+def _build_merge_sources(aggregation_sources: list) -> list:
     """Turn AggregationSource entries into the driver's source dicts.
 
     Base path is each source's curated (filtered-if-present) optimisation_set,
@@ -838,7 +841,7 @@ def _build_merge_sources(state) -> list:
     from services.visualization.picks_filter import resolve_canonical_optset
 
     out = []
-    for s in state.aggregation_sources or []:
+    for s in aggregation_sources:
         p = Path(s.optset_path)
         if p.is_file() and p.name.endswith(".star"):
             canonical = resolve_canonical_optset(p.parent)
@@ -921,10 +924,9 @@ async def _run_merge() -> None:
     slug = _slugify(name, {m.slug for m in (state.aggregation_merges or [])})
     merged_dir = root / slug
 
-    sources = _build_merge_sources(state)
     ui.notify("Merging…", type="info", timeout=2500)
     try:
-        summary = await run.io_bound(_run_merge_sync, merged_dir, sources)
+        summary = await run.io_bound(_run_merge_sync, merged_dir, list(state.aggregation_sources))
     except Exception as e:
         ui.notify(f"Merge failed: {e}", type="negative", timeout=8000)
         return
@@ -23,7 +23,14 @@ Register as an extra tab via the plugin system:
 from pathlib import Path
 from typing import Dict, List
 
-from nicegui import ui
+from nicegui import background_tasks, ui
+
+from services.array_progress import get_array_progress_tracker
+from services.task_files import (
+    read_manifest as _read_manifest,
+    scan_statuses as _scan_statuses,
+    resolve_job_dir,
+)
 
 from ui.components.task_utils import (
     shorten_ts_names,
@@ -31,9 +38,6 @@ from ui.components.task_utils import (
     ts_anchor_id,
     read_tail as _read_tail,
     escape_html as _escape_html,
-    read_manifest as _read_manifest,
-    scan_statuses as _scan_statuses,
-    resolve_job_dir,
 )
 from ui.styles import MONO
 
@@ -45,6 +49,10 @@ _RUNNING = "running"
 _PENDING = "pending"
 _SKIP = "skip"
 
+# Longest a follower waits on the tracker before re-checking that its widget
+# still exists.
+_FOLLOW_TIMEOUT_SEC = 30.0
+
 _CHIP = {
     _OK: ("check_circle", "#16a34a", "#f0fdf4"),
     _FAIL: ("error", "#dc2626", "#fef2f2"),
@@ -114,20 +122,31 @@ def render_array_task_tracker(instance_id: str, job_model, ui_mgr) -> None:
             with ui.column().classes("w-full gap-0").style("padding: 0;"):
                 row_widgets = _build_task_rows(display_order, item_to_task_idx, job_dir, instance_id, focus_target)
 
-    # Initial status update
-    statuses = _scan_statuses(job_dir, items)
-    _update_summary(summary_container, statuses, item_label)
-    _update_progress(progress_bar, statuses)
-    _apply_statuses_to_rows(row_widgets, statuses)
-
-    # Poll timer — only updates summary/progress/row badges, never rebuilds rows
-    def _poll():
-        s = _scan_statuses(job_dir, items)
+    def _apply(s: Dict[str, str]) -> None:
         _update_summary(summary_container, s, item_label)
         _update_progress(progress_bar, s)
         _apply_statuses_to_rows(row_widgets, s)
 
-    ui.timer(5.0, _poll)
+    # Initial status update
+    tracker = get_array_progress_tracker()
+    progress = tracker.get(job_dir)
+    _apply(progress.statuses if progress is not None else _scan_statuses(job_dir, items))
+
+    # Follow the shared tracker — only updates summary/progress/row badges,
+    # never rebuilds rows. Awaits the next change instead of re-listing
+    # .task_status/ on a timer; ends once the widget is gone.
+    async def _follow(version: int) -> None:
+        while not summary_container.is_deleted:
+            fresh = await tracker.wait_for_change(job_dir, version, timeout=_FOLLOW_TIMEOUT_SEC)
+            if summary_container.is_deleted:
+                return
+            if fresh is not None and fresh.version != version:
+                version = fresh.version
+                _apply(fresh.statuses)
+
+    background_tasks.create(
+        _follow(progress.version if progress is not None else 0), name=f"task-tracker:{instance_id}"
+    )
 
     # Scroll the focused TS into view after the DOM settles.
     if focus_target is not None:
@@ -1,9 +1,9 @@
 import asyncio
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from nicegui import ui
+from services.array_progress import get_array_progress_tracker
 from services.models_base import JobStatus
 from services.project_state import JobType, get_project_state
 
@@ -93,54 +93,24 @@ def _get_array_progress(job_model, project_path: Optional[Path] = None) -> Optio
     job_dir = _resolve_array_job_dir(job_model, project_path)
     if job_dir is None:
         return None
-
-    manifest_path = job_dir / ".task_manifest.json"
-    if not manifest_path.exists():
-        return None
-    try:
-        manifest = json.loads(manifest_path.read_text())
-    except Exception:
-        return None
-    items = manifest.get("items", [])
-    if not items:
-        return None
-
-    status_dir = job_dir / ".task_status"
-    n_ok = 0
-    n_fail = 0
-    if status_dir.is_dir():
-        for p in status_dir.iterdir():
-            if p.suffix == ".ok":
-                n_ok += 1
-            elif p.suffix == ".fail":
-                n_fail += 1
-    return (n_ok + n_fail, n_fail, len(items))
+    progress = get_array_progress_tracker().get(job_dir)
+    return progress.counts if progress is not None else None
 
 
 def _get_array_ts_statuses(
     job_model, project_path: Optional[Path] = None
 ) -> Optional[Tuple[List[str], Dict[str, str], Dict[str, str]]]:
     """Return (items, statuses, display_names) for per-TS sub-rows, or None."""
-    from ui.components.task_utils import shorten_ts_names, scan_statuses
+    from ui.components.task_utils import shorten_ts_names
 
     job_dir = _resolve_array_job_dir(job_model, project_path)
     if job_dir is None:
         return None
-
-    manifest_path = job_dir / ".task_manifest.json"
-    if not manifest_path.exists():
-        return None
-    try:
-        manifest = json.loads(manifest_path.read_text())
-    except Exception:
+    progress = get_array_progress_tracker().get(job_dir)
+    if progress is None:
         return None
-    items = manifest.get("items", [])
-    if not items:
-        return None
-
-    statuses = scan_statuses(job_dir, items)
-    display_names = shorten_ts_names(items)
-    return items, statuses, display_names
+    items = list(progress.items)
+    return items, progress.statuses, shorten_ts_names(items)
 
 
 class RosterWidget(FingerprintedView):
@@ -208,18 +178,15 @@ class RosterWidget(FingerprintedView):
     def signature(self) -> Any:
         """Fingerprint of every input the roster's render() reads.
 
-        Cheap in-memory reads dominate. Per-array-job disk reads (~25 file
-        existence checks per array job) match what render() does today, so
-        the signature path is not adding new I/O — it lets us skip the
-        more expensive DOM rebuild downstream.
+        Cheap in-memory reads dominate. Array-job progress comes from the
+        process-wide ArrayProgressTracker, which every open tab shares and
+        which only re-lists a job's .task_status/ when its mtime moved.
         """
         panel = self.panel
         ui_mgr = panel.ui_mgr
         jobs = panel.state_service.state.jobs
 
         # Populate caches that render() will re-read so the two stay in lockstep.
-        # (No memoization across signature+render; they touch the same files,
-        # but file-system caching makes the second read cheap.)
         self._array_progress_cache = {}
         self._array_ts_cache = {}
         for iid, jm in jobs.items():
@@ -4,10 +4,13 @@ Per-tab UI refresher.
 Reconciliation (reading exit markers, patching default_pipeline.star,
 clearing pipeline_active on failure) is owned by the server-side
 PipelineMonitor (services/.../pipeline_monitor.py). This class is purely
-a UI tick: every 3 s it asks the roster to re-render from the in-memory
-state and watches for `pipeline_active` transitions so it can flip the
-per-tab `ui_mgr.is_running` flag, stop the spinner, and notify the user
-when the pipeline finishes.
+a UI tick: every second it compares a cheap signature of the in-memory job
+statuses and asks the roster to re-render when it changed (and at least
+every FULL_REFRESH_TICKS ticks regardless). It also watches for
+`pipeline_active` transitions so it can flip the per-tab
+`ui_mgr.is_running` flag, stop the spinner, and notify the user when the
+pipeline finishes. The monitor reacts to exit markers within about a
+second, so the one-second tick is what bounds the UI latency.
 
 Multi-tab safety: two browser tabs on the same project share one
 ProjectState (path-keyed registry). Both their refreshers observe the
@@ -29,6 +32,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+UI_TICK_SEC = 1.0
+# Re-render unconditionally every this many ticks; the roster also shows
+# things (e.g. timings) the status signature doesn't cover.
+FULL_REFRESH_TICKS = 3
+
 
 class StatusPoller:
     def __init__(self, panel: "PipelineBuilderPanel"):
@@ -36,6 +44,8 @@ class StatusPoller:
         # `None` on first tick means "no prior observation"; first tick
         # only records, doesn't fire transitions.
         self._last_active: Optional[bool] = None
+        self._last_signature: Optional[tuple] = None
+        self._ticks_since_refresh = 0
 
     async def check_and_update_statuses(self):
         """One UI tick. Reads in-memory state (already kept fresh by
@@ -46,12 +56,6 @@ class StatusPoller:
         if not project_path:
             return
 
-        # Roster reads in-memory job_model.execution_status — cheap.
-        panel.roster.refresh()
-
-        overview = await panel.backend.get_pipeline_overview(str(project_path))
-        panel.roster.update_status_label(overview)
-
         state = get_project_state_for(project_path)
         # `pipeline_active` is the monitor's source of truth; OR with
         # is_active() so a freshly-started pipeline (state already True,
@@ -59,6 +63,19 @@ class StatusPoller:
         # first tick.
         current = bool(state.pipeline_active) or panel.backend.pipeline_runner.is_active(project_path)
 
+        signature = (current, tuple((iid, job.execution_status) for iid, job in state.jobs.items()))
+        self._ticks_since_refresh += 1
+        if signature == self._last_signature and self._ticks_since_refresh < FULL_REFRESH_TICKS:
+            return
+        self._last_signature = signature
+        self._ticks_since_refresh = 0
+
+        # Roster reads in-memory job_model.execution_status — cheap.
+        panel.roster.refresh()
+
+        overview = await panel.backend.get_pipeline_overview(str(project_path))
+        panel.roster.update_status_label(overview)
+
         if self._last_active is None:
             self._last_active = current
             return
@@ -96,7 +113,7 @@ class StatusPoller:
 
     async def startup_sync(self):
         """Fires when a workspace tab mounts. Records the initial
-        pipeline_active state and starts the 3-s UI refresher. We don't
+        pipeline_active state and starts the UI refresher. We don't
         call sync_all_jobs here — the server monitor already keeps state
         fresh."""
         panel = self.panel
@@ -122,4 +139,4 @@ class StatusPoller:
         # another tab (or by restart-recovery) shows up here without
         # needing a manual refresh.
         if panel.ui_mgr.status_timer is None:
-            panel.ui_mgr.status_timer = ui.timer(3.0, self.safe_status_check)
+            panel.ui_mgr.status_timer = ui.timer(UI_TICK_SEC, self.safe_status_check)
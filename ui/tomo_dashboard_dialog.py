@@ -35,103 +35,48 @@ from nicegui import ui
 
 from services.models_base import JobStatus, JobType
 from services.project_state import get_project_state
+from services.task_files import resolve_job_dir
 from services.templating.template_metadata import get_effective_template_path, read_template_header
 from services.tilt_series.build import _infer_position
 from services.visualization.imod_vis import generate_candidate_vis
+from services.visualization.journey_table import (
+    _PREP_STAGES,
+    _SPECIES_OVERLAY_COLORS,
+    _candidate_extract_instances,
+    _find_job_by_type,
+    _job_dir_for,
+    _matching_subtomo_instance,
+    _read_tomograms_table,
+    _resolve_species,
+    _resolve_volume_for_3dmod,
+    _split_species_id,
+    _subtomo_extract_instances,
+    get_journey_service,
+)
 from services.visualization.preview_orchestrator import (
     _find_warp_tomo_preview,
     generate_candidate_previews,
     read_preview_manifest,
 )
-from services.visualization.preview_render import is_output_stale, render_xy_slab_preview, render_xz_slab_preview
-from ui.components.task_utils import read_manifest, resolve_job_dir, scan_statuses
+from services.visualization.preview_render import (
+    cached_tomogram_views,
+    is_output_stale,
+    pick_row,
+    picks_columns,
+    picks_count,
+    polarity_stats,
+    render_xy_slab_preview,
+    render_xz_slab_preview,
+)
 
 logger = logging.getLogger(__name__)
 
 
-# Per-species overlay colors for the shared tomogram canvas. Indexed by the
-# candidate-extract instance's sorted position so a species keeps its color
-# across re-renders (and matches its checkbox). Maximally-saturated hues that
-# are absent from a greyscale tomogram (no mid-grays) so the dots pop; the
-# .cb-pick-ghost dual halo (dark + light ring) keeps them legible on both the
-# bright and dark ends of the backdrop.
-_SPECIES_OVERLAY_COLORS = [
-    "#ff1744",  # vivid red
-    "#00e5ff",  # vivid cyan
-    "#ffea00",  # vivid yellow
-    "#d500f9",  # vivid magenta-purple
-    "#76ff03",  # neon green
-    "#2979ff",  # vivid blue
-    "#ff9100",  # vivid orange
-    "#f50057",  # vivid pink
-]
-
-
 # ---------------------------------------------------------------------------
 # Discovery helpers
 # ---------------------------------------------------------------------------
 
 
-def _candidate_extract_instances(state) -> list[tuple[str, object]]:
-    out: list[tuple[str, object]] = []
-    for instance_id, job_model in state.jobs.items():
-        if getattr(job_model, "job_type", None) == JobType.TEMPLATE_EXTRACT_PYTOM:
-            out.append((instance_id, job_model))
-    return sorted(out, key=lambda kv: kv[0])
-
-
-def _subtomo_extract_instances(state) -> list[tuple[str, object]]:
-    out: list[tuple[str, object]] = []
-    for instance_id, job_model in state.jobs.items():
-        if getattr(job_model, "job_type", None) == JobType.SUBTOMO_EXTRACTION:
-            out.append((instance_id, job_model))
-    return sorted(out, key=lambda kv: kv[0])
-
-
-def _job_dir_for(instance_id: str, job_model, project_path: Path) -> Optional[Path]:
-    rjn = getattr(job_model, "relion_job_name", None)
-    if rjn:
-        d = project_path / rjn.rstrip("/")
-        if d.is_dir():
-            return d
-    state = get_project_state()
-    mapped = (state.job_path_mapping or {}).get(instance_id)
-    if mapped:
-        d = project_path / mapped.rstrip("/")
-        if d.is_dir():
-            return d
-    return None
-
-
-def _read_tomograms_table(tomograms_star: Path) -> Optional[pd.DataFrame]:
-    if not tomograms_star.exists():
-        return None
-    try:
-        import starfile
-
-        data = starfile.read(tomograms_star, always_dict=True)
-        for v in data.values():
-            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
-                return v
-    except Exception as e:
-        logger.warning("Could not read %s: %s", tomograms_star, e)
-    return None
-
-
-def _resolve_volume_for_3dmod(tomo_row: pd.Series, project_path: Path) -> Optional[Path]:
-    if "rlnTomoReconstructedTomogram" not in tomo_row.index:
-        return None
-    p = Path(str(tomo_row["rlnTomoReconstructedTomogram"]))
-    if not p.is_absolute():
-        p = project_path / p
-    f32 = p.with_name(p.stem + "_f32.mrc")
-    if f32.exists():
-        return f32
-    if p.exists():
-        return p
-    return None
-
-
 def _vis_asset_url(asset_path: str) -> str:
     # mtime-keyed cache-buster — see ROADMAP §4.7. When the atlas/manifest
     # regenerates, the URL changes, so the browser doesn't keep serving a
@@ -185,480 +130,6 @@ def has_any_dashboard_data() -> bool:
     return False
 
 
-# ---------------------------------------------------------------------------
-# Per-TS journey collector — feeds the 6-pill sidebar strip
-# ---------------------------------------------------------------------------
-
-
-# (key, label, JobType for array stages, or None for synthetic stages handled below).
-_PILL_STAGES: list[tuple[str, str, Optional[JobType]]] = [
-    ("fs_ctf", "FS/CTF", JobType.FS_MOTION_CTF),
-    ("align", "Align", JobType.TS_ALIGNMENT),
-    ("ctf", "CTF", JobType.TS_CTF),
-    ("recon", "Recon", JobType.TS_RECONSTRUCT),
-    ("pick", "Pick", None),
-    ("subtomo", "Subtomo", None),
-]
-
-# Preprocessing track = the 4 array stages (one shared bar per TS row). The
-# particle stages (pick → subtomo) render as a separate per-species track.
-_PREP_STAGES = _PILL_STAGES[:4]
-
-
-# Legacy-job fallback: when `.task_manifest.json` is absent, derive the TS
-# list from the stage's primary output star (which lists every TS the job
-# touched) and apply a coarse job-level status to all of them. Lets pre-
-# array-tracker projects show real "ok" pills instead of being stuck on
-# "pending" for stages that actually finished.
-_ARRAY_STAGE_OUTPUT_STAR: dict[JobType, str] = {
-    JobType.FS_MOTION_CTF: "fs_motion_and_ctf.star",
-    JobType.TS_ALIGNMENT: "aligned_tilt_series.star",
-    JobType.TS_CTF: "ts_ctf_tilt_series.star",
-    JobType.TS_RECONSTRUCT: "tomograms.star",
-}
-
-
-def _ts_names_from_star(p: Path) -> list[str]:
-    """Return the rlnTomoName column from the first DataFrame in a star file."""
-    if not p.exists():
-        return []
-    try:
-        import starfile
-
-        data = starfile.read(p, always_dict=True)
-        for v in data.values():
-            if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
-                return [str(x) for x in v["rlnTomoName"].tolist()]
-    except Exception as e:
-        logger.warning("Could not read TS list from %s: %s", p, e)
-    return []
-
-
-def _coarse_job_status(jm) -> str:
-    es = getattr(jm, "execution_status", None)
-    if es == JobStatus.SUCCEEDED:
-        return "ok"
-    if es == JobStatus.FAILED:
-        return "fail"
-    if es in (JobStatus.RUNNING, JobStatus.QUEUED, JobStatus.SCHEDULED):
-        return "running"
-    return "pending"
-
-
-def _array_stage_status(project_path: Path, jm) -> tuple[list[str], dict[str, str]]:
-    """For an array job, return (ordered TS items, {ts: status_string}).
-
-    Prefers the per-TS array-task tracker (.task_manifest.json + .task_status/)
-    when present. Falls back to the stage's output star + job-level execution
-    status for legacy jobs that ran before the tracker was wired up.
-    """
-    job_dir = resolve_job_dir(jm, project_path)
-    if job_dir is None:
-        return [], {}
-    manifest = read_manifest(job_dir)
-    if manifest is not None:
-        items = manifest.get("items") or []
-        if items:
-            return list(items), scan_statuses(job_dir, items)
-
-    jt = getattr(jm, "job_type", None)
-    primary = _ARRAY_STAGE_OUTPUT_STAR.get(jt)
-    candidates: list[Path] = []
-    if primary:
-        candidates.append(job_dir / primary)
-    candidates.append(job_dir / "tomograms.star")
-    items: list[str] = []
-    for p in candidates:
-        items = _ts_names_from_star(p)
-        if items:
-            break
-    if not items:
-        return [], {}
-    coarse = _coarse_job_status(jm)
-    return items, {ts: coarse for ts in items}
-
-
-def _job_running_or_failed(jm) -> Optional[str]:
-    """For non-array jobs, derive a coarse status from execution_status. Returns
-    'running' / 'fail' / None (None means "fall back to per-TS data check")."""
-    es = getattr(jm, "execution_status", None)
-    if es == JobStatus.RUNNING or es == JobStatus.QUEUED or es == JobStatus.SCHEDULED:
-        return "running"
-    if es == JobStatus.FAILED:
-        return "fail"
-    return None
-
-
-def _zero_pick_tomos_from_tmresults(job_dir: Path) -> set[str]:
-    """Walk `<job_dir>/tmResults/*_particles.star` and return the set of
-    tomograms whose per-TS particles file exists but contains zero data
-    rows. This is the on-disk signal that PyTOM ran on that TS and produced
-    no candidates above cutoff — the supervisor's `pd.concat` merge silently
-    drops these, so they vanish from `candidates.star` and the preview
-    manifest. We surface them here so the journey pill can read "zero"
-    instead of the misleading "pending".
-
-    Fast: each file is header-only (~600 bytes); a 24-TS project takes a
-    few ms. Returns an empty set if `tmResults/` doesn't exist (older
-    project layouts).
-    """
-    tm_dir = job_dir / "tmResults"
-    if not tm_dir.is_dir():
-        return set()
-    out: set[str] = set()
-    for p in tm_dir.glob("*_particles.star"):
-        try:
-            import starfile
-
-            data = starfile.read(p, always_dict=True)
-        except Exception:
-            continue
-        # Find the particles dataframe (first DataFrame in the file).
-        df = None
-        for v in data.values():
-            if isinstance(v, pd.DataFrame):
-                df = v
-                break
-        if df is None or len(df) > 0:
-            continue
-        # Strip the "_particles" suffix to recover the tomo name.
-        stem = p.stem
-        if stem.endswith("_particles"):
-            tomo_name = stem[: -len("_particles")]
-            out.add(tomo_name)
-    return out
-
-
-def _candidate_extract_status_per_ts(job_dir: Path, jm) -> dict[str, str]:
-    """Read the candidate-extract job's preview manifest to bucket TS statuses.
-
-    Buckets:
-      - "ok": manifest entry has picks_json
-      - "fail": tomo listed in summary.errored
-      - "zero": tomo was processed but produced 0 picks above cutoff. Fast
-        path reads summary.zero_picks if present (manifest v10+); otherwise
-        falls back to scanning `tmResults/*_particles.star` for header-only
-        files.
-      - "running" / "pending": defaults based on job state, applied for any
-        TS that's expected (per the staged tomograms.star) but not yet
-        covered by any of the buckets above.
-    """
-    manifest = read_preview_manifest(job_dir) or {}
-    entries = manifest.get("tomograms") or {}
-    summary = manifest.get("summary") or {}
-    errored = {e.get("tomo") for e in (summary.get("errored") or []) if e.get("tomo")}
-
-    # Fast path: orchestrator-recorded zero_picks (v10+). Fallback: scan
-    # tmResults for legacy manifests. The scan is cheap (header-only files)
-    # so we run it unconditionally on miss to recover from old projects.
-    zero_picks: set[str] = set(summary.get("zero_picks") or [])
-    if not zero_picks:
-        zero_picks = _zero_pick_tomos_from_tmresults(job_dir)
-
-    coarse = _job_running_or_failed(jm)
-    out: dict[str, str] = {}
-
-    for tomo_name, entry in entries.items():
-        if tomo_name in errored:
-            out[tomo_name] = "fail"
-        elif entry.get("picks_json"):
-            out[tomo_name] = "ok"
-        elif coarse == "running":
-            out[tomo_name] = "running"
-        else:
-            out[tomo_name] = "pending"
-
-    # Promote zero-pick tomos. These don't appear in `entries` (the
-    # orchestrator only emitted entries for tomos with at least one pick),
-    # so they're additive to the dict.
-    for tomo_name in zero_picks:
-        if tomo_name not in out:
-            out[tomo_name] = "zero"
-
-    return out
-
-
-def _read_subtomo_extracted_ts(job_dir: Path) -> set[str]:
-    """Read job_dir/particles.star and return the set of TS that had at
-    least one row of extracted particles. Tolerant of missing files /
-    parse errors."""
-    particles_star = job_dir / "particles.star"
-    if not particles_star.exists():
-        return set()
-    try:
-        import starfile
-
-        data = starfile.read(particles_star, always_dict=True)
-        df = data.get("particles")
-        if df is None:
-            for v in data.values():
-                if isinstance(v, pd.DataFrame) and "rlnTomoName" in v.columns:
-                    df = v
-                    break
-        if df is None or "rlnTomoName" not in df.columns:
-            return set()
-        return {str(t) for t in df["rlnTomoName"].astype(str).unique()}
-    except Exception as e:
-        logger.warning("Could not parse subtomo particles.star %s: %s", particles_star, e)
-        return set()
-
-
-def _subtomo_extract_status_per_ts(job_dir: Path, jm, expected_ts: Optional[set[str]] = None) -> dict[str, str]:
-    """Bucket per-TS status for the subtomo-extraction job.
-
-    Two layouts are supported, in priority order:
-
-      1. **Array layout** (post-conversion): `.task_manifest.json` exists.
-         Per-TS pass/fail from `.task_status/<ts>.{ok,fail}` is the source
-         of truth. An "ok" task that didn't write any row to particles.star
-         is demoted to "zero" (extraction ran but produced 0 particles for
-         that TS — e.g. all picks filtered by max_dose / min_frames).
-
-      2. **Legacy one-shot layout** (no manifest): we don't have per-TS
-         markers. Fall back to particles.star membership crossed with
-         `expected_ts` (typically the union of "ok" picks across upstream
-         candidate-extract instances). A TS in `expected_ts` but absent
-         from particles.star is "zero" iff the job has SUCCEEDED, else
-         "running" / "pending" depending on job state.
-    """
-    from ui.components.task_utils import read_manifest as read_array_manifest
-    from ui.components.task_utils import scan_statuses
-
-    extracted = _read_subtomo_extracted_ts(job_dir)
-    out: dict[str, str] = {}
-
-    # ── Layout 1: array layout ─────────────────────────────────────────
-    array_manifest = read_array_manifest(job_dir)
-    if array_manifest is not None:
-        items = array_manifest.get("items") or []
-        if items:
-            statuses = scan_statuses(job_dir, items)
-            for ts in items:
-                st = statuses.get(ts, "pending")
-                if st == "ok" and ts not in extracted:
-                    # task completed but the TS isn't in particles.star —
-                    # relion_tomo_subtomo ran and produced nothing (all
-                    # candidates filtered out at this stage).
-                    out[ts] = "zero"
-                else:
-                    out[ts] = st
-            return out
-
-    # ── Layout 2: legacy one-shot ──────────────────────────────────────
-    for ts in extracted:
-        out[ts] = "ok"
-
-    if expected_ts:
-        es = getattr(jm, "execution_status", None)
-        job_running = es in (JobStatus.RUNNING, JobStatus.QUEUED, JobStatus.SCHEDULED)
-        job_succeeded = es == JobStatus.SUCCEEDED
-        for ts in expected_ts:
-            if ts in extracted:
-                continue
-            if job_succeeded:
-                out[ts] = "zero"
-            elif job_running:
-                out[ts] = "running"
-            # Else: leave unset; caller defaults to "pending".
-
-    return out
-
-
-def _collect_dashboard_journey(project_state, project_path: Path) -> tuple[dict[str, dict[str, str]], list[str]]:
-    """Collect per-TS status across the 6 dashboard stages.
-
-    Returns:
-        journey: {ts_name: {stage_key: status_string}} where status is one of
-                 "ok" / "fail" / "running" / "pending".
-        ts_names: ordered list of all tilt series in the project (union across
-                  array-job manifests). Order follows the first stage that
-                  declares a given TS.
-    """
-    journey: dict[str, dict[str, str]] = {}
-    ts_order: list[str] = []
-    seen: set[str] = set()
-
-    # Walk the 4 array stages first so ts_order reflects pipeline order.
-    for key, _label, jt in _PILL_STAGES:
-        if jt is None:
-            continue
-        for iid, jm in (project_state.jobs or {}).items():
-            if getattr(jm, "job_type", None) != jt and iid.split("__")[0] != jt.value:
-                continue
-            items, statuses = _array_stage_status(project_path, jm)
-            if not items:
-                continue
-            for ts_name in items:
-                if ts_name not in seen:
-                    ts_order.append(ts_name)
-                    seen.add(ts_name)
-                journey.setdefault(ts_name, {})[key] = statuses.get(ts_name, "pending")
-            break  # one job per array stage
-
-    # Pick stage: combine across all candidate-extract instances. Promotion
-    # order keeps "ok" winning over "zero" (multi-species: if one species
-    # produced picks here and another didn't, the row is genuinely "ok").
-    pick_combined: dict[str, str] = {}
-    pick_order = {"ok": 5, "running": 4, "zero": 3, "fail": 2, "pending": 1}
-    for iid, jm in _candidate_extract_instances(project_state):
-        jd = _job_dir_for(iid, jm, project_path)
-        if jd is None:
-            continue
-        statuses = _candidate_extract_status_per_ts(jd, jm)
-        for ts_name, st in statuses.items():
-            cur = pick_combined.get(ts_name)
-            if cur is None or pick_order.get(st, 0) > pick_order.get(cur, 0):
-                pick_combined[ts_name] = st
-            if ts_name not in seen:
-                ts_order.append(ts_name)
-                seen.add(ts_name)
-    for ts_name, st in pick_combined.items():
-        journey.setdefault(ts_name, {})["pick"] = st
-
-    # Subtomo stage: combine across all subtomo-extract instances. Pass the
-    # "ok" pick set as `expected_ts` so the predicate can infer zero-state
-    # for TS that should have been extracted but didn't make it into
-    # particles.star (e.g. filtered out by max_dose / min_frames).
-    picked_ok: set[str] = {ts for ts, st in pick_combined.items() if st == "ok"}
-    subtomo_combined: dict[str, str] = {}
-    subtomo_order = {"ok": 5, "running": 4, "zero": 3, "fail": 2, "pending": 1}
-    for iid, jm in _subtomo_extract_instances(project_state):
-        jd = _job_dir_for(iid, jm, project_path)
-        if jd is None:
-            continue
-        statuses = _subtomo_extract_status_per_ts(jd, jm, expected_ts=picked_ok)
-        for ts_name, st in statuses.items():
-            cur = subtomo_combined.get(ts_name)
-            if cur is None or subtomo_order.get(st, 0) > subtomo_order.get(cur, 0):
-                subtomo_combined[ts_name] = st
-            if ts_name not in seen:
-                ts_order.append(ts_name)
-                seen.add(ts_name)
-    for ts_name, st in subtomo_combined.items():
-        journey.setdefault(ts_name, {})["subtomo"] = st
-
-    # Fill missing pills with "pending" so renderers don't have to defend.
-    for ts_name in ts_order:
-        row = journey.setdefault(ts_name, {})
-        for key, _label, _jt in _PILL_STAGES:
-            row.setdefault(key, "pending")
-
-    return journey, ts_order
-
-
-def _species_label_for(jm, iid: str, manifest: dict) -> str:
-    """Display label for a species: manifest species_name → instance suffix →
-    job_model.species_id → bare instance id."""
-    return str(
-        (manifest.get("template") or {}).get("species_name")
-        or _split_species_id(iid)
-        or getattr(jm, "species_id", None)
-        or iid
-    )
-
-
-def _matching_subtomo_instance(state, species_id):
-    """The SUBTOMO_EXTRACTION instance attached to this species_id, or None."""
-    for s_iid, s_jm in _subtomo_extract_instances(state):
-        _, s_sid = _resolve_species(state, s_jm, s_iid)
-        if s_sid == species_id:
-            return s_iid, s_jm
-    return None
-
-
-def _recon_mrc_map(state, project_path: Path) -> dict[str, str]:
-    """{ts_name: reconstructed-tomogram path} read once from the recon job's
-    tomograms.star, so the roster info popover can list the volume without a
-    per-row disk read."""
-    rec = _find_job_by_type(state, JobType.TS_RECONSTRUCT)
-    if not rec:
-        return {}
-    jd = _job_dir_for(rec[0], rec[1], project_path)
-    if jd is None:
-        return {}
-    df = _read_tomograms_table(jd / "tomograms.star")
-    if df is None or "rlnTomoName" not in df.columns:
-        return {}
-    out: dict[str, str] = {}
-    for _, r in df.iterrows():
-        mrc = _resolve_volume_for_3dmod(r, project_path)
-        if mrc:
-            out[str(r["rlnTomoName"])] = str(mrc)
-    return out
-
-
-def _collect_species_journey(project_state, project_path: Path) -> dict[str, list[dict]]:
-    """Per-TS per-species particle-track data for the roster.
-
-    {ts: [{idx, label, color, species_id, pick_status, subtomo_status, n_picks,
-    ce_star, subtomo_star, pixel_size_ang, tomo_dims}]}. Species order + color
-    follow `_candidate_extract_instances` enumeration, so the roster dot matches
-    the canvas overlay and the species tabs everywhere."""
-    out: dict[str, list[dict]] = {}
-    for idx, (iid, jm) in enumerate(_candidate_extract_instances(project_state)):
-        jd = _job_dir_for(iid, jm, project_path)
-        if jd is None:
-            continue
-        color = _SPECIES_OVERLAY_COLORS[idx % len(_SPECIES_OVERLAY_COLORS)]
-        _, species_id = _resolve_species(project_state, jm, iid)
-        manifest = read_preview_manifest(jd) or {}
-        entries = manifest.get("tomograms") or {}
-        label = _species_label_for(jm, iid, manifest)
-        pick_status = _candidate_extract_status_per_ts(jd, jm)
-        sub_match = _matching_subtomo_instance(project_state, species_id)
-        sub_status: dict[str, str] = {}
-        sub_star = None
-        reviewed: dict[str, int] = {}
-        if sub_match is not None:
-            sub_jd = _job_dir_for(sub_match[0], sub_match[1], project_path)
-            if sub_jd is not None:
-                from services.visualization import picks_filter
-
-                sub_star = str(sub_jd / "particles.star")
-                reviewed = picks_filter.read_reviewed_counts(sub_jd)
-                picked_ok = {ts for ts, st in pick_status.items() if st == "ok"}
-                sub_status = _subtomo_extract_status_per_ts(sub_jd, sub_match[1], expected_ts=picked_ok)
-        ce_star = str(jd / "candidates.star")
-        for ts in set(pick_status) | set(sub_status):
-            entry = entries.get(ts) or {}
-            out.setdefault(ts, []).append(
-                {
-                    "idx": idx,
-                    "label": label,
-                    "color": color,
-                    "species_id": species_id,
-                    "pick_status": pick_status.get(ts, "pending"),
-                    "subtomo_status": sub_status.get(ts, "pending"),
-                    "n_picks": entry.get("n_picks"),
-                    "filtered_count": reviewed.get(ts),  # kept count if reviewed, else None
-                    "ce_star": ce_star,
-                    "subtomo_star": sub_star,
-                    "pixel_size_ang": entry.get("pixel_size_ang"),
-                    "tomo_dims": entry.get("tomo_dims_xyz_px"),
-                }
-            )
-    for ts in out:
-        out[ts].sort(key=lambda s: s["idx"])
-    return out
-
-
-def _journey_signature(journey: dict, species_journey: dict, ts_names: list) -> tuple:
-    """Cheap fingerprint of everything the roster renders — prep statuses +
-    per-species (status, status, count). Lets the live timer rebuild the sidebar
-    only when this actually moves (FingerprintedView discipline), so progress
-    ticks don't tear down rows under an in-flight click."""
-    parts = []
-    for ts in ts_names:
-        jr = journey.get(ts, {})
-        prep = tuple(jr.get(k, "") for k, _, _ in _PREP_STAGES)
-        sps = tuple(
-            (s["label"], s["pick_status"], s["subtomo_status"], s["n_picks"], s.get("filtered_count"))
-            for s in species_journey.get(ts, [])
-        )
-        parts.append((ts, prep, sps))
-    return tuple(parts)
-
-
 # ---------------------------------------------------------------------------
 # Plotly figure builders — used by the picks-only scatter fallback when no
 # subtomo cutout atlas exists. ui.plotly() accepts a JSON dict directly, so we
@@ -691,15 +162,17 @@ def _empty_fig(message: str) -> dict:
     }
 
 
-def _build_xy_scatter_fig(picks: list, tomo_dims_xyz: tuple, score_field: Optional[str]) -> dict:
+def _build_xy_scatter_fig(cols: dict, tomo_dims_xyz: tuple, score_field: Optional[str]) -> dict:
+    """`cols` is the parallel-array picks payload (see picks_columns)."""
     x_dim, y_dim, _z_dim = tomo_dims_xyz
-    has_scores = picks and "score" in picks[0]
-    xs = [p["x"] for p in picks]
-    ys = [p["y"] for p in picks]
-    custom = [[p["i"], p.get("z", 0), p.get("score")] for p in picks]
+    n = len(cols.get("i") or [])
+    has_scores = bool(n) and "score" in cols
+    xs = cols.get("x") or []
+    ys = cols.get("y") or []
+    custom = list(zip(cols.get("i") or [], cols.get("z") or [0] * n, cols.get("score") or [None] * n))
     marker: dict = {"size": 6, "line": {"width": 0}, "opacity": 0.85}
     if has_scores:
-        marker["color"] = [p.get("score") for p in picks]
+        marker["color"] = cols["score"]
         marker["colorscale"] = "Viridis"
         marker["showscale"] = True
         marker["colorbar"] = {
@@ -764,16 +237,18 @@ def _build_xy_scatter_fig(picks: list, tomo_dims_xyz: tuple, score_field: Option
 
 
 def _build_xz_scatter_fig(
-    picks: list, tomo_dims_xyz: tuple, score_field: Optional[str], xz_preview_url: Optional[str] = None
+    cols: dict, tomo_dims_xyz: tuple, score_field: Optional[str], xz_preview_url: Optional[str] = None
 ) -> dict:
+    """`cols` is the parallel-array picks payload (see picks_columns)."""
     x_dim, _y_dim, z_dim = tomo_dims_xyz
-    has_scores = picks and "score" in picks[0]
-    xs = [p["x"] for p in picks]
-    zs = [p["z"] for p in picks]
-    custom = [[p["i"], p.get("y", 0), p.get("score")] for p in picks]
+    n = len(cols.get("i") or [])
+    has_scores = bool(n) and "score" in cols
+    xs = cols.get("x") or []
+    zs = cols.get("z") or []
+    custom = list(zip(cols.get("i") or [], cols.get("y") or [0] * n, cols.get("score") or [None] * n))
     marker: dict = {"size": 5, "line": {"width": 0}, "opacity": 0.85}
     if has_scores:
-        marker["color"] = [p.get("score") for p in picks]
+        marker["color"] = cols["score"]
         marker["colorscale"] = "Viridis"
         marker["showscale"] = False
     else:
@@ -844,8 +319,8 @@ def _build_xz_scatter_fig(
     return {"data": [trace], "layout": layout, "config": {"displaylogo": False, "responsive": True}}
 
 
-def _build_score_hist_fig(picks: list, score_field: Optional[str]) -> dict:
-    scores = [p.get("score") for p in picks if p.get("score") is not None]
+def _build_score_hist_fig(cols: dict, score_field: Optional[str]) -> dict:
+    scores = [v for v in (cols.get("score") or []) if v is not None]
     if not scores:
         return _empty_fig("no score column in candidates.star")
     mean_v = sum(scores) / len(scores)
@@ -899,13 +374,21 @@ def _build_score_hist_fig(picks: list, score_field: Optional[str]) -> dict:
 
 
 def _read_picks_json(path: Path) -> dict:
+    """Load picks.json in either layout. The result carries `columns`
+    (parallel arrays, fed straight to Plotly and the ghost-dot layers);
+    `pick_row` turns one index into a dict where a single pick is shown."""
+    empty = {"columns": {}, "tomo_dims_xyz_px": [0, 0, 0], "score_field": None, "n": 0}
     if not path or not Path(path).exists():
-        return {"picks": [], "tomo_dims_xyz_px": [0, 0, 0], "score_field": None, "n": 0}
+        return empty
     try:
-        return json.loads(Path(path).read_text())
+        data = json.loads(Path(path).read_text())
     except Exception as e:
         logger.warning("Failed to load picks.json %s: %s", path, e)
-        return {"picks": [], "tomo_dims_xyz_px": [0, 0, 0], "score_field": None, "n": 0}
+        return empty
+    data["columns"] = picks_columns(data)
+    data.pop("picks", None)
+    data["n"] = picks_count(data["columns"])
+    return data
 
 
 # ---------------------------------------------------------------------------
@@ -918,6 +401,15 @@ def _read_per_tilt_df(per_tilt_star_path: Path) -> Optional[pd.DataFrame]:
     star has one data block named after the TS, with one row per tilt."""
     if not per_tilt_star_path.exists():
         return None
+    try:
+        # One memory-mapped table per job instead of a STAR parse per TS.
+        from services.tilt_series.tilt_table import read_ts_tilts
+
+        df = read_ts_tilts(per_tilt_star_path)
+        if df is not None and "rlnTomoNominalStageTiltAngle" in df.columns:
+            return df
+    except Exception as e:
+        logger.warning("Could not read tilt table for %s: %s", per_tilt_star_path, e)
     try:
         import starfile
 
@@ -1793,7 +1285,8 @@ def open_tomo_dashboard(ts_name: Optional[str] = None, focus_section: Optional[s
         return
 
     project_path = Path(state.project_path)
-    journey, ts_names = _collect_dashboard_journey(state, project_path)
+    journey_table = get_journey_service().table(project_path)
+    ts_names = journey_table.snapshot(state).ts_names
 
     initial_ts = ts_name if (ts_name and ts_name in ts_names) else (ts_names[0] if ts_names else None)
     selected = {"ts": initial_ts}
@@ -1838,7 +1331,8 @@ def open_tomo_dashboard(ts_name: Optional[str] = None, focus_section: Optional[s
             )
 
             row_els: dict[str, object] = {}
-            _sidebar_sig: dict[str, object] = {"sig": None}
+            # Journey-table version the roster currently shows, and its row container.
+            _sidebar_view: dict[str, object] = {"version": None, "rows": None}
 
             def render_main() -> None:
                 main_area.clear()
@@ -1846,7 +1340,7 @@ def open_tomo_dashboard(ts_name: Optional[str] = None, focus_section: Optional[s
                     if selected["ts"] is None:
                         _render_no_data_empty_state()
                     else:
-                        _render_main_pane_for_ts(selected["ts"], state, project_path, refresh_all, render_sidebar)
+                        _render_main_pane_for_ts(selected["ts"], state, project_path, refresh_all, refresh_roster)
                 if focus_section and selected["ts"] is not None:
                     _scroll_section_into_view(focus_section)
 
@@ -1868,40 +1362,66 @@ def open_tomo_dashboard(ts_name: Optional[str] = None, focus_section: Optional[s
                 if ts in row_els:
                     row_els[ts].classes(add="selected")
                 render_main()
-                render_sidebar()
-
-            def render_sidebar() -> None:
-                # Signature-gated (FingerprintedView discipline): the 4 s live
-                # timer calls refresh_all on every background-task tick, but we
-                # only tear down + rebuild rows when the journey data actually
-                # changed — otherwise a tick mid-click would drop the click.
-                fresh_journey, fresh_ts_names = _collect_dashboard_journey(state, project_path)
-                species_journey = _collect_species_journey(state, project_path)
-                sig = _journey_signature(fresh_journey, species_journey, fresh_ts_names)
-                if row_els and sig == _sidebar_sig["sig"]:
+                render_sidebar(recheck=True)
+
+            def render_sidebar(recheck: bool = False) -> None:
+                # Version-gated: the journey table is shared by every open
+                # dashboard and only moves when a TS row actually changed.
+                # Rows named in its delta log are swapped in place; the roster
+                # is torn down only when the TS list itself changed — a
+                # rebuild mid-click would drop the click. `recheck` skips the
+                # table's rate limit (a review count was just saved).
+                if recheck:
+                    journey_table.invalidate()
+                snap = journey_table.snapshot(state)
+                shown = _sidebar_view["version"]
+                if row_els and snap.version == shown:
+                    return
+                changed = journey_table.changes_since(shown) if row_els and shown is not None else None
+                _sidebar_view["version"] = snap.version
+                if changed is not None:
+                    rows_container = _sidebar_view["rows"]
+                    for ts in changed:
+                        old_row = row_els.get(ts)
+                        if old_row is None:
+                            continue
+                        with rows_container:
+                            new_row = _render_ts_row(
+                                ts,
+                                snap.journey.get(ts, {}),
+                                snap.species.get(ts, []),
+                                selected,
+                                select_ts,
+                                snap.recon_mrc.get(ts),
+                            )
+                        new_row.move(rows_container, target_index=snap.ts_names.index(ts))
+                        old_row.delete()
+                        row_els[ts] = new_row
                     return
-                _sidebar_sig["sig"] = sig
-                recon_mrc = _recon_mrc_map(state, project_path)
                 row_els.clear()
                 sidebar.clear()
                 with sidebar:
                     with ui.element("div").classes("cb-sidebar-header"):
-                        ui.label(f"{len(fresh_ts_names)} tilt series").classes("font-mono")
+                        ui.label(f"{len(snap.ts_names)} tilt series").classes("font-mono")
                         ui.label("prep: FS/CTF · Align · CTF · Recon").classes("font-mono").style(
                             "margin-top: 3px; font-size: 9px; color: #94a3b8;"
                         )
                     rows_container = ui.element("div").classes("cb-sidebar-rows")
+                    _sidebar_view["rows"] = rows_container
                     with rows_container:
-                        for ts in fresh_ts_names:
+                        for ts in snap.ts_names:
                             row_els[ts] = _render_ts_row(
                                 ts,
-                                fresh_journey.get(ts, {}),
-                                species_journey.get(ts, []),
+                                snap.journey.get(ts, {}),
+                                snap.species.get(ts, []),
                                 selected,
                                 select_ts,
-                                recon_mrc.get(ts),
+                                snap.recon_mrc.get(ts),
                             )
 
+            def refresh_roster() -> None:
+                render_sidebar(recheck=True)
+
             def refresh_all() -> None:
                 render_sidebar()
                 render_main()
@@ -1913,13 +1433,16 @@ def open_tomo_dashboard(ts_name: Optional[str] = None, focus_section: Optional[s
             # journey strip / section cards in sync with manifests being
             # written by an async preview-render or IMOD-gen task. Skip
             # the rebuild when nothing's running to avoid burning the
-            # event loop on idle dashboards.
+            # event loop on idle dashboards. Pipeline progress reaches the
+            # roster through the journey table's version instead.
             from services.background_tasks import get_background_task_registry
 
             _last_signature = {"sig": None}
 
             def _maybe_refresh() -> None:
                 try:
+                    if journey_table.snapshot(state).version != _sidebar_view["version"]:
+                        render_sidebar()
                     registry = get_background_task_registry()
                     active = [t for t in registry.for_project(str(project_path)) if t.is_running]
                     # Signature picks up "task started", "task finished", and
@@ -2141,17 +1664,6 @@ def _render_main_pane_for_ts(ts_name: str, project_state, project_path: Path, re
 # ---------------------------------------------------------------------------
 
 
-def _find_job_by_type(project_state, jt: JobType) -> Optional[tuple[str, object]]:
-    """Return (instance_id, job_model) for the first job matching this type,
-    or None. The match accepts either `job_model.job_type == jt` or an
-    `instance_id` whose base prefix matches `jt.value` (covers `__species`
-    instances)."""
-    for iid, jm in (project_state.jobs or {}).items():
-        if getattr(jm, "job_type", None) == jt or iid.split("__")[0] == jt.value:
-            return iid, jm
-    return None
-
-
 def _render_datadump_card(
     section_key: str,
     icon: str,
@@ -2200,36 +1712,6 @@ def _render_datadump_card(
 # ---------------------------------------------------------------------------
 
 
-def _split_species_id(instance_id: str) -> Optional[str]:
-    """`templatematching__ribosome` → `ribosome`; bare instance_id → None."""
-    parts = instance_id.split("__", 1)
-    return parts[1] if len(parts) > 1 else None
-
-
-def _resolve_species(state, job_model, instance_id: str):
-    """Find the ParticleSpecies a per-particle job is attached to. Tries:
-    1. `instance_id` suffix (`templatematching__ribosome` → `ribosome`).
-    2. `job_model.species_id` field (set even when instance_id is bare).
-    3. Single-species fallback: if exactly one species exists in the
-       project, attribute the job to it.
-    Returns (species or None, species_id or None)."""
-    sid = _split_species_id(instance_id)
-    if sid:
-        sp = state.get_species(sid)
-        if sp:
-            return sp, sid
-    sid2 = getattr(job_model, "species_id", None)
-    if sid2:
-        sp = state.get_species(sid2)
-        if sp:
-            return sp, sid2
-        return None, sid2
-    if len(state.species_registry) == 1:
-        sp = state.species_registry[0]
-        return sp, sp.id
-    return None, None
-
-
 # Template-header reads are cached centrally in
 # services.templating.template_metadata (mtime-keyed); use the shared
 # helper here as a thin tuple shim so existing callsites don't change.
@@ -3684,8 +3166,10 @@ _TOMO_POLARITY_CACHE: dict[tuple[str, int], dict] = {}
 
 
 def _compute_tomogram_polarity(mrc_path: Path) -> Optional[dict]:
-    """Sample a center 1024×1024 Z slice from a reconstructed tomogram,
-    compute %bright / %dark voxel fractions, classify polarity. Cached by
+    """%bright / %dark voxel fractions of the center 1024×1024 Z slice of a
+    reconstructed tomogram, plus a polarity class. Served from the shared
+    tomogram-view cache when the slabs have been rendered (the recon canvas
+    auto-kicks that); otherwise samples just that one slice. Cached by
     (path, mtime). Returns None on read failure or non-3D volumes."""
     try:
         st = mrc_path.stat()
@@ -3695,6 +3179,13 @@ def _compute_tomogram_polarity(mrc_path: Path) -> Optional[dict]:
     cached = _TOMO_POLARITY_CACHE.get(key)
     if cached is not None:
         return cached
+
+    views = cached_tomogram_views(mrc_path)
+    if views is not None and "polarity" in views.stats:
+        result = {k: views.stats[k] for k in ("pct_bright", "pct_dark", "polarity", "slab_shape")}
+        _TOMO_POLARITY_CACHE[key] = result
+        return result
+
     try:
         import mrcfile
         import numpy as np
@@ -3717,24 +3208,7 @@ def _compute_tomogram_polarity(mrc_path: Path) -> Optional[dict]:
 
     if slab.size == 0:
         return None
-    mean = float(slab.mean())
-    std = float(slab.std()) or 1.0
-    upper = mean + 1.5 * std
-    lower = mean - 1.5 * std
-    n = float(slab.size)
-    pct_bright = 100.0 * float((slab > upper).sum()) / n
-    pct_dark = 100.0 * float((slab < lower).sum()) / n
-
-    # Classify. Margins picked from the doc example: GT had 6.6%/6.8% =
-    # essentially symmetric. >1.5x ratio + >8% absolute = clear skew.
-    if pct_bright > 1.5 * pct_dark and pct_bright > 8.0:
-        polarity = "bright"
-    elif pct_dark > 1.5 * pct_bright and pct_dark > 8.0:
-        polarity = "dark"
-    else:
-        polarity = "symmetric"
-
-    result = {"pct_bright": pct_bright, "pct_dark": pct_dark, "polarity": polarity, "slab_shape": list(slab.shape)}
+    result = polarity_stats(slab)
     _TOMO_POLARITY_CACHE[key] = result
     return result
 
@@ -3973,7 +3447,7 @@ def _auto_kick_recon_slabs(recon_job_dir: Path, ts_name: str, mrc_path: Path, pr
     ).submit(_run, on_complete=lambda _t: refresh(), show_start_toast=False)
 
 
-def _render_pick_layer(picks: list, color: str, dims: list, axis: str, layer_id: str):
+def _render_pick_layer(pick_cols: dict, color: str, dims: list, axis: str, layer_id: str):
     """Render one species' ghost-dot layer over a shared slab canvas.
 
     Carries a stable DOM `layer_id` and per-dot `data-pick-idx` plus a
@@ -3989,15 +3463,16 @@ def _render_pick_layer(picks: list, color: str, dims: list, axis: str, layer_id:
     # styling without per-dot inline overrides.
     layer = ui.element("div").classes("cb-pick-layer").style(f"--sp-color: {color};")
     layer._props["id"] = layer_id
+    n = picks_count(pick_cols)
+    v_col, v_dim = ("y", y_dim) if axis == "xy" else ("z", z_dim)
     with layer:
-        for p in picks:
+        for i, x, v in zip(
+            pick_cols.get("i") or [None] * n, pick_cols.get("x") or [0] * n, pick_cols.get(v_col) or [0] * n
+        ):
             try:
-                idx = int(p.get("i"))
-                fx = max(0.0, min(1.0, float(p.get("x", 0)) / x_dim))
-                if axis == "xy":
-                    fv = 1.0 - max(0.0, min(1.0, float(p.get("y", 0)) / y_dim))
-                else:
-                    fv = 1.0 - max(0.0, min(1.0, float(p.get("z", 0)) / z_dim))
+                idx = int(i)
+                fx = max(0.0, min(1.0, float(x if x is not None else 0) / x_dim))
+                fv = 1.0 - max(0.0, min(1.0, float(v if v is not None else 0) / v_dim))
             except (TypeError, ValueError):
                 continue
             dot = ui.element("div").classes("cb-pick-ghost")
@@ -4286,7 +3761,8 @@ def _collect_species_data_for_ts(project_state, project_path: Path, ts_name: str
                 "entry": entry,
                 "label": str(label),
                 "color": _SPECIES_OVERLAY_COLORS[idx % len(_SPECIES_OVERLAY_COLORS)],
-                "picks": picks_data.get("picks") or [],
+                "pick_cols": picks_data.get("columns") or {},
+                "n_picks": int(picks_data.get("n") or 0),
                 "dims": picks_data.get("tomo_dims_xyz_px") or entry.get("tomo_dims_xyz_px") or [1, 1, 1],
             }
         )
@@ -4331,7 +3807,7 @@ def _render_particles_section(ts_name: str, project_state, project_path: Path, r
                     for sp in species_data:
                         # Label carries name + pick count; a CSS ::before dot (driven by
                         # the inline --sp-color) ties each tab to its canvas overlay color.
-                        tab = ui.tab(sp["iid"], label=f"{sp['label']} · {len(sp['picks'])}").classes("cb-species-tab")
+                        tab = ui.tab(sp["iid"], label=f"{sp['label']} · {sp['n_picks']}").classes("cb-species-tab")
                         tab.style(f"--sp-color: {sp['color']};")
                         tab_objs.append((sp, tab))
                 with ui.tab_panels(tabs, value=tab_objs[0][1]).classes("w-full cb-species-panels"):
@@ -4373,7 +3849,7 @@ def _render_particles_canvas(
             )
         return layer_ids
 
-    with_picks = [sp for sp in species_data if sp["picks"]]
+    with_picks = [sp for sp in species_data if sp["n_picks"]]
     if not with_picks:
         # Recon slab exists but nothing picked yet — clean slab, no overlay.
         with ui.element("div").classes("cb-recon-preview cb-recon-canvas").style("max-height: 70vh;"):
@@ -4401,7 +3877,7 @@ def _render_particles_canvas(
 
             with ui.row().classes("items-center gap-1"):
                 ui.element("div").classes("cb-species-swatch").style(f"background: {sp['color']};")
-                ui.checkbox(f"{sp['label']} ({len(sp['picks'])})", value=True).props("dense").classes(
+                ui.checkbox(f"{sp['label']} ({sp['n_picks']})", value=True).props("dense").classes(
                     "text-[11px]"
                 ).on_value_change(_toggle)
 
@@ -4421,7 +3897,7 @@ def _render_particles_canvas(
             for sp in with_picks:
                 lid = f"cb-pl-{nonce}-{sp['idx']}-xy"
                 sp.setdefault("_layer_els", []).append(
-                    _render_pick_layer(sp["picks"], sp["color"], sp["dims"], "xy", lid)
+                    _render_pick_layer(sp["pick_cols"], sp["color"], sp["dims"], "xy", lid)
                 )
                 layer_ids.setdefault(sp["iid"], {})["xy"] = lid
 
@@ -4433,7 +3909,7 @@ def _render_particles_canvas(
                 for sp in with_picks:
                     lid = f"cb-pl-{nonce}-{sp['idx']}-xz"
                     sp.setdefault("_layer_els", []).append(
-                        _render_pick_layer(sp["picks"], sp["color"], sp["dims"], "xz", lid)
+                        _render_pick_layer(sp["pick_cols"], sp["color"], sp["dims"], "xz", lid)
                     )
                     layer_ids.setdefault(sp["iid"], {})["xz"] = lid
 
@@ -4705,7 +4181,7 @@ def _render_3dmod_section(row: dict) -> None:
 
 
 def _render_reference_strip(
-    picks: list, cutout_index: dict, atlas_url: str, cols: int, rows: int, manifest: dict
+    pick_cols: dict, cutout_index: dict, atlas_url: str, cols: int, rows: int, manifest: dict
 ) -> None:
     """Calibration row above the main gallery: template tile + lowest-score picks.
 
@@ -4766,7 +4242,7 @@ def _render_reference_strip(
                             f"background-size: {bg_w}px {bg_h}px; "
                             f"background-position: {bg_x}px {bg_y}px;"
                         )
-                        pick = picks[pick_idx] if 0 <= pick_idx < len(picks) else None
+                        pick = pick_row(pick_cols, pick_idx)
                         tile = ui.element("div").classes("cb-noise-tile")
                         tile.style(style)
                         tip = [f"#{pick_idx} (low score reference)"]
@@ -4825,7 +4301,7 @@ def _render_peek_skeleton() -> dict:
 
 async def _trigger_peek_for_pick(
     pick_idx: int,
-    picks: list,
+    pick_cols: dict,
     tomo_mrc: Optional[str],
     peek_dir: Optional[Path],
     pixel_size_ang: Optional[float],
@@ -4843,11 +4319,11 @@ async def _trigger_peek_for_pick(
     status = peek_refs.get("status_icon")
     if cmd is None or status is None:
         return
-    if not tomo_mrc or peek_dir is None or not (0 <= pick_idx < len(picks)):
+    pick = pick_row(pick_cols, pick_idx)
+    if not tomo_mrc or peek_dir is None or pick is None:
         cmd.set_value("(no tomogram volume on disk)")
         status.props("name=error_outline").classes(replace="text-red-500")
         return
-    pick = picks[pick_idx]
     try:
         x = int(pick.get("x"))
         y = int(pick.get("y"))
@@ -4911,9 +4387,13 @@ def _render_gallery_body(
 ) -> None:
     picks_json_path = entry.get("picks_json")
     picks_data = (
-        _read_picks_json(Path(picks_json_path)) if picks_json_path else {"picks": [], "tomo_dims_xyz_px": [0, 0, 0]}
+        _read_picks_json(Path(picks_json_path)) if picks_json_path else {"columns": {}, "tomo_dims_xyz_px": [0, 0, 0]}
     )
-    picks = picks_data.get("picks", [])
+    picks = picks_data.get("columns") or {}
+    n_picks_total = picks_count(picks)
+    pick_x = picks.get("x") or [0] * n_picks_total
+    pick_y = picks.get("y") or [0] * n_picks_total
+    pick_z = picks.get("z") or [0] * n_picks_total
     tomo_dims = picks_data.get("tomo_dims_xyz_px") or entry.get("tomo_dims_xyz_px") or [1, 1, 1]
     pixel_size_ang = entry.get("pixel_size_ang")
 
@@ -4933,11 +4413,10 @@ def _render_gallery_body(
             i = int(k)
         except (TypeError, ValueError):
             continue
-        if 0 <= i < len(picks):
-            p = picks[i]
-            fx = max(0.0, min(1.0, float(p.get("x", 0)) / x_dim))
-            fy_top = max(0.0, min(1.0, 1.0 - float(p.get("y", 0)) / y_dim))
-            fz_top = max(0.0, min(1.0, 1.0 - float(p.get("z", 0)) / z_dim))
+        if 0 <= i < n_picks_total:
+            fx = max(0.0, min(1.0, float(pick_x[i] or 0) / x_dim))
+            fy_top = max(0.0, min(1.0, 1.0 - float(pick_y[i] or 0) / y_dim))
+            fz_top = max(0.0, min(1.0, 1.0 - float(pick_z[i] or 0) / z_dim))
             pick_xy_frac[i] = [fx, fy_top]
             pick_xz_frac[i] = [fx, fz_top]
 
@@ -4958,7 +4437,6 @@ def _render_gallery_body(
             degenerate_indices.append(int(f.get("i")))
         except (TypeError, ValueError):
             continue
-    n_picks_total = len(picks)
     all_pick_indices: set[int] = set()
     for k in cutout_index.keys():
         try:
@@ -5077,9 +4555,7 @@ def _render_gallery_body(
             else:
                 save_btn.props("disable")
         if discard_btn is not None:
-            has_saved = (
-                subtomo_job_dir is not None and (subtomo_job_dir / picks_filter.PARTICLES_FILTERED_NAME).exists()
-            )
+            has_saved = subtomo_job_dir is not None and picks_filter.has_filtered_set(subtomo_job_dir)
             if has_saved:
                 discard_btn.props(remove="disable")
             else:
@@ -5102,13 +4578,18 @@ def _render_gallery_body(
                 )
             ui.space()
 
-        def _on_save():
+        async def _on_save():
+            import asyncio as _asyncio
+
             try:
                 if not _is_dirty():
                     ui.notify("No changes to save", type="info", timeout=1500)
                     return
                 effective = _effective_keep_set()
-                result = picks_filter.save_filtered_picks_for_ts(subtomo_job_dir, ce_job_dir, ts_name, effective)
+                # Rewrites the filtered particles star; keep it off the event loop.
+                result = await _asyncio.to_thread(
+                    picks_filter.save_filtered_picks_for_ts, subtomo_job_dir, ce_job_dir, ts_name, effective
+                )
                 ks = state["keep_set"]
                 state["saved_baseline"] = set(ks) if ks is not None else None
                 state["saved_exclude_degen"] = _exclude_degen_on()
@@ -5121,9 +4602,11 @@ def _render_gallery_body(
                 logger.exception("Save filter failed for %s", ts_name)
                 ui.notify(f"Save failed: {e}", type="negative", timeout=4000)
 
-        def _on_discard():
+        async def _on_discard():
+            import asyncio as _asyncio
+
             try:
-                outcome = picks_filter.discard_ts_filter(subtomo_job_dir, ts_name)
+                outcome = await _asyncio.to_thread(picks_filter.discard_ts_filter, subtomo_job_dir, ts_name)
                 if outcome == "noop":
                     ui.notify("No filter to reset for this tomogram", type="info", timeout=1500)
                     return
@@ -5165,9 +4648,10 @@ def _render_gallery_body(
                 .props("dense size=sm color=indigo-6 unelevated")
                 .classes("text-xs")
                 .tooltip(
-                    "Write optimisation_set_filtered.star + particles_filtered.star next to the subtomo "
-                    "job's outputs. Downstream consumers (reconstruct_particle, class3d) auto-prefer the "
-                    "filtered file via the IO-slot resolver when it exists."
+                    "Record this tomogram's picks in the subtomo job's curation journal. "
+                    "optimisation_set_filtered.star + particles_filtered.star are written from it when a "
+                    "downstream consumer (reconstruct_particle, class3d, merge) runs, and auto-preferred "
+                    "via the IO-slot resolver."
                 )
             )
 
@@ -5225,7 +4709,7 @@ def _render_gallery_body(
         if mode == "z":
 
             def _z(i):
-                return picks[i].get("z", 0) if 0 <= i < len(picks) else 0
+                return (pick_z[i] or 0) if 0 <= i < n_picks_total else 0
 
             return sorted(available, key=_z, reverse=True)
         return sorted(available)
@@ -5331,7 +4815,7 @@ def _render_gallery_body(
                 r, c = pos
                 bg_x = -c * DISPLAY_TILE_PX
                 bg_y = -r * DISPLAY_TILE_PX
-                pick = picks[pick_idx] if 0 <= pick_idx < len(picks) else None
+                pick = pick_row(picks, pick_idx)
                 cls = "cb-gallery-tile"
                 if not _is_kept(pick_idx):
                     cls += " cb-tile-dropped"
@@ -5694,9 +5178,9 @@ def _render_picks_scatter_section(row: dict, entry: dict, manifest: dict) -> Non
     the gallery isn't available."""
     picks_json_path = entry.get("picks_json")
     picks_data = (
-        _read_picks_json(Path(picks_json_path)) if picks_json_path else {"picks": [], "tomo_dims_xyz_px": [0, 0, 0]}
+        _read_picks_json(Path(picks_json_path)) if picks_json_path else {"columns": {}, "tomo_dims_xyz_px": [0, 0, 0]}
     )
-    picks = picks_data.get("picks", [])
+    pick_cols = picks_data.get("columns") or {}
     tomo_dims = tuple(picks_data.get("tomo_dims_xyz_px") or entry.get("tomo_dims_xyz_px") or [1, 1, 1])
     score_field = manifest.get("score_field")
     pixel_size_ang = entry.get("pixel_size_ang")
@@ -5724,7 +5208,7 @@ def _render_picks_scatter_section(row: dict, entry: dict, manifest: dict) -> Non
             with ui.column().classes("gap-1").style(f"flex: 1 1 320px; min-width: 280px; max-width: {xy_max_w}px;"):
                 ui.label("X / Y top-down").classes("cb-section-title")
                 with ui.element("div").classes("cb-aspect").style(f"aspect-ratio: {xy_aspect};"):
-                    xy_plot = ui.plotly(_build_xy_scatter_fig(picks, tomo_dims, score_field)).style(
+                    xy_plot = ui.plotly(_build_xy_scatter_fig(pick_cols, tomo_dims, score_field)).style(
                         "width: 100%; height: 100%;"
                     )
             with (
@@ -5734,22 +5218,22 @@ def _render_picks_scatter_section(row: dict, entry: dict, manifest: dict) -> Non
             ):
                 ui.label("X / Z side").classes("cb-section-title")
                 with ui.element("div").classes("cb-aspect").style(f"aspect-ratio: {xz_aspect};"):
-                    xz_plot = ui.plotly(_build_xz_scatter_fig(picks, tomo_dims, score_field, xz_url)).style(
+                    xz_plot = ui.plotly(_build_xz_scatter_fig(pick_cols, tomo_dims, score_field, xz_url)).style(
                         "width: 100%; height: 100%;"
                     )
                 ui.label("Score distribution").classes("cb-section-title")
-                ui.plotly(_build_score_hist_fig(picks, score_field)).style("width: 100%; height: 160px;")
+                ui.plotly(_build_score_hist_fig(pick_cols, score_field)).style("width: 100%; height: 160px;")
                 ui.label("Hovered pick").classes("cb-section-title")
                 hover_labels = _render_hover_card_skeleton()
 
-                def on_hover(e, _picks=picks, _ps=pixel_size_ang, _labels=hover_labels):
+                def on_hover(e, _picks=pick_cols, _ps=pixel_size_ang, _labels=hover_labels):
                     _update_hover_card(e, _picks, _ps, _labels)
 
                 xy_plot.on("plotly_hover", on_hover, throttle=0.08)
                 xz_plot.on("plotly_hover", on_hover, throttle=0.08)
 
 
-def _build_pick_meta_for_js(picks: list, pixel_size_ang: Optional[float]) -> dict:
+def _build_pick_meta_for_js(pick_cols: dict, pixel_size_ang: Optional[float]) -> dict:
     """Pre-compute per-pick formatted strings for the JS-driven hover card.
 
     Mirrors `_update_hover_card`'s formatting verbatim so the visual output
@@ -5757,23 +5241,22 @@ def _build_pick_meta_for_js(picks: list, pixel_size_ang: Optional[float]) -> dic
     ghost-dot hover (JS). Keyed by str(pick_index) — JS reads it directly.
     """
     out: dict = {}
-    for pick in picks:
-        i = pick.get("i")
+    n = picks_count(pick_cols)
+    none = [None] * n
+    columns = zip(*(pick_cols.get(k) or none for k in ("i", "x", "y", "z", "score", "z_pct", "nn_px")))
+    for i, x, y, z, sc, zp, nn_px in columns:
         if i is None:
             continue
-        entry: dict = {"idx": f"#{pick.get('i')}", "px": f"{pick.get('x')}, {pick.get('y')}, {pick.get('z')}"}
+        entry: dict = {"idx": f"#{i}", "px": f"{x}, {y}, {z}"}
         if pixel_size_ang:
-            ax = pick.get("x", 0) * pixel_size_ang
-            ay = pick.get("y", 0) * pixel_size_ang
-            az = pick.get("z", 0) * pixel_size_ang
+            ax = (x or 0) * pixel_size_ang
+            ay = (y or 0) * pixel_size_ang
+            az = (z or 0) * pixel_size_ang
             entry["ang"] = f"{ax:.0f}, {ay:.0f}, {az:.0f}"
         else:
             entry["ang"] = "(no pixel size)"
-        sc = pick.get("score")
         entry["score"] = f"{sc:.4f}" if sc is not None else "—"
-        zp = pick.get("z_pct")
         entry["z%-tile"] = f"{zp:.0f}" if zp is not None else "—"
-        nn_px = pick.get("nn_px")
         if nn_px is not None:
             entry["nn"] = f"{nn_px:.1f} px ({nn_px * pixel_size_ang:.0f} Å)" if pixel_size_ang else f"{nn_px:.1f} px"
         else:
@@ -5813,7 +5296,7 @@ def _render_hover_card_skeleton(horizontal: bool = False) -> dict:
     return labels
 
 
-def _update_hover_card(e, picks: list, pixel_size_ang, labels: dict) -> None:
+def _update_hover_card(e, pick_cols: dict, pixel_size_ang, labels: dict) -> None:
     args = getattr(e, "args", None) or {}
     points = args.get("points") or []
     if not points:
@@ -5826,9 +5309,9 @@ def _update_hover_card(e, picks: list, pixel_size_ang, labels: dict) -> None:
         idx = int(cd[0])
     except (TypeError, ValueError):
         return
-    if idx < 0 or idx >= len(picks):
+    pick = pick_row(pick_cols, idx)
+    if pick is None:
         return
-    pick = picks[idx]
 
     if labels.get("__card") is None:
         return